@@ -21,6 +21,8 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 
+from core.event_log import iter_events
+
 logger = logging.getLogger("caio.activity_timeline")
 
 
@@ -37,13 +39,20 @@ class ActivityTimeline:
     def __init__(self, hive_dir: Path = None):
         self.hive_dir = hive_dir or Path(".hive-mind")
         self.shadow_dir = self.hive_dir / "shadow_mode_emails"
-        self.status_dir = self.hive_dir / "lead_status"
+        self._status_mgr = None
         self.runs_dir = self.hive_dir / "pipeline_runs"
         self.events_file = self.hive_dir / "events.jsonl"
         self.instantly_log = self.hive_dir / "instantly_dispatch_log.jsonl"
         self.heyreach_log = self.hive_dir / "heyreach_events.jsonl"
         self.followups_dir = self.hive_dir / "heyreach_followups"
 
+    def _get_status_manager(self):
+        """Lazy-initialize the LeadStatusManager backing status reads."""
+        if self._status_mgr is None:
+            from core.lead_signals import LeadStatusManager
+            self._status_mgr = LeadStatusManager(hive_dir=self.hive_dir)
+        return self._status_mgr
+
     def get_lead_timeline(self, email: str) -> List[Dict[str, Any]]:
         """
         Get unified timeline for a specific lead.
@@ -85,30 +94,25 @@ class ActivityTimeline:
         """
         leads = {}
 
-        # Build from lead status files (primary source)
-        if self.status_dir.exists():
-            for filepath in self.status_dir.glob("*.json"):
-                try:
-                    record = json.loads(filepath.read_text(encoding="utf-8"))
-                    email = record.get("email", "")
-                    if email:
-                        leads[email] = {
-                            "email": email,
-                            "name": record.get("name", ""),
-                            "company": record.get("company", ""),
-                            "title": record.get("title", ""),
-                            "status": record.get("status", "unknown"),
-                            "icp_tier": record.get("icp_tier", ""),
-                            "icp_score": record.get("icp_score", 0),
-                            "open_count": record.get("open_count", 0),
-                            "reply_count": record.get("reply_count", 0),
-                            "linkedin_status": record.get("linkedin_status"),
-                            "updated_at": record.get("updated_at", ""),
-                            "created_at": record.get("created_at", ""),
-                            "signal_count": len(record.get("signals", [])),
-                        }
-                except (json.JSONDecodeError, OSError):
-                    continue
+        # Build from lead status store (primary source)
+        for record in self._get_status_manager().get_all_lead_statuses():
+            email = record.get("email", "")
+            if email:
+                leads[email] = {
+                    "email": email,
+                    "name": record.get("name", ""),
+                    "company": record.get("company", ""),
+                    "title": record.get("title", ""),
+                    "status": record.get("status", "unknown"),
+                    "icp_tier": record.get("icp_tier", ""),
+                    "icp_score": record.get("icp_score", 0),
+                    "open_count": record.get("open_count", 0),
+                    "reply_count": record.get("reply_count", 0),
+                    "linkedin_status": record.get("linkedin_status"),
+                    "updated_at": record.get("updated_at", ""),
+                    "created_at": record.get("created_at", ""),
+                    "signal_count": len(record.get("signals", [])),
+                }
 
         # Supplement from shadow emails for leads without status files
         if self.shadow_dir.exists():
@@ -162,29 +166,22 @@ class ActivityTimeline:
             "total_leads": 0,
         }
 
-        if not self.status_dir.exists():
-            return funnel
-
-        for filepath in self.status_dir.glob("*.json"):
-            try:
-                record = json.loads(filepath.read_text(encoding="utf-8"))
-                status = record.get("status", "unknown")
-                funnel["total_leads"] += 1
-
-                if status in funnel["pipeline"]:
-                    funnel["pipeline"][status] += 1
-                elif status in funnel["outreach"]:
-                    funnel["outreach"][status] += 1
-                elif status in funnel["engagement"]:
-                    funnel["engagement"][status] += 1
-                elif status in funnel["decay"]:
-                    funnel["decay"][status] += 1
-                elif status in funnel["terminal"]:
-                    funnel["terminal"][status] += 1
-                elif status in funnel["linkedin"]:
-                    funnel["linkedin"][status] += 1
-            except (json.JSONDecodeError, OSError):
-                continue
+        # Precomputed per-status counters — no per-lead scan
+        for status, count in self._get_status_manager().get_status_summary().items():
+            funnel["total_leads"] += count
+
+            if status in funnel["pipeline"]:
+                funnel["pipeline"][status] += count
+            elif status in funnel["outreach"]:
+                funnel["outreach"][status] += count
+            elif status in funnel["engagement"]:
+                funnel["engagement"][status] += count
+            elif status in funnel["decay"]:
+                funnel["decay"][status] += count
+            elif status in funnel["terminal"]:
+                funnel["terminal"][status] += count
+            elif status in funnel["linkedin"]:
+                funnel["linkedin"][status] += count
 
         return funnel
 
@@ -286,26 +283,22 @@ class ActivityTimeline:
     def _get_status_signal_events(self, email: str) -> List[Dict]:
         """Get engagement signal events from lead status history."""
         events = []
-        status_file = self.status_dir / self._email_to_filename(email)
+        record = self._get_status_manager().get_lead_status(email)
 
-        if not status_file.exists():
+        if not record:
             return events
 
-        try:
-            record = json.loads(status_file.read_text(encoding="utf-8"))
-            for signal in record.get("signals", []):
-                source = signal.get("type", "")
-                channel = source.split(":")[0] if ":" in source else "system"
+        for signal in record.get("signals", []):
+            source = signal.get("type", "")
+            channel = source.split(":")[0] if ":" in source else "system"
 
-                events.append({
-                    "timestamp": signal.get("at", ""),
-                    "type": signal.get("status", "signal"),
-                    "channel": channel,
-                    "summary": self._signal_to_summary(signal),
-                    "data": signal.get("data", {}),
-                })
-        except (json.JSONDecodeError, OSError):
-            pass
+            events.append({
+                "timestamp": signal.get("at", ""),
+                "type": signal.get("status", "signal"),
+                "channel": channel,
+                "summary": self._signal_to_summary(signal),
+                "data": signal.get("data", {}),
+            })
 
         return events
 
@@ -377,36 +370,24 @@ class ActivityTimeline:
     def _get_pipeline_events(self, email: str) -> List[Dict]:
         """Get pipeline events (segmentation, campaign creation) for this lead."""
         events = []
-        if not self.events_file.exists():
-            return events
-
         try:
-            for line in self.events_file.read_text(encoding="utf-8").splitlines():
-                if not line.strip():
-                    continue
-                try:
-                    entry = json.loads(line)
-                    payload = entry.get("payload", {})
-                    lead_id = payload.get("lead_id", "")
-                    # Match by lead_id containing email-like patterns
-                    if lead_id and email.split("@")[0].replace(".", "") in lead_id.replace(".", ""):
-                        events.append({
-                            "timestamp": entry.get("timestamp", ""),
-                            "type": entry.get("event_type", ""),
-                            "channel": "pipeline",
-                            "summary": self._pipeline_event_summary(entry),
-                            "data": payload,
-                        })
-                except json.JSONDecodeError:
-                    continue
+            for entry in iter_events(events_file=self.events_file):
+                payload = entry.get("payload", {})
+                lead_id = payload.get("lead_id", "")
+                # Match by lead_id containing email-like patterns
+                if lead_id and email.split("@")[0].replace(".", "") in lead_id.replace(".", ""):
+                    events.append({
+                        "timestamp": entry.get("timestamp", ""),
+                        "type": entry.get("event_type", ""),
+                        "channel": "pipeline",
+                        "summary": self._pipeline_event_summary(entry),
+                        "data": payload,
+                    })
         except OSError:
             pass
 
         return events
 
-    def _email_to_filename(self, email: str) -> str:
-        return email.lower().replace("@", "_at_").replace(".", "_") + ".json"
-
     def _signal_to_summary(self, signal: Dict) -> str:
         """Convert a signal record to a human-readable summary."""
         status = signal.get("status", "")
@@ -19,12 +19,13 @@ Each detection method returns a confidence score (0-1) with:
 import re
 import json
 import math
+import threading
 from dataclasses import dataclass, field
-from typing import Dict, List, Tuple, Optional, Set
+from typing import Dict, Iterable, Iterator, List, Tuple, Optional, Set
 from enum import Enum
 from datetime import datetime, timezone
 from pathlib import Path
-from collections import Counter
+from collections import Counter, OrderedDict
 
 
 class ThreatLevel(Enum):
@@ -209,10 +210,53 @@ EXFILTRATION_PATTERNS = [
 ]
 
 
+class _PatternScanner:
+    """
+    Precompiled scanner for one weighted pattern category.
+
+    All patterns are joined into a single alternation used as a one-pass
+    prefilter: text that matches none of them (the common case) costs one
+    search. On a prefilter hit the individually compiled patterns are
+    checked in list order, so matched patterns and scores are identical to
+    searching each pattern separately (alternation alone would miss
+    overlapping matches).
+    """
+
+    def __init__(self, category: str, patterns: List[Tuple[str, float]]):
+        self.category = category
+        self.patterns = [(p, re.compile(p, re.IGNORECASE), w) for p, w in patterns]
+        self.combined = re.compile("|".join(f"(?:{p})" for p, _ in patterns), re.IGNORECASE)
+
+    def scan(self, text: str) -> Tuple[float, List[str]]:
+        matched_patterns = []
+        max_score = 0.0
+
+        if self.combined.search(text):
+            for pattern, compiled, weight in self.patterns:
+                if compiled.search(text):
+                    matched_patterns.append(f"{self.category}:{pattern[:30]}")
+                    max_score = max(max_score, weight)
+
+        pattern_count = len(matched_patterns)
+        if pattern_count > 1:
+            max_score = min(1.0, max_score + 0.1 * (pattern_count - 1))
+
+        return (max_score, matched_patterns)
+
+
+_PROMPT_INJECTION_SCANNER = _PatternScanner("prompt_injection", PROMPT_INJECTION_PATTERNS)
+_JAILBREAK_SCANNER = _PatternScanner("jailbreak", JAILBREAK_PATTERNS)
+_EXFILTRATION_SCANNER = _PatternScanner("exfiltration", EXFILTRATION_PATTERNS)
+
+_NON_TOKEN_RE = re.compile(r'[^a-z0-9\s]')
+_NON_DIGIT_RE = re.compile(r'\D')
+_EMAIL_VALIDATION_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+
+
 def _tokenize(text: str) -> List[str]:
     """Simple tokenizer for text."""
     text = text.lower()
-    text = re.sub(r'[^a-z0-9\s]', ' ', text)
+    text = _NON_TOKEN_RE.sub(' ', text)
     tokens = text.split()
     return [t for t in tokens if len(t) > 2]
 
@@ -250,12 +294,15 @@ class ThreatPattern:
     category: str
     tokens: List[str] = field(default_factory=list)
     tf: Dict[str, float] = field(default_factory=dict)
+    norm: float = 0.0
     
     def __post_init__(self):
         if not self.tokens:
             self.tokens = _tokenize(self.pattern)
         if not self.tf:
             self.tf = _compute_tf(self.tokens)
+        if not self.norm:
+            self.norm = math.sqrt(sum(v ** 2 for v in self.tf.values()))
 
 
 class PIIDetector:
@@ -285,11 +332,25 @@ class PIIDetector:
         'deposit', 'checking', 'savings', 'acct'
     ]
     
+    STREAM_OVERLAP_CHARS = 256
+    
     def __init__(self, learning_dir: Optional[Path] = None):
         self.patterns = PII_PATTERNS.copy()
         self.masks = PII_MASKS.copy()
         self.learning_dir = learning_dir or Path(".hive-mind/aidefence")
         self.learning_dir.mkdir(parents=True, exist_ok=True)
+        self._compiled: Dict[PIIType, "re.Pattern"] = {}
+        for pii_type, pattern in self.patterns.items():
+            self._compile(pii_type, pattern)
+    
+    def _compile(self, pii_type: PIIType, pattern: str) -> "re.Pattern":
+        """Compiled regex for a PII type (recompiled if self.patterns was changed)."""
+        compiled = self._compiled.get(pii_type)
+        if compiled is None or compiled.pattern != pattern:
+            flags = 0 if pii_type == PIIType.BANK_ACCOUNT else re.IGNORECASE
+            compiled = re.compile(pattern, flags)
+            self._compiled[pii_type] = compiled
+        return compiled
     
     def scan(self, text: str, context: Optional[Dict] = None) -> PIIScanResult:
         """
@@ -334,11 +395,135 @@ class PIIDetector:
             summary=summary
         )
     
+    def scan_many(self, texts: Iterable[str], context: Optional[Dict] = None) -> List[PIIScanResult]:
+        """
+        Scan a batch of texts for PII.
+        
+        Identical texts in the batch are scanned once and share one result
+        object; treat the results as read-only.
+        
+        Args:
+            texts: Texts to scan
+            context: Optional context applied to every text
+            
+        Returns:
+            One PIIScanResult per input text, in order
+        """
+        seen: Dict[str, PIIScanResult] = {}
+        results = []
+        for text in texts:
+            key = text or ""
+            result = seen.get(key)
+            if result is None:
+                result = self.scan(text, context)
+                seen[key] = result
+            results.append(result)
+        return results
+    
+    def redact_many(self, texts: Iterable[str], pii_types: Optional[List[PIIType]] = None) -> List[str]:
+        """
+        Redact a batch of texts, reusing each scan's matches for redaction.
+        
+        Audit logging uses audit_trail.PIIRedactor.redact_many instead: it
+        masks every pattern hit without confidence filtering and uses fixed
+        class-level patterns, so stored audit entries are redacted the same
+        way regardless of how a detector instance has been tuned.
+        
+        Args:
+            texts: Texts to redact
+            pii_types: Optional list of PII types to redact (None = all)
+            
+        Returns:
+            Redacted texts, in input order
+        """
+        texts = list(texts)
+        redacted = []
+        for text, result in zip(texts, self.scan_many(texts)):
+            if pii_types is None or not result.has_pii:
+                redacted.append(result.redacted_text)
+            else:
+                redacted.append(self.redact(text, pii_types, matches=list(result.matches)))
+        return redacted
+    
+    def scan_stream(self, chunks: Iterable[str], overlap: Optional[int] = None,
+                    context: Optional[Dict] = None) -> Iterator[PIIScanResult]:
+        """
+        Scan a large document delivered as chunks.
+        
+        Text is released only once `overlap` characters of lookahead are
+        buffered, and a release never splits a match, so matches spanning
+        chunk boundaries are found as in a whole-document scan. Each yielded
+        result covers the next consecutive segment of the document: match
+        offsets are document offsets and redacted_text is the redacted
+        segment, so joining the redacted_text values gives the redacted
+        document.
+        
+        Args:
+            chunks: Document pieces in order
+            overlap: Context kept on both sides of a segment (default 256 chars)
+            context: Optional context for enhanced detection
+        """
+        overlap = self.STREAM_OVERLAP_CHARS if overlap is None else overlap
+        window = ""
+        base = 0   # document offset of window[0]
+        done = 0   # window index up to which results were yielded
+        
+        for chunk in chunks:
+            window += chunk
+            if len(window) - overlap <= done:
+                continue
+            segment, cut = self._scan_segment(window, base, done, len(window) - overlap, context)
+            if segment is None:
+                continue
+            yield segment
+            drop = max(0, cut - overlap)
+            window = window[drop:]
+            base += drop
+            done = cut - drop
+        
+        if len(window) > done:
+            segment, _ = self._scan_segment(window, base, done, len(window), context)
+            if segment is not None:
+                yield segment
+    
+    def _scan_segment(self, window: str, base: int, start: int, limit: int,
+                      context: Optional[Dict]) -> Tuple[Optional[PIIScanResult], int]:
+        """Scan window and build the result for window[start:cut], cut <= limit not splitting a match."""
+        matches = [m for m in self.scan(window, context).matches if m.start >= start]
+        cut = limit
+        moved = True
+        while moved:
+            moved = False
+            for m in matches:
+                if m.start < cut < m.end:
+                    cut = m.start
+                    moved = True
+        if cut <= start:
+            return None, start
+        
+        local = [
+            PIIMatch(pii_type=m.pii_type, value=m.value, start=m.start - start, end=m.end - start,
+                     confidence=m.confidence, context=m.context)
+            for m in matches if m.end <= cut
+        ]
+        redacted_text = self.redact(window[start:cut], matches=list(local))
+        for m in local:
+            m.start += base + start
+            m.end += base + start
+        local.sort(key=lambda m: m.start)
+        return PIIScanResult(
+            has_pii=len(local) > 0,
+            matches=local,
+            risk_level=self.get_risk_level(local),
+            redacted_text=redacted_text,
+            summary=self._build_summary(local)
+        ), cut
+    
     def _detect_pattern(self, text: str, pii_type: PIIType, pattern: str) -> List[PIIMatch]:
         """Detect PII using regex pattern."""
         matches = []
         
-        for match in re.finditer(pattern, text, re.IGNORECASE):
+        for match in self._compile(pii_type, pattern).finditer(text):
             if pii_type in (PIIType.API_KEY, PIIType.PASSWORD):
                 value = match.group(1) if match.lastindex else match.group(0)
             else:
@@ -363,11 +548,11 @@ class PIIDetector:
     def _detect_bank_account(self, text: str) -> List[PIIMatch]:
         """Detect bank account numbers with context awareness."""
         matches = []
-        pattern = self.patterns[PIIType.BANK_ACCOUNT]
+        pattern = self._compile(PIIType.BANK_ACCOUNT, self.patterns[PIIType.BANK_ACCOUNT])
         
         text_lower = text.lower()
         
-        for match in re.finditer(pattern, text):
+        for match in pattern.finditer(text):
             value = match.group(0)
             start = match.start()
             end = match.end()
@@ -535,8 +720,7 @@ class PIIDetector:
         if not email or '@' not in email:
             return False
         
-        pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        return bool(re.match(pattern, email))
+        return bool(_EMAIL_VALIDATION_RE.match(email))
     
     def validate_credit_card(self, number: str) -> bool:
         """
@@ -548,7 +732,7 @@ class PIIDetector:
         Returns:
             True if valid according to Luhn algorithm
         """
-        digits = re.sub(r'\D', '', number)
+        digits = _NON_DIGIT_RE.sub('', number)
         
         if len(digits) < 13 or len(digits) > 19:
             return False
@@ -576,7 +760,7 @@ class PIIDetector:
         Returns:
             True if valid SSN format
         """
-        digits = re.sub(r'\D', '', ssn)
+        digits = _NON_DIGIT_RE.sub('', ssn)
         
         if len(digits) != 9:
             return False
@@ -828,12 +1012,37 @@ class AIDefence:
         "critical": 0.6
     }
     
-    def __init__(self, threat_patterns_path: Optional[str] = None, enable_pii_detection: bool = True):
+    SCAN_CACHE_SIZE = 1024
+    
+    def __init__(self, threat_patterns_path: Optional[str] = None, enable_pii_detection: bool = True,
+                 scan_cache_size: Optional[int] = None):
         self.known_patterns: List[ThreatPattern] = []
         self.pii_detector = PIIDetector() if enable_pii_detection else None
+        self.scan_cache_size = self.SCAN_CACHE_SIZE if scan_cache_size is None else scan_cache_size
+        self._scan_cache: "OrderedDict[str, tuple]" = OrderedDict()
+        self._scan_cache_lock = threading.Lock()
+        self._token_index: Dict[str, List[int]] = {}
+        self._indexed_count = -1
         self._load_patterns(threat_patterns_path)
         self._initialize_default_patterns()
     
+    def _patterns_changed(self) -> None:
+        """Drop the token index and scan cache after known_patterns changes."""
+        self._indexed_count = -1
+        with self._scan_cache_lock:
+            self._scan_cache.clear()
+    
+    def _ensure_token_index(self) -> None:
+        """(Re)build the token -> known_patterns positions index if stale."""
+        if self._indexed_count == len(self.known_patterns):
+            return
+        index: Dict[str, List[int]] = {}
+        for i, pattern in enumerate(self.known_patterns):
+            for token in pattern.tf:
+                index.setdefault(token, []).append(i)
+        self._token_index = index
+        self._indexed_count = len(self.known_patterns)
+    
     def _load_patterns(self, path: Optional[str]) -> None:
         """Load threat patterns from file if provided."""
         if path is None:
@@ -877,6 +1086,7 @@ class AIDefence:
                     pattern=pattern,
                     category=category
                 ))
+        self._patterns_changed()
     
     def analyze(self, text: str, context: Optional[Dict] = None, scan_pii: bool = True) -> ThreatAnalysis:
         """
@@ -902,11 +1112,8 @@ class AIDefence:
                 pii_scan=None
             )
         
-        text_lower = text.lower()
-        
-        pi_score, pi_patterns = self.detect_prompt_injection(text_lower)
-        jb_score, jb_patterns = self.detect_jailbreak(text_lower)
-        ex_score, ex_patterns = self.detect_exfiltration(text_lower)
+        (pi_score, pi_patterns), (jb_score, jb_patterns), (ex_score, ex_patterns), known_threats = \
+            self._scan_threats(text)
         
         pii_scan_result = None
         pii_risk_score = 0.0
@@ -914,7 +1121,6 @@ class AIDefence:
             pii_scan_result = self.pii_detector.scan(text, context)
             pii_risk_score = self.PII_RISK_SCORE_MAP.get(pii_scan_result.risk_level, 0.0)
         
-        known_threats = self.match_known_threats(text)
         known_threat_score = max([score for _, score in known_threats], default=0.0)
         
         overall_score = (
@@ -962,6 +1168,35 @@ class AIDefence:
         
         return analysis
     
+    def _scan_threats(self, text: str) -> tuple:
+        """
+        Pattern-category scores and known-threat matches for text.
+        
+        Results are kept in a per-text LRU cache (scan_cache_size entries),
+        so repeated content (quoted replies, retried agent I/O) is scanned once.
+        """
+        if self.scan_cache_size > 0:
+            with self._scan_cache_lock:
+                cached = self._scan_cache.get(text)
+                if cached is not None:
+                    self._scan_cache.move_to_end(text)
+                    return cached
+        
+        text_lower = text.lower()
+        result = (
+            self.detect_prompt_injection(text_lower),
+            self.detect_jailbreak(text_lower),
+            self.detect_exfiltration(text_lower),
+            self.match_known_threats(text),
+        )
+        
+        if self.scan_cache_size > 0:
+            with self._scan_cache_lock:
+                self._scan_cache[text] = result
+                while len(self._scan_cache) > self.scan_cache_size:
+                    self._scan_cache.popitem(last=False)
+        return result
+    
     def detect_prompt_injection(self, text: str) -> Tuple[float, List[str]]:
         """
         Detect prompt injection attempts.
@@ -969,19 +1204,7 @@ class AIDefence:
         Returns:
             Tuple of (confidence_score, matched_patterns)
         """
-        matched_patterns = []
-        max_score = 0.0
-        
-        for pattern, weight in PROMPT_INJECTION_PATTERNS:
-            if re.search(pattern, text, re.IGNORECASE):
-                matched_patterns.append(f"prompt_injection:{pattern[:30]}")
-                max_score = max(max_score, weight)
-        
-        pattern_count = len(matched_patterns)
-        if pattern_count > 1:
-            max_score = min(1.0, max_score + 0.1 * (pattern_count - 1))
-        
-        return (max_score, matched_patterns)
+        return _PROMPT_INJECTION_SCANNER.scan(text)
     
     def detect_jailbreak(self, text: str) -> Tuple[float, List[str]]:
         """
@@ -990,19 +1213,7 @@ class AIDefence:
         Returns:
             Tuple of (confidence_score, matched_patterns)
         """
-        matched_patterns = []
-        max_score = 0.0
-        
-        for pattern, weight in JAILBREAK_PATTERNS:
-            if re.search(pattern, text, re.IGNORECASE):
-                matched_patterns.append(f"jailbreak:{pattern[:30]}")
-                max_score = max(max_score, weight)
-        
-        pattern_count = len(matched_patterns)
-        if pattern_count > 1:
-            max_score = min(1.0, max_score + 0.1 * (pattern_count - 1))
-        
-        return (max_score, matched_patterns)
+        return _JAILBREAK_SCANNER.scan(text)
     
     def detect_exfiltration(self, text: str) -> Tuple[float, List[str]]:
         """
@@ -1011,36 +1222,38 @@ class AIDefence:
         Returns:
             Tuple of (confidence_score, matched_patterns)
         """
-        matched_patterns = []
-        max_score = 0.0
-        
-        for pattern, weight in EXFILTRATION_PATTERNS:
-            if re.search(pattern, text, re.IGNORECASE):
-                matched_patterns.append(f"exfiltration:{pattern[:30]}")
-                max_score = max(max_score, weight)
-        
-        pattern_count = len(matched_patterns)
-        if pattern_count > 1:
-            max_score = min(1.0, max_score + 0.1 * (pattern_count - 1))
-        
-        return (max_score, matched_patterns)
+        return _EXFILTRATION_SCANNER.scan(text)
     
     def match_known_threats(self, text: str) -> List[Tuple[str, float]]:
         """
         Match text against known threat patterns using TF-IDF similarity.
         
+        Only patterns sharing at least one token with the text (looked up in
+        an inverted token index) are scored; the rest have similarity 0.
+        
         Returns:
             List of (threat_name, similarity_score) tuples
         """
         if not text.strip():
             return []
         
-        input_tokens = _tokenize(text)
-        input_tf = _compute_tf(input_tokens)
+        input_tf = _compute_tf(_tokenize(text))
+        if not input_tf:
+            return []
+        input_norm = math.sqrt(sum(v ** 2 for v in input_tf.values()))
+        
+        self._ensure_token_index()
+        dots: Dict[int, float] = {}
+        for token, weight in input_tf.items():
+            for i in self._token_index.get(token, ()):
+                dots[i] = dots.get(i, 0.0) + weight * self.known_patterns[i].tf[token]
         
         matches = []
-        for pattern in self.known_patterns:
-            similarity = _compute_similarity(input_tf, pattern.tf)
+        for i in sorted(dots):
+            pattern = self.known_patterns[i]
+            if not pattern.norm:
+                continue
+            similarity = dots[i] / (input_norm * pattern.norm)
             if similarity > 0.3:
                 matches.append((pattern.name, similarity))
         
@@ -1064,6 +1277,7 @@ class AIDefence:
                         pattern=pattern,
                         category=category
                     )
+                    self._patterns_changed()
                     return
         else:
             self.known_patterns.append(ThreatPattern(
@@ -1071,12 +1285,14 @@ class AIDefence:
                 pattern=pattern,
                 category=category
             ))
+            self._patterns_changed()
     
     def remove_threat_pattern(self, name: str) -> bool:
         """Remove a threat pattern by name."""
         for i, p in enumerate(self.known_patterns):
             if p.name == name:
                 self.known_patterns.pop(i)
+                self._patterns_changed()
                 return True
         return False
     
@@ -9,17 +9,29 @@ Day 18 Implementation:
 - Weekly markdown reports
 - PII redaction for sensitive data
 - Support for all 13 Beta Swarm agents
+
+Writes go through a background writer: log_action() enqueues the entry and
+a single task drains the queue in batched transactions (WAL, persistent
+connection, executemany), updating the audit_metrics daily aggregates in
+the same transaction. Call flush() (or close()) before shutdown; entries a
+loop left queued are still written synchronously when another loop logs
+or at interpreter exit.
 """
 
 from dataclasses import dataclass, asdict, field
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
+import atexit
 import json
+import logging
+import os
 import re
 import sqlite3
+import threading
+import weakref
 import asyncio
 import aiosqlite
-from typing import Dict, List, Any, Optional, Set
+from typing import Dict, Iterable, List, Any, Optional, Set, Tuple
 from collections import defaultdict
 from enum import Enum
 
@@ -28,6 +40,13 @@ HIVE_MIND_DIR = PROJECT_ROOT / ".hive-mind"
 DEFAULT_DB_PATH = HIVE_MIND_DIR / "audit.db"
 DEFAULT_BACKUP_DIR = HIVE_MIND_DIR / "audit_backup"
 
+# Background writer tuning: rows per transaction, and the queue size at
+# which log_action() blocks until the writer catches up (backpressure).
+AUDIT_WRITE_BATCH_SIZE = int(os.getenv("AUDIT_WRITE_BATCH_SIZE", "500"))
+AUDIT_QUEUE_MAX_SIZE = int(os.getenv("AUDIT_QUEUE_MAX_SIZE", "10000"))
+
+logger = logging.getLogger(__name__)
+
 
 # ============================================================================
 # PII REDACTION
@@ -102,6 +121,10 @@ class PIIRedactor:
         "refresh_token", "bearer", "credential"
     }
     
+    # Every pattern needs an '@', a digit or an API-key keyword; strings
+    # without any of them are returned unchanged without running the patterns.
+    CANDIDATE_PATTERN = re.compile(r'[@\d]|api|token|secret|password|auth', re.IGNORECASE)
+    
     @classmethod
     def redact_string(cls, text: str, preserve_partial: bool = False) -> str:
         """
@@ -117,6 +140,9 @@ class PIIRedactor:
         if not isinstance(text, str):
             return str(text)
         
+        if not cls.CANDIDATE_PATTERN.search(text):
+            return text
+        
         result = text
         
         # Redact each PII type
@@ -140,18 +166,74 @@ class PIIRedactor:
         return result
     
     @classmethod
-    def redact_dict(cls, data: Dict[str, Any], depth: int = 0, max_depth: int = 10) -> Dict[str, Any]:
+    def redact_many(cls, texts: Iterable[str], preserve_partial: bool = False) -> List[str]:
         """
-        Recursively redact PII from a dictionary.
+        Redact PII from a batch of strings.
+        
+        Each distinct string is redacted once; strings that cannot contain
+        PII skip the patterns entirely.
+        
+        This is deliberately separate from aidefence.PIIDetector.redact_many.
+        Audit records are redacted on every log_action, so this path stays
+        stateless and classmethod-only, and it masks every pattern hit:
+        PIIDetector drops matches below 0.5 confidence and keeps mutable
+        per-instance patterns, neither of which suits a log whose stored
+        entries must be redacted the same way every time.
         
         Args:
-            data: Dictionary to redact
-            depth: Current recursion depth
-            max_depth: Maximum recursion depth
+            texts: Strings to redact
+            preserve_partial: If True, show partial data (e.g., email domain)
         
         Returns:
-            Redacted dictionary
+            Redacted strings, in input order
+        """
+        done: Dict[str, str] = {}
+        result = []
+        for text in texts:
+            redacted = done.get(text) if isinstance(text, str) else None
+            if redacted is None:
+                redacted = cls.redact_string(text, preserve_partial)
+                if isinstance(text, str):
+                    done[text] = redacted
+            result.append(redacted)
+        return result
+    
+    @classmethod
+    def redact_values(cls, values: List[Any], max_depth: int = 10) -> List[Any]:
+        """
+        Redact several dicts and/or strings in a single batched pass.
+        
+        Dicts follow redact_dict rules and strings redact_string rules; other
+        values (including None) are returned unchanged. All string leaves are
+        collected first and redacted together with redact_many.
+        
+        Args:
+            values: Dicts, strings or other values
+            max_depth: Maximum recursion depth for dicts
+        
+        Returns:
+            Redacted values, in input order
         """
+        pending: List[Tuple[Any, Any, str]] = []
+        holder: List[Any] = []
+        for i, value in enumerate(values):
+            if isinstance(value, dict):
+                holder.append(cls._collect_dict(value, 0, max_depth, pending))
+            elif isinstance(value, str):
+                holder.append(value)
+                pending.append((holder, i, value))
+            else:
+                holder.append(value)
+        
+        redacted = cls.redact_many(text for _, _, text in pending)
+        for (container, key, _), text in zip(pending, redacted):
+            container[key] = text
+        return holder
+    
+    @classmethod
+    def _collect_dict(cls, data: Dict[str, Any], depth: int, max_depth: int,
+                      pending: List[Tuple[Any, Any, str]]) -> Dict[str, Any]:
+        """Copy data applying field-name rules; string leaves are queued in pending."""
         if depth > max_depth:
             return {"_truncated": "max_depth_exceeded"}
         
@@ -167,40 +249,68 @@ class PIIRedactor:
             if any(sensitive in key_lower for sensitive in cls.SENSITIVE_FIELDS):
                 result[key] = "[SENSITIVE_REDACTED]"
             elif isinstance(value, dict):
-                result[key] = cls.redact_dict(value, depth + 1, max_depth)
+                result[key] = cls._collect_dict(value, depth + 1, max_depth, pending)
             elif isinstance(value, list):
-                result[key] = [
-                    cls.redact_dict(item, depth + 1, max_depth) if isinstance(item, dict)
-                    else cls.redact_string(str(item)) if isinstance(item, str)
-                    else item
-                    for item in value
-                ]
+                items = []
+                for item in value:
+                    if isinstance(item, dict):
+                        items.append(cls._collect_dict(item, depth + 1, max_depth, pending))
+                    else:
+                        if isinstance(item, str):
+                            pending.append((items, len(items), item))
+                        items.append(item)
+                result[key] = items
             elif isinstance(value, str):
-                result[key] = cls.redact_string(value)
+                result[key] = value
+                pending.append((result, key, value))
             else:
                 result[key] = value
         
         return result
     
     @classmethod
-    def create_summary(cls, data: Dict[str, Any], max_length: int = 500) -> str:
+    def redact_dict(cls, data: Dict[str, Any], depth: int = 0, max_depth: int = 10) -> Dict[str, Any]:
         """
-        Create a redacted summary of input/output data.
+        Recursively redact PII from a dictionary.
         
         Args:
-            data: Data to summarize
-            max_length: Maximum length of summary
+            data: Dictionary to redact
+            depth: Current recursion depth
+            max_depth: Maximum recursion depth
         
         Returns:
-            Redacted, truncated summary string
+            Redacted dictionary
         """
-        redacted = cls.redact_dict(data)
+        pending: List[Tuple[Any, Any, str]] = []
+        result = cls._collect_dict(data, depth, max_depth, pending)
+        redacted = cls.redact_many(text for _, _, text in pending)
+        for (container, key, _), text in zip(pending, redacted):
+            container[key] = text
+        return result
+    
+    @classmethod
+    def summarize(cls, redacted: Dict[str, Any], max_length: int = 500) -> str:
+        """Serialize already-redacted data, truncated to max_length."""
         summary = json.dumps(redacted, default=str)
         
         if len(summary) > max_length:
             return summary[:max_length - 3] + "..."
         
         return summary
+    
+    @classmethod
+    def create_summary(cls, data: Dict[str, Any], max_length: int = 500) -> str:
+        """
+        Create a redacted summary of input/output data.
+        
+        Args:
+            data: Data to summarize
+            max_length: Maximum length of summary
+        
+        Returns:
+            Redacted, truncated summary string
+        """
+        return cls.summarize(cls.redact_dict(data), max_length)
 
 
 class ApprovalStatus(Enum):
@@ -250,6 +360,41 @@ class AuditEntry:
 
 
 
+_INSERT_LOG_SQL = """
+    INSERT INTO audit_log
+    (timestamp, agent_name, action_type, target_resource, action_details,
+     input_summary, output_summary, status, approval_status, risk_level,
+     grounding_evidence, duration_ms, error_message)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+# Incremental daily aggregate, applied per entry inside the batch transaction
+_UPSERT_METRICS_SQL = """
+    INSERT INTO audit_metrics (date, agent_name, action_type,
+                               total_count, success_count, failure_count, avg_duration_ms)
+    VALUES (?, ?, ?, 1, ?, ?, ?)
+    ON CONFLICT(date, agent_name, action_type) DO UPDATE SET
+        total_count = total_count + 1,
+        success_count = success_count + ?,
+        failure_count = failure_count + ?,
+        avg_duration_ms = CASE
+            WHEN excluded.avg_duration_ms IS NOT NULL
+            THEN (COALESCE(avg_duration_ms, 0) * total_count + excluded.avg_duration_ms) / (total_count + 1)
+            ELSE avg_duration_ms
+        END
+"""
+
+
+# Trails whose queued entries are written at exit
+_live_trails: "weakref.WeakSet[AuditTrail]" = weakref.WeakSet()
+
+
+@atexit.register
+def _drain_audit_trails() -> None:
+    for trail in list(_live_trails):
+        trail._drain_pending()
+
+
 class AuditTrail:
     """
     Comprehensive audit trail system with SQLite storage, JSON backup,
@@ -259,14 +404,26 @@ class AuditTrail:
     def __init__(
         self,
         db_path: Optional[Path] = None,
-        backup_dir: Optional[Path] = None
+        backup_dir: Optional[Path] = None,
+        batch_size: Optional[int] = None,
+        max_queue_size: Optional[int] = None
     ):
         self.db_path = db_path or DEFAULT_DB_PATH
         self.backup_dir = backup_dir or DEFAULT_BACKUP_DIR
+        self.batch_size = max(1, batch_size or AUDIT_WRITE_BATCH_SIZE)
+        self.max_queue_size = max_queue_size or AUDIT_QUEUE_MAX_SIZE
         self._write_lock = asyncio.Lock()
         self._initialized = False
         self._cleanup_task: Optional[asyncio.Task] = None
 
+        # Background writer state (queue is bound to the loop that created it)
+        self._queue: Optional[asyncio.Queue] = None
+        self._queue_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._writer_task: Optional[asyncio.Task] = None
+        self._writer_conn: Optional[sqlite3.Connection] = None
+        self._writer_conn_lock = threading.Lock()
+        _live_trails.add(self)
+
     async def initialize(self) -> None:
         """Initialize database tables and backup directory."""
         if self._initialized:
@@ -276,6 +433,8 @@ class AuditTrail:
         self.backup_dir.mkdir(parents=True, exist_ok=True)
 
         async with aiosqlite.connect(str(self.db_path)) as db:
+            await db.execute("PRAGMA journal_mode=WAL")
+
             # Main audit log table with Day 18 enhancements
             await db.execute("""
                 CREATE TABLE IF NOT EXISTS audit_log (
@@ -347,13 +506,23 @@ class AuditTrail:
         self._initialized = True
 
     async def close(self) -> None:
-        """Clean up resources."""
+        """Flush queued entries and clean up resources."""
+        await self.flush()
         if self._cleanup_task:
             self._cleanup_task.cancel()
             try:
                 await self._cleanup_task
             except asyncio.CancelledError:
                 pass
+        with self._writer_conn_lock:
+            if self._writer_conn is not None:
+                self._writer_conn.close()
+                self._writer_conn = None
+
+    async def flush(self) -> None:
+        """Wait until every queued audit entry has been committed."""
+        if self._queue is not None and self._queue_loop is asyncio.get_running_loop():
+            await self._queue.join()
 
     async def log_action(
         self,
@@ -369,8 +538,9 @@ class AuditTrail:
         grounding_evidence: Optional[Dict[str, Any]] = None,
         duration_ms: Optional[float] = None,
         error: Optional[str] = None,
-        redact_pii: bool = True
-    ) -> int:
+        redact_pii: bool = True,
+        wait: bool = True
+    ) -> Optional[int]:
         """
         Log an agent action to the audit trail.
         
@@ -388,38 +558,38 @@ class AuditTrail:
             duration_ms: Execution time in milliseconds
             error: Error message if failed
             redact_pii: Whether to redact PII (default True)
+            wait: If True, wait for the entry's batch to commit and return its
+                ID; if False, return as soon as the entry is queued
 
         Returns:
-            The ID of the created audit log entry.
+            The ID of the created audit log entry, or None when wait is False.
         """
         await self.initialize()
 
         timestamp = datetime.now(timezone.utc).isoformat()
         
-        # Create redacted summaries for input/output
+        # Redact details, input/output and target_resource in one batched pass
+        if redact_pii:
+            details, input_data, output_data, target_resource = PIIRedactor.redact_values(
+                [details, input_data or None, output_data or None, target_resource or None]
+            )
+        
+        # Create summaries for input/output
         input_summary = ""
         output_summary = ""
         
         if input_data:
             if redact_pii:
-                input_summary = PIIRedactor.create_summary(input_data)
+                input_summary = PIIRedactor.summarize(input_data)
             else:
                 input_summary = json.dumps(input_data, default=str)[:500]
         
         if output_data:
             if redact_pii:
-                output_summary = PIIRedactor.create_summary(output_data)
+                output_summary = PIIRedactor.summarize(output_data)
             else:
                 output_summary = json.dumps(output_data, default=str)[:500]
         
-        # Redact details if needed
-        if redact_pii:
-            details = PIIRedactor.redact_dict(details)
-        
-        # Redact target_resource if it looks like PII
-        if target_resource and redact_pii:
-            target_resource = PIIRedactor.redact_string(target_resource)
-        
         entry = AuditEntry(
             timestamp=timestamp,
             agent_name=agent_name,
@@ -436,71 +606,130 @@ class AuditTrail:
             error_message=error
         )
 
-        async with self._write_lock:
-            async with aiosqlite.connect(str(self.db_path)) as db:
-                cursor = await db.execute(
-                    """
-                    INSERT INTO audit_log 
-                    (timestamp, agent_name, action_type, target_resource, action_details,
-                     input_summary, output_summary, status, approval_status, risk_level,
-                     grounding_evidence, duration_ms, error_message)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """,
-                    (
-                        entry.timestamp,
-                        entry.agent_name,
-                        entry.action_type,
-                        entry.target_resource,
-                        json.dumps(entry.action_details),
-                        entry.input_summary,
-                        entry.output_summary,
-                        entry.status,
-                        entry.approval_status,
-                        entry.risk_level,
-                        json.dumps(entry.grounding_evidence) if entry.grounding_evidence else None,
-                        entry.duration_ms,
-                        entry.error_message
-                    )
-                )
-                entry_id = cursor.lastrowid
-                await self._update_metrics(db, entry)
-                await db.commit()
+        row = (
+            entry.timestamp,
+            entry.agent_name,
+            entry.action_type,
+            entry.target_resource,
+            json.dumps(entry.action_details),
+            entry.input_summary,
+            entry.output_summary,
+            entry.status,
+            entry.approval_status,
+            entry.risk_level,
+            json.dumps(entry.grounding_evidence) if entry.grounding_evidence else None,
+            entry.duration_ms,
+            entry.error_message
+        )
 
-        return entry_id
+        queue = self._get_queue()
+        future = asyncio.get_running_loop().create_future() if wait else None
+        await queue.put((row, self._metrics_params(entry), future))
+        if self._writer_task is None or self._writer_task.done():
+            self._writer_task = asyncio.create_task(self._drain_queue())
+
+        return await future if future is not None else None
+
+    def _get_queue(self) -> asyncio.Queue:
+        """Return the write queue, recreating it if the event loop changed."""
+        loop = asyncio.get_running_loop()
+        if self._queue is None or self._queue_loop is not loop:
+            # The old loop may have exited before its writer ran (wait=False)
+            self._drain_pending()
+            self._queue = asyncio.Queue(maxsize=self.max_queue_size)
+            self._queue_loop = loop
+            self._writer_task = None
+        return self._queue
+
+    async def _drain_queue(self) -> None:
+        """Background writer: commit queued entries in batches until the queue is empty."""
+        queue = self._queue
+        loop = asyncio.get_running_loop()
+        while not queue.empty():
+            batch = [queue.get_nowait()]
+            while len(batch) < self.batch_size and not queue.empty():
+                batch.append(queue.get_nowait())
 
-    async def _update_metrics(
-        self,
-        db: aiosqlite.Connection,
-        entry: AuditEntry
-    ) -> None:
-        """Update aggregated metrics for the entry."""
-        date = entry.timestamp[:10]  # YYYY-MM-DD
-
-        await db.execute(
-            """
-            INSERT INTO audit_metrics (date, agent_name, action_type, 
-                                        total_count, success_count, failure_count, avg_duration_ms)
-            VALUES (?, ?, ?, 1, ?, ?, ?)
-            ON CONFLICT(date, agent_name, action_type) DO UPDATE SET
-                total_count = total_count + 1,
-                success_count = success_count + ?,
-                failure_count = failure_count + ?,
-                avg_duration_ms = CASE 
-                    WHEN excluded.avg_duration_ms IS NOT NULL 
-                    THEN (COALESCE(avg_duration_ms, 0) * total_count + excluded.avg_duration_ms) / (total_count + 1)
-                    ELSE avg_duration_ms
-                END
-            """,
-            (
-                date,
-                entry.agent_name,
-                entry.action_type,
-                1 if entry.status == "success" else 0,
-                1 if entry.status == "failure" else 0,
-                entry.duration_ms,
-                1 if entry.status == "success" else 0,
-                1 if entry.status == "failure" else 0
+            try:
+                ids = await loop.run_in_executor(None, self._write_batch, batch)
+            except Exception as exc:
+                logger.error("Audit trail batch write failed (%d entries): %s", len(batch), exc)
+                for _, _, future in batch:
+                    if future is not None and not future.done():
+                        future.set_exception(exc)
+            else:
+                for entry_id, (_, _, future) in zip(ids, batch):
+                    if future is not None and not future.done():
+                        future.set_result(entry_id)
+            finally:
+                for _ in batch:
+                    queue.task_done()
+
+    def _drain_pending(self) -> None:
+        """Synchronously write whatever is left on the current queue."""
+        queue = self._queue
+        items = []
+        while queue is not None:
+            try:
+                items.append(queue.get_nowait())
+            except asyncio.QueueEmpty:
+                break
+            queue.task_done()
+        for i in range(0, len(items), self.batch_size):
+            batch = items[i:i + self.batch_size]
+            try:
+                ids = self._write_batch(batch)
+            except Exception as exc:
+                logger.error("Audit trail batch write failed (%d entries): %s", len(batch), exc)
+                continue
+            for entry_id, (_, _, future) in zip(ids, batch):
+                # A waiter on a loop that is still running in another thread
+                if future is not None and not future.get_loop().is_closed():
+                    future.get_loop().call_soon_threadsafe(
+                        lambda f=future, r=entry_id: f.done() or f.set_result(r)
+                    )
+
+    def _connect_writer(self) -> sqlite3.Connection:
+        """Open (once) the persistent writer connection."""
+        if self._writer_conn is None:
+            conn = sqlite3.connect(
+                str(self.db_path), timeout=30, isolation_level=None, check_same_thread=False
             )
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._writer_conn = conn
+        return self._writer_conn
+
+    def _write_batch(self, batch: List[Tuple[tuple, tuple, Any]]) -> List[int]:
+        """Insert a batch of rows and update audit_metrics in one transaction."""
+        with self._writer_conn_lock:
+            conn = self._connect_writer()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                conn.executemany(_INSERT_LOG_SQL, [row for row, _, _ in batch])
+                last_id = conn.execute("SELECT last_insert_rowid()").fetchone()[0]
+                conn.executemany(_UPSERT_METRICS_SQL, [metrics for _, metrics, _ in batch])
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+        # AUTOINCREMENT ids are consecutive within a single writer transaction
+        return list(range(last_id - len(batch) + 1, last_id + 1))
+
+    @staticmethod
+    def _metrics_params(entry: AuditEntry) -> tuple:
+        """Parameters for the audit_metrics upsert of one entry."""
+        success = 1 if entry.status == "success" else 0
+        failure = 1 if entry.status == "failure" else 0
+        return (
+            entry.timestamp[:10],  # YYYY-MM-DD
+            entry.agent_name,
+            entry.action_type,
+            success,
+            failure,
+            entry.duration_ms,
+            success,
+            failure
         )
 
     async def get_logs(
@@ -525,6 +754,7 @@ class AuditTrail:
             List of audit log entries as dictionaries.
         """
         await self.initialize()
+        await self.flush()
 
         conditions = []
         params = []
@@ -581,6 +811,7 @@ class AuditTrail:
             Dictionary with success_rate, avg_duration, and action_counts.
         """
         await self.initialize()
+        await self.flush()
 
         start_date = (datetime.now(timezone.utc) - timedelta(days=days)).strftime("%Y-%m-%d")
 
@@ -640,6 +871,7 @@ class AuditTrail:
             Dictionary with totals by agent and action type.
         """
         await self.initialize()
+        await self.flush()
 
         if date is None:
             date = datetime.now(timezone.utc).strftime("%Y-%m-%d")
@@ -715,6 +947,7 @@ class AuditTrail:
             List of matching audit log entries.
         """
         await self.initialize()
+        await self.flush()
 
         async with aiosqlite.connect(str(self.db_path)) as db:
             db.row_factory = aiosqlite.Row
@@ -743,6 +976,7 @@ class AuditTrail:
             Markdown-formatted report string.
         """
         await self.initialize()
+        await self.flush()
 
         end_date = datetime.now(timezone.utc)
         start_date = end_date - timedelta(days=7)
@@ -909,6 +1143,7 @@ class AuditTrail:
             Dictionary with counts of deleted records and archived files.
         """
         await self.initialize()
+        await self.flush()
 
         cutoff_date = (datetime.now(timezone.utc) - timedelta(days=90)).isoformat()
         cutoff_date_short = (datetime.now(timezone.utc) - timedelta(days=90)).strftime("%Y-%m-%d")
@@ -1,9 +1,21 @@
 """
 Circuit Breaker pattern implementation to stop operations when failures exceed thresholds.
 Prevents cascading failures by temporarily blocking calls to failing services.
+
+Persistence:
+- CIRCUIT_BREAKER_PERSIST_MODE=immediate (default) writes the state file on every change
+- CIRCUIT_BREAKER_PERSIST_MODE=write_behind writes on state transitions and otherwise
+  at most once per CIRCUIT_BREAKER_FLUSH_SECONDS (debounced), plus at exit
+- CIRCUIT_BREAKER_BACKEND=redis shares OPEN/HALF_OPEN/CLOSED transitions across
+  workers via {STATE_REDIS_PREFIX}:circuit_breaker:{name} (uses REDIS_URL)
 """
 
 import json
+import os
+import atexit
+import tempfile
+import threading
+import time
 import functools
 import asyncio
 from enum import Enum
@@ -18,6 +30,14 @@ try:
 except ImportError:
     _ALERTS_AVAILABLE = False
 
+try:
+    import redis
+except ImportError:  # pragma: no cover - optional runtime dependency
+    redis = None
+
+PERSIST_IMMEDIATE = "immediate"
+PERSIST_WRITE_BEHIND = "write_behind"
+
 
 class CircuitState(Enum):
     """Circuit breaker states."""
@@ -83,11 +103,59 @@ class CircuitBreakerError(Exception):
 class CircuitBreakerRegistry:
     """Registry managing all circuit breakers."""
     
-    def __init__(self, state_file: Optional[Path] = None):
+    def __init__(self, state_file: Optional[Path] = None,
+                 persist_mode: Optional[str] = None,
+                 flush_interval_seconds: Optional[float] = None,
+                 redis_url: Optional[str] = None,
+                 redis_sync_seconds: float = 1.0):
         self.breakers: Dict[str, CircuitBreaker] = {}
         self.state_file = state_file or Path(".hive-mind/circuit_breakers.json")
+        self.persist_mode = (
+            persist_mode or os.getenv("CIRCUIT_BREAKER_PERSIST_MODE") or PERSIST_IMMEDIATE
+        ).strip().lower()
+        if flush_interval_seconds is None:
+            flush_interval_seconds = float(os.getenv("CIRCUIT_BREAKER_FLUSH_SECONDS") or 5.0)
+        self.flush_interval_seconds = max(0.0, flush_interval_seconds)
+        self.redis_prefix = (os.getenv("STATE_REDIS_PREFIX") or "caio").strip() or "caio"
+        self.redis_sync_seconds = redis_sync_seconds
+        
+        self._lock = threading.RLock()
+        self._dirty = False
+        self._last_save = 0.0
+        self._flush_timer: Optional[threading.Timer] = None
+        # name -> changed_at of the last shared transition seen/published
+        self._shared_versions: Dict[str, float] = {}
+        self._last_sync: Dict[str, float] = {}
+        
+        self._redis = None
+        self._init_redis(redis_url)
         self._load_state()
         self._register_defaults()
+        if self.persist_mode == PERSIST_WRITE_BEHIND:
+            atexit.register(self.flush)
+    
+    def _init_redis(self, redis_url: Optional[str]):
+        """Connect the shared-state backend if configured."""
+        if redis_url is None:
+            if (os.getenv("CIRCUIT_BREAKER_BACKEND") or "").strip().lower() != "redis":
+                return
+            redis_url = (os.getenv("REDIS_URL") or "").strip()
+        if not redis_url:
+            return
+        if redis is None:
+            print("[CircuitBreaker] redis package not available; using local state only")
+            return
+        try:
+            self._redis = redis.Redis.from_url(
+                redis_url,
+                decode_responses=True,
+                socket_connect_timeout=2,
+                socket_timeout=2,
+            )
+            self._redis.ping()
+        except Exception as e:
+            print(f"[CircuitBreaker] Redis init failed; using local state only: {e}")
+            self._redis = None
     
     def _register_defaults(self):
         """Register pre-configured breakers."""
@@ -116,14 +184,127 @@ class CircuitBreakerRegistry:
                 print(f"[CircuitBreaker] Failed to load state: {e}")
     
     def _save_state(self):
-        """Persist state to file."""
-        self.state_file.parent.mkdir(parents=True, exist_ok=True)
-        data = {
-            "breakers": [b.to_dict() for b in self.breakers.values()],
-            "updated_at": datetime.now().isoformat()
-        }
-        with open(self.state_file, "w") as f:
-            json.dump(data, f, indent=2)
+        """Persist state to file atomically (temp file + os.replace)."""
+        with self._lock:
+            self.state_file.parent.mkdir(parents=True, exist_ok=True)
+            data = {
+                "breakers": [b.to_dict() for b in self.breakers.values()],
+                "updated_at": datetime.now().isoformat()
+            }
+            fd, tmp_path = tempfile.mkstemp(
+                dir=str(self.state_file.parent), prefix=".circuit_breakers_", suffix=".tmp"
+            )
+            try:
+                with os.fdopen(fd, "w") as f:
+                    json.dump(data, f, indent=2)
+                os.replace(tmp_path, self.state_file)
+            except BaseException:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+                raise
+            self._dirty = False
+            self._last_save = time.monotonic()
+    
+    def _mark_changed(self, transition: bool = False):
+        """Persist a change according to persist_mode.
+        
+        Immediate mode writes every change. Write-behind writes state
+        transitions right away and debounces counter-only updates.
+        """
+        if self.persist_mode != PERSIST_WRITE_BEHIND or transition:
+            self._save_state()
+            return
+        with self._lock:
+            self._dirty = True
+            if time.monotonic() - self._last_save >= self.flush_interval_seconds:
+                self._save_state()
+            elif self._flush_timer is None:
+                delay = self.flush_interval_seconds - (time.monotonic() - self._last_save)
+                self._flush_timer = threading.Timer(max(0.0, delay), self._timer_flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+    
+    def _timer_flush(self):
+        with self._lock:
+            self._flush_timer = None
+        self.flush()
+    
+    def flush(self):
+        """Write pending write-behind changes to disk."""
+        with self._lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            if self._dirty:
+                try:
+                    self._save_state()
+                except OSError as e:
+                    print(f"[CircuitBreaker] Failed to flush state: {e}")
+    
+    def _transition(self, breaker: CircuitBreaker):
+        """Persist and share a state transition."""
+        self._mark_changed(transition=True)
+        self._publish_shared(breaker)
+    
+    # ------------------------------------------------------------------
+    # Shared (Redis) state
+    # ------------------------------------------------------------------
+    
+    def _shared_key(self, name: str) -> str:
+        return f"{self.redis_prefix}:circuit_breaker:{name}"
+    
+    def _publish_shared(self, breaker: CircuitBreaker):
+        """Publish a breaker transition so other workers adopt it."""
+        if self._redis is None:
+            return
+        changed_at = time.time()
+        payload = breaker.to_dict()
+        payload["changed_at"] = changed_at
+        try:
+            self._redis.set(self._shared_key(breaker.name), json.dumps(payload))
+            self._shared_versions[breaker.name] = changed_at
+            self._last_sync[breaker.name] = time.monotonic()
+        except Exception as e:
+            print(f"[CircuitBreaker] Redis publish failed for {breaker.name}: {e}")
+    
+    def _sync_shared(self, breaker: CircuitBreaker, force: bool = False):
+        """Adopt a newer transition published by another worker.
+        
+        Reads are throttled to one per redis_sync_seconds per breaker.
+        """
+        if self._redis is None:
+            return
+        now = time.monotonic()
+        if not force and now - self._last_sync.get(breaker.name, 0.0) < self.redis_sync_seconds:
+            return
+        self._last_sync[breaker.name] = now
+        try:
+            raw = self._redis.get(self._shared_key(breaker.name))
+        except Exception as e:
+            print(f"[CircuitBreaker] Redis read failed for {breaker.name}: {e}")
+            return
+        if not raw:
+            return
+        try:
+            remote = json.loads(raw)
+            changed_at = float(remote.get("changed_at") or 0.0)
+            if changed_at <= self._shared_versions.get(breaker.name, 0.0):
+                return
+            remote_state = CircuitState(remote["state"])
+            last_failure = remote.get("last_failure_time")
+        except (ValueError, KeyError, TypeError) as e:
+            print(f"[CircuitBreaker] Ignoring malformed shared state for {breaker.name}: {e}")
+            return
+        self._shared_versions[breaker.name] = changed_at
+        if remote_state == breaker.state:
+            return
+        breaker.state = remote_state
+        breaker.last_failure_time = datetime.fromisoformat(last_failure) if last_failure else None
+        breaker.failure_count = int(remote.get("failure_count", breaker.failure_count))
+        breaker.half_open_call_count = int(remote.get("half_open_call_count", 0))
+        self._mark_changed(transition=True)
     
     def register(self, name: str, failure_threshold: int = 5, 
                  recovery_timeout: int = 60, half_open_max_calls: int = 3) -> CircuitBreaker:
@@ -138,7 +319,7 @@ class CircuitBreakerRegistry:
             half_open_max_calls=half_open_max_calls
         )
         self.breakers[name] = breaker
-        self._save_state()
+        self._mark_changed(transition=True)
         return breaker
     
     def get_breaker(self, name: str) -> Optional[CircuitBreaker]:
@@ -157,7 +338,7 @@ class CircuitBreakerRegistry:
         if elapsed >= breaker.recovery_timeout_seconds:
             breaker.state = CircuitState.HALF_OPEN
             breaker.half_open_call_count = 0
-            self._save_state()
+            self._transition(breaker)
             print(f"[CircuitBreaker] {breaker.name}: OPEN -> HALF_OPEN (testing recovery)")
             return True
         return False
@@ -168,6 +349,7 @@ class CircuitBreakerRegistry:
         if not breaker:
             return
         
+        previous_state = breaker.state
         breaker.success_count += 1
         
         if breaker.state == CircuitState.HALF_OPEN:
@@ -187,7 +369,10 @@ class CircuitBreakerRegistry:
         elif breaker.state == CircuitState.CLOSED:
             breaker.failure_count = 0
         
-        self._save_state()
+        if breaker.state != previous_state:
+            self._transition(breaker)
+        else:
+            self._mark_changed()
     
     def record_failure(self, name: str, error: Optional[Exception] = None):
         """Record a failed call."""
@@ -195,6 +380,7 @@ class CircuitBreakerRegistry:
         if not breaker:
             return
         
+        previous_state = breaker.state
         breaker.failure_count += 1
         breaker.last_failure_time = datetime.now()
         
@@ -231,7 +417,10 @@ class CircuitBreakerRegistry:
         if error:
             print(f"[CircuitBreaker] {breaker.name} failure: {type(error).__name__}: {error}")
         
-        self._save_state()
+        if breaker.state != previous_state:
+            self._transition(breaker)
+        else:
+            self._mark_changed()
     
     def is_available(self, name: str) -> bool:
         """Check if a service is available (circuit not open)."""
@@ -239,6 +428,8 @@ class CircuitBreakerRegistry:
         if not breaker:
             return True
         
+        self._sync_shared(breaker)
+        
         if breaker.state == CircuitState.CLOSED:
             return True
         
@@ -268,6 +459,7 @@ class CircuitBreakerRegistry:
         """Get status of all circuit breakers."""
         status = {}
         for name, breaker in self.breakers.items():
+            self._sync_shared(breaker)
             self._check_recovery(breaker)
             status[name] = {
                 "state": breaker.state.value,
@@ -285,7 +477,7 @@ class CircuitBreakerRegistry:
         if breaker:
             breaker.state = CircuitState.OPEN
             breaker.last_failure_time = datetime.now()
-            self._save_state()
+            self._transition(breaker)
             print(f"[CircuitBreaker] {name}: Manually OPENED")
     
     def force_close(self, name: str):
@@ -295,7 +487,7 @@ class CircuitBreakerRegistry:
             breaker.state = CircuitState.CLOSED
             breaker.failure_count = 0
             breaker.half_open_call_count = 0
-            self._save_state()
+            self._transition(breaker)
             print(f"[CircuitBreaker] {name}: Manually CLOSED (reset)")
 
 
@@ -0,0 +1,306 @@
+#!/usr/bin/env python3
+"""
+Enrichment Result Cache
+=======================
+Persistent cache in front of the enrichment waterfall
+(execution/enricher_waterfall.py) so leads we already paid Apollo,
+BetterContact or Clay for are not re-enriched on every pipeline run.
+
+Entries are keyed by (normalized LinkedIn URL, provider):
+    - Positive entries store the enriched sections (contact, company, intent).
+      Each section has its own freshness TTL; stale sections are dropped on
+      read and an entry missing a required section counts as a miss.
+    - Negative entries record a definite "not found" from a provider and
+      expire on a shorter TTL so the lead is retried later.
+
+Backed by SQLite (WAL). Size is bounded by LRU eviction on last access.
+
+Configuration:
+    ENRICHMENT_CACHE_ENABLED=true             Turn the cache on for WaterfallEnricher
+    ENRICHMENT_CACHE_PATH                     Default .hive-mind/enrichment_cache.db
+    ENRICHMENT_CACHE_MAX_ENTRIES              Default 100000
+    ENRICHMENT_CACHE_NEGATIVE_TTL_SECONDS     Default 3 days
+
+Usage:
+    cache = EnrichmentCache()
+    cache.put("linkedin.com/in/jdoe", "apollo", {"contact": {...}, "company": {...}})
+    hit = cache.get("linkedin.com/in/jdoe", "apollo", required_fields=("contact",))
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+logger = logging.getLogger("enrichment_cache")
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+DAY_SECONDS = 86400
+
+# Contact data decays slowest to matter for outreach; intent signals go stale fastest.
+DEFAULT_FIELD_TTL_SECONDS: Dict[str, int] = {
+    "contact": 30 * DAY_SECONDS,
+    "company": 90 * DAY_SECONDS,
+    "intent": 7 * DAY_SECONDS,
+}
+DEFAULT_NEGATIVE_TTL_SECONDS = 3 * DAY_SECONDS
+DEFAULT_MAX_ENTRIES = 100_000
+
+# Evict (and sweep expired rows) once every N writes rather than on every put.
+EVICT_EVERY_WRITES = 64
+
+
+@dataclass
+class CacheLookup:
+    """Result of a cache read."""
+    found: bool                                   # False => cached "not found"
+    fields: Dict[str, Any] = field(default_factory=dict)
+    stale_fields: List[str] = field(default_factory=list)
+    fetched_at: float = 0.0
+
+
+class EnrichmentCache:
+    """SQLite-backed enrichment cache with field-level TTLs and LRU eviction."""
+
+    def __init__(
+        self,
+        db_path: Optional[Path] = None,
+        max_entries: Optional[int] = None,
+        field_ttls: Optional[Dict[str, int]] = None,
+        negative_ttl: Optional[int] = None,
+    ):
+        self.db_path = Path(
+            db_path
+            or os.getenv("ENRICHMENT_CACHE_PATH")
+            or PROJECT_ROOT / ".hive-mind" / "enrichment_cache.db"
+        )
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_entries = max(1, int(max_entries or os.getenv("ENRICHMENT_CACHE_MAX_ENTRIES", DEFAULT_MAX_ENTRIES)))
+        self.field_ttls = dict(field_ttls or DEFAULT_FIELD_TTL_SECONDS)
+        self.negative_ttl = int(
+            negative_ttl if negative_ttl is not None
+            else os.getenv("ENRICHMENT_CACHE_NEGATIVE_TTL_SECONDS", DEFAULT_NEGATIVE_TTL_SECONDS)
+        )
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._writes_since_evict = 0
+        self.counters = {"hits": 0, "negative_hits": 0, "misses": 0}
+        self._init_db()
+
+    def _get_connection(self) -> sqlite3.Connection:
+        """Get thread-local database connection."""
+        if not hasattr(self._local, "conn") or self._local.conn is None:
+            conn = sqlite3.connect(str(self.db_path), check_same_thread=False, timeout=30.0)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return self._local.conn
+
+    @contextmanager
+    def _transaction(self):
+        """Context manager for database transactions."""
+        conn = self._get_connection()
+        try:
+            yield conn
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+
+    def _init_db(self):
+        with self._transaction() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS enrichment_cache (
+                    url_key TEXT NOT NULL,
+                    provider TEXT NOT NULL,
+                    found INTEGER NOT NULL,
+                    payload TEXT,
+                    fetched_at REAL NOT NULL,
+                    expires_at REAL NOT NULL,
+                    last_access REAL NOT NULL,
+                    PRIMARY KEY (url_key, provider)
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_enrichment_cache_access ON enrichment_cache(last_access)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_enrichment_cache_expires ON enrichment_cache(expires_at)")
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self.counters[name] += 1
+
+    # ── Reads ────────────────────────────────────────────────────
+
+    def get(self, url_key: str, provider: str, required_fields: Iterable[str] = ()) -> Optional[CacheLookup]:
+        """
+        Return the cached result for (url_key, provider), or None on a miss.
+
+        Sections older than their TTL are left out of `fields` and listed in
+        `stale_fields`; if any of `required_fields` is stale the read is a miss.
+        """
+        now = time.time()
+        try:
+            conn = self._get_connection()
+            row = conn.execute(
+                "SELECT found, payload, fetched_at, expires_at FROM enrichment_cache WHERE url_key = ? AND provider = ?",
+                (url_key, provider),
+            ).fetchone()
+        except sqlite3.Error as exc:
+            logger.warning("Enrichment cache read failed: %s", exc)
+            row = None
+
+        if row is None or row["expires_at"] <= now:
+            self._count("misses")
+            return None
+
+        fetched_at = row["fetched_at"]
+        if not row["found"]:
+            self._touch(url_key, provider, now)
+            self._count("negative_hits")
+            return CacheLookup(found=False, fetched_at=fetched_at)
+
+        payload = json.loads(row["payload"] or "{}")
+        fresh: Dict[str, Any] = {}
+        stale: List[str] = []
+        for name, value in payload.items():
+            ttl = self.field_ttls.get(name)
+            if ttl is None or fetched_at + ttl > now:
+                fresh[name] = value
+            else:
+                stale.append(name)
+
+        if any(name in stale or name not in fresh for name in required_fields):
+            self._count("misses")
+            return None
+
+        self._touch(url_key, provider, now)
+        self._count("hits")
+        return CacheLookup(found=True, fields=fresh, stale_fields=stale, fetched_at=fetched_at)
+
+    def _touch(self, url_key: str, provider: str, now: float) -> None:
+        try:
+            with self._transaction() as conn:
+                conn.execute(
+                    "UPDATE enrichment_cache SET last_access = ? WHERE url_key = ? AND provider = ?",
+                    (now, url_key, provider),
+                )
+        except sqlite3.Error as exc:
+            logger.debug("Enrichment cache touch failed: %s", exc)
+
+    # ── Writes ───────────────────────────────────────────────────
+
+    def put(self, url_key: str, provider: str, fields: Dict[str, Any]) -> None:
+        """Store a positive result; expiry is the longest TTL among its sections."""
+        ttl = max((self.field_ttls.get(name, 0) for name in fields), default=0)
+        if ttl <= 0:
+            ttl = max(self.field_ttls.values(), default=DEFAULT_NEGATIVE_TTL_SECONDS)
+        self._write(url_key, provider, True, json.dumps(fields, default=str), ttl)
+
+    def put_negative(self, url_key: str, provider: str) -> None:
+        """Remember that the provider had no match for this lead."""
+        self._write(url_key, provider, False, None, self.negative_ttl)
+
+    def _write(self, url_key: str, provider: str, found: bool, payload: Optional[str], ttl: int) -> None:
+        now = time.time()
+        try:
+            with self._transaction() as conn:
+                conn.execute("""
+                    INSERT INTO enrichment_cache (url_key, provider, found, payload, fetched_at, expires_at, last_access)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                    ON CONFLICT(url_key, provider) DO UPDATE SET
+                        found = excluded.found,
+                        payload = excluded.payload,
+                        fetched_at = excluded.fetched_at,
+                        expires_at = excluded.expires_at,
+                        last_access = excluded.last_access
+                """, (url_key, provider, int(found), payload, now, now + ttl, now))
+        except sqlite3.Error as exc:
+            logger.warning("Enrichment cache write failed: %s", exc)
+            return
+
+        with self._lock:
+            self._writes_since_evict += 1
+            due = self._writes_since_evict >= EVICT_EVERY_WRITES
+            if due:
+                self._writes_since_evict = 0
+        if due:
+            self.evict()
+
+    def invalidate(self, url_key: str, provider: Optional[str] = None) -> int:
+        """Drop cached results for a lead (one provider or all). Returns rows removed."""
+        with self._transaction() as conn:
+            if provider:
+                cur = conn.execute(
+                    "DELETE FROM enrichment_cache WHERE url_key = ? AND provider = ?", (url_key, provider)
+                )
+            else:
+                cur = conn.execute("DELETE FROM enrichment_cache WHERE url_key = ?", (url_key,))
+            return cur.rowcount
+
+    def evict(self) -> Dict[str, int]:
+        """Delete expired rows, then least-recently-used rows beyond max_entries."""
+        now = time.time()
+        with self._transaction() as conn:
+            expired = conn.execute("DELETE FROM enrichment_cache WHERE expires_at <= ?", (now,)).rowcount
+            total = conn.execute("SELECT COUNT(*) FROM enrichment_cache").fetchone()[0]
+            overflow = max(0, total - self.max_entries)
+            evicted = 0
+            if overflow:
+                evicted = conn.execute("""
+                    DELETE FROM enrichment_cache WHERE rowid IN (
+                        SELECT rowid FROM enrichment_cache ORDER BY last_access ASC LIMIT ?
+                    )
+                """, (overflow,)).rowcount
+        return {"expired": expired, "evicted": evicted}
+
+    # ── Metrics ──────────────────────────────────────────────────
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Entry counts plus this process's hit/miss counters."""
+        conn = self._get_connection()
+        row = conn.execute(
+            "SELECT COUNT(*) AS total, COALESCE(SUM(CASE WHEN found = 0 THEN 1 ELSE 0 END), 0) AS negative "
+            "FROM enrichment_cache"
+        ).fetchone()
+        with self._lock:
+            counters = dict(self.counters)
+        lookups = counters["hits"] + counters["negative_hits"] + counters["misses"]
+        served = counters["hits"] + counters["negative_hits"]
+        return {
+            "entries": row["total"],
+            "negative_entries": row["negative"],
+            "max_entries": self.max_entries,
+            **counters,
+            "lookups": lookups,
+            "hit_rate": round(served / lookups * 100, 2) if lookups else 0.0,
+        }
+
+
+_cache_instance: Optional[EnrichmentCache] = None
+_cache_lock = threading.Lock()
+
+
+def cache_enabled() -> bool:
+    return os.getenv("ENRICHMENT_CACHE_ENABLED", "").strip().lower() in ("1", "true", "yes")
+
+
+def get_enrichment_cache() -> Optional[EnrichmentCache]:
+    """Process-wide cache when ENRICHMENT_CACHE_ENABLED is set, else None."""
+    global _cache_instance
+    if not cache_enabled():
+        return None
+    with _cache_lock:
+        if _cache_instance is None:
+            try:
+                _cache_instance = EnrichmentCache()
+            except Exception as exc:
+                logger.warning("Enrichment cache unavailable: %s", exc)
+                return None
+        return _cache_instance
@@ -1,14 +1,26 @@
 """
 Event logging module for SDR automation.
 Writes structured events to JSONL format.
+
+Storage layout (next to the legacy .hive-mind/events.jsonl):
+
+    events/2026-01-31.jsonl      one segment per UTC day, append-only
+    events/2026-01-31.idx        sidecar index: "event_type<TAB>offset<TAB>length" per event
+
+Readers (iter_events / count_events) only open the segments whose day falls
+in the requested range, and type-filtered reads seek straight to the indexed
+offsets. Events still in the legacy single file are read as before until
+migrate_legacy_events() splits it into segments.
 """
 
 import json
+import os
 import uuid
-from datetime import datetime, timezone
+from collections import Counter
+from datetime import date, datetime, timedelta, timezone
 from enum import Enum
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Iterable, Iterator, Optional
 
 
 class EventType(Enum):
@@ -37,6 +49,18 @@ class EventType(Enum):
 
 EVENTS_FILE = Path(".hive-mind/events.jsonl")
 
+SEGMENT_SUFFIX = ".jsonl"
+INDEX_SUFFIX = ".idx"
+
+# segment path -> ((segment size, index size), per-type counts)
+_COUNT_CACHE: dict[Path, tuple[tuple[Optional[int], int], Counter]] = {}
+
+
+def segments_dir(events_file: Optional[Path] = None) -> Path:
+    """Directory holding the day segments for a given legacy events file."""
+    events_file = Path(events_file or EVENTS_FILE)
+    return events_file.parent / "events"
+
 
 def log_event(
     event_type: EventType,
@@ -45,31 +69,411 @@ def log_event(
 ) -> str:
     """
     Log an event to the JSONL event store.
-    
+
     Args:
         event_type: The type of event being logged
         payload: Event-specific data
         metadata: Optional additional context
-        
+
     Returns:
         The generated event_id
     """
     event_id = str(uuid.uuid4())
     timestamp = datetime.now(timezone.utc).isoformat()
-    
+
     event = {
         "timestamp": timestamp,
         "event_id": event_id,
         "event_type": event_type.value,
         "payload": payload
     }
-    
+
     if metadata:
         event["metadata"] = metadata
-    
-    EVENTS_FILE.parent.mkdir(parents=True, exist_ok=True)
-    
-    with open(EVENTS_FILE, "a", encoding="utf-8") as f:
-        f.write(json.dumps(event) + "\n")
-    
+
+    write_events([event])
+
     return event_id
+
+
+def write_events(events: Iterable[dict[str, Any]], events_file: Optional[Path] = None) -> int:
+    """
+    Append events to their day segments and sidecar indexes.
+
+    Events are grouped by the UTC day of their timestamp; each day gets one
+    O_APPEND write to the segment and one to its index, so concurrent
+    writers never interleave partial lines.
+
+    Returns:
+        Number of events written
+    """
+    by_day: dict[str, list[bytes]] = {}
+    types: dict[str, list[str]] = {}
+    for event in events:
+        day = _event_day(event) or datetime.now(timezone.utc).date()
+        key = day.isoformat()
+        by_day.setdefault(key, []).append((json.dumps(event) + "\n").encode("utf-8"))
+        types.setdefault(key, []).append(_index_safe(event.get("event_type")))
+
+    if not by_day:
+        return 0
+
+    directory = segments_dir(events_file)
+    directory.mkdir(parents=True, exist_ok=True)
+    written = 0
+    for key, lines in by_day.items():
+        data = b"".join(lines)
+        fd = os.open(directory / f"{key}{SEGMENT_SUFFIX}", os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+        try:
+            os.write(fd, data)
+            # With O_APPEND the offset lands at the end of this write, even if
+            # another process appended in between
+            offset = os.lseek(fd, 0, os.SEEK_CUR) - len(data)
+        finally:
+            os.close(fd)
+
+        index_lines = []
+        for event_type, line in zip(types[key], lines):
+            index_lines.append(f"{event_type}\t{offset}\t{len(line)}\n")
+            offset += len(line)
+        fd = os.open(directory / f"{key}{INDEX_SUFFIX}", os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+        try:
+            os.write(fd, "".join(index_lines).encode("utf-8"))
+        finally:
+            os.close(fd)
+        written += len(lines)
+    return written
+
+
+def iter_events(
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+    event_types: Optional[Iterable[str]] = None,
+    events_file: Optional[Path] = None
+) -> Iterator[dict[str, Any]]:
+    """
+    Yield events in [start_date, end_date), optionally limited to event types.
+
+    Legacy events.jsonl entries come first, then day segments in date order.
+    Only segments for days overlapping the range are opened; with a type
+    filter, only the indexed lines of those types are read.
+    """
+    events_file = Path(events_file or EVENTS_FILE)
+    wanted = set(event_types) if event_types else None
+
+    if events_file.exists():
+        yield from _iter_legacy(events_file, start_date, end_date, wanted)
+
+    for day, segment in _segments_in_range(segments_dir(events_file), start_date, end_date):
+        whole_day = _covers_day(day, start_date, end_date)
+        for event in _iter_segment(segment, wanted):
+            if not whole_day and not _in_range(event, start_date, end_date):
+                continue
+            yield event
+
+
+def count_events(
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+    event_types: Optional[Iterable[str]] = None,
+    events_file: Optional[Path] = None
+) -> int:
+    """
+    Count events, answering from the sidecar indexes where possible.
+
+    Whole days are counted from their index without reading the segment;
+    partial days at the range edges and the legacy file are read.
+    """
+    events_file = Path(events_file or EVENTS_FILE)
+    wanted = set(event_types) if event_types else None
+    total = 0
+
+    if events_file.exists():
+        if start_date is None and end_date is None and wanted is None:
+            with open(events_file, "rb") as f:
+                total += sum(1 for line in f if line.strip())
+        else:
+            total += sum(1 for _ in _iter_legacy(events_file, start_date, end_date, wanted))
+
+    for day, segment in _segments_in_range(segments_dir(events_file), start_date, end_date):
+        whole_day = _covers_day(day, start_date, end_date)
+        if whole_day and wanted is None:
+            total += _day_count(segment)
+        elif whole_day:
+            counts = _day_type_counts(segment)
+            total += sum(counts[t] for t in wanted)
+        else:
+            total += sum(1 for event in _iter_segment(segment, wanted)
+                         if _in_range(event, start_date, end_date))
+    return total
+
+
+def recent_events(limit: int = 500, events_file: Optional[Path] = None) -> list[dict[str, Any]]:
+    """
+    The last `limit` events, oldest first.
+
+    Reads day segments newest-first and stops once enough events are
+    collected; the legacy file is only read if the segments fall short.
+    """
+    events_file = Path(events_file or EVENTS_FILE)
+    chunks: list[list[dict[str, Any]]] = []
+    remaining = limit
+    for _, segment in reversed(_segments_in_range(segments_dir(events_file), None, None)):
+        if remaining <= 0:
+            break
+        day_events = list(_iter_segment(segment, None))[-remaining:]
+        chunks.append(day_events)
+        remaining -= len(day_events)
+    if remaining > 0 and events_file.exists():
+        chunks.append(list(_iter_legacy(events_file, None, None, None))[-remaining:])
+    return [event for chunk in reversed(chunks) for event in chunk]
+
+
+def migrate_legacy_events(events_file: Optional[Path] = None, batch_size: int = 10_000) -> int:
+    """
+    Split the legacy events.jsonl into day segments.
+
+    The legacy file is renamed to events.jsonl.migrated afterwards so it is
+    not read twice. Lines that are not valid JSON are dropped.
+
+    Returns:
+        Number of events migrated
+    """
+    events_file = Path(events_file or EVENTS_FILE)
+    if not events_file.exists():
+        return 0
+
+    migrated = 0
+    batch: list[dict[str, Any]] = []
+    with open(events_file, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                batch.append(json.loads(line))
+            except json.JSONDecodeError:
+                continue
+            if len(batch) >= batch_size:
+                migrated += write_events(batch, events_file)
+                batch = []
+    migrated += write_events(batch, events_file)
+    events_file.rename(events_file.with_name(events_file.name + ".migrated"))
+    return migrated
+
+
+# ---------------------------------------------------------------------------
+# Internals
+# ---------------------------------------------------------------------------
+
+def _index_safe(value: Any) -> str:
+    return str(value or "").replace("\t", " ").replace("\n", " ")
+
+
+def _parse_ts(value: Any) -> Optional[datetime]:
+    if not value:
+        return None
+    try:
+        ts = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if ts.tzinfo is None:
+        ts = ts.replace(tzinfo=timezone.utc)
+    return ts
+
+
+def _event_day(event: dict[str, Any]) -> Optional[date]:
+    ts = _parse_ts(event.get("timestamp"))
+    return ts.astimezone(timezone.utc).date() if ts else None
+
+
+def _covers_day(day: date, start_date: Optional[datetime], end_date: Optional[datetime]) -> bool:
+    """True if [start_date, end_date) contains the whole UTC day."""
+    day_start = datetime(day.year, day.month, day.day, tzinfo=timezone.utc)
+    return (
+        (start_date is None or start_date <= day_start)
+        and (end_date is None or day_start + timedelta(days=1) <= end_date)
+    )
+
+
+def _in_range(event: dict[str, Any], start_date: Optional[datetime], end_date: Optional[datetime]) -> bool:
+    """Date filter as load_events always applied it: untimestamped events pass, unparsable ones don't."""
+    if not event.get("timestamp"):
+        return True
+    ts = _parse_ts(event["timestamp"])
+    if ts is None:
+        return False
+    if start_date and ts < start_date:
+        return False
+    if end_date and ts >= end_date:
+        return False
+    return True
+
+
+def _iter_legacy(
+    events_file: Path,
+    start_date: Optional[datetime],
+    end_date: Optional[datetime],
+    wanted: Optional[set[str]]
+) -> Iterator[dict[str, Any]]:
+    """Linear read of the pre-segment single file (same filtering as before)."""
+    try:
+        with open(events_file, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    event = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                if not _in_range(event, start_date, end_date):
+                    continue
+                if wanted and event.get("event_type") not in wanted:
+                    continue
+                yield event
+    except OSError:
+        return
+
+
+def _segments_in_range(
+    directory: Path,
+    start_date: Optional[datetime],
+    end_date: Optional[datetime]
+) -> list[tuple[date, Path]]:
+    """Day segments overlapping [start_date, end_date), oldest first."""
+    if not directory.is_dir():
+        return []
+    first = start_date.astimezone(timezone.utc).date() if start_date else None
+    last = (end_date - timedelta(microseconds=1)).astimezone(timezone.utc).date() if end_date else None
+
+    segments = []
+    for path in directory.glob(f"*{SEGMENT_SUFFIX}"):
+        try:
+            day = date.fromisoformat(path.stem)
+        except ValueError:
+            continue
+        if (first and day < first) or (last and day > last):
+            continue
+        segments.append((day, path))
+    segments.sort()
+    return segments
+
+
+def _read_index(segment: Path) -> list[tuple[str, int, int]]:
+    """
+    (event_type, offset, length) for every line of a segment.
+
+    If the index is missing entries at the tail (a writer stopped between
+    the segment and index appends), the uncovered tail is indexed by
+    reading it.
+    """
+    entries: list[tuple[str, int, int]] = []
+    index_path = segment.with_suffix(INDEX_SUFFIX)
+    try:
+        with open(index_path, "r", encoding="utf-8") as f:
+            for line in f:
+                parts = line.rstrip("\n").split("\t")
+                if len(parts) == 3:
+                    entries.append((parts[0], int(parts[1]), int(parts[2])))
+    except (OSError, ValueError):
+        entries = []
+
+    covered = max((offset + length for _, offset, length in entries), default=0)
+    try:
+        size = segment.stat().st_size
+    except OSError:
+        return entries
+    if covered < size:
+        with open(segment, "rb") as f:
+            f.seek(covered)
+            offset = covered
+            for raw in f:
+                try:
+                    event_type = json.loads(raw).get("event_type")
+                except (json.JSONDecodeError, UnicodeDecodeError, AttributeError):
+                    event_type = None
+                if event_type is not None:
+                    entries.append((_index_safe(event_type), offset, len(raw)))
+                offset += len(raw)
+    return entries
+
+
+def _index_covers(raw: bytes, seg_size: Optional[int]) -> bool:
+    """True if the last index line ends exactly at the segment size (the usual case)."""
+    last = raw.rstrip(b"\n").rsplit(b"\n", 1)[-1].split(b"\t")
+    try:
+        return len(last) == 3 and int(last[1]) + int(last[2]) == seg_size
+    except ValueError:
+        return False
+
+
+def _day_count(segment: Path) -> int:
+    """Events in one segment: the index line count when it covers the segment."""
+    try:
+        raw = segment.with_suffix(INDEX_SUFFIX).read_bytes()
+        if _index_covers(raw, segment.stat().st_size):
+            return raw.count(b"\n")
+    except OSError:
+        pass
+    return sum(_day_type_counts(segment).values())
+
+
+def _day_type_counts(segment: Path) -> Counter:
+    """
+    Events per type for one segment, cached until the segment or index grows.
+
+    When the index covers the segment, types are tallied straight from the
+    index; otherwise the index is rebuilt with _read_index.
+    """
+    try:
+        seg_size = segment.stat().st_size
+        raw = segment.with_suffix(INDEX_SUFFIX).read_bytes()
+    except OSError:
+        raw, seg_size = b"", None
+    key = (seg_size, len(raw))
+    cached = _COUNT_CACHE.get(segment)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+
+    if raw and _index_covers(raw, seg_size):
+        counts = Counter(line.split(b"\t", 1)[0].decode("utf-8") for line in raw.splitlines())
+    else:
+        counts = Counter(event_type for event_type, _, _ in _read_index(segment))
+    _COUNT_CACHE[segment] = (key, counts)
+    return counts
+
+
+def _iter_segment(segment: Path, wanted: Optional[set[str]]) -> Iterator[dict[str, Any]]:
+    """Events of one segment; with a type filter, only indexed lines of those types are read."""
+    selected = None
+    if wanted is not None:
+        entries = _read_index(segment)
+        selected = [(offset, length) for event_type, offset, length in entries if event_type in wanted]
+        if not selected:
+            return
+        if len(selected) * 2 > len(entries):
+            selected = None  # most of the day matches: one sequential pass is cheaper
+
+    try:
+        with open(segment, "rb") as f:
+            if selected is None:
+                for raw in f:
+                    if not raw.strip():
+                        continue
+                    try:
+                        event = json.loads(raw)
+                    except (json.JSONDecodeError, UnicodeDecodeError):
+                        continue
+                    if wanted is None or event.get("event_type") in wanted:
+                        yield event
+                return
+
+            for offset, length in selected:
+                f.seek(offset)
+                try:
+                    yield json.loads(f.read(length))
+                except (json.JSONDecodeError, UnicodeDecodeError):
+                    continue
+    except OSError:
+        return
@@ -13,6 +13,14 @@ Sync Strategy:
 - Incremental sync: Every 15 minutes (recently modified only)
 - Real-time: Webhook updates from GHL
 
+Storage:
+    .hive-mind/ghl_cache/contacts.db (SQLite, WAL). One row per contact,
+    upserted only when its content changes, with an FTS5 trigram index over
+    name/email/company for substring search and tag / pipeline-stage
+    inverted indexes. Incremental sync resumes from the newest dateUpdated
+    returned by earlier sync pages (kept in sync_meta; webhook updates do
+    not move it). A legacy contacts.json cache is imported on first use.
+
 Usage:
     from core.ghl_local_sync import get_ghl_sync, GHLLocalSync
     
@@ -29,11 +37,15 @@ import os
 import sys
 import json
 import asyncio
+import hashlib
 import logging
+import sqlite3
+import threading
 import aiohttp
+from contextlib import contextmanager
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, Iterable, List, Any, Optional, Tuple
 from dataclasses import dataclass, asdict
 
 PROJECT_ROOT = Path(__file__).parent.parent
@@ -45,6 +57,80 @@ load_dotenv()
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("ghl_local_sync")
 
+# SQLite caps bound parameters per statement; IN (...) lookups stay below it
+_SQL_IN_CHUNK = 500
+
+# Trigram FTS cannot match substrings shorter than this; shorter queries scan
+_FTS_MIN_QUERY_CHARS = 3
+
+# sync_meta key for the delta-sync watermark (newest dateUpdated seen by a
+# sync_contacts() page; webhook and single-contact upserts never move it)
+_WATERMARK_KEY = "contacts_sync_watermark"
+
+
+def _parse_timestamp(value: Any) -> Optional[float]:
+    """ISO-8601 string to epoch seconds (naive values are UTC), or None."""
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    except (ValueError, TypeError):
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp()
+
+
+def _newest_date_updated(contacts: Iterable[Dict]) -> Optional[str]:
+    """dateUpdated of the most recently updated contact, or None."""
+    newest, newest_ts = None, None
+    for contact in contacts:
+        updated_ts = _parse_timestamp(contact.get("dateUpdated"))
+        if updated_ts is not None and (newest_ts is None or updated_ts > newest_ts):
+            newest, newest_ts = contact["dateUpdated"], updated_ts
+    return newest
+
+
+def _searchable_text(contact: Dict) -> str:
+    """Lowercased name/email/company text matched by search_contacts_local."""
+    return " ".join([
+        contact.get("firstName") or "",
+        contact.get("lastName") or "",
+        contact.get("email") or "",
+        contact.get("companyName") or "",
+    ]).lower()
+
+
+def _contact_tags(contact: Dict) -> List[str]:
+    """Distinct lowercased tags of a contact."""
+    return sorted({str(t).lower() for t in (contact.get("tags") or []) if t})
+
+
+def _contact_stages(contact: Dict) -> List[str]:
+    """Distinct lowercased pipeline stages (pipelineStage and pipeline_stage custom field)."""
+    stages = set()
+    stage = contact.get("pipelineStage")
+    if stage:
+        stages.add(str(stage).lower())
+
+    custom_fields = contact.get("customField") or contact.get("customFields") or {}
+    if isinstance(custom_fields, dict):
+        if custom_fields.get("pipeline_stage"):
+            stages.add(str(custom_fields["pipeline_stage"]).lower())
+    elif isinstance(custom_fields, list):
+        for cf in custom_fields:
+            if not isinstance(cf, dict):
+                continue
+            if (cf.get("key") or cf.get("name", "")).lower() == "pipeline_stage" and cf.get("value"):
+                stages.add(str(cf["value"]).lower())
+    return sorted(stages)
+
+
+def _content_hash(contact: Dict) -> str:
+    """Hash of the contact payload, ignoring local sync bookkeeping fields."""
+    payload = {k: v for k, v in contact.items() if k not in ("_synced_at", "_source")}
+    return hashlib.sha1(json.dumps(payload, sort_keys=True, default=str).encode()).hexdigest()
+
 
 @dataclass
 class SyncStats:
@@ -52,6 +138,7 @@ class SyncStats:
     last_full_sync: Optional[str] = None
     last_incremental_sync: Optional[str] = None
     contacts_synced: int = 0
+    contacts_unchanged: int = 0
     opportunities_synced: int = 0
     local_reads: int = 0
     api_reads_avoided: int = 0
@@ -72,18 +159,23 @@ class GHLLocalSync:
     
     GHL_BASE_URL = "https://services.leadconnectorhq.com"
     
-    def __init__(self):
+    def __init__(self, data_dir: Optional[Path] = None):
         self.api_key = os.getenv("GHL_API_KEY") or os.getenv("GHL_PROD_API_KEY")
         self.location_id = os.getenv("GHL_LOCATION_ID")
         
         # Local storage
-        self.data_dir = PROJECT_ROOT / ".hive-mind" / "ghl_cache"
+        self.data_dir = Path(data_dir or PROJECT_ROOT / ".hive-mind" / "ghl_cache")
         self.data_dir.mkdir(parents=True, exist_ok=True)
         
-        self.contacts_file = self.data_dir / "contacts.json"
+        self.db_path = self.data_dir / "contacts.db"
+        self.contacts_file = self.data_dir / "contacts.json"  # legacy, imported once
         self.opportunities_file = self.data_dir / "opportunities.json"
         self.stats_file = self.data_dir / "sync_stats.json"
         
+        self._local = threading.local()
+        self._fts_enabled = False
+        self._init_db()
+        
         # In-memory cache for hot data
         self._contacts: Dict[str, Dict] = {}
         self._opportunities: Dict[str, Dict] = {}
@@ -114,19 +206,100 @@ class GHLLocalSync:
         """Save sync statistics."""
         self.stats_file.write_text(json.dumps(asdict(self.stats), indent=2))
     
+    # =========================================================================
+    # LOCAL STORE (SQLite mirror)
+    # =========================================================================
+
+    def _get_connection(self) -> sqlite3.Connection:
+        """Get thread-local database connection."""
+        if not hasattr(self._local, "conn") or self._local.conn is None:
+            conn = sqlite3.connect(str(self.db_path), check_same_thread=False, timeout=30.0)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return self._local.conn
+
+    @contextmanager
+    def _transaction(self):
+        """Write transaction holding the write lock for its whole duration."""
+        conn = self._get_connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+
+    def _init_db(self):
+        conn = self._get_connection()
+        conn.executescript("""
+            CREATE TABLE IF NOT EXISTS contacts (
+                id TEXT PRIMARY KEY,
+                email TEXT,
+                date_updated TEXT,
+                updated_ts REAL,
+                content_hash TEXT NOT NULL,
+                searchable TEXT NOT NULL,
+                record TEXT NOT NULL,
+                synced_at TEXT
+            );
+            CREATE INDEX IF NOT EXISTS idx_contacts_email ON contacts(email);
+            CREATE INDEX IF NOT EXISTS idx_contacts_updated ON contacts(updated_ts);
+            -- Inverted indexes carry the contact rowid (insertion order) and id,
+            -- so lookups are covered by the primary key without joining contacts
+            CREATE TABLE IF NOT EXISTS contact_tags (
+                tag TEXT NOT NULL,
+                contact_rowid INTEGER NOT NULL,
+                contact_id TEXT NOT NULL,
+                PRIMARY KEY (tag, contact_rowid)
+            ) WITHOUT ROWID;
+            CREATE INDEX IF NOT EXISTS idx_contact_tags_contact ON contact_tags(contact_rowid);
+            CREATE TABLE IF NOT EXISTS contact_stages (
+                stage TEXT NOT NULL,
+                contact_rowid INTEGER NOT NULL,
+                contact_id TEXT NOT NULL,
+                PRIMARY KEY (stage, contact_rowid)
+            ) WITHOUT ROWID;
+            CREATE INDEX IF NOT EXISTS idx_contact_stages_contact ON contact_stages(contact_rowid);
+            CREATE TABLE IF NOT EXISTS sync_meta (
+                key TEXT PRIMARY KEY,
+                value TEXT
+            );
+        """)
+        if "synced_at" not in {row["name"] for row in conn.execute("PRAGMA table_info(contacts)")}:
+            # Stores created before synced_at was kept outside the record
+            conn.execute("ALTER TABLE contacts ADD COLUMN synced_at TEXT")
+        try:
+            conn.execute(
+                "CREATE VIRTUAL TABLE IF NOT EXISTS contacts_fts "
+                "USING fts5(searchable, contact_id UNINDEXED, tokenize='trigram')"
+            )
+            self._fts_enabled = True
+        except sqlite3.OperationalError as e:
+            # SQLite built without FTS5 / trigram (< 3.34): searches scan instead
+            logger.warning(f"FTS5 trigram index unavailable, using scans: {e}")
+
     def _load_local_data(self):
-        """Load cached data from disk."""
-        if self.contacts_file.exists():
-            try:
-                contacts = json.loads(self.contacts_file.read_text())
-                self._contacts = {c["id"]: c for c in contacts if "id" in c}
-                self._contact_by_email = {
-                    c.get("email", "").lower(): c["id"] 
-                    for c in contacts if c.get("email")
-                }
-                logger.info(f"Loaded {len(self._contacts)} contacts from cache")
-            except Exception as e:
-                logger.warning(f"Failed to load contacts cache: {e}")
+        """Load cached data from the local store (importing legacy JSON once)."""
+        try:
+            self._migrate_legacy_json()
+            rows = self._get_connection().execute(
+                "SELECT record, synced_at FROM contacts ORDER BY rowid"
+            ).fetchall()
+            self._contacts = {}
+            for row in rows:
+                contact = json.loads(row["record"])
+                if row["synced_at"]:
+                    contact["_synced_at"] = row["synced_at"]
+                self._contacts[contact["id"]] = contact
+            self._contact_by_email = {
+                c["email"].lower(): cid for cid, c in self._contacts.items() if c.get("email")
+            }
+            logger.info(f"Loaded {len(self._contacts)} contacts from cache")
+        except Exception as e:
+            logger.warning(f"Failed to load contacts cache: {e}")
         
         if self.opportunities_file.exists():
             try:
@@ -135,19 +308,134 @@ class GHLLocalSync:
                 logger.info(f"Loaded {len(self._opportunities)} opportunities from cache")
             except Exception as e:
                 logger.warning(f"Failed to load opportunities cache: {e}")
-    
-    def _save_local_data(self):
-        """Save cached data to disk."""
-        try:
-            self.contacts_file.write_text(
-                json.dumps(list(self._contacts.values()), indent=2)
-            )
-            self.opportunities_file.write_text(
-                json.dumps(list(self._opportunities.values()), indent=2)
+
+    def _migrate_legacy_json(self) -> int:
+        """Import contacts.json from the pre-SQLite cache layout (once)."""
+        conn = self._get_connection()
+        done = conn.execute(
+            "SELECT value FROM sync_meta WHERE key = 'legacy_json_migrated_at'"
+        ).fetchone()
+        if done or not self.contacts_file.exists():
+            return 0
+        contacts = json.loads(self.contacts_file.read_text())
+        written = self._upsert_contacts(c for c in contacts if isinstance(c, dict) and "id" in c)
+        with self._transaction() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO sync_meta (key, value) VALUES ('legacy_json_migrated_at', ?)",
+                (datetime.now(timezone.utc).isoformat(),)
             )
-        except Exception as e:
-            logger.error(f"Failed to save local data: {e}")
-    
+        logger.info(f"Imported {written} contacts from legacy {self.contacts_file.name}")
+        return written
+
+    def _upsert_contacts(self, contacts: Iterable[Dict], watermark: Optional[str] = None) -> int:
+        """
+        Write contacts to the local store in one transaction, updating the
+        search, tag and stage indexes. Contacts whose content is unchanged
+        are skipped apart from their synced_at column. A sync page passes its newest dateUpdated as watermark,
+        which is stored in the same transaction if it is newer than the
+        current one. Returns the number of rows written.
+        """
+        written = 0
+        resynced: List[Tuple[str, str]] = []
+        with self._transaction() as conn:
+            for contact in contacts:
+                contact_id = contact["id"]
+                digest = _content_hash(contact)
+                row = conn.execute(
+                    "SELECT rowid, content_hash FROM contacts WHERE id = ?", (contact_id,)
+                ).fetchone()
+                if row is not None and row["content_hash"] == digest:
+                    if contact.get("_synced_at"):
+                        resynced.append((contact["_synced_at"], contact_id))
+                    continue
+
+                searchable = _searchable_text(contact)
+                conn.execute("""
+                    INSERT INTO contacts (id, email, date_updated, updated_ts, content_hash, searchable, record, synced_at)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                    ON CONFLICT(id) DO UPDATE SET
+                        email = excluded.email,
+                        date_updated = excluded.date_updated,
+                        updated_ts = excluded.updated_ts,
+                        content_hash = excluded.content_hash,
+                        searchable = excluded.searchable,
+                        record = excluded.record,
+                        synced_at = excluded.synced_at
+                """, (
+                    contact_id,
+                    (contact.get("email") or "").lower() or None,
+                    contact.get("dateUpdated"),
+                    _parse_timestamp(contact.get("dateUpdated")),
+                    digest,
+                    searchable,
+                    json.dumps(contact),
+                    contact.get("_synced_at"),
+                ))
+                rowid = row["rowid"] if row is not None else conn.execute(
+                    "SELECT rowid FROM contacts WHERE id = ?", (contact_id,)
+                ).fetchone()[0]
+
+                if self._fts_enabled:
+                    conn.execute("DELETE FROM contacts_fts WHERE rowid = ?", (rowid,))
+                    conn.execute(
+                        "INSERT INTO contacts_fts (rowid, searchable, contact_id) VALUES (?, ?, ?)",
+                        (rowid, searchable, contact_id)
+                    )
+                conn.execute("DELETE FROM contact_tags WHERE contact_rowid = ?", (rowid,))
+                conn.executemany(
+                    "INSERT INTO contact_tags (tag, contact_rowid, contact_id) VALUES (?, ?, ?)",
+                    [(tag, rowid, contact_id) for tag in _contact_tags(contact)]
+                )
+                conn.execute("DELETE FROM contact_stages WHERE contact_rowid = ?", (rowid,))
+                conn.executemany(
+                    "INSERT INTO contact_stages (stage, contact_rowid, contact_id) VALUES (?, ?, ?)",
+                    [(stage, rowid, contact_id) for stage in _contact_stages(contact)]
+                )
+                written += 1
+
+            if resynced:
+                conn.executemany("UPDATE contacts SET synced_at = ? WHERE id = ?", resynced)
+
+            if watermark is not None:
+                row = conn.execute(
+                    "SELECT value FROM sync_meta WHERE key = ?", (_WATERMARK_KEY,)
+                ).fetchone()
+                current_ts = _parse_timestamp(row["value"]) if row else None
+                if current_ts is None or (_parse_timestamp(watermark) or 0) > current_ts:
+                    conn.execute(
+                        "INSERT OR REPLACE INTO sync_meta (key, value) VALUES (?, ?)",
+                        (_WATERMARK_KEY, watermark)
+                    )
+        return written
+
+    def _contacts_watermark(self) -> Optional[str]:
+        """Newest dateUpdated seen by sync_contacts() (delta sync resumes from here)."""
+        row = self._get_connection().execute(
+            "SELECT value FROM sync_meta WHERE key = ?", (_WATERMARK_KEY,)
+        ).fetchone()
+        return row["value"] if row else None
+
+    def _fetch_pairs(self, sql: str, params: Iterable[Any]) -> List[Tuple[int, str]]:
+        """Run a (rowid, id) query, returning plain tuples."""
+        cursor = self._get_connection().cursor()
+        cursor.row_factory = None
+        return cursor.execute(sql, tuple(params)).fetchall()
+
+    def _query_rows(self, sql: str, values: List[str]) -> List[Tuple[int, str]]:
+        """Run a (rowid, id) query with an IN (...) list, chunked under SQLite's parameter cap."""
+        rows: List[Tuple[int, str]] = []
+        for i in range(0, len(values), _SQL_IN_CHUNK):
+            chunk = values[i:i + _SQL_IN_CHUNK]
+            placeholders = ",".join("?" * len(chunk))
+            rows.extend(self._fetch_pairs(sql.format(placeholders=placeholders), chunk))
+        return rows
+
+    def _ordered_contacts(self, rows: Iterable[Tuple[int, str]], distinct: bool = False) -> List[Dict]:
+        """Cached contacts for (rowid, id) rows in insertion order; pass distinct=True if rows are unique."""
+        ordered = sorted(rows) if distinct else sorted(set(rows))
+        contacts = self._contacts
+        return [contacts[cid] for _, cid in ordered if cid in contacts]
+
     async def _get_session(self) -> aiohttp.ClientSession:
         """Get or create aiohttp session."""
         if self._session is None or self._session.closed:
@@ -193,7 +481,7 @@ class GHLLocalSync:
             self._contacts[contact_id] = contact
             if contact.get("email"):
                 self._contact_by_email[contact["email"].lower()] = contact_id
-            self._save_local_data()
+            self._upsert_contacts([contact])
         
         return contact
     
@@ -221,7 +509,7 @@ class GHLLocalSync:
         if contact:
             self._contacts[contact["id"]] = contact
             self._contact_by_email[email_lower] = contact["id"]
-            self._save_local_data()
+            self._upsert_contacts([contact])
         
         return contact
     
@@ -243,19 +531,21 @@ class GHLLocalSync:
         query_lower = query.lower()
         self.stats.local_reads += 1
         
-        matches = []
-        for contact in self._contacts.values():
-            searchable = " ".join([
-                contact.get("firstName", ""),
-                contact.get("lastName", ""),
-                contact.get("email", ""),
-                contact.get("companyName", ""),
-            ]).lower()
-            
-            if query_lower in searchable:
-                matches.append(contact)
+        if not query_lower:
+            return list(self._contacts.values())
         
-        return matches
+        if self._fts_enabled and len(query_lower) >= _FTS_MIN_QUERY_CHARS:
+            # Quoted trigram phrase == substring match on the searchable text
+            phrase = '"' + query_lower.replace('"', '""') + '"'
+            rows = self._fetch_pairs(
+                "SELECT rowid, contact_id FROM contacts_fts WHERE contacts_fts MATCH ?", (phrase,)
+            )
+        else:
+            rows = self._fetch_pairs(
+                "SELECT rowid, id FROM contacts WHERE instr(searchable, ?) > 0", (query_lower,)
+            )
+        
+        return self._ordered_contacts(rows, distinct=True)
     
     # =========================================================================
     # SEARCH / FILTER (Local cache, instant)
@@ -273,19 +563,21 @@ class GHLLocalSync:
             List of matching contacts
         """
         self.stats.local_reads += 1
-        tags_lower = [t.lower() for t in tags]
-        matches = []
-
-        for contact in self._contacts.values():
-            contact_tags = [t.lower() for t in (contact.get("tags") or [])]
-            if match_all:
-                if all(t in contact_tags for t in tags_lower):
-                    matches.append(contact)
-            else:
-                if any(t in contact_tags for t in tags_lower):
-                    matches.append(contact)
-
-        return matches
+        tags_lower = sorted({t.lower() for t in tags})
+        if not tags_lower:
+            return list(self._contacts.values()) if match_all else []
+
+        sql = "SELECT contact_rowid, contact_id FROM contact_tags WHERE tag IN ({placeholders})"
+        if not match_all:
+            return self._ordered_contacts(self._query_rows(sql, tags_lower))
+
+        rows = None
+        for tag in tags_lower:
+            tag_rows = set(self._query_rows(sql, [tag]))
+            rows = tag_rows if rows is None else rows & tag_rows
+            if not rows:
+                return []
+        return self._ordered_contacts(rows)
 
     def search_by_pipeline_stage(self, stages: List[str]) -> List[Dict]:
         """
@@ -295,36 +587,19 @@ class GHLLocalSync:
         Checks: pipelineStage, customField.pipeline_stage, and tags containing stage names.
         """
         self.stats.local_reads += 1
-        stages_lower = [s.lower() for s in stages]
-        matches = []
-
-        for contact in self._contacts.values():
-            # Check direct pipeline stage field
-            stage = (contact.get("pipelineStage") or "").lower()
-            if stage and stage in stages_lower:
-                matches.append(contact)
-                continue
-
-            # Check custom fields
-            custom_fields = contact.get("customField") or contact.get("customFields") or {}
-            if isinstance(custom_fields, dict):
-                ps = (custom_fields.get("pipeline_stage") or "").lower()
-                if ps and ps in stages_lower:
-                    matches.append(contact)
-                    continue
-            elif isinstance(custom_fields, list):
-                for cf in custom_fields:
-                    if (cf.get("key") or cf.get("name", "")).lower() == "pipeline_stage":
-                        if (cf.get("value") or "").lower() in stages_lower:
-                            matches.append(contact)
-                            break
+        stages_lower = sorted({s.lower() for s in stages})
+        if not stages_lower:
+            return []
 
-            # Check tags containing stage names
-            contact_tags = [t.lower() for t in (contact.get("tags") or [])]
-            if any(s in contact_tags for s in stages_lower):
-                matches.append(contact)
-
-        return matches
+        rows = self._query_rows(
+            "SELECT contact_rowid, contact_id FROM contact_stages WHERE stage IN ({placeholders})",
+            stages_lower
+        )
+        rows += self._query_rows(
+            "SELECT contact_rowid, contact_id FROM contact_tags WHERE tag IN ({placeholders})",
+            stages_lower
+        )
+        return self._ordered_contacts(rows)
 
     def get_stale_contacts(self, inactive_days: int = 30) -> List[Dict]:
         """
@@ -458,10 +733,11 @@ class GHLLocalSync:
                 "limit": min(limit, 100)
             }
             
-            if not full and self.stats.last_incremental_sync:
-                # Only get contacts modified since last sync
-                last_sync = datetime.fromisoformat(self.stats.last_incremental_sync.replace("Z", "+00:00"))
-                params["startAfter"] = last_sync.isoformat()
+            # Mirrors without a stored watermark resume from the last sync time, as before
+            watermark = None if full else (self._contacts_watermark() or self.stats.last_incremental_sync)
+            if watermark:
+                # Only get contacts modified after the newest one a sync has seen
+                params["startAfter"] = watermark
             
             url = f"{self.GHL_BASE_URL}/contacts/"
             
@@ -470,15 +746,21 @@ class GHLLocalSync:
                     data = await resp.json()
                     contacts = data.get("contacts", [])
                     
+                    watermark_ts = _parse_timestamp(watermark)
+                    changed = []
                     for contact in contacts:
+                        updated_ts = _parse_timestamp(contact.get("dateUpdated"))
+                        if watermark_ts and updated_ts and updated_ts < watermark_ts:
+                            continue
                         contact["_synced_at"] = datetime.now(timezone.utc).isoformat()
                         self._contacts[contact["id"]] = contact
                         if contact.get("email"):
                             self._contact_by_email[contact["email"].lower()] = contact["id"]
-                        synced += 1
+                        changed.append(contact)
                     
-                    self._save_local_data()
+                    synced = self._upsert_contacts(changed, watermark=_newest_date_updated(contacts))
                     self.stats.contacts_synced += synced
+                    self.stats.contacts_unchanged += len(contacts) - synced
                     
                     if full:
                         self.stats.last_full_sync = datetime.now(timezone.utc).isoformat()
@@ -516,7 +798,7 @@ class GHLLocalSync:
         if contact_data.get("email"):
             self._contact_by_email[contact_data["email"].lower()] = contact_id
         
-        self._save_local_data()
+        self._upsert_contacts([contact_data])
         logger.info(f"Webhook update: {event_type} for contact {contact_id}")
     
     # =========================================================================
@@ -531,6 +813,8 @@ class GHLLocalSync:
             "local_reads": self.stats.local_reads,
             "api_reads_avoided": self.stats.api_reads_avoided,
             "total_synced": self.stats.contacts_synced,
+            "unchanged_skipped": self.stats.contacts_unchanged,
+            "contacts_watermark": self._contacts_watermark(),
             "sync_errors": self.stats.sync_errors,
             "last_full_sync": self.stats.last_full_sync,
             "last_incremental_sync": self.stats.last_incremental_sync,
@@ -417,19 +417,26 @@ class HotLeadDetector:
 
 class WebhookQueueProcessor:
     """
-    Processes webhook events from the queue file.
+    Processes webhook events from the webhook EventQueue.
     
     Runs as a background service, polling for new events
     and passing them through the HotLeadDetector.
     """
     
-    def __init__(self, poll_interval: float = 2.0):
+    def __init__(self, poll_interval: float = 2.0, event_queue=None):
         self.detector = HotLeadDetector()
         self.poll_interval = poll_interval
         self.running = False
-        self.queue_file = Path(".hive-mind/webhook_queue.json")
+        self.event_queue = event_queue
         self.processed_ids: set = set()
     
+    def _get_queue(self):
+        """The webhook EventQueue (opened on first use)."""
+        if self.event_queue is None:
+            from webhooks.webhook_server import EventQueue
+            self.event_queue = EventQueue()
+        return self.event_queue
+    
     async def start(self):
         """Start the queue processor."""
         self.running = True
@@ -450,47 +457,27 @@ class WebhookQueueProcessor:
     
     async def _process_pending_events(self):
         """Process pending events from the queue."""
-        if not self.queue_file.exists():
-            return
-        
-        try:
-            with open(self.queue_file, 'r') as f:
-                data = json.load(f)
-        except Exception:
-            return
+        queue = self._get_queue()
+        # The webhook server appends from its own process
+        queue.refresh()
         
-        events = data.get("events", [])
-        
-        for event in events:
-            event_id = event.get("event_id")
-            
-            # Skip already processed
-            if event_id in self.processed_ids:
+        for event in queue.get_unprocessed():
+            # Skip events whose ack failed to persist last time
+            if event.event_id in self.processed_ids:
                 continue
             
-            # Skip already marked as processed in queue
-            if event.get("processed"):
-                self.processed_ids.add(event_id)
-                continue
-            
-            # Process the event
-            payload = event.get("payload", {})
-            source = event.get("source", "")
-            
-            if source == "gohighlevel":
-                alert = await self.detector.process_webhook_event(payload)
-                if alert:
-                    logger.info(f"Alert created: {alert.alert_id}")
-            
-            self.processed_ids.add(event_id)
+            error = None
+            if event.source == "gohighlevel":
+                try:
+                    alert = await self.detector.process_webhook_event(event.payload)
+                    if alert:
+                        logger.info(f"Alert created: {alert.alert_id}")
+                except Exception as e:
+                    logger.error(f"Error processing event {event.event_id}: {e}")
+                    error = str(e)
             
-            # Mark as processed in queue file
-            event["processed"] = True
-            event["processed_at"] = datetime.now(timezone.utc).isoformat()
-        
-        # Save updated queue
-        with open(self.queue_file, 'w') as f:
-            json.dump(data, f, indent=2)
+            self.processed_ids.add(event.event_id)
+            queue.mark_processed(event.event_id, error=error)
 
 
 # =============================================================================
@@ -18,10 +18,21 @@ Signal Sources:
     - HeyReach webhooks: connection_accepted, message_reply, campaign_completed
     - RB2B webhooks: visitor identification (website intent)
     - Time-based rules: ghosting (72h no open), stalling (7d no reply)
+
+Storage:
+    .hive-mind/lead_status.db (SQLite, WAL). One row per lead keyed by
+    lowercased email, indexed on (status, updated_ts) so decay detection is
+    a range query, plus a per-status counter table maintained in the same
+    transaction as each update so the status summary never scans leads.
+    Records from the old one-file-per-lead layout (.hive-mind/lead_status/)
+    are imported on first use.
 """
 
 import json
 import logging
+import sqlite3
+import threading
+from contextlib import contextmanager
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
 from typing import Dict, List, Optional, Any, Tuple
@@ -65,34 +76,225 @@ GHOST_THRESHOLD_HOURS = 72
 STALL_THRESHOLD_DAYS = 7
 ENGAGED_NOT_REPLIED_OPENS = 2
 
+# SQLite caps bound parameters per statement; bulk lookups are chunked below it
+_SQL_IN_CHUNK = 500
+
+
+def _parse_timestamp(value: Any) -> Optional[float]:
+    """ISO-8601 string to epoch seconds (naive values are UTC), or None."""
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(str(value))
+    except (ValueError, TypeError):
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp()
+
 
 class LeadStatusManager:
     """
     Manages lead engagement status based on multi-channel signals.
 
-    Reads/writes status to individual lead files in .hive-mind/lead_status/.
-    Each file is keyed by lead email (sanitized filename).
+    Status records live in a SQLite store (.hive-mind/lead_status.db) keyed
+    by lowercased email. Per-status counts are kept incrementally.
     """
 
-    def __init__(self, hive_dir: Path = None):
+    def __init__(self, hive_dir: Path = None, db_path: Optional[Path] = None):
         self.hive_dir = hive_dir or Path(".hive-mind")
+        self.hive_dir.mkdir(parents=True, exist_ok=True)
+        # Legacy per-lead JSON files, imported once into the store
         self.status_dir = self.hive_dir / "lead_status"
-        self.status_dir.mkdir(parents=True, exist_ok=True)
         self.shadow_dir = self.hive_dir / "shadow_mode_emails"
+        self.db_path = Path(db_path or self.hive_dir / "lead_status.db")
+        self._local = threading.local()
+        self._init_db()
+        self.migrate_from_files()
+
+    # ─── Storage ───────────────────────────────────────────────────────
+
+    def _get_connection(self) -> sqlite3.Connection:
+        """Get thread-local database connection."""
+        if not hasattr(self._local, "conn") or self._local.conn is None:
+            conn = sqlite3.connect(str(self.db_path), check_same_thread=False, timeout=30.0)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return self._local.conn
+
+    @contextmanager
+    def _transaction(self):
+        """Write transaction; takes the write lock up front so read-modify-write is atomic."""
+        conn = self._get_connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+
+    def _init_db(self):
+        conn = self._get_connection()
+        conn.executescript("""
+            CREATE TABLE IF NOT EXISTS lead_status (
+                email TEXT PRIMARY KEY,
+                status TEXT NOT NULL,
+                updated_at TEXT,
+                updated_ts REAL,
+                open_count INTEGER NOT NULL DEFAULT 0,
+                record TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_lead_status_status_updated
+                ON lead_status(status, updated_ts);
+            CREATE TABLE IF NOT EXISTS lead_status_counts (
+                status TEXT PRIMARY KEY,
+                count INTEGER NOT NULL DEFAULT 0
+            );
+            CREATE TABLE IF NOT EXISTS lead_status_meta (
+                key TEXT PRIMARY KEY,
+                value TEXT
+            );
+        """)
+
+    @staticmethod
+    def _read_record(conn: sqlite3.Connection, key: str) -> Optional[Dict[str, Any]]:
+        row = conn.execute("SELECT record FROM lead_status WHERE email = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        try:
+            return json.loads(row["record"])
+        except json.JSONDecodeError:
+            return None
+
+    @staticmethod
+    def _write_record(conn: sqlite3.Connection, record: Dict[str, Any], only_if_absent: bool = False) -> bool:
+        """
+        Upsert a record and adjust per-status counters. Must run inside
+        _transaction(). Returns False if only_if_absent and the lead exists.
+        """
+        key = (record.get("email") or "").lower()
+        status = record.get("status") or "unknown"
+        row = conn.execute("SELECT status FROM lead_status WHERE email = ?", (key,)).fetchone()
+        if row is not None and only_if_absent:
+            return False
+        old_status = row["status"] if row is not None else None
+
+        conn.execute("""
+            INSERT INTO lead_status (email, status, updated_at, updated_ts, open_count, record)
+            VALUES (?, ?, ?, ?, ?, ?)
+            ON CONFLICT(email) DO UPDATE SET
+                status = excluded.status,
+                updated_at = excluded.updated_at,
+                updated_ts = excluded.updated_ts,
+                open_count = excluded.open_count,
+                record = excluded.record
+        """, (
+            key,
+            status,
+            record.get("updated_at"),
+            _parse_timestamp(record.get("updated_at")),
+            int(record.get("open_count") or 0),
+            json.dumps(record),
+        ))
+
+        if old_status != status:
+            if old_status is not None:
+                conn.execute(
+                    "UPDATE lead_status_counts SET count = count - 1 WHERE status = ?", (old_status,)
+                )
+            conn.execute("""
+                INSERT INTO lead_status_counts (status, count) VALUES (?, 1)
+                ON CONFLICT(status) DO UPDATE SET count = count + 1
+            """, (status,))
+        return True
+
+    def _save_record(self, record: Dict[str, Any]) -> None:
+        with self._transaction() as conn:
+            self._write_record(conn, record)
+
+    def migrate_from_files(self, force: bool = False) -> int:
+        """
+        Import records from the legacy .hive-mind/lead_status/*.json layout.
 
-    def _email_to_filename(self, email: str) -> str:
-        """Convert email to safe filename."""
-        return email.lower().replace("@", "_at_").replace(".", "_") + ".json"
+        Runs once per store (tracked in lead_status_meta); leads already in the
+        store are not overwritten. The JSON files are left in place.
+        Returns the number of records imported.
+        """
+        conn = self._get_connection()
+        if not force:
+            row = conn.execute(
+                "SELECT value FROM lead_status_meta WHERE key = 'legacy_files_migrated_at'"
+            ).fetchone()
+            if row is not None:
+                return 0
+
+        imported = 0
+        files = sorted(self.status_dir.glob("*.json")) if self.status_dir.exists() else []
+        with self._transaction() as conn:
+            for filepath in files:
+                try:
+                    record = json.loads(filepath.read_text(encoding="utf-8"))
+                except (json.JSONDecodeError, OSError):
+                    continue
+                if not isinstance(record, dict) or not record.get("email"):
+                    continue
+                if self._write_record(conn, record, only_if_absent=True):
+                    imported += 1
+            conn.execute("""
+                INSERT INTO lead_status_meta (key, value) VALUES ('legacy_files_migrated_at', ?)
+                ON CONFLICT(key) DO UPDATE SET value = excluded.value
+            """, (datetime.now(timezone.utc).isoformat(),))
+
+        if imported:
+            logger.info("Migrated %d lead status records from %s", imported, self.status_dir)
+        return imported
+
+    def rebuild_status_counts(self) -> Dict[str, int]:
+        """Recompute the per-status counters from the lead rows."""
+        with self._transaction() as conn:
+            conn.execute("DELETE FROM lead_status_counts")
+            conn.execute("""
+                INSERT INTO lead_status_counts (status, count)
+                SELECT status, COUNT(*) FROM lead_status GROUP BY status
+            """)
+        return self.get_status_summary()
+
+    # ─── Reads ─────────────────────────────────────────────────────────
 
     def get_lead_status(self, email: str) -> Optional[Dict[str, Any]]:
         """Get current status record for a lead."""
-        filepath = self.status_dir / self._email_to_filename(email)
-        if filepath.exists():
-            try:
-                return json.loads(filepath.read_text(encoding="utf-8"))
-            except (json.JSONDecodeError, OSError):
-                return None
-        return None
+        if not email:
+            return None
+        try:
+            return self._read_record(self._get_connection(), email.lower())
+        except sqlite3.Error as e:
+            logger.warning("Lead status read failed for %s: %s", email, e)
+            return None
+
+    def get_lead_statuses(self, emails: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Bulk status lookup keyed by lowercased email.
+
+        Leads without a status record are omitted. One call per scan instead
+        of one get_lead_status() per lead per check.
+        """
+        keys = sorted({e.lower() for e in emails if e})
+        statuses: Dict[str, Dict[str, Any]] = {}
+        conn = self._get_connection()
+        for i in range(0, len(keys), _SQL_IN_CHUNK):
+            chunk = keys[i:i + _SQL_IN_CHUNK]
+            placeholders = ",".join("?" * len(chunk))
+            for row in conn.execute(
+                f"SELECT email, record FROM lead_status WHERE email IN ({placeholders})", chunk
+            ):
+                try:
+                    statuses[row["email"]] = json.loads(row["record"])
+                except json.JSONDecodeError:
+                    continue
+        return statuses
 
     def update_lead_status(
         self,
@@ -113,51 +315,52 @@ class LeadStatusManager:
         Returns:
             Updated lead status record
         """
-        existing = self.get_lead_status(email) or {
-            "email": email,
-            "status": "unknown",
-            "status_history": [],
-            "signals": [],
-            "created_at": datetime.now(timezone.utc).isoformat(),
-            "open_count": 0,
-            "reply_count": 0,
-            "linkedin_status": None,
-        }
+        # Read-modify-write under one write lock so concurrent webhook
+        # handlers cannot lose signals or skew the status counters
+        with self._transaction() as conn:
+            existing = self._read_record(conn, email.lower()) or {
+                "email": email,
+                "status": "unknown",
+                "status_history": [],
+                "signals": [],
+                "created_at": datetime.now(timezone.utc).isoformat(),
+                "open_count": 0,
+                "reply_count": 0,
+                "linkedin_status": None,
+            }
 
-        old_status = existing["status"]
-        now = datetime.now(timezone.utc).isoformat()
+            old_status = existing["status"]
+            now = datetime.now(timezone.utc).isoformat()
 
-        # Record status transition
-        if old_status != new_status:
-            existing["status_history"].append({
-                "from": old_status,
-                "to": new_status,
-                "at": now,
-                "source": signal_source,
-            })
+            # Record status transition
+            if old_status != new_status:
+                existing["status_history"].append({
+                    "from": old_status,
+                    "to": new_status,
+                    "at": now,
+                    "source": signal_source,
+                })
 
-        existing["status"] = new_status
-        existing["updated_at"] = now
+            existing["status"] = new_status
+            existing["updated_at"] = now
 
-        # Record the signal
-        signal_record = {
-            "type": signal_source,
-            "status": new_status,
-            "at": now,
-        }
-        if metadata:
-            signal_record["data"] = metadata
-        existing["signals"].append(signal_record)
+            # Record the signal
+            signal_record = {
+                "type": signal_source,
+                "status": new_status,
+                "at": now,
+            }
+            if metadata:
+                signal_record["data"] = metadata
+            existing["signals"].append(signal_record)
 
-        # Track open/reply counts
-        if new_status == "opened":
-            existing["open_count"] = existing.get("open_count", 0) + 1
-        elif new_status in ("replied", "linkedin_replied"):
-            existing["reply_count"] = existing.get("reply_count", 0) + 1
+            # Track open/reply counts
+            if new_status == "opened":
+                existing["open_count"] = existing.get("open_count", 0) + 1
+            elif new_status in ("replied", "linkedin_replied"):
+                existing["reply_count"] = existing.get("reply_count", 0) + 1
 
-        # Write to file
-        filepath = self.status_dir / self._email_to_filename(email)
-        filepath.write_text(json.dumps(existing, indent=2), encoding="utf-8")
+            self._write_record(conn, existing)
 
         logger.info(
             "Lead %s: %s → %s (source: %s)",
@@ -225,8 +428,7 @@ class LeadStatusManager:
         )
         record["linkedin_status"] = "connected"
         # Re-save with linkedin_status
-        filepath = self.status_dir / self._email_to_filename(email)
-        filepath.write_text(json.dumps(record, indent=2), encoding="utf-8")
+        self._save_record(record)
         return record
 
     def handle_linkedin_reply(self, linkedin_url: str, message_text: str = "", email: str = "") -> Dict:
@@ -278,54 +480,52 @@ class LeadStatusManager:
         stall_cutoff = now - timedelta(days=STALL_THRESHOLD_DAYS)
 
         results = {"ghosted": [], "stalled": [], "engaged_not_replied": []}
-
-        for filepath in self.status_dir.glob("*.json"):
-            try:
-                record = json.loads(filepath.read_text(encoding="utf-8"))
-            except (json.JSONDecodeError, OSError):
-                continue
-
-            status = record.get("status", "")
-            email = record.get("email", "")
-            updated_at_str = record.get("updated_at", "")
-
-            if not updated_at_str:
-                continue
-
-            try:
-                updated_at = datetime.fromisoformat(updated_at_str)
-                if updated_at.tzinfo is None:
-                    updated_at = updated_at.replace(tzinfo=timezone.utc)
-            except (ValueError, TypeError):
-                continue
-
-            # Ghost detection: dispatched/sent but never opened after 72h
-            if status in ("dispatched", "sent") and updated_at < ghost_cutoff:
-                self.update_lead_status(
-                    email, "ghosted", "engagement_monitor:ghost_detection",
-                    {"hours_since_send": (now - updated_at).total_seconds() / 3600},
-                )
-                results["ghosted"].append({"email": email, "since": updated_at_str})
-
-            # Stall detection: opened but no reply after 7 days
-            elif status == "opened" and updated_at < stall_cutoff:
-                self.update_lead_status(
-                    email, "stalled", "engagement_monitor:stall_detection",
-                    {"days_since_open": (now - updated_at).days},
-                )
-                results["stalled"].append({"email": email, "since": updated_at_str})
-
-            # Engaged but not replied: 2+ opens, still no reply
-            elif status == "opened" and record.get("open_count", 0) >= ENGAGED_NOT_REPLIED_OPENS:
-                self.update_lead_status(
-                    email, "engaged_not_replied",
-                    "engagement_monitor:engagement_pattern",
-                    {"open_count": record["open_count"]},
-                )
-                results["engaged_not_replied"].append({
-                    "email": email,
-                    "open_count": record["open_count"],
-                })
+        conn = self._get_connection()
+
+        # Ghost detection: dispatched/sent but never opened after 72h
+        ghost_rows = conn.execute("""
+            SELECT email, updated_at, updated_ts FROM lead_status
+            WHERE status IN ('dispatched', 'sent') AND updated_ts < ?
+        """, (ghost_cutoff.timestamp(),)).fetchall()
+        # Stall detection: opened but no reply after 7 days
+        stall_rows = conn.execute("""
+            SELECT email, updated_at, updated_ts FROM lead_status
+            WHERE status = 'opened' AND updated_ts < ?
+        """, (stall_cutoff.timestamp(),)).fetchall()
+        # Engaged but not replied: 2+ opens, still no reply
+        engaged_rows = conn.execute("""
+            SELECT email, open_count FROM lead_status
+            WHERE status = 'opened' AND updated_ts >= ? AND open_count >= ?
+        """, (stall_cutoff.timestamp(), ENGAGED_NOT_REPLIED_OPENS)).fetchall()
+
+        for row in ghost_rows:
+            email = self._display_email(row["email"])
+            self.update_lead_status(
+                email, "ghosted", "engagement_monitor:ghost_detection",
+                {"hours_since_send": (now.timestamp() - row["updated_ts"]) / 3600},
+            )
+            results["ghosted"].append({"email": email, "since": row["updated_at"]})
+
+        for row in stall_rows:
+            email = self._display_email(row["email"])
+            updated_at = datetime.fromtimestamp(row["updated_ts"], tz=timezone.utc)
+            self.update_lead_status(
+                email, "stalled", "engagement_monitor:stall_detection",
+                {"days_since_open": (now - updated_at).days},
+            )
+            results["stalled"].append({"email": email, "since": row["updated_at"]})
+
+        for row in engaged_rows:
+            email = self._display_email(row["email"])
+            self.update_lead_status(
+                email, "engaged_not_replied",
+                "engagement_monitor:engagement_pattern",
+                {"open_count": row["open_count"]},
+            )
+            results["engaged_not_replied"].append({
+                "email": email,
+                "open_count": row["open_count"],
+            })
 
         logger.info(
             "Engagement decay scan: %d ghosted, %d stalled, %d engaged_not_replied",
@@ -340,25 +540,24 @@ class LeadStatusManager:
     def get_all_lead_statuses(self) -> List[Dict[str, Any]]:
         """Get all lead status records for dashboard display."""
         leads = []
-        for filepath in sorted(self.status_dir.glob("*.json")):
+        for row in self._get_connection().execute("SELECT record FROM lead_status ORDER BY email"):
             try:
-                record = json.loads(filepath.read_text(encoding="utf-8"))
-                leads.append(record)
-            except (json.JSONDecodeError, OSError):
+                leads.append(json.loads(row["record"]))
+            except json.JSONDecodeError:
                 continue
         return leads
 
     def get_status_summary(self) -> Dict[str, int]:
         """Get count of leads by status for dashboard KPIs."""
-        counts: Dict[str, int] = {}
-        for filepath in self.status_dir.glob("*.json"):
-            try:
-                record = json.loads(filepath.read_text(encoding="utf-8"))
-                status = record.get("status", "unknown")
-                counts[status] = counts.get(status, 0) + 1
-            except (json.JSONDecodeError, OSError):
-                continue
-        return counts
+        rows = self._get_connection().execute(
+            "SELECT status, count FROM lead_status_counts WHERE count > 0"
+        )
+        return {row["status"]: row["count"] for row in rows}
+
+    def _display_email(self, key: str) -> str:
+        """Email as originally recorded (rows are keyed lowercased)."""
+        record = self._read_record(self._get_connection(), key)
+        return (record or {}).get("email") or key
 
     # ─── Bootstrap: Seed from existing shadow emails ───────────────────
 
@@ -382,10 +581,6 @@ class LeadStatusManager:
             if not email:
                 continue
 
-            # Skip if already tracked
-            if self.get_lead_status(email):
-                continue
-
             status = email_data.get("status", "pending")
             context = email_data.get("context", {})
             recipient = email_data.get("recipient_data", {})
@@ -410,9 +605,10 @@ class LeadStatusManager:
                 "email_id": email_data.get("email_id", ""),
             }
 
-            status_file = self.status_dir / self._email_to_filename(email)
-            status_file.write_text(json.dumps(record, indent=2), encoding="utf-8")
-            created += 1
+            # Skip if already tracked
+            with self._transaction() as conn:
+                if self._write_record(conn, record, only_if_absent=True):
+                    created += 1
 
         logger.info("Bootstrap: created %d lead status records from shadow emails", created)
         return created
@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+"""
+LLM Response Cache
+==================
+Opt-in exact-match response cache for core/llm_routing_gateway.py.
+
+Segmentor analysis and template rewrites often send the same prompt on
+every run. For deterministic / low-temperature requests the gateway can
+serve a stored completion instead of calling a provider.
+
+Key: sha256 over (task_type, model, normalized messages, system_prompt,
+temperature, max_tokens). Messages are normalized by lower-casing roles and
+collapsing whitespace in content. Entries expire on a per-task TTL and the
+table is bounded by LRU eviction on last access. Backed by SQLite (WAL).
+
+Configuration:
+    LLM_RESPONSE_CACHE_ENABLED=true          Turn the cache on in LLMRoutingGateway
+    LLM_RESPONSE_CACHE_PATH                  Default .hive-mind/llm_routing/response_cache.db
+    LLM_RESPONSE_CACHE_MAX_ENTRIES           Default 20000
+    LLM_RESPONSE_CACHE_MAX_TEMPERATURE       Only cache requests at or below this (default 0.3)
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger("llm_response_cache")
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+HOUR_SECONDS = 3600
+DAY_SECONDS = 86400
+
+# Per-task TTLs (TaskType values). Analysis/template output stays valid for
+# days; planning and decisions depend on live state and expire quickly.
+TASK_TTL_SECONDS: Dict[str, int] = {
+    "analysis": 7 * DAY_SECONDS,
+    "template_creation": 7 * DAY_SECONDS,
+    "data_transformation": 7 * DAY_SECONDS,
+    "messaging": 2 * DAY_SECONDS,
+    "personalization": 2 * DAY_SECONDS,
+    "content_generation": 2 * DAY_SECONDS,
+    "planning": HOUR_SECONDS,
+    "orchestration": HOUR_SECONDS,
+    "decision": HOUR_SECONDS,
+    "scheduling": HOUR_SECONDS,
+}
+DEFAULT_TTL_SECONDS = DAY_SECONDS
+DEFAULT_MAX_ENTRIES = 20_000
+DEFAULT_MAX_TEMPERATURE = 0.3
+
+EVICT_EVERY_WRITES = 64
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_messages(messages: List[Dict[str, str]]) -> List[Dict[str, str]]:
+    """Canonical form of chat messages for cache keying."""
+    return [
+        {
+            "role": str(m.get("role", "")).strip().lower(),
+            "content": _WHITESPACE.sub(" ", str(m.get("content", ""))).strip(),
+        }
+        for m in messages
+    ]
+
+
+def make_cache_key(
+    task_type: str,
+    model: str,
+    messages: List[Dict[str, str]],
+    system_prompt: Optional[str],
+    temperature: float,
+    max_tokens: int,
+) -> str:
+    material = json.dumps({
+        "task_type": task_type,
+        "model": model,
+        "messages": normalize_messages(messages),
+        "system_prompt": _WHITESPACE.sub(" ", system_prompt or "").strip(),
+        "temperature": round(float(temperature), 3),
+        "max_tokens": int(max_tokens),
+    }, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+class LLMResponseCache:
+    """SQLite-backed exact-match completion cache with per-task TTLs and LRU eviction."""
+
+    def __init__(
+        self,
+        db_path: Optional[Path] = None,
+        max_entries: Optional[int] = None,
+        max_temperature: Optional[float] = None,
+        task_ttls: Optional[Dict[str, int]] = None,
+    ):
+        self.db_path = Path(
+            db_path
+            or os.getenv("LLM_RESPONSE_CACHE_PATH")
+            or PROJECT_ROOT / ".hive-mind" / "llm_routing" / "response_cache.db"
+        )
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_entries = max(1, int(max_entries or os.getenv("LLM_RESPONSE_CACHE_MAX_ENTRIES", DEFAULT_MAX_ENTRIES)))
+        self.max_temperature = float(
+            max_temperature if max_temperature is not None
+            else os.getenv("LLM_RESPONSE_CACHE_MAX_TEMPERATURE", DEFAULT_MAX_TEMPERATURE)
+        )
+        self.task_ttls = dict(TASK_TTL_SECONDS if task_ttls is None else task_ttls)
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._writes_since_evict = 0
+        self._init_db()
+
+    def _get_connection(self) -> sqlite3.Connection:
+        """Get thread-local database connection."""
+        if not hasattr(self._local, "conn") or self._local.conn is None:
+            conn = sqlite3.connect(str(self.db_path), check_same_thread=False, timeout=30.0)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return self._local.conn
+
+    @contextmanager
+    def _transaction(self):
+        """Context manager for database transactions."""
+        conn = self._get_connection()
+        try:
+            yield conn
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+
+    def _init_db(self):
+        with self._transaction() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS llm_response_cache (
+                    cache_key TEXT PRIMARY KEY,
+                    task_type TEXT NOT NULL,
+                    model TEXT NOT NULL,
+                    response TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    expires_at REAL NOT NULL,
+                    last_access REAL NOT NULL,
+                    hits INTEGER DEFAULT 0
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_llm_cache_access ON llm_response_cache(last_access)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_llm_cache_expires ON llm_response_cache(expires_at)")
+
+    def is_cacheable(self, temperature: float) -> bool:
+        return temperature <= self.max_temperature
+
+    def ttl_for(self, task_type: str) -> int:
+        return int(self.task_ttls.get(task_type, DEFAULT_TTL_SECONDS))
+
+    def get(self, cache_key: str) -> Optional[Dict[str, Any]]:
+        """Stored response fields for cache_key, or None if absent/expired."""
+        now = time.time()
+        try:
+            with self._transaction() as conn:
+                row = conn.execute(
+                    "SELECT response, expires_at FROM llm_response_cache WHERE cache_key = ?", (cache_key,)
+                ).fetchone()
+                if row is None or row["expires_at"] <= now:
+                    return None
+                conn.execute(
+                    "UPDATE llm_response_cache SET last_access = ?, hits = hits + 1 WHERE cache_key = ?",
+                    (now, cache_key),
+                )
+        except sqlite3.Error as exc:
+            logger.warning("LLM response cache read failed: %s", exc)
+            return None
+        return json.loads(row["response"])
+
+    def put(self, cache_key: str, task_type: str, model: str, response: Dict[str, Any]) -> None:
+        ttl = self.ttl_for(task_type)
+        if ttl <= 0:
+            return
+        now = time.time()
+        try:
+            with self._transaction() as conn:
+                conn.execute("""
+                    INSERT INTO llm_response_cache
+                        (cache_key, task_type, model, response, created_at, expires_at, last_access, hits)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, 0)
+                    ON CONFLICT(cache_key) DO UPDATE SET
+                        response = excluded.response,
+                        created_at = excluded.created_at,
+                        expires_at = excluded.expires_at,
+                        last_access = excluded.last_access
+                """, (cache_key, task_type, model, json.dumps(response), now, now + ttl, now))
+        except sqlite3.Error as exc:
+            logger.warning("LLM response cache write failed: %s", exc)
+            return
+
+        with self._lock:
+            self._writes_since_evict += 1
+            due = self._writes_since_evict >= EVICT_EVERY_WRITES
+            if due:
+                self._writes_since_evict = 0
+        if due:
+            try:
+                self.evict()
+            except sqlite3.Error as exc:
+                logger.warning("LLM response cache eviction failed: %s", exc)
+
+    def evict(self) -> Dict[str, int]:
+        """Delete expired rows, then least-recently-used rows beyond max_entries."""
+        now = time.time()
+        with self._transaction() as conn:
+            expired = conn.execute("DELETE FROM llm_response_cache WHERE expires_at <= ?", (now,)).rowcount
+            total = conn.execute("SELECT COUNT(*) FROM llm_response_cache").fetchone()[0]
+            overflow = max(0, total - self.max_entries)
+            evicted = 0
+            if overflow:
+                evicted = conn.execute("""
+                    DELETE FROM llm_response_cache WHERE cache_key IN (
+                        SELECT cache_key FROM llm_response_cache ORDER BY last_access ASC LIMIT ?
+                    )
+                """, (overflow,)).rowcount
+        return {"expired": expired, "evicted": evicted}
+
+    def get_stats(self) -> Dict[str, Any]:
+        row = self._get_connection().execute(
+            "SELECT COUNT(*) AS entries, COALESCE(SUM(hits), 0) AS hits FROM llm_response_cache"
+        ).fetchone()
+        return {
+            "entries": row["entries"],
+            "lifetime_hits": row["hits"],
+            "max_entries": self.max_entries,
+            "max_temperature": self.max_temperature,
+        }
+
+
+def response_cache_enabled() -> bool:
+    return os.getenv("LLM_RESPONSE_CACHE_ENABLED", "").strip().lower() in ("1", "true", "yes")
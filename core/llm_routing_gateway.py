@@ -57,13 +57,19 @@ import json
 import asyncio
 import logging
 import time
+import math
+import socket
+import weakref
 import httpx
+from bisect import bisect_left
+from collections import deque
 from enum import Enum
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Callable, Tuple, Union
 from dataclasses import dataclass, field, asdict
 from abc import ABC, abstractmethod
+from contextlib import asynccontextmanager
 
 PROJECT_ROOT = Path(__file__).parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
@@ -77,6 +83,8 @@ logging.basicConfig(
 )
 logger = logging.getLogger('llm_router')
 
+from core.llm_response_cache import LLMResponseCache, make_cache_key, response_cache_enabled
+
 try:
     from core.circuit_breaker import get_registry as get_circuit_registry
     HAS_CIRCUIT_BREAKER = True
@@ -243,6 +251,8 @@ class RoutedResponse:
     cost_estimate: float = 0.0
     fallback_used: bool = False
     fallback_chain: List[str] = field(default_factory=list)
+    cached: bool = False
+    hedged: bool = False
     timestamp: str = field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
     
     def to_dict(self) -> Dict[str, Any]:
@@ -331,16 +341,200 @@ PROVIDER_CONFIGS: Dict[LLMProviderType, ProviderConfig] = {
 }
 
 
+# Log-spaced latency buckets: 25ms upward in 25% steps (top bucket ~870s).
+LATENCY_BUCKETS_MS: List[float] = [25.0 * (1.25 ** i) for i in range(48)]
+
+# Hedged fallback (LLM_HEDGING_ENABLED): launch the next provider in the route
+# once the primary has been running longer than its recent p95 latency.
+HEDGE_MIN_SAMPLES = 20
+
+
+class RollingLatencyHistogram:
+    """
+    Bucketed latency histogram over the last `window` successful calls.
+    
+    record() and percentile() are O(buckets); percentiles are reported as
+    the upper bound of the bucket holding the requested rank.
+    """
+    
+    def __init__(self, window: int = 512):
+        self._samples: deque = deque(maxlen=window)
+        self._counts = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+    
+    def record(self, latency_ms: float):
+        idx = bisect_left(LATENCY_BUCKETS_MS, latency_ms)
+        if len(self._samples) == self._samples.maxlen:
+            self._counts[self._samples[0]] -= 1
+        self._samples.append(idx)
+        self._counts[idx] += 1
+    
+    @property
+    def count(self) -> int:
+        return len(self._samples)
+    
+    def percentile(self, pct: float) -> float:
+        if not self._samples:
+            return 0.0
+        rank = max(1, math.ceil(pct / 100.0 * len(self._samples)))
+        cumulative = 0
+        for idx, bucket_count in enumerate(self._counts):
+            cumulative += bucket_count
+            if cumulative >= rank:
+                return LATENCY_BUCKETS_MS[min(idx, len(LATENCY_BUCKETS_MS) - 1)]
+        return LATENCY_BUCKETS_MS[-1]
+    
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "p50_ms": self.percentile(50),
+            "p95_ms": self.percentile(95),
+            "p99_ms": self.percentile(99),
+        }
+
+
+@dataclass
+class HTTPPoolSettings:
+    """Connection pool limits for the adapters' shared HTTP clients."""
+    max_connections: int = 20
+    max_keepalive_connections: int = 10
+    keepalive_expiry: float = 30.0
+    http2: bool = False
+    
+    @classmethod
+    def from_env(cls) -> 'HTTPPoolSettings':
+        return cls(
+            max_connections=int(os.getenv("LLM_HTTP_MAX_CONNECTIONS", "20")),
+            max_keepalive_connections=int(os.getenv("LLM_HTTP_MAX_KEEPALIVE", "10")),
+            keepalive_expiry=float(os.getenv("LLM_HTTP_KEEPALIVE_EXPIRY", "30")),
+            http2=os.getenv("LLM_HTTP2", "").strip().lower() in ("1", "true", "yes"),
+        )
+
+
+class HTTPClientPool:
+    """
+    Long-lived httpx.AsyncClient per provider base URL, owned by LLMRoutingGateway.
+    
+    Adapters that share a host (Opus/Sonnet, Flash/Pro, the OpenAI models)
+    share one connection pool. Clients are bound to the event loop that
+    created them; a call from a different loop (e.g. a later asyncio.run())
+    gets a fresh client and the old one is retired: closed on its own loop
+    if that loop is still running, otherwise its kept-alive sockets are shut
+    down (aclose() cannot run once the owning loop has closed).
+    
+    Connection reuse is counted with httpcore trace events: every request
+    that sends headers without opening a TCP connection first was served
+    from a kept-alive connection.
+    """
+    
+    def __init__(self, settings: Optional[HTTPPoolSettings] = None):
+        self.settings = settings or HTTPPoolSettings.from_env()
+        if self.settings.http2:
+            try:
+                import h2  # noqa: F401
+            except ImportError:
+                logger.warning("LLM_HTTP2 requested but the h2 package is missing; using HTTP/1.1")
+                self.settings.http2 = False
+        # base_url -> (client, its loop, network streams it has used)
+        self._clients: Dict[str, Tuple[httpx.AsyncClient, asyncio.AbstractEventLoop, weakref.WeakSet]] = {}
+        self._stats = {"clients_created": 0, "clients_retired": 0, "requests": 0, "connections_opened": 0}
+    
+    def get(self, base_url: str) -> httpx.AsyncClient:
+        """Return the pooled client for base_url on the running event loop."""
+        loop = asyncio.get_running_loop()
+        entry = self._clients.get(base_url)
+        if entry and entry[1] is loop and not entry[0].is_closed:
+            return entry[0]
+        if entry:
+            self._retire(*entry)
+        
+        streams: weakref.WeakSet = weakref.WeakSet()
+        
+        async def track_stream(response: httpx.Response):
+            stream = response.extensions.get("network_stream")
+            if stream is not None:
+                streams.add(stream)
+        
+        client = httpx.AsyncClient(
+            http2=self.settings.http2,
+            limits=httpx.Limits(
+                max_connections=self.settings.max_connections,
+                max_keepalive_connections=self.settings.max_keepalive_connections,
+                keepalive_expiry=self.settings.keepalive_expiry,
+            ),
+            event_hooks={"request": [self._attach_trace], "response": [track_stream]},
+        )
+        self._clients[base_url] = (client, loop, streams)
+        self._stats["clients_created"] += 1
+        return client
+    
+    def _retire(self, client: httpx.AsyncClient, loop: asyncio.AbstractEventLoop, streams: weakref.WeakSet):
+        """Release a client that belongs to another event loop."""
+        if client.is_closed:
+            return
+        self._stats["clients_retired"] += 1
+        if loop.is_running() and not loop.is_closed():
+            asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+            return
+        for stream in list(streams):
+            sock = stream.get_extra_info("socket")
+            try:
+                if sock is not None:
+                    sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass  # already closed by the peer
+    
+    async def _attach_trace(self, request: httpx.Request):
+        request.extensions["trace"] = self._trace
+    
+    async def _trace(self, event_name: str, info: Dict[str, Any]):
+        if event_name == "connection.connect_tcp.complete":
+            self._stats["connections_opened"] += 1
+        elif event_name in ("http11.send_request_headers.started", "http2.send_request_headers.started"):
+            self._stats["requests"] += 1
+    
+    async def aclose(self):
+        """Close every client created on the running loop; retire the rest."""
+        loop = asyncio.get_running_loop()
+        clients, self._clients = self._clients, {}
+        for client, client_loop, streams in clients.values():
+            if client_loop is not loop:
+                self._retire(client, client_loop, streams)
+            elif not client.is_closed:
+                await client.aclose()
+    
+    def get_stats(self) -> Dict[str, Any]:
+        requests = self._stats["requests"]
+        reused = max(0, requests - self._stats["connections_opened"])
+        return {
+            **self._stats,
+            "connections_reused": reused,
+            "reuse_rate": round(reused / requests, 4) if requests else 0.0,
+            "open_clients": sum(1 for c, _, _ in self._clients.values() if not c.is_closed),
+            "http2": self.settings.http2,
+        }
+
+
 class LLMAdapter(ABC):
     """Abstract base class for LLM provider adapters."""
     
-    def __init__(self, config: ProviderConfig):
+    def __init__(self, config: ProviderConfig, client_pool: Optional[HTTPClientPool] = None):
         self.config = config
         self.api_key = os.getenv(config.api_key_env)
+        self.client_pool = client_pool
         self._request_count = 0
         self._total_tokens = 0
         self._total_cost = 0.0
         self._errors = 0
+        self._cancelled = 0
+    
+    @asynccontextmanager
+    async def _http_client(self):
+        """Yield the pooled client when one is attached, else a one-off client."""
+        if self.client_pool is not None:
+            yield self.client_pool.get(self.config.base_url)
+            return
+        async with httpx.AsyncClient(timeout=self.config.timeout_seconds) as client:
+            yield client
     
     @property
     def is_available(self) -> bool:
@@ -362,13 +556,16 @@ class LLMAdapter(ABC):
         output_cost = (output_tokens / 1_000_000) * self.config.output_price_per_million
         return input_cost + output_cost
     
-    def record_usage(self, input_tokens: int, output_tokens: int, success: bool):
+    def record_usage(self, input_tokens: int, output_tokens: int, success: Optional[bool]):
+        """success=None marks a call cancelled mid-flight: billed, but neither a success nor an error."""
         self._request_count += 1
         self._total_tokens += input_tokens + output_tokens
-        if success:
-            self._total_cost += self.calculate_cost(input_tokens, output_tokens)
-        else:
+        if success is False:
             self._errors += 1
+        else:
+            self._total_cost += self.calculate_cost(input_tokens, output_tokens)
+            if success is None:
+                self._cancelled += 1
     
     def get_stats(self) -> Dict[str, Any]:
         return {
@@ -378,7 +575,8 @@ class LLMAdapter(ABC):
             "requests": self._request_count,
             "total_tokens": self._total_tokens,
             "total_cost": round(self._total_cost, 4),
-            "errors": self._errors
+            "errors": self._errors,
+            "cancelled": self._cancelled
         }
 
 
@@ -392,7 +590,7 @@ class ClaudeAdapter(LLMAdapter):
         temperature: float,
         system_prompt: Optional[str] = None
     ) -> Tuple[str, int, int]:
-        async with httpx.AsyncClient(timeout=self.config.timeout_seconds) as client:
+        async with self._http_client() as client:
             headers = {
                 "x-api-key": self.api_key,
                 "anthropic-version": "2023-06-01",
@@ -412,7 +610,8 @@ class ClaudeAdapter(LLMAdapter):
             response = await client.post(
                 f"{self.config.base_url}/messages",
                 headers=headers,
-                json=payload
+                json=payload,
+                timeout=self.config.timeout_seconds
             )
             response.raise_for_status()
             data = response.json()
@@ -434,7 +633,7 @@ class GeminiAdapter(LLMAdapter):
         temperature: float,
         system_prompt: Optional[str] = None
     ) -> Tuple[str, int, int]:
-        async with httpx.AsyncClient(timeout=self.config.timeout_seconds) as client:
+        async with self._http_client() as client:
             # Convert messages to Gemini format
             contents = []
             for msg in messages:
@@ -457,7 +656,7 @@ class GeminiAdapter(LLMAdapter):
             
             url = f"{self.config.base_url}/models/{self.config.model}:generateContent?key={self.api_key}"
             
-            response = await client.post(url, json=payload)
+            response = await client.post(url, json=payload, timeout=self.config.timeout_seconds)
             response.raise_for_status()
             data = response.json()
             
@@ -483,7 +682,7 @@ class OpenAIAdapter(LLMAdapter):
         temperature: float,
         system_prompt: Optional[str] = None
     ) -> Tuple[str, int, int]:
-        async with httpx.AsyncClient(timeout=self.config.timeout_seconds) as client:
+        async with self._http_client() as client:
             headers = {
                 "Authorization": f"Bearer {self.api_key}",
                 "Content-Type": "application/json"
@@ -504,7 +703,8 @@ class OpenAIAdapter(LLMAdapter):
             response = await client.post(
                 f"{self.config.base_url}/chat/completions",
                 headers=headers,
-                json=payload
+                json=payload,
+                timeout=self.config.timeout_seconds
             )
             response.raise_for_status()
             data = response.json()
@@ -527,10 +727,33 @@ class LLMRoutingGateway:
     - OpenAI/Codex for coding/API/execution
     """
     
-    def __init__(self):
+    def __init__(
+        self,
+        pool_settings: Optional[HTTPPoolSettings] = None,
+        response_cache: Optional[LLMResponseCache] = None,
+        hedging: Optional[bool] = None
+    ):
         self.storage_dir = PROJECT_ROOT / ".hive-mind" / "llm_routing"
         self.storage_dir.mkdir(parents=True, exist_ok=True)
         
+        self._http_pool = HTTPClientPool(pool_settings)
+        self._response_cache = response_cache
+        if self._response_cache is None and response_cache_enabled():
+            try:
+                self._response_cache = LLMResponseCache()
+            except Exception as e:
+                logger.warning(f"LLM response cache unavailable: {e}")
+        self._cache_counters = {"hits": 0, "misses": 0}
+        
+        # Hedged fallback + rolling latency per (task_type, provider) and ("*", provider)
+        if hedging is None:
+            hedging = os.getenv("LLM_HEDGING_ENABLED", "").strip().lower() in ("1", "true", "yes")
+        self.hedging_enabled = hedging
+        self.hedge_default_delay_ms = float(os.getenv("LLM_HEDGE_DEFAULT_DELAY_MS", "8000"))
+        self.hedge_min_delay_ms = float(os.getenv("LLM_HEDGE_MIN_DELAY_MS", "250"))
+        self.hedge_percentile = float(os.getenv("LLM_HEDGE_PERCENTILE", "95"))
+        self._latency: Dict[Tuple[str, str], RollingLatencyHistogram] = {}
+        self._hedge_counters = {"launched": 0, "secondary_wins": 0, "cancelled": 0}
         self._adapters: Dict[LLMProviderType, LLMAdapter] = {}
         self._circuit_registry = get_circuit_registry() if HAS_CIRCUIT_BREAKER else None
         
@@ -548,11 +771,15 @@ class LLMRoutingGateway:
         """Initialize all provider adapters."""
         for provider_type, config in PROVIDER_CONFIGS.items():
             if provider_type in [LLMProviderType.CLAUDE_OPUS, LLMProviderType.CLAUDE_SONNET]:
-                self._adapters[provider_type] = ClaudeAdapter(config)
+                self._adapters[provider_type] = ClaudeAdapter(config, self._http_pool)
             elif provider_type in [LLMProviderType.GEMINI_FLASH, LLMProviderType.GEMINI_PRO]:
-                self._adapters[provider_type] = GeminiAdapter(config)
+                self._adapters[provider_type] = GeminiAdapter(config, self._http_pool)
             else:
-                self._adapters[provider_type] = OpenAIAdapter(config)
+                self._adapters[provider_type] = OpenAIAdapter(config, self._http_pool)
+    
+    async def aclose(self):
+        """Close pooled HTTP clients (call on application shutdown)."""
+        await self._http_pool.aclose()
     
     def _get_available_providers(self) -> List[LLMProviderType]:
         """Get list of available providers."""
@@ -605,7 +832,9 @@ class LLMRoutingGateway:
         max_tokens: int = 2000,
         temperature: float = 0.7,
         system_prompt: Optional[str] = None,
-        metadata: Optional[Dict[str, Any]] = None
+        metadata: Optional[Dict[str, Any]] = None,
+        use_cache: Optional[bool] = None,
+        hedge: Optional[bool] = None
     ) -> RoutedResponse:
         """
         Complete a request with task-aware routing.
@@ -618,6 +847,10 @@ class LLMRoutingGateway:
             temperature: Sampling temperature
             system_prompt: Optional system prompt
             metadata: Optional metadata for tracking
+            use_cache: Force the response cache on/off for this call
+                (default: cache when enabled and temperature is low enough)
+            hedge: Force hedged fallback on/off for this call
+                (default: LLM_HEDGING_ENABLED)
         
         Returns:
             RoutedResponse with content and routing metadata
@@ -641,62 +874,80 @@ class LLMRoutingGateway:
                 fallback_used=False
             )
         
-        fallback_chain = []
-        last_error = None
+        cache_keys = self._response_cache_keys(
+            route, task_type, messages, system_prompt, temperature, max_tokens, use_cache
+        )
+        for provider_type, cache_key in cache_keys.items():
+            cached = self._response_cache.get(cache_key)
+            if cached is not None:
+                return self._cached_response(cached, provider_type, task_type, agent_name, start_time, metadata)
+        if cache_keys:
+            self._cache_counters["misses"] += 1
         
-        for i, provider_type in enumerate(route):
-            adapter = self._adapters.get(provider_type)
-            if not adapter or not adapter.is_available:
+        fallback_chain: List[str] = []
+        errors: List[str] = []
+        call = {
+            "messages": messages,
+            "max_tokens": max_tokens,
+            "temperature": temperature,
+            "system_prompt": system_prompt
+        }
+        candidates = [
+            p for p in route
+            if self._adapters.get(p) is not None and self._adapters[p].is_available
+        ]
+        hedge = self.hedging_enabled if hedge is None else hedge
+        
+        i = 0
+        while i < len(candidates):
+            if hedge and i + 1 < len(candidates):
+                outcome, hedged = await self._attempt_hedged(
+                    candidates[i], candidates[i + 1], task_type, agent_name, call, fallback_chain, errors
+                )
+                i += 2
+            else:
+                outcome, hedged = await self._attempt(candidates[i], task_type, agent_name, call, fallback_chain, errors), False
+                i += 1
+            if outcome is None:
                 continue
             
-            try:
-                logger.info(f"[{agent_name}] {task_type.value} → {provider_type.value}")
-                
-                content, input_tokens, output_tokens = await adapter.complete(
-                    messages=messages,
-                    max_tokens=max_tokens,
-                    temperature=temperature,
-                    system_prompt=system_prompt
-                )
-                
-                adapter.record_usage(input_tokens, output_tokens, success=True)
-                
-                if self._circuit_registry:
-                    self._circuit_registry.record_success(f"llm_{provider_type.value}")
-                
-                latency_ms = (time.time() - start_time) * 1000
-                cost = adapter.calculate_cost(input_tokens, output_tokens)
-                
-                # Track usage
-                self._track_usage(task_type, agent_name, provider_type, input_tokens, output_tokens, cost)
-                
-                response = RoutedResponse(
-                    content=content,
-                    provider=provider_type.value,
-                    model=adapter.config.model,
-                    task_type=task_type.value,
-                    agent_name=agent_name,
-                    input_tokens=input_tokens,
-                    output_tokens=output_tokens,
-                    latency_ms=latency_ms,
-                    cost_estimate=cost,
-                    fallback_used=(i > 0),
-                    fallback_chain=fallback_chain
-                )
-                
-                self._log_routing(response, metadata)
-                return response
-                
-            except Exception as e:
-                error_msg = str(e)
-                logger.warning(f"{provider_type.value} failed: {error_msg}")
-                
-                adapter.record_usage(0, 0, success=False)
-                fallback_chain.append(f"{provider_type.value}:{error_msg[:50]}")
-                last_error = error_msg
-                
-                if self._circuit_registry:
-                    self._circuit_registry.record_failure(f"llm_{provider_type.value}")
+            provider_type, content, input_tokens, output_tokens = outcome
+            adapter = self._adapters[provider_type]
+            latency_ms = (time.time() - start_time) * 1000
+            cost = adapter.calculate_cost(input_tokens, output_tokens)
+            
+            # Track usage
+            self._track_usage(task_type, agent_name, provider_type, input_tokens, output_tokens, cost)
+            
+            response = RoutedResponse(
+                content=content,
+                provider=provider_type.value,
+                model=adapter.config.model,
+                task_type=task_type.value,
+                agent_name=agent_name,
+                input_tokens=input_tokens,
+                output_tokens=output_tokens,
+                latency_ms=latency_ms,
+                cost_estimate=cost,
+                fallback_used=(provider_type != candidates[0]),
+                fallback_chain=fallback_chain,
+                hedged=hedged
+            )
+            
+            self._log_routing(response, metadata)
+            
+            if provider_type in cache_keys:
+                self._response_cache.put(cache_keys[provider_type], task_type.value, adapter.config.model, {
+                    "content": content,
+                    "provider": provider_type.value,
+                    "input_tokens": input_tokens,
+                    "output_tokens": output_tokens,
+                    "cost": cost,
+                    "latency_ms": latency_ms,
+                })
+            return response
+        
+        last_error = errors[-1] if errors else None
         
         # All providers failed
         return RoutedResponse(
@@ -710,6 +961,246 @@ class LLMRoutingGateway:
             latency_ms=(time.time() - start_time) * 1000
         )
     
+    async def _attempt(
+        self,
+        provider_type: LLMProviderType,
+        task_type: TaskType,
+        agent_name: str,
+        call: Dict[str, Any],
+        fallback_chain: List[str],
+        errors: List[str]
+    ) -> Optional[Tuple[LLMProviderType, str, int, int]]:
+        """
+        One provider call. Returns (provider, content, input_tokens, output_tokens),
+        or None after recording the failure.
+        
+        If the call is cancelled (it lost a hedge), the prompt tokens it already
+        sent are estimated and charged as hedge cost before re-raising. Its
+        latency is left to _attempt_hedged, which knows whether it was the
+        primary.
+        """
+        adapter = self._adapters[provider_type]
+        logger.info(f"[{agent_name}] {task_type.value} → {provider_type.value}")
+        started = time.time()
+        try:
+            content, input_tokens, output_tokens = await adapter.complete(**call)
+        except asyncio.CancelledError:
+            estimated_input = self._estimate_prompt_tokens(call)
+            adapter.record_usage(estimated_input, 0, success=None)
+            self._record_hedge_cost(task_type, agent_name, adapter.calculate_cost(estimated_input, 0))
+            self._hedge_counters["cancelled"] += 1
+            raise
+        except Exception as e:
+            error_msg = str(e)
+            logger.warning(f"{provider_type.value} failed: {error_msg}")
+            
+            adapter.record_usage(0, 0, success=False)
+            fallback_chain.append(f"{provider_type.value}:{error_msg[:50]}")
+            errors.append(error_msg)
+            
+            if self._circuit_registry:
+                self._circuit_registry.record_failure(f"llm_{provider_type.value}")
+            return None
+        
+        adapter.record_usage(input_tokens, output_tokens, success=True)
+        
+        if self._circuit_registry:
+            self._circuit_registry.record_success(f"llm_{provider_type.value}")
+        
+        self._record_latency(task_type, provider_type, (time.time() - started) * 1000)
+        return provider_type, content, input_tokens, output_tokens
+    
+    async def _attempt_hedged(
+        self,
+        primary: LLMProviderType,
+        secondary: LLMProviderType,
+        task_type: TaskType,
+        agent_name: str,
+        call: Dict[str, Any],
+        fallback_chain: List[str],
+        errors: List[str]
+    ) -> Tuple[Optional[Tuple[LLMProviderType, str, int, int]], bool]:
+        """
+        Run primary; if it is still running after the hedge delay, start
+        secondary too. The first success wins and the other call is cancelled.
+        A primary that fails before the delay falls back to secondary serially.
+        
+        A cancelled primary has its elapsed time recorded as a lower bound on
+        its latency; dropping it would hide exactly the slow tail that sets the
+        hedge delay. A cancelled secondary records nothing, since it was only
+        started late and its short run says nothing about its latency.
+        
+        Returns (outcome, hedge_launched).
+        """
+        delay_s = self.get_hedge_delay_ms(task_type, primary) / 1000.0
+        primary_started = time.time()
+        first = asyncio.create_task(self._attempt(primary, task_type, agent_name, call, fallback_chain, errors))
+        tasks = [first]
+        try:
+            done, _ = await asyncio.wait({first}, timeout=delay_s)
+            if done:
+                result = first.result()
+                if result is not None:
+                    return result, False
+                return await self._attempt(secondary, task_type, agent_name, call, fallback_chain, errors), False
+            
+            logger.info(
+                f"[{agent_name}] {task_type.value}: {primary.value} slower than "
+                f"{delay_s * 1000:.0f}ms, hedging with {secondary.value}"
+            )
+            self._hedge_counters["launched"] += 1
+            second = asyncio.create_task(self._attempt(secondary, task_type, agent_name, call, fallback_chain, errors))
+            tasks.append(second)
+            
+            winner = None
+            pending = set(tasks)
+            while pending and winner is None:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    result = task.result()
+                    if result is None:
+                        continue
+                    if winner is None:
+                        winner = result
+                    else:
+                        self._charge_hedge_loser(result, task_type, agent_name)
+            
+            if winner is not None and winner[0] == secondary:
+                self._hedge_counters["secondary_wins"] += 1
+            return winner, True
+        finally:
+            for task in tasks:
+                if task.done():
+                    continue
+                task.cancel()
+                try:
+                    result = await task
+                except asyncio.CancelledError:
+                    result = None
+                    if task is first:
+                        self._record_latency(task_type, primary, (time.time() - primary_started) * 1000)
+                if result is not None:
+                    self._charge_hedge_loser(result, task_type, agent_name)
+    
+    def _charge_hedge_loser(
+        self,
+        result: Tuple[LLMProviderType, str, int, int],
+        task_type: TaskType,
+        agent_name: str
+    ):
+        """A hedge loser that completed anyway: its full cost is hedge overhead."""
+        provider_type, _, input_tokens, output_tokens = result
+        cost = self._adapters[provider_type].calculate_cost(input_tokens, output_tokens)
+        self._record_hedge_cost(task_type, agent_name, cost)
+    
+    @staticmethod
+    def _estimate_prompt_tokens(call: Dict[str, Any]) -> int:
+        chars = sum(len(m.get("content", "")) for m in call["messages"]) + len(call.get("system_prompt") or "")
+        return chars // 4
+    
+    def _record_hedge_cost(self, task_type: TaskType, agent_name: str, cost: float):
+        """Charge the extra call a hedge made to the task/agent usage buckets."""
+        for bucket in (
+            self._usage_by_task.setdefault(task_type.value, {"requests": 0, "tokens": 0, "cost": 0.0, "providers": {}}),
+            self._usage_by_agent.setdefault(agent_name, {"requests": 0, "tokens": 0, "cost": 0.0, "task_types": {}}),
+        ):
+            bucket["cost"] += cost
+            bucket["hedged_calls"] = bucket.get("hedged_calls", 0) + 1
+            bucket["hedge_cost"] = bucket.get("hedge_cost", 0.0) + cost
+    
+    def _record_latency(self, task_type: TaskType, provider_type: LLMProviderType, latency_ms: float):
+        for key in ((task_type.value, provider_type.value), ("*", provider_type.value)):
+            hist = self._latency.get(key)
+            if hist is None:
+                hist = self._latency[key] = RollingLatencyHistogram()
+            hist.record(latency_ms)
+    
+    def get_hedge_delay_ms(self, task_type: TaskType, provider_type: LLMProviderType) -> float:
+        """
+        Hedge delay for a provider: its rolling p95 for this task type (or across
+        tasks while the task has too few samples), clamped to [min delay, timeout].
+        """
+        observed = None
+        for key in ((task_type.value, provider_type.value), ("*", provider_type.value)):
+            hist = self._latency.get(key)
+            if hist is not None and hist.count >= HEDGE_MIN_SAMPLES:
+                observed = hist.percentile(self.hedge_percentile)
+                break
+        delay = self.hedge_default_delay_ms if observed is None else observed
+        timeout_ms = self._adapters[provider_type].config.timeout_seconds * 1000
+        return max(self.hedge_min_delay_ms, min(delay, timeout_ms))
+    
+    def get_latency_report(self) -> Dict[str, Any]:
+        """Rolling latency percentiles per provider (all tasks) and per task/provider."""
+        report: Dict[str, Any] = {"by_provider": {}, "by_task": {}}
+        for (task, provider), hist in self._latency.items():
+            if task == "*":
+                report["by_provider"][provider] = hist.summary()
+            else:
+                report["by_task"].setdefault(task, {})[provider] = hist.summary()
+        return report
+    
+    def _response_cache_keys(
+        self,
+        route: List[LLMProviderType],
+        task_type: TaskType,
+        messages: List[Dict[str, str]],
+        system_prompt: Optional[str],
+        temperature: float,
+        max_tokens: int,
+        use_cache: Optional[bool]
+    ) -> Dict[LLMProviderType, str]:
+        """Cache key per provider in the route, or {} when this call is not cacheable."""
+        if self._response_cache is None or use_cache is False:
+            return {}
+        if use_cache is None and not self._response_cache.is_cacheable(temperature):
+            return {}
+        return {
+            provider_type: make_cache_key(
+                task_type.value, self._adapters[provider_type].config.model,
+                messages, system_prompt, temperature, max_tokens
+            )
+            for provider_type in route
+            if provider_type in self._adapters
+        }
+    
+    def _cached_response(
+        self,
+        cached: Dict[str, Any],
+        provider_type: LLMProviderType,
+        task_type: TaskType,
+        agent_name: str,
+        start_time: float,
+        metadata: Optional[Dict[str, Any]]
+    ) -> RoutedResponse:
+        """Build a response from a cache hit and credit the avoided cost/latency."""
+        self._cache_counters["hits"] += 1
+        latency_ms = (time.time() - start_time) * 1000
+        logger.info(f"[{agent_name}] {task_type.value} → cache ({provider_type.value})")
+        
+        self._track_usage(
+            task_type, agent_name, provider_type,
+            cached.get("input_tokens", 0), cached.get("output_tokens", 0), 0.0,
+            cached=True,
+            cost_saved=cached.get("cost", 0.0),
+            latency_saved_ms=max(0.0, cached.get("latency_ms", 0.0) - latency_ms)
+        )
+        
+        response = RoutedResponse(
+            content=cached["content"],
+            provider=provider_type.value,
+            model=self._adapters[provider_type].config.model,
+            task_type=task_type.value,
+            agent_name=agent_name,
+            input_tokens=cached.get("input_tokens", 0),
+            output_tokens=cached.get("output_tokens", 0),
+            latency_ms=latency_ms,
+            cost_estimate=0.0,
+            cached=True
+        )
+        self._log_routing(response, metadata)
+        return response
+    
     def _track_usage(
         self,
         task_type: TaskType,
@@ -717,9 +1208,28 @@ class LLMRoutingGateway:
         provider: LLMProviderType,
         input_tokens: int,
         output_tokens: int,
-        cost: float
+        cost: float,
+        cached: bool = False,
+        cost_saved: float = 0.0,
+        latency_saved_ms: float = 0.0
     ):
-        """Track usage by task type and agent."""
+        """
+        Track usage by task type and agent.
+        
+        Cache hits count as requests but consume no tokens; the provider cost
+        and latency they avoided are credited as cost_saved/latency_saved_ms.
+        """
+        if cached:
+            for bucket in (
+                self._usage_by_task.setdefault(task_type.value, {"requests": 0, "tokens": 0, "cost": 0.0, "providers": {}}),
+                self._usage_by_agent.setdefault(agent_name, {"requests": 0, "tokens": 0, "cost": 0.0, "task_types": {}}),
+            ):
+                bucket["requests"] += 1
+                bucket["cache_hits"] = bucket.get("cache_hits", 0) + 1
+                bucket["cost_saved"] = bucket.get("cost_saved", 0.0) + cost_saved
+                bucket["latency_saved_ms"] = bucket.get("latency_saved_ms", 0.0) + latency_saved_ms
+            return
+        
         # By task type
         if task_type.value not in self._usage_by_task:
             self._usage_by_task[task_type.value] = {
@@ -759,6 +1269,8 @@ class LLMRoutingGateway:
             "cost": response.cost_estimate,
             "latency_ms": response.latency_ms,
             "fallback_used": response.fallback_used,
+            "cached": response.cached,
+            "hedged": response.hedged,
             "metadata": metadata
         }
         self._routing_log.append(entry)
@@ -786,6 +1298,9 @@ class LLMRoutingGateway:
                 "total_cost": round(total_cost, 4),
                 "recent_routes": len(self._routing_log)
             },
+            "http_pool": self._http_pool.get_stats(),
+            "hedging": {"enabled": self.hedging_enabled, **self._hedge_counters},
+            "latency": self.get_latency_report(),
             "task_routing_table": {
                 k.value: [p.value for p in v] 
                 for k, v in TASK_ROUTING.items()
@@ -812,9 +1327,27 @@ class LLMRoutingGateway:
             "by_task_type": self._usage_by_task,
             "by_agent": self._usage_by_agent,
             "total_cost": sum(p["cost"] for p in by_provider.values()),
-            "cost_saved_estimate": self._estimate_savings()
+            "cost_saved_estimate": self._estimate_savings(),
+            "response_cache": self._response_cache_report()
         }
     
+    def _response_cache_report(self) -> Dict[str, Any]:
+        """Cache hits and the cost/latency they saved, summed over task types."""
+        report = {
+            "enabled": self._response_cache is not None,
+            "hits": sum(u.get("cache_hits", 0) for u in self._usage_by_task.values()),
+            "cost_saved": round(sum(u.get("cost_saved", 0.0) for u in self._usage_by_task.values()), 6),
+            "latency_saved_ms": round(sum(u.get("latency_saved_ms", 0.0) for u in self._usage_by_task.values()), 1),
+            "session_hits": self._cache_counters["hits"],
+            "session_misses": self._cache_counters["misses"],
+        }
+        if self._response_cache is not None:
+            try:
+                report.update(self._response_cache.get_stats())
+            except Exception as e:
+                logger.warning(f"Response cache stats unavailable: {e}")
+        return report
+    
     def _estimate_savings(self) -> float:
         """Estimate cost savings from intelligent routing."""
         # Calculate what it would cost if everything used Claude Opus
@@ -902,6 +1435,12 @@ def get_llm_router() -> LLMRoutingGateway:
     return _router
 
 
+async def shutdown_llm_router():
+    """Close the global gateway's HTTP clients if it was ever created."""
+    if _router is not None:
+        await _router.aclose()
+
+
 async def demo():
     """Demonstrate LLM routing gateway."""
     print("\n" + "=" * 60)
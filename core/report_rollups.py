@@ -0,0 +1,335 @@
+"""
+Incremental per-day rollups of the event store for core.reporting.
+
+The daily/weekly/monthly reports only need counts and sums per UTC day, so
+instead of re-reading raw events on every request they are kept in
+.hive-mind/report_rollups.db (SQLite, WAL):
+
+    rollup_daily(day, metric, key, value)   one row per aggregate per day
+    rollup_checkpoints(source, position)    bytes of each events file consumed
+
+refresh() reads only what was appended to each day segment (and to the
+legacy events.jsonl) since its checkpoint, and adds it to the day's rows in
+the same transaction that advances the checkpoint. A weekly or monthly
+report is then a SUM over its days. If a consumed file shrinks or
+disappears (legacy migration, manual cleanup) the rollups are rebuilt from
+scratch; rebuild() does the same on demand
+(scripts/rebuild_report_rollups.py).
+
+Metrics (key is the JSON-encoded payload value, so ints stay ints):
+
+    event_type            events per event_type
+    leads_by_source       lead_segmented per payload.source
+    icp_tier              lead_segmented per payload.tier
+    scraped               sum of scrape_completed payload.count
+    campaign_sent         sum of campaign_sent payload.count per campaign_id
+    campaign_opened       email_opened per campaign_id
+    campaign_replied      reply_classified per campaign_id
+    campaign_meetings     meeting_booked per campaign_id
+    reply_objection       reply_classified per payload.objection_type
+    rejection_reason      campaign_rejected per payload.reason
+    compliance_violation  compliance_failed per payload.violation_type
+    error_category        system_error per payload.category
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from datetime import date
+from pathlib import Path
+from typing import Any, Iterable, Optional
+
+from core.event_log import EVENTS_FILE, SEGMENT_SUFFIX, _event_day, segments_dir
+
+logger = logging.getLogger(__name__)
+
+# Day bucket for legacy events without a timestamp; load_events() has always
+# returned those for every date range, so every report includes them
+UNDATED = "*"
+
+LEGACY_SOURCE = "legacy"
+
+_READ_BLOCK = 8 * 1024 * 1024
+
+_UPSERT_SQL = """
+    INSERT INTO rollup_daily (day, metric, key, value) VALUES (?, ?, ?, ?)
+    ON CONFLICT(day, metric, key) DO UPDATE SET value = value + excluded.value
+"""
+
+_instances: dict[Path, "ReportRollups"] = {}
+_instances_lock = threading.Lock()
+
+
+def _key(value: Any) -> str:
+    return json.dumps(value, sort_keys=True)
+
+
+def _decode_key(raw: str) -> Any:
+    value = json.loads(raw)
+    return raw if isinstance(value, (list, dict)) else value
+
+
+def _count(payload: dict[str, Any]) -> float:
+    count = payload.get("count", 1)
+    return count if isinstance(count, (int, float)) else 1
+
+
+def add_event(totals: Counter, event: dict[str, Any]) -> None:
+    """Add one event to a (metric, encoded key) -> value counter."""
+    event_type = event.get("event_type")
+    payload = event.get("payload")
+    if not isinstance(payload, dict):
+        payload = {}
+    totals[("event_type", _key(event_type))] += 1
+
+    if event_type == "lead_segmented":
+        totals[("leads_by_source", _key(payload.get("source", "unknown")))] += 1
+        totals[("icp_tier", _key(payload.get("tier", "unknown")))] += 1
+    elif event_type == "scrape_completed":
+        totals[("scraped", _key(None))] += _count(payload)
+    elif event_type == "campaign_sent":
+        totals[("campaign_sent", _key(payload.get("campaign_id", "unknown")))] += _count(payload)
+    elif event_type == "email_opened":
+        totals[("campaign_opened", _key(payload.get("campaign_id", "unknown")))] += 1
+    elif event_type == "reply_classified":
+        totals[("campaign_replied", _key(payload.get("campaign_id", "unknown")))] += 1
+        totals[("reply_objection", _key(payload.get("objection_type", "unknown")))] += 1
+    elif event_type == "meeting_booked":
+        totals[("campaign_meetings", _key(payload.get("campaign_id", "unknown")))] += 1
+    elif event_type == "campaign_rejected":
+        totals[("rejection_reason", _key(payload.get("reason", "unspecified")))] += 1
+    elif event_type == "compliance_failed":
+        totals[("compliance_violation", _key(payload.get("violation_type", "unknown")))] += 1
+    elif event_type == "system_error":
+        totals[("error_category", _key(payload.get("category", "unknown")))] += 1
+
+
+def _nest(items: Iterable[tuple[str, str, float]]) -> dict[str, Counter]:
+    nested: dict[str, Counter] = defaultdict(Counter)
+    for metric, key, value in items:
+        nested[metric][_decode_key(key)] += value
+    return nested
+
+
+def aggregate_events(events: Iterable[dict[str, Any]]) -> dict[str, Counter]:
+    """The same totals as ReportRollups.totals(), computed from an event list."""
+    totals: Counter = Counter()
+    for event in events:
+        if isinstance(event, dict):
+            add_event(totals, event)
+    return _nest((metric, key, value) for (metric, key), value in totals.items())
+
+
+class ReportRollups:
+    """
+    Per-day report aggregates, consumed incrementally from the event store.
+
+    Use get_report_rollups() for the shared instance of an events file.
+    """
+
+    def __init__(self, events_file: Optional[Path] = None, db_path: Optional[Path] = None):
+        self.events_file = Path(events_file or EVENTS_FILE)
+        self.db_path = Path(db_path or self.events_file.parent / "report_rollups.db")
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()
+        self._init_db()
+
+    def _get_connection(self) -> sqlite3.Connection:
+        """Get thread-local database connection."""
+        if not hasattr(self._local, "conn") or self._local.conn is None:
+            conn = sqlite3.connect(str(self.db_path), check_same_thread=False, timeout=30.0)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return self._local.conn
+
+    @contextmanager
+    def _transaction(self):
+        """Write transaction; takes the write lock up front so a checkpoint is never consumed twice."""
+        conn = self._get_connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+
+    def _init_db(self):
+        conn = self._get_connection()
+        conn.executescript("""
+            CREATE TABLE IF NOT EXISTS rollup_daily (
+                day TEXT NOT NULL,
+                metric TEXT NOT NULL,
+                key TEXT NOT NULL,
+                value NUMERIC NOT NULL DEFAULT 0,
+                PRIMARY KEY (day, metric, key)
+            ) WITHOUT ROWID;
+            CREATE TABLE IF NOT EXISTS rollup_checkpoints (
+                source TEXT PRIMARY KEY,
+                position INTEGER NOT NULL
+            );
+        """)
+
+    def _sources(self) -> dict[str, tuple[Path, Optional[str], int]]:
+        """source name -> (path, day or None for the legacy file, size)."""
+        sources = {}
+        try:
+            sources[LEGACY_SOURCE] = (self.events_file, None, self.events_file.stat().st_size)
+        except OSError:
+            pass
+        directory = segments_dir(self.events_file)
+        if directory.is_dir():
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if not entry.name.endswith(SEGMENT_SUFFIX):
+                        continue
+                    day = entry.name[:-len(SEGMENT_SUFFIX)]
+                    try:
+                        date.fromisoformat(day)
+                        size = entry.stat().st_size
+                    except (ValueError, OSError):
+                        continue
+                    sources[entry.name] = (Path(entry.path), day, size)
+        return sources
+
+    def _consume(self, conn: sqlite3.Connection, source: str, path: Path, day: Optional[str]) -> int:
+        """
+        Add the complete lines appended to one file since its checkpoint.
+
+        Must run inside _transaction(). A trailing line without its newline
+        is left for the next call.
+        """
+        row = conn.execute("SELECT position FROM rollup_checkpoints WHERE source = ?", (source,)).fetchone()
+        offset = row[0] if row else 0
+        per_day: dict[str, Counter] = defaultdict(Counter)
+        consumed = 0
+        try:
+            with open(path, "rb") as f:
+                f.seek(offset)
+                pending = b""
+                while True:
+                    block = f.read(_READ_BLOCK)
+                    if not block:
+                        break
+                    block = pending + block
+                    cut = block.rfind(b"\n") + 1
+                    pending = block[cut:]
+                    offset += cut
+                    for raw in block[:cut].splitlines():
+                        if not raw.strip():
+                            continue
+                        try:
+                            event = json.loads(raw)
+                        except (json.JSONDecodeError, UnicodeDecodeError):
+                            continue
+                        if not isinstance(event, dict):
+                            continue
+                        event_day = day or self._legacy_day(event)
+                        if event_day is None:
+                            continue
+                        add_event(per_day[event_day], event)
+                        consumed += 1
+        except OSError as e:
+            logger.warning("Could not read %s for report rollups: %s", path, e)
+            return 0
+
+        conn.executemany(_UPSERT_SQL, (
+            (event_day, metric, key, value)
+            for event_day, totals in per_day.items()
+            for (metric, key), value in totals.items()
+        ))
+        conn.execute(
+            "INSERT INTO rollup_checkpoints (source, position) VALUES (?, ?) "
+            "ON CONFLICT(source) DO UPDATE SET position = excluded.position",
+            (source, offset),
+        )
+        return consumed
+
+    @staticmethod
+    def _legacy_day(event: dict[str, Any]) -> Optional[str]:
+        """Day bucket for a legacy line: UNDATED without a timestamp, None (skipped) if unparsable."""
+        if not event.get("timestamp"):
+            return UNDATED
+        day = _event_day(event)
+        return day.isoformat() if day else None
+
+    def refresh(self) -> int:
+        """
+        Consume everything appended to the event store since the last call.
+
+        Returns:
+            Number of events added to the rollups
+        """
+        sources = self._sources()
+        checkpoints = dict(self._get_connection().execute(
+            "SELECT source, position FROM rollup_checkpoints"
+        ).fetchall())
+        for source, offset in checkpoints.items():
+            if source not in sources or sources[source][2] < offset:
+                logger.info("Event file %s shrank or was removed; rebuilding report rollups", source)
+                return self.rebuild()
+
+        consumed = 0
+        for source, (path, day, size) in sources.items():
+            if size > checkpoints.get(source, 0):
+                with self._transaction() as conn:
+                    consumed += self._consume(conn, source, path, day)
+        return consumed
+
+    def rebuild(self) -> int:
+        """
+        Drop all rollups and checkpoints and consume the whole event store.
+
+        Returns:
+            Number of events consumed
+        """
+        with self._transaction() as conn:
+            conn.execute("DELETE FROM rollup_daily")
+            conn.execute("DELETE FROM rollup_checkpoints")
+            return sum(
+                self._consume(conn, source, path, day)
+                for source, (path, day, _) in self._sources().items()
+            )
+
+    def totals(self, start: Optional[date] = None, end: Optional[date] = None) -> dict[str, Counter]:
+        """
+        Merged totals for the days in [start, end), as metric -> {key: value}.
+
+        Undated legacy events are always included. Does not refresh; call
+        refresh() first to pick up new events.
+        """
+        clauses, params = [], []
+        if start is not None:
+            clauses.append("day >= ?")
+            params.append(start.isoformat())
+        if end is not None:
+            clauses.append("day < ?")
+            params.append(end.isoformat())
+        where = f"WHERE ({' AND '.join(clauses)}) OR day = ?" if clauses else ""
+        if clauses:
+            params.append(UNDATED)
+        rows = self._get_connection().execute(
+            f"SELECT metric, key, SUM(value) FROM rollup_daily {where} GROUP BY metric, key",
+            params,
+        )
+        return _nest(rows)
+
+    def close(self) -> None:
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+
+def get_report_rollups(events_file: Optional[Path] = None) -> ReportRollups:
+    """Shared ReportRollups for an events file (one SQLite store per file)."""
+    path = Path(events_file or EVENTS_FILE).resolve()
+    with _instances_lock:
+        if path not in _instances:
+            _instances[path] = ReportRollups(path)
+        return _instances[path]
@@ -1,16 +1,29 @@
 """
 Reporting module for SDR automation.
-Reads from events.jsonl and queue files to generate daily/weekly/monthly reports.
+Reads from the event store (day-partitioned segments plus the legacy
+events.jsonl, see core.event_log) and queue files to generate
+daily/weekly/monthly reports.
+
+The reports are built from the per-day rollups in core.report_rollups, which
+are brought up to date with the events appended since the last report, so a
+weekly or monthly report merges 7-31 rows per metric instead of re-reading
+the raw events. The _calc_* functions compute the same sections from an
+event list.
 """
 
 import json
+import logging
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Any, Optional
-from collections import defaultdict
+from collections import Counter, defaultdict
 
 import yaml
 
+from core.event_log import iter_events
+from core.report_rollups import aggregate_events, get_report_rollups
+
+logger = logging.getLogger(__name__)
 
 PROJECT_ROOT = Path(__file__).parent.parent
 HIVE_MIND = PROJECT_ROOT / ".hive-mind"
@@ -24,7 +37,9 @@ def load_events(
     event_types: Optional[list[str]] = None
 ) -> list[dict[str, Any]]:
     """
-    Load events from events.jsonl with optional filtering.
+    Load events from the event store with optional filtering.
+
+    Only the day segments overlapping [start_date, end_date) are read.
     
     Args:
         start_date: Filter events on or after this date
@@ -34,42 +49,29 @@ def load_events(
     Returns:
         List of event dicts
     """
-    events = []
-    
-    if not EVENTS_FILE.exists():
-        return events
-    
     try:
-        with open(EVENTS_FILE, "r", encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-                if not line:
-                    continue
-                try:
-                    event = json.loads(line)
-                    
-                    # Parse timestamp
-                    ts_str = event.get("timestamp", "")
-                    if ts_str:
-                        ts = datetime.fromisoformat(ts_str.replace("Z", "+00:00"))
-                        
-                        # Apply date filters
-                        if start_date and ts < start_date:
-                            continue
-                        if end_date and ts >= end_date:
-                            continue
-                    
-                    # Apply event type filter
-                    if event_types and event.get("event_type") not in event_types:
-                        continue
-                    
-                    events.append(event)
-                except (json.JSONDecodeError, ValueError):
-                    continue
+        return list(iter_events(start_date, end_date, event_types, events_file=EVENTS_FILE))
     except Exception:
-        pass
-    
-    return events
+        return []
+
+
+def load_totals(start_date: datetime, end_date: datetime) -> dict[str, Counter]:
+    """
+    Merged per-day rollups for the UTC days in [start_date, end_date).
+
+    New events are consumed into the rollups first. If the rollup store
+    cannot be used, the same totals are aggregated from load_events().
+
+    Returns:
+        metric -> {key: value}, see core.report_rollups for the metrics
+    """
+    try:
+        rollups = get_report_rollups(EVENTS_FILE)
+        rollups.refresh()
+        return rollups.totals(start_date.date(), end_date.date())
+    except Exception as e:
+        logger.warning("Report rollups unavailable, aggregating raw events: %s", e)
+        return aggregate_events(load_events(start_date=start_date, end_date=end_date))
 
 
 def load_sla_targets() -> dict[str, Any]:
@@ -131,17 +133,17 @@ def daily_report(date: datetime) -> dict[str, Any]:
     start = datetime(date.year, date.month, date.day, tzinfo=timezone.utc)
     end = start + timedelta(days=1)
     
-    # Load all events for the day
-    events = load_events(start_date=start, end_date=end)
+    totals = load_totals(start, end)
+    types = totals["event_type"]
     
     report = {
         "date": date.strftime("%Y-%m-%d"),
         "generated_at": datetime.now(timezone.utc).isoformat(),
-        "leads_scraped": _count_leads_scraped(events, start),
-        "enrichment": _calc_enrichment_stats(events, start),
-        "emails": _calc_email_stats(events),
-        "replies": _count_replies_by_sentiment(events),
-        "meetings_booked": _count_meetings(events),
+        "leads_scraped": _leads_scraped(totals["leads_by_source"], start),
+        "enrichment": _enrichment_stats(types["enrichment_completed"], types["enrichment_failed"], start),
+        "emails": _email_stats(sum(totals["campaign_sent"].values()), types["email_delivered"], types["email_opened"]),
+        "replies": _replies_by_sentiment(_sentiment_counts(totals["reply_objection"])),
+        "meetings_booked": types["meeting_booked"],
     }
     
     return report
@@ -150,14 +152,20 @@ def daily_report(date: datetime) -> dict[str, Any]:
 def _count_leads_scraped(events: list[dict], date: datetime) -> dict[str, int]:
     """Count leads scraped by source from lead_segmented events."""
     by_source = defaultdict(int)
-    total = 0
     
     # From events
     for event in events:
         if event.get("event_type") == "lead_segmented":
             source = event.get("payload", {}).get("source", "unknown")
             by_source[source] += 1
-            total += 1
+    
+    return _leads_scraped(by_source, date)
+
+
+def _leads_scraped(by_source: dict, date: datetime) -> dict[str, int]:
+    """Leads scraped by source, from the scraped directory if no lead_segmented events."""
+    by_source = defaultdict(int, by_source)
+    total = sum(by_source.values())
     
     # Fallback to scraped directory if no events
     if total == 0:
@@ -189,6 +197,11 @@ def _calc_enrichment_stats(events: list[dict], date: datetime) -> dict[str, Any]
         elif event.get("event_type") == "enrichment_failed":
             failed += 1
     
+    return _enrichment_stats(completed, failed, date)
+
+
+def _enrichment_stats(completed: int, failed: int, date: datetime) -> dict[str, Any]:
+    """Enrichment success rate, from the enriched directory if no enrichment events."""
     # Fallback to enriched directory if no events
     if completed == 0 and failed == 0:
         enriched_dir = HIVE_MIND / "enriched"
@@ -233,6 +246,11 @@ def _calc_email_stats(events: list[dict]) -> dict[str, int]:
         elif event_type == "email_opened":
             opened += 1
     
+    return _email_stats(sent, delivered, opened)
+
+
+def _email_stats(sent: int, delivered: int, opened: int) -> dict[str, int]:
+    """Email stats, counting queued outbox emails as sent if no campaign_sent events."""
     # If no events, check outbox for queued emails
     if sent == 0:
         outbox_dir = HIVE_MIND / "outbox"
@@ -256,23 +274,37 @@ def _calc_email_stats(events: list[dict]) -> dict[str, int]:
 def _count_replies_by_sentiment(events: list[dict]) -> dict[str, Any]:
     """Count replies by sentiment from reply_classified events."""
     by_sentiment = defaultdict(int)
-    total = 0
     
     for event in events:
         if event.get("event_type") == "reply_classified":
             payload = event.get("payload", {})
             objection_type = payload.get("objection_type", "unknown")
-            
-            # Map objection types to sentiment
-            if objection_type in ["positive_interest", "buying_signals"]:
-                sentiment = "positive"
-            elif objection_type in ["not_interested", "already_have_solution"]:
-                sentiment = "negative"
-            else:
-                sentiment = "neutral"
-            
-            by_sentiment[sentiment] += 1
-            total += 1
+            by_sentiment[_sentiment(objection_type)] += 1
+    
+    return _replies_by_sentiment(by_sentiment)
+
+
+def _sentiment(objection_type: Any) -> str:
+    """Map an objection type to reply sentiment."""
+    if objection_type in ["positive_interest", "buying_signals"]:
+        return "positive"
+    elif objection_type in ["not_interested", "already_have_solution"]:
+        return "negative"
+    return "neutral"
+
+
+def _sentiment_counts(by_objection: dict) -> dict[str, int]:
+    """Reply counts per objection type folded into sentiments."""
+    by_sentiment = defaultdict(int)
+    for objection_type, count in by_objection.items():
+        by_sentiment[_sentiment(objection_type)] += count
+    return by_sentiment
+
+
+def _replies_by_sentiment(by_sentiment: dict) -> dict[str, Any]:
+    """Replies by sentiment, from the replies directory if no reply_classified events."""
+    by_sentiment = defaultdict(int, by_sentiment)
+    total = sum(by_sentiment.values())
     
     # Fallback to replies directory
     if total == 0:
@@ -317,18 +349,31 @@ def weekly_report(week_start: datetime) -> dict[str, Any]:
     start = datetime(week_start.year, week_start.month, week_start.day, tzinfo=timezone.utc) - timedelta(days=days_since_monday)
     end = start + timedelta(days=7)
     
-    events = load_events(start_date=start, end_date=end)
+    totals = load_totals(start, end)
+    types = totals["event_type"]
     sla_targets = load_sla_targets()
     perf_targets = load_performance_targets()
     
+    by_tier = defaultdict(int)
+    for tier, count in totals["icp_tier"].items():
+        by_tier[_tier_label(tier)] += count
+    
     report = {
         "week_start": start.strftime("%Y-%m-%d"),
         "week_end": (end - timedelta(days=1)).strftime("%Y-%m-%d"),
         "generated_at": datetime.now(timezone.utc).isoformat(),
-        "icp_tier_distribution": _calc_icp_distribution(events, start),
-        "conversion_funnel": _calc_conversion_funnel(events),
-        "ae_approval_trends": _calc_ae_approval_trends(events),
-        "performance_vs_targets": _calc_performance_vs_targets(events, perf_targets),
+        "icp_tier_distribution": _icp_distribution(by_tier),
+        "conversion_funnel": _conversion_funnel_from_totals(totals),
+        "ae_approval_trends": _ae_approval_trends(
+            types["campaign_approved"], types["campaign_rejected"], totals["rejection_reason"]
+        ),
+        "performance_vs_targets": _performance_vs_targets(
+            types["campaign_sent"],
+            types["email_opened"],
+            types["reply_classified"],
+            totals["reply_objection"]["positive_interest"],
+            perf_targets,
+        ),
     }
     
     return report
@@ -337,14 +382,23 @@ def weekly_report(week_start: datetime) -> dict[str, Any]:
 def _calc_icp_distribution(events: list[dict], start: datetime) -> dict[str, Any]:
     """Calculate ICP tier distribution from segmented outputs."""
     by_tier = defaultdict(int)
-    total = 0
     
     for event in events:
         if event.get("event_type") == "lead_segmented":
             tier = event.get("payload", {}).get("tier", "unknown")
-            tier_str = f"tier_{tier}" if isinstance(tier, int) else str(tier)
-            by_tier[tier_str] += 1
-            total += 1
+            by_tier[_tier_label(tier)] += 1
+    
+    return _icp_distribution(by_tier)
+
+
+def _tier_label(tier: Any) -> str:
+    return f"tier_{tier}" if isinstance(tier, int) else str(tier)
+
+
+def _icp_distribution(by_tier: dict) -> dict[str, Any]:
+    """ICP tier percentages, from the segmented directory if no lead_segmented events."""
+    by_tier = defaultdict(int, by_tier)
+    total = sum(by_tier.values())
     
     # Fallback to segmented directory
     if total == 0:
@@ -405,6 +459,20 @@ def _calc_conversion_funnel(events: list[dict]) -> dict[str, int]:
     return funnel
 
 
+def _conversion_funnel_from_totals(totals: dict[str, Counter]) -> dict[str, int]:
+    """Conversion funnel from rollup totals (same stages as _calc_conversion_funnel)."""
+    types = totals["event_type"]
+    return {
+        "scraped": totals["scraped"][None],
+        "enriched": types["enrichment_completed"],
+        "segmented": types["lead_segmented"],
+        "campaigns_created": types["campaign_created"],
+        "emails_sent": sum(totals["campaign_sent"].values()),
+        "replies": types["reply_classified"],
+        "meetings": types["meeting_booked"],
+    }
+
+
 def _calc_ae_approval_trends(events: list[dict]) -> dict[str, Any]:
     """Calculate AE approval/rejection trends from Gatekeeper queue."""
     approved = 0
@@ -420,6 +488,13 @@ def _calc_ae_approval_trends(events: list[dict]) -> dict[str, Any]:
             reason = event.get("payload", {}).get("reason", "unspecified")
             rejection_reasons[reason] += 1
     
+    return _ae_approval_trends(approved, rejected, rejection_reasons)
+
+
+def _ae_approval_trends(approved: int, rejected: int, rejection_reasons: dict) -> dict[str, Any]:
+    """Approval rate and rejection reasons, from review_queue.json if no review events."""
+    rejection_reasons = defaultdict(int, rejection_reasons)
+    
     # Fallback to review_queue.json
     if approved == 0 and rejected == 0:
         queue_data = load_queue_file("review_queue.json")
@@ -453,6 +528,17 @@ def _calc_performance_vs_targets(events: list[dict], targets: dict) -> dict[str,
         and e.get("payload", {}).get("objection_type") == "positive_interest"
     )
     
+    return _performance_vs_targets(emails_sent, emails_opened, replies, positive_replies, targets)
+
+
+def _performance_vs_targets(
+    emails_sent: int,
+    emails_opened: int,
+    replies: int,
+    positive_replies: int,
+    targets: dict
+) -> dict[str, Any]:
+    """Compare open/reply/positive-reply rates against targets."""
     actual = {
         "open_rate": round(emails_opened / max(emails_sent, 1), 3),
         "reply_rate": round(replies / max(emails_sent, 1), 3),
@@ -504,15 +590,15 @@ def monthly_report(month_start: datetime) -> dict[str, Any]:
     else:
         end = datetime(month_start.year, month_start.month + 1, 1, tzinfo=timezone.utc)
     
-    events = load_events(start_date=start, end_date=end)
+    totals = load_totals(start, end)
     
     report = {
         "month": start.strftime("%Y-%m"),
         "generated_at": datetime.now(timezone.utc).isoformat(),
         "roi_analysis": _placeholder_roi_analysis(),
-        "campaign_performance": _calc_campaign_performance(events),
-        "compliance_audit": _calc_compliance_audit(events),
-        "system_health": _calc_system_health(events),
+        "campaign_performance": _campaign_performance_from_totals(totals),
+        "compliance_audit": _compliance_audit(totals["compliance_violation"]),
+        "system_health": _system_health_from_totals(totals),
     }
     
     return report
@@ -550,6 +636,28 @@ def _calc_campaign_performance(events: list[dict]) -> dict[str, Any]:
         elif event_type == "meeting_booked":
             campaigns[campaign_id]["meetings"] += 1
     
+    return _campaign_performance(campaigns)
+
+
+def _campaign_performance_from_totals(totals: dict[str, Counter]) -> dict[str, Any]:
+    """Campaign performance from the per-campaign rollup metrics."""
+    campaigns = defaultdict(lambda: {
+        "sent": 0, "opened": 0, "replied": 0, "meetings": 0
+    })
+    for stat, metric in (
+        ("sent", "campaign_sent"),
+        ("opened", "campaign_opened"),
+        ("replied", "campaign_replied"),
+        ("meetings", "campaign_meetings"),
+    ):
+        for campaign_id, value in totals[metric].items():
+            campaigns[campaign_id][stat] += value
+    
+    return _campaign_performance(campaigns)
+
+
+def _campaign_performance(campaigns: dict[Any, dict[str, int]]) -> dict[str, Any]:
+    """Open/reply/meeting rates for campaigns with sends."""
     # Calculate performance metrics for each campaign
     performance = {}
     for campaign_id, stats in campaigns.items():
@@ -570,13 +678,18 @@ def _calc_campaign_performance(events: list[dict]) -> dict[str, Any]:
 def _calc_compliance_audit(events: list[dict]) -> dict[str, Any]:
     """Count compliance_failed events by type."""
     by_type = defaultdict(int)
-    total_violations = 0
     
     for event in events:
         if event.get("event_type") == "compliance_failed":
             violation_type = event.get("payload", {}).get("violation_type", "unknown")
             by_type[violation_type] += 1
-            total_violations += 1
+    
+    return _compliance_audit(by_type)
+
+
+def _compliance_audit(by_type: dict) -> dict[str, Any]:
+    """Compliance violation summary from counts per violation type."""
+    total_violations = sum(by_type.values())
     
     return {
         "total_violations": total_violations,
@@ -608,7 +721,31 @@ def _calc_system_health(events: list[dict]) -> dict[str, Any]:
         elif event_type == "sla_breach":
             sla_breaches += 1
     
-    total_events = len(events)
+    return _system_health(retries, errors, sla_breaches, error_types, len(events))
+
+
+def _system_health_from_totals(totals: dict[str, Counter]) -> dict[str, Any]:
+    """System health summary from rollup totals."""
+    types = totals["event_type"]
+    error_types = defaultdict(int, totals["error_category"])
+    for event_type in ["enrichment_failed", "scrape_failed"]:
+        if types[event_type]:
+            error_types[event_type] += types[event_type]
+    errors = types["system_error"] + types["enrichment_failed"] + types["scrape_failed"]
+    
+    return _system_health(
+        types["retry_scheduled"], errors, types["sla_breach"], error_types, sum(types.values())
+    )
+
+
+def _system_health(
+    retries: int,
+    errors: int,
+    sla_breaches: int,
+    error_types: dict,
+    total_events: int
+) -> dict[str, Any]:
+    """Health status from retry/error/SLA breach counts."""
     error_rate = round(errors / max(total_events, 1) * 100, 2)
     
     # Determine health status
@@ -11,7 +11,7 @@ from enum import Enum
 from pathlib import Path
 from typing import Any, Callable, Optional
 
-from core.event_log import log_event, EventType, EVENTS_FILE
+from core.event_log import log_event, iter_events, EventType, EVENTS_FILE
 
 
 class OperationType(Enum):
@@ -239,9 +239,6 @@ def _compute_metrics_from_events() -> dict[str, Any]:
         "compliance_failure_count_1h": 0,
     }
 
-    if not EVENTS_FILE.exists():
-        return metrics
-
     now = datetime.now(timezone.utc)
     one_hour_ago = now - timedelta(hours=1)
 
@@ -253,40 +250,32 @@ def _compute_metrics_from_events() -> dict[str, Any]:
     compliance_failures_1h = 0
 
     try:
-        with open(EVENTS_FILE, "r", encoding="utf-8") as f:
-            for line in f:
-                if not line.strip():
-                    continue
+        for event in iter_events(events_file=EVENTS_FILE):
+            event_type = event.get("event_type", "")
+            timestamp_str = event.get("timestamp", "")
+
+            if event_type == EventType.CAMPAIGN_SENT.value:
+                total_sends += 1
+                total_operations += 1
+
+            if event_type == EventType.SYSTEM_ERROR.value:
+                errors += 1
+                total_operations += 1
+
+            payload = event.get("payload", {})
+            if payload.get("bounce"):
+                bounces += 1
+            if payload.get("spam_complaint"):
+                spam_complaints += 1
+
+            if event_type == EventType.COMPLIANCE_FAILED.value:
                 try:
-                    event = json.loads(line)
-                    event_type = event.get("event_type", "")
-                    timestamp_str = event.get("timestamp", "")
-
-                    if event_type == EventType.CAMPAIGN_SENT.value:
-                        total_sends += 1
-                        total_operations += 1
-
-                    if event_type == EventType.SYSTEM_ERROR.value:
-                        errors += 1
-                        total_operations += 1
-
-                    payload = event.get("payload", {})
-                    if payload.get("bounce"):
-                        bounces += 1
-                    if payload.get("spam_complaint"):
-                        spam_complaints += 1
-
-                    if event_type == EventType.COMPLIANCE_FAILED.value:
-                        try:
-                            ts = datetime.fromisoformat(timestamp_str.replace("Z", "+00:00"))
-                            if ts >= one_hour_ago:
-                                compliance_failures_1h += 1
-                        except (ValueError, TypeError):
-                            pass
-
-                except json.JSONDecodeError:
-                    continue
-    except IOError:
+                    ts = datetime.fromisoformat(timestamp_str.replace("Z", "+00:00"))
+                    if ts >= one_hour_ago:
+                        compliance_failures_1h += 1
+                except (ValueError, TypeError):
+                    pass
+    except OSError:
         pass
 
     if total_sends > 0:
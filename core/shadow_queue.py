@@ -7,16 +7,21 @@ Solves the local-vs-Railway filesystem mismatch:
 - Dashboard runs on Railway → reads from Redis (shared Upstash instance)
 
 Key pattern: caio:shadow:email:{email_id}
+Status indexes (ZSET, score = epoch of last transition):
+  caio:shadow:pending_ids             (pending — legacy key, kept for compat)
+  caio:shadow:status:{status}         (approved / rejected / sent)
 """
 
 from __future__ import annotations
 
+import copy
 import json
 import logging
 import os
+import time
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 logger = logging.getLogger("shadow_queue")
 
@@ -28,6 +33,14 @@ except Exception:
 _client: Optional[Any] = None
 _init_done = False
 
+# In-process cache of list_pending() pages: (prefix, limit) -> (expires_at, emails).
+# The dashboard polls the pending queue constantly, and /api/pending-emails can
+# read it twice per request. Off unless SHADOW_QUEUE_PAGE_CACHE_TTL_SECONDS > 0;
+# local writes invalidate it, writes from other processes show up after the TTL.
+_page_cache: Dict[Tuple[str, int], Tuple[float, List[Dict[str, Any]]]] = {}
+# Bumped on every invalidation; a read that overlapped one does not fill the cache.
+_page_cache_generation = 0
+
 
 def _get_redis() -> Optional[Any]:
     """Lazy-init Redis client from REDIS_URL env var."""
@@ -71,6 +84,235 @@ def _index_key() -> str:
     return f"{_prefix()}:shadow:pending_ids"
 
 
+def _page_cache_ttl() -> float:
+    try:
+        return max(0.0, float(os.getenv("SHADOW_QUEUE_PAGE_CACHE_TTL_SECONDS", "0") or 0))
+    except ValueError:
+        return 0.0
+
+
+def invalidate_page_cache() -> None:
+    """Drop cached list_pending() pages (called before and after every local write)."""
+    global _page_cache_generation
+    _page_cache_generation += 1
+    _page_cache.clear()
+
+
+# Statuses that get their own sorted-set index. "pending" keeps the legacy
+# pending_ids key so pending_count()/queue_watcher keep working unchanged.
+INDEXED_STATUSES = ("pending", "approved", "rejected", "sent")
+
+# Timestamp fields used to score backfilled entries, most specific first.
+_STATUS_TIME_FIELDS = {
+    "pending": ("timestamp", "created_at"),
+    "approved": ("approved_at", "timestamp"),
+    "rejected": ("rejected_at", "timestamp"),
+    "sent": ("sent_at", "approved_at", "timestamp"),
+}
+
+
+def _status_index_key(status: str) -> str:
+    if status == "pending":
+        return _index_key()
+    return f"{_prefix()}:shadow:status:{status}"
+
+
+def _stage_status_index(pipe: Any, email_id: str, status: str, score: float) -> None:
+    """Queue index moves on a pipeline: drop from every other status, add to this one."""
+    for other in INDEXED_STATUSES:
+        if other != status:
+            pipe.zrem(_status_index_key(other), email_id)
+    if status in INDEXED_STATUSES:
+        pipe.zadd(_status_index_key(status), {email_id: score})
+
+
+def _parse_score(value: Any) -> Optional[float]:
+    if not value:
+        return None
+    try:
+        dt = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.timestamp()
+
+
+def _score_for(data: Dict[str, Any], status: str) -> float:
+    for field_name in _STATUS_TIME_FIELDS.get(status, ("timestamp",)):
+        score = _parse_score(data.get(field_name))
+        if score is not None:
+            return score
+    return datetime.now(timezone.utc).timestamp()
+
+
+# ──────────────────────────────────────────────────────────────────
+# Filesystem index
+# ──────────────────────────────────────────────────────────────────
+#
+# Files are named {email_id}.json, so most lookups are a single stat. Older
+# writers used other names; for those, an append-only manifest in the shadow
+# dir maps email_id -> filename. A manifest whose header says "complete"
+# (written by rebuild_file_index() or by the first push into an empty dir)
+# lets a miss return immediately instead of parsing every file.
+
+FILE_INDEX_NAME = ".email_index.jsonl"
+_FILE_INDEX_VERSION = 1
+
+# Resolved shadow dir -> {"offset", "complete", "files"}; tails the manifest.
+_file_index_cache: Dict[str, Dict[str, Any]] = {}
+
+
+def _canonical_path(shadow_dir: Path, email_id: str) -> Optional[Path]:
+    if not email_id or "/" in email_id or "\\" in email_id:
+        return None
+    return shadow_dir / f"{email_id}.json"
+
+
+def _load_file_index(shadow_dir: Path) -> Dict[str, Any]:
+    """Return the cached manifest for ``shadow_dir``, reading only new appends."""
+    cache_key = str(shadow_dir.resolve())
+    entry = _file_index_cache.get(cache_key)
+    manifest = shadow_dir / FILE_INDEX_NAME
+    try:
+        size = manifest.stat().st_size
+    except OSError:
+        size = 0
+    if entry is None or size < entry["offset"]:
+        # First load, or the manifest was rebuilt/truncated underneath us.
+        entry = {"offset": 0, "complete": False, "files": {}}
+        _file_index_cache[cache_key] = entry
+    if size > entry["offset"]:
+        with open(manifest, "rb") as f:
+            f.seek(entry["offset"])
+            chunk = f.read()
+        # Only consume whole lines; a concurrent append may be mid-write.
+        consumed = chunk.rfind(b"\n") + 1
+        for line in chunk[:consumed].splitlines():
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            if record.get("_index"):
+                entry["complete"] = bool(record.get("complete"))
+            elif record.get("email_id") and record.get("file"):
+                entry["files"][str(record["email_id"])] = str(record["file"])
+        entry["offset"] += consumed
+    return entry
+
+
+def _append_file_index(shadow_dir: Path, records: List[Dict[str, Any]]) -> None:
+    lines = "".join(json.dumps(rec, ensure_ascii=False) + "\n" for rec in records)
+    with open(shadow_dir / FILE_INDEX_NAME, "a", encoding="utf-8") as f:
+        f.write(lines)
+
+
+def _record_email_file(shadow_dir: Path, email_id: str, filename: str, from_push: bool = False) -> None:
+    """Add ``email_id -> filename`` to the manifest unless it is already there."""
+    try:
+        manifest_exists = (shadow_dir / FILE_INDEX_NAME).exists()
+        index = _load_file_index(shadow_dir)
+        if index["files"].get(email_id) == filename:
+            return
+        records: List[Dict[str, Any]] = []
+        if from_push and not manifest_exists:
+            # A dir holding nothing but this email is fully described by the manifest.
+            others = (f for f in shadow_dir.glob("*.json") if f.name != filename)
+            if next(others, None) is None:
+                records.append({"_index": "shadow_email_files", "version": _FILE_INDEX_VERSION, "complete": True})
+        records.append({"email_id": email_id, "file": filename})
+        _append_file_index(shadow_dir, records)
+    except OSError as exc:
+        logger.debug("Shadow file index append failed for %s: %s", email_id, exc)
+
+
+def _find_email_file(shadow_dir: Path, email_id: str) -> Optional[Path]:
+    """
+    Locate the file holding ``email_id``: canonical name, then manifest, then
+    (only for directories never indexed) a legacy full scan.
+    """
+    canonical = _canonical_path(shadow_dir, email_id)
+    if canonical is not None and canonical.exists():
+        return canonical
+
+    index = _load_file_index(shadow_dir)
+    filename = index["files"].get(email_id)
+    if filename:
+        candidate = shadow_dir / filename
+        if candidate.exists():
+            return candidate
+    if index["complete"]:
+        return None
+
+    for f in shadow_dir.glob("*.json"):
+        try:
+            with open(f, encoding="utf-8") as fp:
+                data = json.load(fp)
+        except Exception:
+            continue
+        if data.get("email_id") == email_id or f.stem == email_id:
+            _record_email_file(shadow_dir, email_id, f.name)
+            return f
+    return None
+
+
+def rebuild_file_index(shadow_dir: Path, rename_to_canonical: bool = False) -> Dict[str, Any]:
+    """
+    Rebuild the manifest for ``shadow_dir`` from the files on disk.
+
+    Repairs directories written by older versions. With
+    ``rename_to_canonical`` files are also moved to ``{email_id}.json`` when
+    that name is free, so later lookups never need the manifest.
+    """
+    summary: Dict[str, Any] = {
+        "shadow_dir": str(shadow_dir),
+        "files_scanned": 0,
+        "indexed": 0,
+        "non_canonical": 0,
+        "renamed": 0,
+        "duplicates": 0,
+        "unreadable": 0,
+    }
+    if not shadow_dir.exists():
+        return summary
+
+    files: Dict[str, str] = {}
+    for f in sorted(shadow_dir.glob("*.json")):
+        summary["files_scanned"] += 1
+        try:
+            with open(f, encoding="utf-8") as fp:
+                data = json.load(fp)
+            email_id = str(data.get("email_id") or f.stem)
+        except Exception:
+            summary["unreadable"] += 1
+            continue
+        canonical = _canonical_path(shadow_dir, email_id)
+        if email_id in files:
+            summary["duplicates"] += 1
+            # Prefer the canonical file when an id appears twice.
+            if canonical is None or f != canonical:
+                continue
+        if canonical is not None and f != canonical:
+            summary["non_canonical"] += 1
+            if rename_to_canonical and not canonical.exists():
+                os.replace(f, canonical)
+                f = canonical
+                summary["renamed"] += 1
+        files[email_id] = f.name
+
+    records = [{"_index": "shadow_email_files", "version": _FILE_INDEX_VERSION, "complete": True}]
+    # Canonical files resolve by name; the manifest only needs the exceptions,
+    # but listing everything keeps it a faithful inventory for repair tooling.
+    records.extend({"email_id": eid, "file": name} for eid, name in files.items())
+    tmp = shadow_dir / f"{FILE_INDEX_NAME}.tmp"
+    with open(tmp, "w", encoding="utf-8") as fh:
+        fh.write("".join(json.dumps(rec, ensure_ascii=False) + "\n" for rec in records))
+    os.replace(tmp, shadow_dir / FILE_INDEX_NAME)
+    _file_index_cache.pop(str(shadow_dir.resolve()), None)
+    summary["indexed"] = len(files)
+    return summary
+
+
 # ──────────────────────────────────────────────────────────────────
 # Write
 # ──────────────────────────────────────────────────────────────────
@@ -84,19 +326,26 @@ def push(email_data: Dict[str, Any], shadow_dir: Optional[Path] = None) -> bool:
     email_id = email_data.get("email_id", "")
     wrote_redis = False
     wrote_file = False
+    invalidate_page_cache()
 
     # Redis write
     r = _get_redis()
     if r:
         try:
-            r.set(_key(email_id), json.dumps(email_data, ensure_ascii=False),
-                  ex=604800)  # 7-day TTL -- stale emails auto-expire
-            # Maintain a sorted set of pending IDs (score = timestamp for ordering)
-            if email_data.get("status") == "pending":
-                r.zadd(_index_key(), {email_id: datetime.now(timezone.utc).timestamp()})
+            # Record + status index move in one MULTI so readers never see a
+            # record indexed under a stale status.
+            pipe = r.pipeline(transaction=True)
+            pipe.set(_key(email_id), json.dumps(email_data, ensure_ascii=False),
+                     ex=604800)  # 7-day TTL -- stale emails auto-expire
+            _stage_status_index(
+                pipe, email_id, str(email_data.get("status") or ""),
+                datetime.now(timezone.utc).timestamp(),
+            )
+            pipe.execute()
             wrote_redis = True
         except Exception as exc:
             logger.warning("Shadow queue Redis write failed for %s: %s", email_id, exc)
+        invalidate_page_cache()
 
     # Filesystem write (local dev + backup)
     if shadow_dir:
@@ -106,6 +355,7 @@ def push(email_data: Dict[str, Any], shadow_dir: Optional[Path] = None) -> bool:
             with open(filepath, "w", encoding="utf-8") as f:
                 json.dump(email_data, f, indent=2, ensure_ascii=False)
             wrote_file = True
+            _record_email_file(shadow_dir, email_id, filepath.name, from_push=True)
         except Exception as exc:
             logger.warning("Shadow queue file write failed for %s: %s", email_id, exc)
 
@@ -116,6 +366,57 @@ def push(email_data: Dict[str, Any], shadow_dir: Optional[Path] = None) -> bool:
 # Read
 # ──────────────────────────────────────────────────────────────────
 
+def _read_pending_page(r: Any, limit: int) -> List[Dict[str, Any]]:
+    """
+    Read one page of pending emails in a fixed number of round trips:
+    ZREVRANGE + MGET, plus one pipeline for stale-index cleanup when needed.
+    """
+    index_key = _index_key()
+    # Get pending IDs from sorted set (newest first)
+    pending_ids = r.zrevrange(index_key, 0, limit - 1)
+    if pending_ids:
+        pending = []
+        stale = []
+        raws = r.mget([_key(eid) for eid in pending_ids])
+        for eid, raw in zip(pending_ids, raws):
+            if not raw:
+                # Stale index entry (record expired)
+                stale.append(eid)
+                continue
+            data = json.loads(raw)
+            if data.get("status") == "pending":
+                pending.append(data)
+            else:
+                # Status changed without an index move
+                stale.append(eid)
+        if stale:
+            r.zrem(index_key, *stale)
+        if pending:
+            return pending
+
+    # If index is empty but we have Redis, check for stray keys
+    # (migration scenario where keys exist but index doesn't)
+    pattern = f"{_prefix()}:shadow:email:*"
+    keys = list(r.scan_iter(match=pattern, count=100))
+    if not keys:
+        return []
+    pending = []
+    rebuild: Dict[str, float] = {}
+    for raw in r.mget(keys[:limit * 2]):
+        if not raw:
+            continue
+        data = json.loads(raw)
+        if data.get("status") == "pending":
+            pending.append(data)
+            eid = data.get("email_id", "")
+            if eid:
+                rebuild[eid] = _score_for(data, "pending")
+    if rebuild:
+        r.zadd(index_key, rebuild)
+    pending.sort(key=lambda e: e.get("timestamp", ""), reverse=True)
+    return pending[:limit]
+
+
 def list_pending(limit: int = 20, shadow_dir: Optional[Path] = None) -> List[Dict[str, Any]]:
     """
     Return pending shadow emails. Redis first, filesystem fallback.
@@ -123,50 +424,20 @@ def list_pending(limit: int = 20, shadow_dir: Optional[Path] = None) -> List[Dic
     # Try Redis
     r = _get_redis()
     if r:
+        ttl = _page_cache_ttl()
+        cache_key = (_prefix(), limit)
+        if ttl:
+            cached = _page_cache.get(cache_key)
+            if cached and cached[0] > time.monotonic():
+                # Callers decorate the dicts in place; never hand out the cached ones.
+                return copy.deepcopy(cached[1])
+        generation = _page_cache_generation
         try:
-            # Get pending IDs from sorted set (newest first)
-            pending_ids = r.zrevrange(_index_key(), 0, limit - 1)
-            if pending_ids:
-                pending = []
-                for eid in pending_ids:
-                    raw = r.get(_key(eid))
-                    if not raw:
-                        # Stale index entry — remove
-                        r.zrem(_index_key(), eid)
-                        continue
-                    data = json.loads(raw)
-                    if data.get("status") == "pending":
-                        pending.append(data)
-                    else:
-                        # Status changed — remove from pending index
-                        r.zrem(_index_key(), eid)
-                if pending:
-                    return pending
-            # If index is empty but we have Redis, check for stray keys
-            # (migration scenario where keys exist but index doesn't)
-            pattern = f"{_prefix()}:shadow:email:*"
-            keys = list(r.scan_iter(match=pattern, count=100))
-            if keys:
-                pending = []
-                for key in keys[:limit * 2]:
-                    raw = r.get(key)
-                    if not raw:
-                        continue
-                    data = json.loads(raw)
-                    if data.get("status") == "pending":
-                        pending.append(data)
-                        # Rebuild index
-                        eid = data.get("email_id", "")
-                        if eid:
-                            ts = data.get("timestamp", "")
-                            try:
-                                score = datetime.fromisoformat(ts.replace("+00:00", "+00:00")).timestamp()
-                            except Exception:
-                                score = datetime.now(timezone.utc).timestamp()
-                            r.zadd(_index_key(), {eid: score})
-                if pending:
-                    pending.sort(key=lambda e: e.get("timestamp", ""), reverse=True)
-                    return pending[:limit]
+            pending = _read_pending_page(r, limit)
+            if pending:
+                if ttl and generation == _page_cache_generation:
+                    _page_cache[cache_key] = (time.monotonic() + ttl, copy.deepcopy(pending))
+                return pending
         except Exception as exc:
             logger.warning("Shadow queue Redis read failed: %s", exc)
 
@@ -201,6 +472,7 @@ def update_status(
     Update email status in Redis and filesystem. Returns updated data or None.
     """
     data = None
+    invalidate_page_cache()
 
     # Redis update
     r = _get_redis()
@@ -212,34 +484,147 @@ def update_status(
                 data["status"] = new_status
                 if extra_fields:
                     data.update(extra_fields)
-                r.set(_key(email_id), json.dumps(data, ensure_ascii=False))
-                # Remove from pending index if no longer pending
-                if new_status != "pending":
-                    r.zrem(_index_key(), email_id)
+                pipe = r.pipeline(transaction=True)
+                pipe.set(_key(email_id), json.dumps(data, ensure_ascii=False))
+                _stage_status_index(
+                    pipe, email_id, new_status, datetime.now(timezone.utc).timestamp(),
+                )
+                pipe.execute()
         except Exception as exc:
             logger.warning("Shadow queue Redis update failed for %s: %s", email_id, exc)
+        invalidate_page_cache()
 
     # Filesystem update
     if shadow_dir and shadow_dir.exists():
-        for f in shadow_dir.glob("*.json"):
+        f = _find_email_file(shadow_dir, email_id)
+        if f is not None:
             try:
                 with open(f) as fp:
                     fdata = json.load(fp)
-                if fdata.get("email_id") == email_id or f.stem == email_id:
-                    fdata["status"] = new_status
-                    if extra_fields:
-                        fdata.update(extra_fields)
-                    with open(f, "w", encoding="utf-8") as fp:
-                        json.dump(fdata, fp, indent=2, ensure_ascii=False)
-                    if data is None:
-                        data = fdata
-                    break
-            except Exception:
-                continue
+                fdata["status"] = new_status
+                if extra_fields:
+                    fdata.update(extra_fields)
+                with open(f, "w", encoding="utf-8") as fp:
+                    json.dump(fdata, fp, indent=2, ensure_ascii=False)
+                if data is None:
+                    data = fdata
+            except Exception as exc:
+                logger.warning("Shadow queue file update failed for %s: %s", email_id, exc)
 
     return data
 
 
+def list_by_status(
+    status: str,
+    cursor: int = 0,
+    limit: int = 50,
+) -> Tuple[List[Dict[str, Any]], int]:
+    """
+    Page through emails in a status index (newest transition first).
+
+    Returns ``(emails, next_cursor)``; ``next_cursor`` is 0 once the index is
+    exhausted (same convention as Redis SCAN). One ZREVRANGE + one MGET per
+    page; index entries whose record expired or moved status are pruned in a
+    single pipeline. Redis-only — returns ``([], 0)`` without Redis.
+    """
+    if status not in INDEXED_STATUSES or limit <= 0:
+        return [], 0
+    r = _get_redis()
+    if not r:
+        return [], 0
+
+    index_key = _status_index_key(status)
+    try:
+        ids = r.zrevrange(index_key, cursor, cursor + limit - 1)
+        if not ids:
+            return [], 0
+        raws = r.mget([_key(eid) for eid in ids])
+        emails: List[Dict[str, Any]] = []
+        stale: List[str] = []
+        for eid, raw in zip(ids, raws):
+            if not raw:
+                stale.append(eid)
+                continue
+            data = json.loads(raw)
+            if data.get("status") != status:
+                stale.append(eid)
+                continue
+            emails.append(data)
+        if stale:
+            r.zrem(index_key, *stale)
+    except Exception as exc:
+        logger.warning("Shadow queue list_by_status(%s) failed: %s", status, exc)
+        return [], 0
+
+    if len(ids) < limit:
+        return emails, 0
+    # Pruned entries shift the remaining members up by len(stale).
+    return emails, cursor + len(ids) - len(stale)
+
+
+def get_email_history(limit: int = 100) -> List[Dict[str, Any]]:
+    """Most recently reviewed (approved + rejected) emails, newest first."""
+    reviewed: List[Dict[str, Any]] = []
+    for status in ("approved", "rejected"):
+        emails, _ = list_by_status(status, limit=limit)
+        reviewed.extend(emails)
+    reviewed.sort(
+        key=lambda e: str(e.get("approved_at") or e.get("rejected_at") or e.get("timestamp") or ""),
+        reverse=True,
+    )
+    return reviewed[:limit]
+
+
+def backfill_status_indexes(batch_size: int = 500, dry_run: bool = False) -> Dict[str, Any]:
+    """
+    Build the status indexes from existing ``shadow:email:*`` keys.
+
+    One-shot migration for records written before the indexes existed.
+    Keys are read in MGET batches and indexed with one pipeline per batch.
+    """
+    summary: Dict[str, Any] = {
+        "scanned": 0,
+        "indexed": {status: 0 for status in INDEXED_STATUSES},
+        "unindexed_status": 0,
+        "dry_run": dry_run,
+    }
+    r = _get_redis()
+    if not r:
+        summary["error"] = "redis_unavailable"
+        return summary
+
+    def _flush(keys: List[str]) -> None:
+        raws = r.mget(keys)
+        pipe = r.pipeline(transaction=False)
+        for raw in raws:
+            if not raw:
+                continue
+            try:
+                data = json.loads(raw)
+            except (TypeError, ValueError):
+                continue
+            email_id = str(data.get("email_id") or "")
+            status = str(data.get("status") or "")
+            if not email_id or status not in INDEXED_STATUSES:
+                summary["unindexed_status"] += 1
+                continue
+            summary["indexed"][status] += 1
+            _stage_status_index(pipe, email_id, status, _score_for(data, status))
+        if not dry_run:
+            pipe.execute()
+
+    batch: List[str] = []
+    for key in r.scan_iter(match=f"{_prefix()}:shadow:email:*", count=batch_size):
+        batch.append(key)
+        summary["scanned"] += 1
+        if len(batch) >= batch_size:
+            _flush(batch)
+            batch = []
+    if batch:
+        _flush(batch)
+    return summary
+
+
 def pending_count() -> int:
     """Fast O(1) count of pending emails via Redis ZCARD."""
     r = _get_redis()
@@ -256,6 +641,7 @@ def clear_pending() -> int:
 
     Returns the number of deleted email records.
     """
+    invalidate_page_cache()
     r = _get_redis()
     if not r:
         return 0
@@ -265,9 +651,10 @@ def clear_pending() -> int:
         for key in r.scan_iter(f"{_prefix()}:shadow:email:*"):
             r.delete(key)
             deleted += 1
-        r.delete(_index_key())
+        r.delete(*[_status_index_key(status) for status in INDEXED_STATUSES])
     except Exception as exc:
         logger.warning("clear_pending failed: %s", exc)
+    invalidate_page_cache()
 
     return deleted
 
@@ -284,13 +671,12 @@ def get_email(email_id: str, shadow_dir: Optional[Path] = None) -> Optional[Dict
             pass
 
     if shadow_dir and shadow_dir.exists():
-        for f in shadow_dir.glob("*.json"):
+        f = _find_email_file(shadow_dir, email_id)
+        if f is not None:
             try:
                 with open(f) as fp:
-                    data = json.load(fp)
-                if data.get("email_id") == email_id or f.stem == email_id:
-                    return data
+                    return json.load(fp)
             except Exception:
-                continue
+                pass
 
     return None
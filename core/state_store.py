@@ -4,7 +4,8 @@ Unified state storage for OPERATOR and Cadence.
 
 Supports:
 - Redis source-of-truth with dual-read fallback from file state
-- File backend fallback when Redis is unavailable
+- SQLite (WAL) backend for single-host deployments (STATE_BACKEND=sqlite)
+- File backend fallback when Redis/SQLite is unavailable
 - Distributed locks for live dispatch paths
 """
 
@@ -14,11 +15,14 @@ import hashlib
 import json
 import logging
 import os
+import sqlite3
 import tempfile
+import threading
 import uuid
-from datetime import date
+from contextlib import contextmanager
+from datetime import date, datetime, time as dt_time, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
 try:
     import redis
@@ -33,6 +37,19 @@ def normalize_email(email: str) -> str:
     return (email or "").strip().lower()
 
 
+def _utc_now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+def _due_date_score(value: Any) -> Optional[float]:
+    """Epoch (UTC midnight) for an ISO next_step_due date, None if unparseable."""
+    try:
+        due = date.fromisoformat(str(value or ""))
+    except ValueError:
+        return None
+    return datetime.combine(due, dt_time.min, tzinfo=timezone.utc).timestamp()
+
+
 def cadence_email_hash(email: str) -> str:
     normalized = normalize_email(email)
     if not normalized:
@@ -48,7 +65,12 @@ class StateStore:
     - {prefix}:operator:state:{YYYY-MM-DD}
     - {prefix}:operator:batch:{batch_id}
     - {prefix}:cadence:lead:{email_hash}
+    - {prefix}:cadence:due:{cadence_id}   (ZSET email_hash -> next_step_due epoch)
     - {prefix}:locks:operator:{motion}
+
+    STATE_BACKEND=sqlite keeps the same records in {hive_dir}/state_store.db
+    (override with STATE_SQLITE_PATH), with status/cadence_id/next_step_due
+    as indexed columns so due-action scans are range queries.
     """
 
     def __init__(self, hive_dir: Optional[Path] = None):
@@ -59,6 +81,11 @@ class StateStore:
         self.redis_prefix = (os.getenv("STATE_REDIS_PREFIX") or "caio").strip() or "caio"
         self.redis_url = (os.getenv("REDIS_URL") or "").strip()
         self._redis_client = None
+        self.sqlite_path = Path(
+            (os.getenv("STATE_SQLITE_PATH") or "").strip() or (self.hive_dir / "state_store.db")
+        )
+        self._sqlite_ready = False
+        self._local = threading.local()
 
         self._dual_read_enabled = (os.getenv("STATE_DUAL_READ_ENABLED") or "true").strip().lower() in {
             "1", "true", "yes", "on"
@@ -74,6 +101,7 @@ class StateStore:
         self.cadence_state_dir.mkdir(parents=True, exist_ok=True)
 
         self._init_redis()
+        self._init_sqlite()
 
     # ------------------------------------------------------------------
     # Redis helpers
@@ -138,6 +166,172 @@ class StateStore:
             logger.warning("Redis scan failed for pattern=%s: %s", pattern, exc)
             return []
 
+    # ------------------------------------------------------------------
+    # SQLite helpers
+    # ------------------------------------------------------------------
+
+    def _init_sqlite(self) -> None:
+        if self.backend != "sqlite":
+            return
+        try:
+            self.sqlite_path.parent.mkdir(parents=True, exist_ok=True)
+            with self._sqlite_transaction() as conn:
+                conn.execute("""
+                    CREATE TABLE IF NOT EXISTS operator_state (
+                        state_date TEXT PRIMARY KEY,
+                        payload TEXT NOT NULL,
+                        updated_at TEXT NOT NULL
+                    )
+                """)
+                conn.execute("""
+                    CREATE TABLE IF NOT EXISTS operator_batches (
+                        batch_id TEXT PRIMARY KEY,
+                        status TEXT,
+                        created_at TEXT,
+                        payload TEXT NOT NULL,
+                        updated_at TEXT NOT NULL
+                    )
+                """)
+                conn.execute("""
+                    CREATE TABLE IF NOT EXISTS cadence_leads (
+                        email_hash TEXT PRIMARY KEY,
+                        email TEXT NOT NULL,
+                        status TEXT,
+                        cadence_id TEXT,
+                        next_step_due TEXT,
+                        payload TEXT NOT NULL,
+                        updated_at TEXT NOT NULL
+                    )
+                """)
+                conn.execute("""
+                    CREATE INDEX IF NOT EXISTS idx_batches_status
+                    ON operator_batches(status, created_at)
+                """)
+                conn.execute("""
+                    CREATE INDEX IF NOT EXISTS idx_cadence_due
+                    ON cadence_leads(status, cadence_id, next_step_due)
+                """)
+            self._sqlite_ready = True
+            logger.info("StateStore using SQLite backend at %s.", self.sqlite_path)
+        except sqlite3.Error as exc:
+            logger.warning("StateStore SQLite init failed; file fallback only. Error: %s", exc)
+            self._sqlite_ready = False
+
+    def _sqlite_enabled(self) -> bool:
+        return self.backend == "sqlite" and self._sqlite_ready
+
+    def _get_sqlite_connection(self) -> sqlite3.Connection:
+        """Get thread-local database connection (WAL so readers never block the writer)."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(str(self.sqlite_path), check_same_thread=False, timeout=30.0)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    @contextmanager
+    def _sqlite_transaction(self) -> Iterator[sqlite3.Connection]:
+        conn = self._get_sqlite_connection()
+        try:
+            yield conn
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+
+    def _sqlite_get_payload(self, sql: str, params: tuple) -> Optional[Dict[str, Any]]:
+        if not self._sqlite_enabled():
+            return None
+        try:
+            row = self._get_sqlite_connection().execute(sql, params).fetchone()
+            return json.loads(row[0]) if row else None
+        except (sqlite3.Error, ValueError) as exc:
+            logger.warning("SQLite read failed: %s", exc)
+            return None
+
+    def _sqlite_list_payloads(self, sql: str, params: tuple = ()) -> List[Dict[str, Any]]:
+        if not self._sqlite_enabled():
+            return []
+        try:
+            rows = self._get_sqlite_connection().execute(sql, params).fetchall()
+        except sqlite3.Error as exc:
+            logger.warning("SQLite read failed: %s", exc)
+            return []
+        payloads: List[Dict[str, Any]] = []
+        for (raw,) in rows:
+            try:
+                payloads.append(json.loads(raw))
+            except ValueError:
+                continue
+        return payloads
+
+    def _sqlite_execute(self, sql: str, params: tuple) -> None:
+        if not self._sqlite_enabled():
+            return
+        try:
+            with self._sqlite_transaction() as conn:
+                conn.execute(sql, params)
+        except sqlite3.Error as exc:
+            logger.warning("SQLite write failed: %s", exc)
+
+    def _sqlite_has_cadence_rows(self) -> bool:
+        try:
+            return self._get_sqlite_connection().execute(
+                "SELECT 1 FROM cadence_leads LIMIT 1"
+            ).fetchone() is not None
+        except sqlite3.Error:
+            return False
+
+    def _sqlite_upsert_operator_state(self, state_date: str, payload: Dict[str, Any]) -> None:
+        self._sqlite_execute(
+            """
+            INSERT INTO operator_state (state_date, payload, updated_at) VALUES (?, ?, ?)
+            ON CONFLICT(state_date) DO UPDATE SET payload=excluded.payload, updated_at=excluded.updated_at
+            """,
+            (state_date, json.dumps(payload, ensure_ascii=False), _utc_now()),
+        )
+
+    def _sqlite_upsert_batch(self, batch_id: str, payload: Dict[str, Any]) -> None:
+        self._sqlite_execute(
+            """
+            INSERT INTO operator_batches (batch_id, status, created_at, payload, updated_at)
+            VALUES (?, ?, ?, ?, ?)
+            ON CONFLICT(batch_id) DO UPDATE SET
+                status=excluded.status, created_at=excluded.created_at,
+                payload=excluded.payload, updated_at=excluded.updated_at
+            """,
+            (
+                batch_id,
+                payload.get("status"),
+                payload.get("created_at", ""),
+                json.dumps(payload, ensure_ascii=False),
+                _utc_now(),
+            ),
+        )
+
+    def _sqlite_upsert_cadence(self, email_hash: str, payload: Dict[str, Any]) -> None:
+        self._sqlite_execute(
+            """
+            INSERT INTO cadence_leads
+                (email_hash, email, status, cadence_id, next_step_due, payload, updated_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(email_hash) DO UPDATE SET
+                email=excluded.email, status=excluded.status, cadence_id=excluded.cadence_id,
+                next_step_due=excluded.next_step_due, payload=excluded.payload,
+                updated_at=excluded.updated_at
+            """,
+            (
+                email_hash,
+                normalize_email(payload.get("email", "")),
+                payload.get("status"),
+                payload.get("cadence_id"),
+                payload.get("next_step_due") or "",
+                json.dumps(payload, ensure_ascii=False),
+                _utc_now(),
+            ),
+        )
+
     # ------------------------------------------------------------------
     # File helpers
     # ------------------------------------------------------------------
@@ -174,6 +368,11 @@ class StateStore:
         redis_key = self._key("operator", "state", target_date)
 
         data = self._redis_get_json(redis_key)
+        if data:
+            return data
+        data = self._sqlite_get_payload(
+            "SELECT payload FROM operator_state WHERE state_date = ?", (target_date,)
+        )
         if data:
             return data
 
@@ -181,12 +380,14 @@ class StateStore:
         if file_data and file_data.get("date") == target_date:
             if self._dual_read_enabled:
                 self._redis_set_json(redis_key, file_data)
+                self._sqlite_upsert_operator_state(target_date, file_data)
             return file_data
         return None
 
     def save_operator_daily_state(self, state_date: str, payload: Dict[str, Any]) -> None:
         redis_key = self._key("operator", "state", state_date)
         self._redis_set_json(redis_key, payload)
+        self._sqlite_upsert_operator_state(state_date, payload)
         if self._file_write_enabled:
             self._write_json_file(self.operator_state_file, payload)
 
@@ -200,17 +401,24 @@ class StateStore:
     def get_batch(self, batch_id: str) -> Optional[Dict[str, Any]]:
         redis_key = self._key("operator", "batch", batch_id)
         data = self._redis_get_json(redis_key)
+        if data:
+            return data
+        data = self._sqlite_get_payload(
+            "SELECT payload FROM operator_batches WHERE batch_id = ?", (batch_id,)
+        )
         if data:
             return data
 
         file_data = self._read_json_file(self._batch_file(batch_id))
         if file_data and self._dual_read_enabled:
             self._redis_set_json(redis_key, file_data)
+            self._sqlite_upsert_batch(batch_id, file_data)
         return file_data
 
     def save_batch(self, batch_id: str, payload: Dict[str, Any]) -> None:
         redis_key = self._key("operator", "batch", batch_id)
         self._redis_set_json(redis_key, payload)
+        self._sqlite_upsert_batch(batch_id, payload)
         if self._file_write_enabled:
             self._write_json_file(self._batch_file(batch_id), payload)
 
@@ -231,6 +439,19 @@ class StateStore:
             batches.sort(key=lambda b: b.get("created_at", ""), reverse=True)
             return batches
 
+        if self._sqlite_enabled():
+            if status:
+                batches = self._sqlite_list_payloads(
+                    "SELECT payload FROM operator_batches WHERE status = ? ORDER BY created_at DESC",
+                    (status,),
+                )
+            else:
+                batches = self._sqlite_list_payloads(
+                    "SELECT payload FROM operator_batches ORDER BY created_at DESC"
+                )
+            if batches:
+                return batches
+
         # fallback read from file batch dir
         for path in self.batch_dir.glob("batch_*.json"):
             data = self._read_json_file(path)
@@ -241,6 +462,7 @@ class StateStore:
             batches.append(data)
             if self._dual_read_enabled and data.get("batch_id"):
                 self._redis_set_json(self._key("operator", "batch", data["batch_id"]), data)
+                self._sqlite_upsert_batch(data["batch_id"], data)
 
         batches.sort(key=lambda b: b.get("created_at", ""), reverse=True)
         return batches
@@ -259,12 +481,19 @@ class StateStore:
             return None
         redis_key = self._key("cadence", "lead", email_hash)
         data = self._redis_get_json(redis_key)
+        if data:
+            return data
+        data = self._sqlite_get_payload(
+            "SELECT payload FROM cadence_leads WHERE email_hash = ?", (email_hash,)
+        )
         if data:
             return data
 
         file_data = self._read_json_file(self._cadence_file_path(email))
         if file_data and self._dual_read_enabled:
             self._redis_set_json(redis_key, file_data)
+            self._redis_index_cadence_due(email_hash, file_data)
+            self._sqlite_upsert_cadence(email_hash, file_data)
         return file_data
 
     def save_cadence_lead_state(self, email: str, payload: Dict[str, Any]) -> None:
@@ -273,6 +502,8 @@ class StateStore:
             return
         redis_key = self._key("cadence", "lead", email_hash)
         self._redis_set_json(redis_key, payload)
+        self._redis_index_cadence_due(email_hash, payload)
+        self._sqlite_upsert_cadence(email_hash, payload)
         if self._file_write_enabled:
             self._write_json_file(self._cadence_file_path(email), payload)
 
@@ -288,6 +519,10 @@ class StateStore:
         if states:
             return states
 
+        states = self._sqlite_list_payloads("SELECT payload FROM cadence_leads")
+        if states:
+            return states
+
         for path in self.cadence_state_dir.glob("*.json"):
             data = self._read_json_file(path)
             if not data:
@@ -297,8 +532,136 @@ class StateStore:
                 email_hash = cadence_email_hash(data["email"])
                 if email_hash:
                     self._redis_set_json(self._key("cadence", "lead", email_hash), data)
+                    self._redis_index_cadence_due(email_hash, data)
+                    self._sqlite_upsert_cadence(email_hash, data)
         return states
 
+    def list_due_cadence_lead_states(self, cadence_id: str, due_on_or_before: str) -> List[Dict[str, Any]]:
+        """
+        Active cadence states for ``cadence_id`` with next_step_due <= the given ISO date.
+
+        SQLite answers this from the (status, cadence_id, next_step_due) index,
+        Redis from the per-cadence due ZSET (built on the first full scan);
+        the file backend filters the full listing.
+        """
+        if self._sqlite_enabled():
+            due = self._sqlite_list_payloads(
+                """
+                SELECT payload FROM cadence_leads
+                WHERE status = 'active' AND cadence_id = ?
+                  AND next_step_due != '' AND next_step_due <= ?
+                ORDER BY next_step_due
+                """,
+                (cadence_id, due_on_or_before),
+            )
+            if due or self._sqlite_has_cadence_rows():
+                return due
+            # Empty table on first run: fall through so list_cadence_lead_states()
+            # can migrate file state, then filter what it returned.
+
+        if self._redis_enabled() and self._redis_due_index_ready():
+            due = self._redis_list_due(cadence_id, due_on_or_before)
+            if due is not None:
+                return due
+
+        due = []
+        all_states = self.list_cadence_lead_states()
+        for data in all_states:
+            if data.get("status") != "active" or data.get("cadence_id") != cadence_id:
+                continue
+            next_due = str(data.get("next_step_due") or "")
+            if next_due and next_due <= due_on_or_before:
+                due.append(data)
+        if self._redis_enabled():
+            # First scan after upgrade: index everything we just read so later
+            # scans are range queries.
+            self._redis_backfill_due_index(all_states)
+        return due
+
+    # ------------------------------------------------------------------
+    # Cadence due index (Redis)
+    # ------------------------------------------------------------------
+
+    def _due_index_key(self, cadence_id: str) -> str:
+        return self._key("cadence", "due", cadence_id or "unknown")
+
+    def _due_index_ready_key(self) -> str:
+        return self._key("cadence", "due_index_ready")
+
+    def _redis_index_cadence_due(self, email_hash: str, payload: Dict[str, Any]) -> None:
+        """Keep the per-cadence due ZSET in step with a saved lead state."""
+        if not self._redis_enabled():
+            return
+        key = self._due_index_key(str(payload.get("cadence_id") or ""))
+        score = _due_date_score(payload.get("next_step_due"))
+        try:
+            if payload.get("status") == "active" and score is not None:
+                self._redis_client.zadd(key, {email_hash: score})
+            else:
+                self._redis_client.zrem(key, email_hash)
+        except Exception as exc:
+            logger.warning("Redis due-index update failed for %s: %s", key, exc)
+
+    def _redis_due_index_ready(self) -> bool:
+        try:
+            return bool(self._redis_client.get(self._due_index_ready_key()))
+        except Exception:
+            return False
+
+    def _redis_backfill_due_index(self, states: List[Dict[str, Any]]) -> None:
+        try:
+            for data in states:
+                email_hash = cadence_email_hash(data.get("email", ""))
+                if email_hash:
+                    self._redis_index_cadence_due(email_hash, data)
+            self._redis_client.set(self._due_index_ready_key(), _utc_now())
+        except Exception as exc:
+            logger.warning("Redis due-index backfill failed: %s", exc)
+
+    def _redis_list_due(self, cadence_id: str, due_on_or_before: str) -> Optional[List[Dict[str, Any]]]:
+        """
+        Range query over the due ZSET, then one MGET for the lead records.
+
+        Members whose record vanished, left "active" or moved cadence are
+        dropped from the index. Returns None if Redis fails mid-query.
+        """
+        max_score = _due_date_score(due_on_or_before)
+        if max_score is None:
+            return []
+        key = self._due_index_key(cadence_id)
+        try:
+            hashes = self._redis_client.zrangebyscore(key, "-inf", max_score)
+            if not hashes:
+                return []
+            raws = self._redis_client.mget([self._key("cadence", "lead", h) for h in hashes])
+        except Exception as exc:
+            logger.warning("Redis due-index read failed for %s: %s", key, exc)
+            return None
+
+        due: List[Dict[str, Any]] = []
+        stale: List[str] = []
+        for email_hash, raw in zip(hashes, raws):
+            try:
+                data = json.loads(raw) if raw else None
+            except ValueError:
+                data = None
+            if (
+                not data
+                or data.get("status") != "active"
+                or data.get("cadence_id") != cadence_id
+            ):
+                stale.append(email_hash)
+                continue
+            next_due = str(data.get("next_step_due") or "")
+            if next_due and next_due <= due_on_or_before:
+                due.append(data)
+        if stale:
+            try:
+                self._redis_client.zrem(key, *stale)
+            except Exception as exc:
+                logger.warning("Redis due-index prune failed for %s: %s", key, exc)
+        return due
+
     # ------------------------------------------------------------------
     # Distributed lock (Redis)
     # ------------------------------------------------------------------
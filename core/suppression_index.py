@@ -0,0 +1,379 @@
+#!/usr/bin/env python3
+"""
+Suppression Index
+=================
+In-memory membership index over the append-only suppression list
+(.hive-mind/unsubscribes.jsonl) written by webhooks/instantly_webhook.py
+and execution/sync_suppression.py.
+
+The JSONL file is parsed once; later checks stat the file and only read
+bytes appended since the last check, so a membership test is O(1) no
+matter how many unsubscribes have accumulated. Truncation or replacement
+of the file triggers a full reload.
+
+Two modes:
+    exact  Python set of normalized emails (default). No false positives.
+    bloom  Bloom filter persisted next to the JSONL (unsubscribes.bloom).
+           A process starting in bloom mode loads the filter and tails only
+           the lines appended after it was written, so short-lived workers
+           and dispatch jobs skip the full parse. False positives (a lead
+           wrongly treated as suppressed) occur at roughly the configured
+           error rate; false negatives do not occur.
+
+Configuration:
+    SUPPRESSION_INDEX_MODE          exact | bloom (default exact)
+    SUPPRESSION_BLOOM_ERROR_RATE    Target false-positive rate (default 0.001)
+
+Usage:
+    index = get_suppression_index()
+    if index.contains("jdoe@acme.com"):
+        ...
+    index.add("jdoe@acme.com", source="instantly_webhook")
+"""
+
+import hashlib
+import json
+import logging
+import math
+import os
+import struct
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+logger = logging.getLogger("suppression_index")
+
+PROJECT_ROOT = Path(__file__).parent.parent
+SUPPRESSION_FILE = PROJECT_ROOT / ".hive-mind" / "unsubscribes.jsonl"
+
+DEFAULT_BLOOM_ERROR_RATE = 0.001
+# Bloom filters are sized for at least this many entries, and rebuilt when
+# the list grows past their capacity.
+MIN_BLOOM_CAPACITY = 10_000
+
+_BLOOM_MAGIC = b"SUPB1"
+_BLOOM_HEADER = struct.Struct("<5sQIQQQ")  # magic, bits, hashes, count, capacity, source offset
+
+
+def normalize_email(email: Optional[str]) -> str:
+    return (email or "").strip().lower()
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter using double hashing over one blake2b digest."""
+
+    def __init__(self, capacity: int, error_rate: float = DEFAULT_BLOOM_ERROR_RATE):
+        capacity = max(1, int(capacity))
+        error_rate = min(max(error_rate, 1e-9), 0.5)
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.num_bits = max(8, int(math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2))))
+        self.num_hashes = max(1, int(round(self.num_bits / capacity * math.log(2))))
+        self.bits = bytearray((self.num_bits + 7) // 8)
+        self.count = 0
+
+    def _positions(self, key: str):
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+        h1, h2 = struct.unpack("<QQ", digest)
+        h2 |= 1
+        m = self.num_bits
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % m
+
+    def add(self, key: str) -> None:
+        for pos in self._positions(key):
+            self.bits[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+
+    def __contains__(self, key: str) -> bool:
+        bits = self.bits
+        return all(bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(key))
+
+    def estimated_error_rate(self) -> float:
+        if not self.count:
+            return 0.0
+        return (1 - math.exp(-self.num_hashes * self.count / self.num_bits)) ** self.num_hashes
+
+    def save(self, path: Path, source_offset: int) -> None:
+        """Write atomically with the byte offset of the JSONL it covers."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(path.suffix + ".tmp")
+        with open(tmp, "wb") as f:
+            f.write(_BLOOM_HEADER.pack(
+                _BLOOM_MAGIC, self.num_bits, self.num_hashes, self.count, self.capacity, source_offset,
+            ))
+            f.write(self.bits)
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: Path):
+        """Return (filter, source_offset) or None if the file is missing or corrupt."""
+        try:
+            raw = path.read_bytes()
+            magic, num_bits, num_hashes, count, capacity, offset = _BLOOM_HEADER.unpack_from(raw)
+        except (OSError, struct.error):
+            return None
+        bits = raw[_BLOOM_HEADER.size:]
+        if magic != _BLOOM_MAGIC or len(bits) != (num_bits + 7) // 8:
+            return None
+        bloom = cls.__new__(cls)
+        bloom.num_bits = num_bits
+        bloom.num_hashes = num_hashes
+        bloom.count = count
+        bloom.capacity = max(1, capacity)
+        bloom.error_rate = DEFAULT_BLOOM_ERROR_RATE
+        bloom.bits = bytearray(bits)
+        return bloom, offset
+
+
+class SuppressionIndex:
+    """Membership index over unsubscribes.jsonl that tails new appends."""
+
+    def __init__(
+        self,
+        path: Optional[Path] = None,
+        mode: Optional[str] = None,
+        bloom_path: Optional[Path] = None,
+        error_rate: Optional[float] = None,
+    ):
+        self.path = Path(path or SUPPRESSION_FILE)
+        self.mode = (mode or os.getenv("SUPPRESSION_INDEX_MODE", "exact")).strip().lower()
+        if self.mode not in ("exact", "bloom"):
+            raise ValueError(f"Unknown suppression index mode: {self.mode}")
+        self.bloom_path = Path(bloom_path or self.path.with_suffix(".bloom"))
+        self.error_rate = float(
+            error_rate if error_rate is not None
+            else os.getenv("SUPPRESSION_BLOOM_ERROR_RATE", DEFAULT_BLOOM_ERROR_RATE)
+        )
+        self._lock = threading.RLock()
+        self._emails: Set[str] = set()
+        self._bloom: Optional[BloomFilter] = None
+        self._offset = 0
+        self._file_id: Optional[tuple] = None
+        self.stats = {"checks": 0, "hits": 0, "reloads": 0, "lines_read": 0}
+        if self.mode == "bloom":
+            self._load_bloom()
+        self.refresh()
+        if self.mode == "bloom" and self.stats["lines_read"]:
+            self._save_bloom_quietly()
+
+    # ── Loading ──────────────────────────────────────────────────
+
+    def _reset(self) -> None:
+        self._emails = set()
+        self._offset = 0
+        if self.mode == "bloom":
+            self._bloom = BloomFilter(MIN_BLOOM_CAPACITY, self.error_rate)
+
+    def _load_bloom(self) -> None:
+        loaded = BloomFilter.load(self.bloom_path)
+        size = self.path.stat().st_size if self.path.exists() else 0
+        if loaded is not None and loaded[1] <= size and self._ends_line(loaded[1]):
+            self._bloom, self._offset = loaded
+            self._bloom.error_rate = self.error_rate
+            logger.info("Loaded suppression bloom filter (%d entries)", self._bloom.count)
+        else:
+            self._reset()
+
+    def _ends_line(self, offset: int) -> bool:
+        """True if `offset` sits just after a newline, i.e. the filter matches this file."""
+        if offset == 0:
+            return True
+        try:
+            with open(self.path, "rb") as f:
+                f.seek(offset - 1)
+                return f.read(1) == b"\n"
+        except OSError:
+            return False
+
+    def _save_bloom_quietly(self) -> None:
+        try:
+            self.save_bloom()
+        except OSError as exc:
+            logger.warning("Failed to persist suppression bloom filter: %s", exc)
+
+    def _insert(self, email: str) -> bool:
+        """Insert a normalized email; returns True if it was not already present."""
+        if self.mode == "exact":
+            if email in self._emails:
+                return False
+            self._emails.add(email)
+            return True
+        if email in self._bloom:
+            return False
+        if self._bloom.count >= self._bloom.capacity:
+            self._rebuild_bloom()
+        self._bloom.add(email)
+        return True
+
+    def _rebuild_bloom(self) -> None:
+        """Re-read the whole list into a filter with room for it to double."""
+        data = self.path.read_bytes() if self.path.exists() else b""
+        capacity = max(MIN_BLOOM_CAPACITY, self._bloom.capacity * 2, data.count(b"\n") * 2)
+        bloom = BloomFilter(capacity, self.error_rate)
+        for email in self._parse_lines([raw for raw in data.split(b"\n") if raw.strip()]):
+            if email and email not in bloom:
+                bloom.add(email)
+        self._bloom = bloom
+
+    @staticmethod
+    def _parse_line(raw: bytes) -> str:
+        try:
+            return normalize_email(json.loads(raw).get("email"))
+        except (ValueError, AttributeError):
+            return ""
+
+    def refresh(self) -> int:
+        """Read lines appended since the last refresh. Returns new entries indexed."""
+        with self._lock:
+            try:
+                st = os.stat(self.path)
+            except FileNotFoundError:
+                if self._offset or self._file_id:
+                    self._reset()
+                    self._file_id = None
+                return 0
+
+            file_id = (st.st_dev, st.st_ino)
+            if self._file_id is not None and (file_id != self._file_id or st.st_size < self._offset):
+                # Rotated, replaced or truncated: start over
+                self.stats["reloads"] += 1
+                self._reset()
+            self._file_id = file_id
+            if st.st_size == self._offset:
+                return 0
+
+            added = 0
+            with open(self.path, "rb") as f:
+                f.seek(self._offset)
+                data = f.read(st.st_size - self._offset)
+            end = data.rfind(b"\n")
+            if end < 0:
+                return 0  # partial line still being written
+            lines = [raw for raw in data[:end].split(b"\n") if raw.strip()]
+            self.stats["lines_read"] += len(lines)
+            for email in self._parse_lines(lines):
+                if email and self._insert(email):
+                    added += 1
+            self._offset += end + 1
+            return added
+
+    def _parse_lines(self, lines: List[bytes]) -> List[str]:
+        """Parse a batch of JSONL lines, falling back to per-line parsing on bad input."""
+        try:
+            records = json.loads(b"[" + b",".join(lines) + b"]")
+            return [normalize_email(r.get("email")) if isinstance(r, dict) else "" for r in records]
+        except ValueError:
+            return [self._parse_line(raw) for raw in lines]
+
+    # ── Queries ──────────────────────────────────────────────────
+
+    def _member(self, key: str) -> bool:
+        return key in self._emails if self.mode == "exact" else key in self._bloom
+
+    def _has(self, key: str) -> bool:
+        hit = self._member(key)
+        self.stats["checks"] += 1
+        if hit:
+            self.stats["hits"] += 1
+        return hit
+
+    def contains(self, email: str) -> bool:
+        """True if the email is on the suppression list."""
+        key = normalize_email(email)
+        if not key:
+            return False
+        with self._lock:
+            self.refresh()
+            return self._has(key)
+
+    __contains__ = contains
+
+    def __len__(self) -> int:
+        with self._lock:
+            self.refresh()
+            return len(self._emails) if self.mode == "exact" else self._bloom.count
+
+    def filter_unsuppressed(self, emails: Iterable[str]) -> list:
+        """Return the emails that are not suppressed, preserving order."""
+        with self._lock:
+            self.refresh()
+            return [e for e in emails if not self._has(normalize_email(e))]
+
+    # ── Writes ───────────────────────────────────────────────────
+
+    def add(self, email: str, source: Optional[str] = None) -> bool:
+        """Append an email to the suppression list. Returns False if it was not written."""
+        return self.add_many([email], source=source) == 1
+
+    def add_many(self, emails: Iterable[str], source: Optional[str] = None) -> int:
+        """
+        Append emails in a single write. Returns the number of lines written.
+
+        Exact mode skips emails already on the list. Bloom mode cannot tell a
+        false positive from a real entry, so it always appends: the JSONL is
+        the source of truth and readers dedupe repeated lines.
+        """
+        with self._lock:
+            self.refresh()
+            now = datetime.now(timezone.utc).isoformat()
+            lines = []
+            seen: Set[str] = set()
+            for email in emails:
+                key = normalize_email(email)
+                if not key or key in seen or (self.mode == "exact" and key in self._emails):
+                    continue
+                seen.add(key)
+                entry: Dict[str, Any] = {"email": email.strip(), "at": now}
+                if source:
+                    entry["source"] = source
+                lines.append(json.dumps(entry) + "\n")
+            if not lines:
+                return 0
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write("".join(lines))
+            self.refresh()
+            return len(lines)
+
+    def save_bloom(self) -> Path:
+        """Persist a Bloom filter of the current list for bloom-mode readers."""
+        with self._lock:
+            self.refresh()
+            if self.mode == "bloom":
+                bloom = self._bloom
+            else:
+                bloom = BloomFilter(max(MIN_BLOOM_CAPACITY, len(self._emails) * 2), self.error_rate)
+                for email in self._emails:
+                    bloom.add(email)
+            bloom.save(self.bloom_path, self._offset)
+            return self.bloom_path
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = {
+                **self.stats,
+                "mode": self.mode,
+                "entries": len(self._emails) if self.mode == "exact" else self._bloom.count,
+                "offset": self._offset,
+            }
+            if self.mode == "bloom":
+                stats["bloom_bits"] = self._bloom.num_bits
+                stats["bloom_estimated_error_rate"] = round(self._bloom.estimated_error_rate(), 6)
+            return stats
+
+
+_indexes: Dict[str, SuppressionIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_suppression_index(path: Optional[Path] = None) -> SuppressionIndex:
+    """Process-wide index for a suppression file (default .hive-mind/unsubscribes.jsonl)."""
+    key = str(Path(path or SUPPRESSION_FILE).resolve())
+    with _indexes_lock:
+        index = _indexes.get(key)
+        if index is None:
+            index = SuppressionIndex(path)
+            _indexes[key] = index
+        return index
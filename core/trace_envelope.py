@@ -4,6 +4,20 @@ Structured trace envelope utilities for replay and diagnostics.
 
 This module centralizes runtime traces with a normalized schema so
 record/replay and deterministic evaluation can consume a single format.
+
+Storage (TRACE_ENVELOPE_FILE, default .hive-mind/traces/):
+
+    tool_trace_envelopes.jsonl        current file, append-only
+    tool_trace_envelopes.jsonl.idx    sidecar index, one line per trace:
+                                      "agent<TAB>correlation_id<TAB>case_id<TAB>offset<TAB>length"
+    tool_trace_envelopes.jsonl.1      rotated files (.1 newest), each with its .idx
+
+The current file rotates once it exceeds TRACE_ENVELOPE_MAX_BYTES, keeping
+TRACE_ENVELOPE_RETENTION rotated files. Appends and rotation hold an flock on
+tool_trace_envelopes.jsonl.lock, since the dashboard and pipeline processes
+both write traces. tail_traces() reads the newest traces by seeking backwards
+in blocks; agent and correlation/case lookups go through the index and only
+read the matching lines.
 """
 
 from __future__ import annotations
@@ -12,12 +26,18 @@ import json
 import logging
 import os
 import threading
+from contextlib import contextmanager
 from contextvars import ContextVar, Token
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 from uuid import uuid4
 
+try:
+    import fcntl
+except ImportError:  # Windows: writers are only serialized within a process
+    fcntl = None
+
 
 logger = logging.getLogger(__name__)
 
@@ -25,6 +45,12 @@ PROJECT_ROOT = Path(__file__).parent.parent
 TRACE_DIR = PROJECT_ROOT / ".hive-mind" / "traces"
 DEFAULT_TRACE_FILE = TRACE_DIR / "tool_trace_envelopes.jsonl"
 
+TRACE_MAX_BYTES = int(os.getenv("TRACE_ENVELOPE_MAX_BYTES", str(50 * 1024 * 1024)))
+TRACE_RETENTION = int(os.getenv("TRACE_ENVELOPE_RETENTION", "5"))
+INDEX_SUFFIX = ".idx"
+
+_TAIL_BLOCK = 64 * 1024
+
 _WRITE_LOCK = threading.Lock()
 _correlation_id_var: ContextVar[Optional[str]] = ContextVar("trace_correlation_id", default=None)
 _case_id_var: ContextVar[Optional[str]] = ContextVar("trace_case_id", default=None)
@@ -157,10 +183,313 @@ def emit_tool_trace(
     trace_file.parent.mkdir(parents=True, exist_ok=True)
 
     try:
-        with _WRITE_LOCK:
-            with open(trace_file, "a", encoding="utf-8") as f:
-                f.write(json.dumps(envelope, ensure_ascii=False) + "\n")
+        with _WRITE_LOCK, _process_lock(trace_file):
+            size = _append_trace(trace_file, envelope)
+            if TRACE_MAX_BYTES > 0 and size >= TRACE_MAX_BYTES:
+                _rotate(trace_file, TRACE_RETENTION)
     except Exception as exc:
         logger.error("Failed to emit trace envelope to %s: %s", trace_file, exc)
 
     return envelope
+
+
+def trace_files(trace_file: Optional[Path] = None) -> List[Path]:
+    """The current trace file and its retained rotations, newest first."""
+    trace_file = Path(trace_file or _resolve_trace_file())
+    files = [trace_file] if trace_file.exists() else []
+    n = 1
+    while True:
+        rotated = _rotated_path(trace_file, n)
+        if not rotated.exists():
+            break
+        files.append(rotated)
+        n += 1
+    return files
+
+
+def tail_traces(
+    limit: int = 50,
+    agent: Optional[str] = None,
+    trace_file: Optional[Path] = None,
+) -> List[Dict[str, Any]]:
+    """
+    The newest `limit` traces, newest first, optionally for one agent.
+
+    Without an agent filter the files are read backwards in blocks, so only
+    the bytes of the returned traces (plus one block) are touched. With an
+    agent filter the indexes are read backwards instead and only matching
+    traces are read.
+    """
+    traces: List[Dict[str, Any]] = []
+    if limit <= 0:
+        return traces
+    for path in trace_files(trace_file):
+        if agent is None:
+            candidates = (_load_line(raw) for raw in _reverse_lines(path))
+        else:
+            wanted = _index_safe(agent)
+            candidates = _read_entries(path, (
+                entry for entry in _iter_index_reversed(path, contains=wanted) if entry[0] == wanted
+            ))
+        for trace in candidates:
+            if trace is None:
+                continue
+            traces.append(trace)
+            if len(traces) >= limit:
+                return traces
+    return traces
+
+
+def find_traces(
+    correlation_id: Optional[str] = None,
+    case_id: Optional[str] = None,
+    agent: Optional[str] = None,
+    trace_file: Optional[Path] = None,
+) -> List[Dict[str, Any]]:
+    """
+    All retained traces matching every given id, oldest first.
+
+    Candidates come from the sidecar indexes; only the matching trace lines
+    are read from the trace files.
+    """
+    wanted = [
+        (position, _index_safe(value))
+        for position, value in ((0, agent), (1, correlation_id), (2, case_id))
+        if value is not None
+    ]
+    # Prefilter index lines on the most selective id given
+    needle = next(
+        (_index_safe(value) for value in (correlation_id, case_id, agent) if value is not None), None
+    )
+    traces: List[Dict[str, Any]] = []
+    for path in reversed(trace_files(trace_file)):
+        matches = [
+            entry for entry in reversed(list(_iter_index_reversed(path, contains=needle)))
+            if all(entry[position] == value for position, value in wanted)
+        ]
+        traces.extend(trace for trace in _read_entries(path, matches) if trace is not None)
+    return traces
+
+
+def count_traces(trace_file: Optional[Path] = None) -> int:
+    """Number of retained traces, counted from the indexes."""
+    total = 0
+    for path in trace_files(trace_file):
+        index = _index_path(path)
+        try:
+            raw = index.read_bytes()
+            if _last_entry_end(raw) == path.stat().st_size:
+                total += raw.count(b"\n")
+                continue
+        except OSError:
+            pass
+        total += sum(1 for _ in _iter_index_reversed(path))
+    return total
+
+
+# ---------------------------------------------------------------------------
+# Storage internals
+# ---------------------------------------------------------------------------
+
+# (agent, correlation_id, case_id, offset, length)
+_IndexEntry = Tuple[str, str, str, int, int]
+
+
+def _index_path(path: Path) -> Path:
+    return path.with_name(path.name + INDEX_SUFFIX)
+
+
+def _rotated_path(trace_file: Path, n: int) -> Path:
+    return trace_file.with_name(f"{trace_file.name}.{n}")
+
+
+def _index_safe(value: Any) -> str:
+    return str(value or "").replace("\t", " ").replace("\n", " ")
+
+
+def _index_fields(envelope: Dict[str, Any]) -> Tuple[str, str, str]:
+    return (
+        _index_safe(envelope.get("agent")),
+        _index_safe(envelope.get("correlation_id")),
+        _index_safe(envelope.get("case_id")),
+    )
+
+
+def _index_line(envelope: Dict[str, Any], offset: int, length: int) -> str:
+    return "\t".join(_index_fields(envelope)) + f"\t{offset}\t{length}\n"
+
+
+@contextmanager
+def _process_lock(trace_file: Path) -> Iterator[None]:
+    """Exclusive lock shared with other processes writing the same trace file."""
+    if fcntl is None:
+        yield
+        return
+    fd = os.open(trace_file.with_name(trace_file.name + ".lock"), os.O_WRONLY | os.O_CREAT, 0o644)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+        yield
+    finally:
+        os.close(fd)
+
+
+def _append_trace(trace_file: Path, envelope: Dict[str, Any]) -> int:
+    """Append one trace and its index line; returns the trace file size afterwards."""
+    index = _index_path(trace_file)
+    if not index.exists() and trace_file.exists():
+        # Trace file written before indexing existed: index it once
+        tmp = index.with_name(index.name + ".tmp")
+        tmp.write_text("".join(
+            "\t".join(entry[:3]) + f"\t{entry[3]}\t{entry[4]}\n"
+            for entry in _scan_entries(trace_file, 0)
+        ), encoding="utf-8")
+        os.replace(tmp, index)
+
+    data = (json.dumps(envelope, ensure_ascii=False) + "\n").encode("utf-8")
+    fd = os.open(trace_file, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+    try:
+        os.write(fd, data)
+        # With O_APPEND the offset lands at the end of this write, even if
+        # another process appended in between
+        end = os.lseek(fd, 0, os.SEEK_CUR)
+    finally:
+        os.close(fd)
+
+    fd = os.open(index, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+    try:
+        os.write(fd, _index_line(envelope, end - len(data), len(data)).encode("utf-8"))
+    finally:
+        os.close(fd)
+    return end
+
+
+def _rotate(trace_file: Path, retention: int) -> None:
+    """Shift trace_file -> .1 -> .2 ..., keeping at most `retention` rotated files."""
+    def numbered(n: int) -> Path:
+        return _rotated_path(trace_file, n) if n else trace_file
+
+    retention = max(retention, 0)
+    rotations = len(trace_files(trace_file)) - int(trace_file.exists())
+    for n in range(rotations, retention - 1, -1):
+        numbered(n).unlink(missing_ok=True)
+        _index_path(numbered(n)).unlink(missing_ok=True)
+
+    for n in range(retention - 1, -1, -1):
+        src, dst = numbered(n), numbered(n + 1)
+        if not src.exists():
+            continue
+        if _index_path(src).exists():
+            os.replace(_index_path(src), _index_path(dst))
+        else:
+            _index_path(dst).unlink(missing_ok=True)
+        os.replace(src, dst)
+
+
+def _reverse_lines(path: Path, block_size: int = _TAIL_BLOCK) -> Iterator[bytes]:
+    """Non-empty lines of a file from last to first, reading backwards in blocks."""
+    try:
+        f = open(path, "rb")
+    except OSError:
+        return
+    with f:
+        position = f.seek(0, os.SEEK_END)
+        partial = b""
+        while position > 0:
+            step = min(block_size, position)
+            position -= step
+            f.seek(position)
+            lines = (f.read(step) + partial).split(b"\n")
+            partial = lines[0]
+            for line in reversed(lines[1:]):
+                if line.strip():
+                    yield line
+        if partial.strip():
+            yield partial
+
+
+def _load_line(raw: bytes) -> Optional[Dict[str, Any]]:
+    try:
+        trace = json.loads(raw)
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        return None
+    return trace if isinstance(trace, dict) else None
+
+
+def _parse_index_line(raw: bytes) -> Optional[_IndexEntry]:
+    parts = raw.decode("utf-8", errors="replace").split("\t")
+    if len(parts) != 5:
+        return None
+    try:
+        return parts[0], parts[1], parts[2], int(parts[3]), int(parts[4])
+    except ValueError:
+        return None
+
+
+def _last_entry_end(raw_index: bytes) -> int:
+    entry = _parse_index_line(raw_index.rstrip(b"\n").rsplit(b"\n", 1)[-1])
+    return entry[3] + entry[4] if entry else -1
+
+
+def _iter_index_reversed(path: Path, contains: Optional[str] = None) -> Iterator[_IndexEntry]:
+    """
+    Index entries of one trace file, newest first.
+
+    Traces past the last index entry (a writer stopped between the trace
+    and index appends) are indexed by scanning that tail of the trace file.
+    `contains` skips index lines without that text before parsing them;
+    callers still compare the parsed fields.
+    """
+    lines = _reverse_lines(_index_path(path))
+    newest = None
+    for raw in lines:
+        newest = _parse_index_line(raw)
+        if newest is not None:
+            break
+    covered = newest[3] + newest[4] if newest else 0
+
+    try:
+        size = path.stat().st_size
+    except OSError:
+        size = covered
+    if covered < size:
+        yield from reversed(_scan_entries(path, covered))
+
+    if newest is None:
+        return
+    yield newest
+    needle = contains.encode("utf-8") if contains else None
+    for raw in lines:
+        if needle is not None and needle not in raw:
+            continue
+        entry = _parse_index_line(raw)
+        if entry is not None:
+            yield entry
+
+
+def _scan_entries(path: Path, start: int) -> List[_IndexEntry]:
+    """Index entries for the traces from byte `start` to the end of a trace file."""
+    entries: List[_IndexEntry] = []
+    try:
+        with open(path, "rb") as f:
+            f.seek(start)
+            offset = start
+            for raw in f:
+                trace = _load_line(raw)
+                if trace is not None:
+                    entries.append((*_index_fields(trace), offset, len(raw)))
+                offset += len(raw)
+    except OSError:
+        pass
+    return entries
+
+
+def _read_entries(path: Path, entries) -> Iterator[Optional[Dict[str, Any]]]:
+    """Load the trace lines for index entries, in the order given."""
+    try:
+        f = open(path, "rb")
+    except OSError:
+        return
+    with f:
+        for _, _, _, offset, length in entries:
+            f.seek(offset)
+            yield _load_line(f.read(length))
@@ -42,11 +42,12 @@ import sys
 import json
 import time
 import asyncio
+import atexit
 import functools
 import logging
 import tempfile
 import threading
-import uuid
+import weakref
 from enum import Enum
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
@@ -476,8 +477,126 @@ def get_permissions_config() -> PermissionsConfigLoader:
 # RATE LIMITER
 # =============================================================================
 
+# Sub-buckets per rate-limit window (minute: 1s, hour: 1min, day: 24min)
+RATE_LIMIT_SUB_BUCKETS = 60
+# Write-behind delay for the file backend: recorded actions are persisted at
+# most this long after they happen (0 = write on every action)
+RATE_LIMIT_FLUSH_SECONDS = float(os.getenv("RATE_LIMIT_FLUSH_SECONDS", "1.0"))
+
+# Atomic check (and optionally record) against one hash of sub-bucket counts
+# per window. KEYS: one hash per window. ARGV: now, record flag, then
+# (window seconds, bucket seconds, limit) per key; limit < 0 means unchecked.
+# Returns {index of the first exceeded window or 0, count per window}.
+_RATE_LIMIT_LUA = """
+local now = tonumber(ARGV[1])
+local record = ARGV[2] == "1"
+local result = {0}
+for i, key in ipairs(KEYS) do
+    local base = 2 + (i - 1) * 3
+    local window = tonumber(ARGV[base + 1])
+    local width = tonumber(ARGV[base + 2])
+    local limit = tonumber(ARGV[base + 3])
+    local oldest = math.floor(now / width) - math.floor(window / width + 0.5)
+    local fields = redis.call("HGETALL", key)
+    local total = 0
+    for j = 1, #fields, 2 do
+        if tonumber(fields[j]) < oldest then
+            redis.call("HDEL", key, fields[j])
+        else
+            total = total + tonumber(fields[j + 1])
+        end
+    end
+    result[i + 1] = total
+    if result[1] == 0 and limit >= 0 and total >= limit then
+        result[1] = i
+    end
+end
+if record and result[1] == 0 then
+    for i, key in ipairs(KEYS) do
+        local base = 2 + (i - 1) * 3
+        local window = tonumber(ARGV[base + 1])
+        local width = tonumber(ARGV[base + 2])
+        redis.call("HINCRBY", key, tostring(math.floor(now / width)), 1)
+        redis.call("EXPIRE", key, math.ceil(window + width) + 60)
+    end
+end
+return result
+"""
+
+_live_rate_limiters: "weakref.WeakSet[UnifiedRateLimiter]" = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_rate_limiters() -> None:
+    for limiter in list(_live_rate_limiters):
+        limiter.flush()
+
+
+class SlidingWindowCounter:
+    """
+    Action count over a sliding window, kept in fixed sub-buckets.
+
+    A ring of buckets + 1 slots covers the current sub-bucket plus the whole
+    window before it, so the count may include up to one sub-bucket of
+    older actions but never misses one inside the window. add() and count()
+    are O(1) amortised: each slot is cleared once as the window moves past it.
+    """
+
+    __slots__ = ("window_seconds", "bucket_seconds", "slots", "head", "total")
+
+    def __init__(self, window_seconds: float, buckets: int = RATE_LIMIT_SUB_BUCKETS):
+        self.window_seconds = window_seconds
+        self.bucket_seconds = window_seconds / buckets
+        self.slots = [0] * (buckets + 1)
+        self.head = 0  # bucket number of the newest slot
+        self.total = 0
+
+    def _advance(self, now: float):
+        current = int(now // self.bucket_seconds)
+        if current <= self.head:
+            return
+        if current - self.head >= len(self.slots):
+            self.slots = [0] * len(self.slots)
+            self.total = 0
+        else:
+            for number in range(self.head + 1, current + 1):
+                index = number % len(self.slots)
+                self.total -= self.slots[index]
+                self.slots[index] = 0
+        self.head = current
+
+    def count(self, now: float) -> int:
+        self._advance(now)
+        return self.total
+
+    def add(self, now: float, n: int = 1):
+        self._advance(now)
+        self.slots[self.head % len(self.slots)] += n
+        self.total += n
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"head": self.head, "slots": self.slots}
+
+    def load(self, data: Any):
+        """Restore saved state; a legacy list of timestamps is re-bucketed."""
+        if isinstance(data, list):
+            for ts in sorted(t for t in data if isinstance(t, (int, float))):
+                self.add(ts)
+        elif isinstance(data, dict) and len(data.get("slots", ())) == len(self.slots):
+            self.head = int(data["head"])
+            self.slots = [int(n) for n in data["slots"]]
+            self.total = sum(self.slots)
+
+
 class UnifiedRateLimiter:
-    """Unified rate limiter for all agents and services."""
+    """
+    Unified rate limiter for all agents and services.
+
+    Counts live in per-window SlidingWindowCounters (file backend) or in one
+    Redis hash of sub-bucket counts per window, updated by a single Lua call.
+    The file backend persists with write-behind: record_action() marks the
+    state dirty and a timer writes it at most flush_interval seconds later.
+    """
     
     DEFAULT_LIMITS = RateLimitConfig(per_minute=30, per_hour=150, per_day=3000)
     
@@ -494,22 +613,29 @@ class UnifiedRateLimiter:
         storage_path: Optional[Path] = None,
         redis_url: Optional[str] = None,
         redis_namespace: str = "caio:ratelimit",
+        flush_interval: Optional[float] = None,
     ):
         self.storage_path = storage_path or PROJECT_ROOT / ".hive-mind" / "rate_limits.json"
         self.storage_path.parent.mkdir(parents=True, exist_ok=True)
         self._lock = threading.RLock()
+        self.flush_interval = RATE_LIMIT_FLUSH_SECONDS if flush_interval is None else flush_interval
+        self._dirty = False
+        self._flush_timer: Optional[threading.Timer] = None
         
         self.redis_namespace = os.getenv("RATE_LIMIT_REDIS_NAMESPACE", redis_namespace)
         self._redis = None
+        self._redis_script = None
         self._use_redis = False
         configured_redis_url = os.getenv("REDIS_URL") if redis_url is None else redis_url
         self._initialize_redis(configured_redis_url)
         
-        self.counters: Dict[str, Dict[str, List[float]]] = defaultdict(
-            lambda: {"minute": [], "hour": [], "day": []}
-        )
+        self.counters: Dict[str, Dict[str, SlidingWindowCounter]] = defaultdict(self._new_counters)
         if not self._use_redis:
             self._load_state()
+        _live_rate_limiters.add(self)
+    
+    def _new_counters(self) -> Dict[str, SlidingWindowCounter]:
+        return {name: SlidingWindowCounter(seconds) for name, seconds, _ in self._WINDOWS}
     
     def _initialize_redis(self, redis_url: Optional[str]) -> None:
         if not redis_url or redis is None:
@@ -522,6 +648,7 @@ class UnifiedRateLimiter:
                 socket_timeout=2,
             )
             self._redis.ping()
+            self._redis_script = self._redis.register_script(_RATE_LIMIT_LUA)
             self._use_redis = True
             logger.info("UnifiedRateLimiter configured with Redis backend")
         except Exception as exc:
@@ -534,7 +661,8 @@ class UnifiedRateLimiter:
     
     def _redis_key(self, key: str, window_name: str) -> str:
         normalized = "".join(ch if ch.isalnum() or ch in ("_", "-") else "_" for ch in key)
-        return f"{self.redis_namespace}:{window_name}:{normalized}"
+        # "win:" keeps the bucket hashes apart from the older sorted-set keys
+        return f"{self.redis_namespace}:win:{window_name}:{normalized}"
     
     def _load_state(self):
         if not self.storage_path.exists():
@@ -544,17 +672,20 @@ class UnifiedRateLimiter:
                 data = json.load(f)
             for key, counters in data.get("counters", {}).items():
                 if isinstance(counters, dict):
-                    self.counters[key] = {
-                        "minute": list(counters.get("minute", [])),
-                        "hour": list(counters.get("hour", [])),
-                        "day": list(counters.get("day", [])),
-                    }
+                    loaded = self._new_counters()
+                    for window_name, counter in loaded.items():
+                        counter.load(counters.get(window_name))
+                    self.counters[key] = loaded
         except Exception as exc:
             logger.warning("Failed to load rate-limit state from %s: %s", self.storage_path, exc)
     
     def _save_state_locked(self):
         data = {
-            "counters": dict(self.counters),
+            "counters": {
+                key: {name: counter.to_dict() for name, counter in counters.items()}
+                for key, counters in self.counters.items()
+                if counters["day"].total
+            },
             "updated_at": datetime.now(timezone.utc).isoformat(),
         }
         fd = None
@@ -579,105 +710,138 @@ class UnifiedRateLimiter:
                 except OSError:
                     pass
     
+    def _mark_dirty_locked(self):
+        """Persist now (flush_interval <= 0) or schedule one write-behind flush."""
+        self._dirty = True
+        if self.flush_interval <= 0:
+            self.flush()
+        elif self._flush_timer is None:
+            self._flush_timer = threading.Timer(self.flush_interval, self.flush)
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
+    
+    def flush(self):
+        """Write pending file-backend state now."""
+        with self._lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            if not self._dirty:
+                return
+            try:
+                self._save_state_locked()
+                self._dirty = False
+            except Exception as exc:
+                logger.warning("Failed to save rate-limit state to %s: %s", self.storage_path, exc)
+    
     def _clean_old_timestamps(self, key: str):
-        """Remove timestamps outside windows."""
+        """Expire sub-buckets that have left each window."""
         now = time.time()
-        counters = self.counters[key]
-        counters["minute"] = [t for t in counters["minute"] if now - t < 60]
-        counters["hour"] = [t for t in counters["hour"] if now - t < 3600]
-        counters["day"] = [t for t in counters["day"] if now - t < 86400]
+        for counter in self.counters[key].values():
+            counter.count(now)
     
-    def _get_redis_counts(self, key: str) -> Optional[Dict[str, int]]:
+    def _run_redis_script(
+        self, key: str, limits: Optional[RateLimitConfig], record: bool
+    ) -> Optional[Tuple[Optional[str], Dict[str, int]]]:
+        """
+        One atomic Redis round trip: counts per window and, if record is set
+        and no limit is exceeded, the recorded action.
+
+        Returns (exceeded window name or None, counts before recording), or
+        None when Redis is not in use or failed (the caller falls back to the
+        file backend).
+        """
         if not self._use_redis or not self._redis:
             return None
-        now = time.time()
+        keys, args = [], [time.time(), "1" if record else "0"]
+        for window_name, window_seconds, limit_attr in self._WINDOWS:
+            keys.append(self._redis_key(key, window_name))
+            limit = getattr(limits, limit_attr) if limits is not None else -1
+            args.extend([window_seconds, window_seconds / RATE_LIMIT_SUB_BUCKETS, limit])
         try:
-            pipe = self._redis.pipeline(transaction=True)
-            for window_name, window_seconds, _ in self._WINDOWS:
-                redis_key = self._redis_key(key, window_name)
-                pipe.zremrangebyscore(redis_key, 0, now - window_seconds)
-                pipe.zcard(redis_key)
-            results = pipe.execute()
-            counts: Dict[str, int] = {}
-            idx = 0
-            for window_name, _, _ in self._WINDOWS:
-                idx += 1  # skip zremrangebyscore result
-                counts[window_name] = int(results[idx])
-                idx += 1
-            return counts
+            result = self._redis_script(keys=keys, args=args)
         except Exception as exc:
-            logger.warning("Redis check_limit failed, falling back to file backend: %s", exc)
+            logger.warning("Redis rate limit call failed, falling back to file backend: %s", exc)
             self._use_redis = False
             self._redis = None
             return None
+        exceeded = self._WINDOWS[int(result[0]) - 1][0] if int(result[0]) else None
+        counts = {name: int(n) for (name, _, _), n in zip(self._WINDOWS, result[1:])}
+        return exceeded, counts
+    
+    def _check_locked(self, key: str, limits: RateLimitConfig, now: float) -> Optional[str]:
+        """Name of the first exceeded window for a key, or None."""
+        counters = self.counters[key]
+        for window_name, _, limit_attr in self._WINDOWS:
+            if counters[window_name].count(now) >= getattr(limits, limit_attr):
+                return window_name
+        return None
+    
+    @staticmethod
+    def _denied(limits: RateLimitConfig, window_name: str) -> Tuple[bool, str]:
+        limit = getattr(limits, f"per_{window_name}")
+        return False, f"Rate limit: {limit}/{window_name} exceeded"
     
     def check_limit(self, key: str, limits: Optional[RateLimitConfig] = None) -> Tuple[bool, Optional[str]]:
         """Check if rate limit allows action. Returns (allowed, reason)."""
         limits = limits or self.DEFAULT_LIMITS
         
-        counts = self._get_redis_counts(key)
-        if counts is not None:
-            if counts["minute"] >= limits.per_minute:
-                return False, f"Rate limit: {limits.per_minute}/minute exceeded"
-            if counts["hour"] >= limits.per_hour:
-                return False, f"Rate limit: {limits.per_hour}/hour exceeded"
-            if counts["day"] >= limits.per_day:
-                return False, f"Rate limit: {limits.per_day}/day exceeded"
+        result = self._run_redis_script(key, limits, record=False)
+        if result is not None:
+            exceeded = result[0]
+        else:
+            with self._lock:
+                exceeded = self._check_locked(key, limits, time.time())
+        
+        if exceeded:
+            return self._denied(limits, exceeded)
+        return True, None
+    
+    def acquire(self, key: str, limits: Optional[RateLimitConfig] = None) -> Tuple[bool, Optional[str]]:
+        """
+        Check the limit and, if allowed, record the action in the same
+        atomic step (one Lua call on Redis). Returns (allowed, reason).
+        """
+        limits = limits or self.DEFAULT_LIMITS
+        
+        result = self._run_redis_script(key, limits, record=True)
+        if result is not None:
+            if result[0]:
+                return self._denied(limits, result[0])
             return True, None
         
         with self._lock:
-            self._clean_old_timestamps(key)
-            counters = self.counters[key]
-            
-            if len(counters["minute"]) >= limits.per_minute:
-                return False, f"Rate limit: {limits.per_minute}/minute exceeded"
-            if len(counters["hour"]) >= limits.per_hour:
-                return False, f"Rate limit: {limits.per_hour}/hour exceeded"
-            if len(counters["day"]) >= limits.per_day:
-                return False, f"Rate limit: {limits.per_day}/day exceeded"
-            
-            return True, None
+            now = time.time()
+            exceeded = self._check_locked(key, limits, now)
+            if exceeded:
+                return self._denied(limits, exceeded)
+            for counter in self.counters[key].values():
+                counter.add(now)
+            self._mark_dirty_locked()
+        return True, None
     
     def record_action(self, key: str):
-        """Record an action timestamp."""
-        now = time.time()
-        
-        if self._use_redis and self._redis:
-            try:
-                pipe = self._redis.pipeline(transaction=True)
-                member = f"{now}:{uuid.uuid4().hex}"
-                for window_name, window_seconds, _ in self._WINDOWS:
-                    redis_key = self._redis_key(key, window_name)
-                    pipe.zadd(redis_key, {member: now})
-                    pipe.expire(redis_key, window_seconds + 120)
-                pipe.execute()
-                return
-            except Exception as exc:
-                logger.warning("Redis record_action failed, falling back to file backend: %s", exc)
-                self._use_redis = False
-                self._redis = None
+        """Record an action."""
+        if self._run_redis_script(key, None, record=True) is not None:
+            return
         
         with self._lock:
-            self._clean_old_timestamps(key)
-            self.counters[key]["minute"].append(now)
-            self.counters[key]["hour"].append(now)
-            self.counters[key]["day"].append(now)
-            self._save_state_locked()
+            now = time.time()
+            for counter in self.counters[key].values():
+                counter.add(now)
+            self._mark_dirty_locked()
     
     def get_usage(self, key: str, limits: Optional[RateLimitConfig] = None) -> Dict[str, Any]:
         """Get current usage for a key."""
         limits = limits or self.DEFAULT_LIMITS
         
-        counts = self._get_redis_counts(key)
-        if counts is None:
+        result = self._run_redis_script(key, None, record=False)
+        if result is not None:
+            counts = result[1]
+        else:
             with self._lock:
-                self._clean_old_timestamps(key)
-                counters = self.counters[key]
-                counts = {
-                    "minute": len(counters["minute"]),
-                    "hour": len(counters["hour"]),
-                    "day": len(counters["day"]),
-                }
+                now = time.time()
+                counts = {name: counter.count(now) for name, counter in self.counters[key].items()}
         
         return {
             "minute": {"used": counts["minute"], "limit": limits.per_minute},
@@ -890,7 +1054,8 @@ class UnifiedGuardrails:
                 status="success" if result.success else "failure",
                 risk_level=risk_level,
                 duration_ms=result.execution_time_ms,
-                error=result.error
+                error=result.error,
+                wait=False
             )
         except Exception as exc:
             logger.error("Audit trail write failed: %s", exc)
@@ -22,6 +22,7 @@ Usage:
 import os
 import sys
 import json
+import math
 import time
 import asyncio
 import bisect
@@ -32,7 +33,7 @@ from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Callable, Set, Tuple
 from dataclasses import dataclass, field, asdict
-from collections import defaultdict
+from collections import defaultdict, deque
 import logging
 
 PROJECT_ROOT = Path(__file__).parent.parent
@@ -271,58 +272,168 @@ class HeartbeatTracker:
 # LATENCY TRACKER
 # =============================================================================
 
+# Latency sketches: log-spaced buckets sized so that every value in a bucket
+# is within LATENCY_SKETCH_ACCURACY of the bucket's representative value.
+LATENCY_SKETCH_ACCURACY = 0.01
+_SKETCH_GAMMA = (1 + LATENCY_SKETCH_ACCURACY) / (1 - LATENCY_SKETCH_ACCURACY)
+_SKETCH_LOG_GAMMA = math.log(_SKETCH_GAMMA)
+_SKETCH_MIN_MS = 1e-3  # samples below this land in the zero bucket
+_SKETCH_ZERO_KEY = -(1 << 31)
+
+# Windows reported by LatencyTracker.get_window_stats (plus its own window)
+DEFAULT_LATENCY_WINDOWS = (60, 300, 900)
+# Time buckets per smallest window; sets how finely windows expire
+LATENCY_BUCKETS_PER_WINDOW = 12
+
+
+def _sketch_key(latency_ms: float) -> int:
+    if latency_ms < _SKETCH_MIN_MS:
+        return _SKETCH_ZERO_KEY
+    return math.ceil(math.log(latency_ms) / _SKETCH_LOG_GAMMA)
+
+
+def _sketch_value(key: int) -> float:
+    if key == _SKETCH_ZERO_KEY:
+        return 0.0
+    return 2 * _SKETCH_GAMMA ** key / (_SKETCH_GAMMA + 1)
+
+
+class LatencySketch:
+    """
+    Mergeable latency histogram with relative-error percentiles.
+
+    add() is O(1); memory grows with the spread of values (about 115
+    buckets per 10x range at 1% accuracy), not with the sample count.
+    Exact min/max are kept, so percentiles are clamped to the observed range
+    and a single-valued sketch reports that value exactly.
+    """
+
+    __slots__ = ("counts", "count", "min_ms", "max_ms")
+
+    def __init__(self):
+        self.counts: Dict[int, int] = {}
+        self.count = 0
+        self.min_ms = math.inf
+        self.max_ms = -math.inf
+
+    def add(self, latency_ms: float):
+        key = _sketch_key(latency_ms)
+        self.counts[key] = self.counts.get(key, 0) + 1
+        self.count += 1
+        if latency_ms < self.min_ms:
+            self.min_ms = latency_ms
+        if latency_ms > self.max_ms:
+            self.max_ms = latency_ms
+
+    def merge(self, other: "LatencySketch"):
+        for key, n in other.counts.items():
+            self.counts[key] = self.counts.get(key, 0) + n
+        self.count += other.count
+        self.min_ms = min(self.min_ms, other.min_ms)
+        self.max_ms = max(self.max_ms, other.max_ms)
+
+    def quantiles(self, qs: List[float]) -> List[float]:
+        """
+        Percentiles for fractions in [0, 1].
+
+        Uses the same rank interpolation as sorting the raw samples; each
+        result is within LATENCY_SKETCH_ACCURACY of the exact value.
+        """
+        if not self.count:
+            return [0.0 for _ in qs]
+        keys = sorted(self.counts)
+        cumulative = []
+        total = 0
+        for key in keys:
+            total += self.counts[key]
+            cumulative.append(total)
+
+        def value_at(rank: int) -> float:
+            value = _sketch_value(keys[bisect.bisect_right(cumulative, rank)])
+            return min(max(value, self.min_ms), self.max_ms)
+
+        results = []
+        for q in qs:
+            idx = (self.count - 1) * q
+            lower = int(idx)
+            upper = min(lower + 1, self.count - 1)
+            frac = idx - lower
+            results.append(value_at(lower) * (1 - frac) + value_at(upper) * frac)
+        return results
+
+
 class LatencyTracker:
-    """Tracks latency with percentile calculations using a rolling window."""
+    """
+    Tracks latency percentiles per component over rolling windows.
 
-    def __init__(self, window_seconds: int = 300):
+    Each component keeps a ring of short time buckets, each holding a
+    LatencySketch. record_latency is O(1); a percentile query merges the
+    sketches of the buckets inside the window. Memory per component is
+    bounded by the number of buckets in the largest window, whatever the
+    sample rate.
+    """
+
+    def __init__(self, window_seconds: int = 300, windows: Optional[Tuple[float, ...]] = None):
         self.window_seconds = window_seconds
-        self._samples: Dict[str, List[Tuple[datetime, float]]] = defaultdict(list)
+        self.windows = tuple(sorted(set(windows or DEFAULT_LATENCY_WINDOWS) | {window_seconds}))
+        self.bucket_seconds = self.windows[0] / LATENCY_BUCKETS_PER_WINDOW
+        self._max_buckets = math.ceil(self.windows[-1] / self.bucket_seconds)
+        # component -> deque of (bucket number, sketch), oldest first
+        self._buckets: Dict[str, deque] = defaultdict(deque)
+
+    def _bucket_number(self) -> int:
+        return int(time.monotonic() / self.bucket_seconds)
 
     def record_latency(self, component_name: str, latency_ms: float):
         """Record a latency sample for a component."""
-        now = datetime.now(timezone.utc)
-        samples = self._samples[component_name]
-        samples.append((now, latency_ms))
-        self._prune_old_samples(component_name)
-
-    def _prune_old_samples(self, component_name: str):
-        """Remove samples outside the rolling window."""
-        cutoff = datetime.now(timezone.utc) - timedelta(seconds=self.window_seconds)
-        samples = self._samples[component_name]
-        while samples and samples[0][0] < cutoff:
-            samples.pop(0)
-
-    def get_percentiles(self, component_name: str) -> LatencyStats:
-        """Calculate p50, p95, p99 for a component."""
-        self._prune_old_samples(component_name)
-        samples = self._samples[component_name]
-        
-        if not samples:
-            return LatencyStats(window_seconds=self.window_seconds)
-        
-        latencies = sorted([s[1] for s in samples])
-        n = len(latencies)
-        
-        def percentile(p: float) -> float:
-            if n == 1:
-                return latencies[0]
-            idx = (n - 1) * p
-            lower = int(idx)
-            upper = min(lower + 1, n - 1)
-            frac = idx - lower
-            return latencies[lower] * (1 - frac) + latencies[upper] * frac
-        
+        number = self._bucket_number()
+        buckets = self._buckets[component_name]
+        if not buckets or buckets[-1][0] != number:
+            buckets.append((number, LatencySketch()))
+            while buckets[0][0] <= number - self._max_buckets:
+                buckets.popleft()
+        buckets[-1][1].add(latency_ms)
+
+    def _window_sketch(self, component_name: str, window_seconds: float) -> LatencySketch:
+        """Merge of the component's buckets that fall inside the window."""
+        merged = LatencySketch()
+        buckets = self._buckets.get(component_name)
+        if not buckets:
+            return merged
+        oldest = self._bucket_number() - math.ceil(window_seconds / self.bucket_seconds)
+        for number, sketch in reversed(buckets):
+            if number <= oldest:
+                break
+            merged.merge(sketch)
+        return merged
+
+    def get_percentiles(self, component_name: str, window_seconds: Optional[float] = None) -> LatencyStats:
+        """Calculate p50, p95, p99 for a component (default: the tracker's window)."""
+        window = window_seconds or self.window_seconds
+        sketch = self._window_sketch(component_name, window)
+        if not sketch.count:
+            return LatencyStats(window_seconds=window)
+
+        p50, p95, p99 = sketch.quantiles([0.50, 0.95, 0.99])
         return LatencyStats(
-            p50_ms=percentile(0.50),
-            p95_ms=percentile(0.95),
-            p99_ms=percentile(0.99),
-            samples=n,
-            window_seconds=self.window_seconds
+            p50_ms=p50,
+            p95_ms=p95,
+            p99_ms=p99,
+            samples=sketch.count,
+            window_seconds=window
         )
 
+    def get_window_stats(self, component_name: str) -> Dict[str, LatencyStats]:
+        """p50/p95/p99 for each configured window, keyed by window seconds."""
+        return {str(w): self.get_percentiles(component_name, w) for w in self.windows}
+
     def get_all_stats(self) -> Dict[str, LatencyStats]:
         """Get latency stats for all components."""
-        return {name: self.get_percentiles(name) for name in self._samples.keys()}
+        return {name: self.get_percentiles(name) for name in self._buckets.keys()}
+
+    def get_all_window_stats(self) -> Dict[str, Dict[str, LatencyStats]]:
+        """Per-window latency stats for all components."""
+        return {name: self.get_window_stats(name) for name in self._buckets.keys()}
 
 
 # =============================================================================
@@ -1048,6 +1159,10 @@ class HealthMonitor:
             "reasoning_bank": self.reasoning_bank_monitor.get_stats(),
             "heartbeats": self.heartbeat_tracker.get_all_heartbeats(),
             "latency_stats": {k: v.to_dict() for k, v in self.latency_tracker.get_all_stats().items()},
+            "latency_windows": {
+                k: {w: stats.to_dict() for w, stats in windows.items()}
+                for k, windows in self.latency_tracker.get_all_window_stats().items()
+            },
             "stale_agents": self.get_stale_agents(),
             "recent_actions": [a.to_dict() for a in self.recent_actions[:20]],
             "alerts": self.alerts[-10:],
@@ -1100,9 +1215,9 @@ class HealthMonitor:
         """Record a latency sample for percentile tracking."""
         self.latency_tracker.record_latency(component_name, latency_ms)
 
-    def get_latency_percentiles(self, component_name: str) -> LatencyStats:
+    def get_latency_percentiles(self, component_name: str, window_seconds: Optional[float] = None) -> LatencyStats:
         """Get p50/p95/p99 latency stats for a component."""
-        return self.latency_tracker.get_percentiles(component_name)
+        return self.latency_tracker.get_percentiles(component_name, window_seconds)
 
     # =========================================================================
     # QUEUE DEPTH METHODS - Day 19
@@ -49,13 +49,16 @@ from core.ghl_send_proof import GHLSendProofEngine
 from core.deliverability_guard import DeliverabilityGuard
 from core.feedback_loop import FeedbackLoop
 from core.email_signature import enforce_text_signature
+from core.event_log import count_events
 from core.task_routing_policy import get_task_routes, routes_ready
 from core.runtime_reliability import get_runtime_dependency_health
 from core.trace_envelope import (
+    count_traces,
     set_current_case_id,
     reset_current_case_id,
     set_current_correlation_id,
     reset_current_correlation_id,
+    tail_traces,
 )
 from dotenv import load_dotenv
 
@@ -985,6 +988,13 @@ async def app_lifespan(app: FastAPI):
                 task.cancel()
             with suppress(asyncio.CancelledError):
                 await task
+        # Close pooled LLM HTTP clients (only if the gateway was ever imported).
+        llm_gateway = sys.modules.get("core.llm_routing_gateway")
+        if llm_gateway is not None:
+            try:
+                await llm_gateway.shutdown_llm_router()
+            except Exception as exc:
+                logger.warning("LLM router shutdown failed: %s", exc)
 
 
 # N6 fix: disable OpenAPI docs in production/staging to avoid exposing internal
@@ -1835,14 +1845,10 @@ async def get_compound_metrics(auth: bool = Depends(require_auth)):
     except Exception:
         metrics["gateway_health"] = {"overall": "unavailable"}
 
-    # 4. Event volume (from events.jsonl)
+    # 4. Event volume (from the event store's per-day indexes)
     try:
         events_file = project_root / ".hive-mind" / "events.jsonl"
-        if events_file.exists():
-            line_count = sum(1 for _ in open(events_file, "r", encoding="utf-8", errors="replace"))
-            metrics["event_volume"] = {"total_events": line_count}
-        else:
-            metrics["event_volume"] = {"total_events": 0}
+        metrics["event_volume"] = {"total_events": count_events(events_file=events_file)}
     except Exception:
         metrics["event_volume"] = {"error": "Events file not readable"}
 
@@ -1881,23 +1887,12 @@ async def get_compound_metrics(auth: bool = Depends(require_auth)):
     # 6. Trace coverage (pipeline stage observability)
     try:
         _trace_file = project_root / ".hive-mind" / "traces" / "tool_trace_envelopes.jsonl"
-        if _trace_file.exists():
-            _lines = _trace_file.read_text(encoding="utf-8", errors="replace").splitlines()
-            _recent = _lines[-100:] if len(_lines) > 100 else _lines
-            _agents_seen: set = set()
-            for _line in _recent:
-                try:
-                    _entry = json.loads(_line)
-                    _agents_seen.add(_entry.get("agent", "unknown"))
-                except Exception:
-                    pass
-            metrics["trace_coverage"] = {
-                "total_traces": len(_lines),
-                "recent_agents": sorted(_agents_seen),
-                "pipeline_stages_traced": len(_agents_seen),
-            }
-        else:
-            metrics["trace_coverage"] = {"total_traces": 0, "recent_agents": [], "pipeline_stages_traced": 0}
+        _agents_seen = {_entry.get("agent", "unknown") for _entry in tail_traces(100, trace_file=_trace_file)}
+        metrics["trace_coverage"] = {
+            "total_traces": count_traces(_trace_file),
+            "recent_agents": sorted(_agents_seen),
+            "pipeline_stages_traced": len(_agents_seen),
+        }
     except Exception:
         metrics["trace_coverage"] = {"error": "Trace file not readable"}
 
@@ -1913,25 +1908,11 @@ async def get_recent_traces(
     """Recent pipeline trace envelopes for agent self-diagnosis."""
     project_root = Path(__file__).parent.parent
     trace_file = project_root / ".hive-mind" / "traces" / "tool_trace_envelopes.jsonl"
-    if not trace_file.exists():
-        return {"traces": [], "count": 0}
 
     limit = min(max(limit, 1), 200)
     traces: list = []
     try:
-        lines = trace_file.read_text(encoding="utf-8", errors="replace").splitlines()
-        for line in reversed(lines):
-            if not line.strip():
-                continue
-            try:
-                entry = json.loads(line)
-                if agent and entry.get("agent") != agent:
-                    continue
-                traces.append(entry)
-                if len(traces) >= limit:
-                    break
-            except (json.JSONDecodeError, ValueError):
-                continue
+        traces = tail_traces(limit, agent=agent or None, trace_file=trace_file)
     except Exception:
         pass
 
@@ -2218,35 +2199,28 @@ async def get_email_history(
     """Return recently reviewed (approved/rejected) emails from shadow queue (Redis + file fallback)."""
     reviewed = []
     try:
-        from core.shadow_queue import _prefix, _get_redis
-        prefix = _prefix()
-        r = _get_redis()
-        if r:
-            import json as _json
-            for key in r.scan_iter(f"{prefix}:shadow:email:*"):
-                try:
-                    raw = r.get(key)
-                    if not raw:
-                        continue
-                    data = _json.loads(raw)
-                    status = (data.get("status") or "").lower()
-                    if status not in ("approved", "rejected"):
-                        continue
-                    reviewed.append({
-                        "email_id": data.get("email_id", ""),
-                        "to": data.get("to", ""),
-                        "subject": data.get("subject", ""),
-                        "status": status,
-                        "reviewed_at": data.get("approved_at") or data.get("rejected_at") or data.get("timestamp", ""),
-                        "reviewer": data.get("approved_by") or data.get("rejected_by") or "",
-                        "feedback": data.get("feedback"),
-                        "rejection_reason": data.get("rejection_reason"),
-                        "rejection_tag": data.get("rejection_tag"),
-                        "campaign_ref": data.get("campaign_ref") or {},
-                        "classifier": data.get("classifier") or {},
-                    })
-                except Exception:
+        # Status indexes: one ZREVRANGE + MGET per status instead of SCAN over every email key.
+        from core.shadow_queue import get_email_history as sq_history
+        for data in sq_history(limit=limit):
+            try:
+                status = (data.get("status") or "").lower()
+                if status not in ("approved", "rejected"):
                     continue
+                reviewed.append({
+                    "email_id": data.get("email_id", ""),
+                    "to": data.get("to", ""),
+                    "subject": data.get("subject", ""),
+                    "status": status,
+                    "reviewed_at": data.get("approved_at") or data.get("rejected_at") or data.get("timestamp", ""),
+                    "reviewer": data.get("approved_by") or data.get("rejected_by") or "",
+                    "feedback": data.get("feedback"),
+                    "rejection_reason": data.get("rejection_reason"),
+                    "rejection_tag": data.get("rejection_tag"),
+                    "campaign_ref": data.get("campaign_ref") or {},
+                    "classifier": data.get("classifier") or {},
+                })
+            except Exception:
+                continue
     except Exception as exc:
         logger.warning("get_email_history error: %s", exc)
     # File fallback for local/dev scenarios when Redis is unavailable or sparse.
@@ -53,6 +53,10 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("cadence_engine")
 
 
+# Sentinel: "signal record not fetched yet" (None means fetched, no record).
+_UNSET = object()
+
+
 # =============================================================================
 # DATA MODELS
 # =============================================================================
@@ -199,6 +203,16 @@ class CadenceEngine:
                 continue
         return states
 
+    def get_due_cadence_states(self, cadence_id: str, today: date) -> List[LeadCadenceState]:
+        """Load active states for ``cadence_id`` due on or before ``today`` (indexed on SQLite)."""
+        states = []
+        for data in self._state_store.list_due_cadence_lead_states(cadence_id, today.isoformat()):
+            try:
+                states.append(LeadCadenceState(**data))
+            except TypeError:
+                continue
+        return states
+
     # -------------------------------------------------------------------------
     # Enrollment
     # -------------------------------------------------------------------------
@@ -251,9 +265,12 @@ class CadenceEngine:
 
     def get_due_actions(self, cadence_id: str = "default_21day") -> List[CadenceAction]:
         """
-        Scan all active leads and return actions due today.
+        Return actions due today.
 
-        For each active lead:
+        Only leads whose next step is due are loaded (state-store range query),
+        and signal statuses for them are fetched in one bulk lookup.
+
+        For each due lead:
         1. Check if next_step_due <= today
         2. Evaluate the step's condition
         3. If condition met, add to actions list
@@ -262,10 +279,16 @@ class CadenceEngine:
         """
         today = date.today()
         cadence_cfg, steps = self.get_cadence_definition(cadence_id)
-        exit_statuses = self.get_exit_statuses(cadence_id)
+        steps_by_num = {s.step: s for s in steps}
+        exit_statuses = set(self.get_exit_statuses(cadence_id))
 
         actions: List[CadenceAction] = []
-        states = self.get_all_cadence_states()
+        states = self.get_due_cadence_states(cadence_id, today)
+        # One bulk signal lookup for the whole scan (exit check + conditions).
+        lead_statuses = (
+            self._get_signal_manager().get_lead_statuses([s.email for s in states])
+            if states else {}
+        )
 
         for state in states:
             if state.status != "active":
@@ -283,22 +306,19 @@ class CadenceEngine:
                 continue  # Not yet due
 
             # Check signal loop for exits
-            if self._should_exit(state.email, exit_statuses):
+            lead_status = lead_statuses.get(state.email.lower())
+            if lead_status and lead_status.get("status", "") in exit_statuses:
                 continue  # Will be handled by sync_signals()
 
             # Find current step definition
-            current_step_def = None
-            for s in steps:
-                if s.step == state.current_step:
-                    current_step_def = s
-                    break
+            current_step_def = steps_by_num.get(state.current_step)
 
             if not current_step_def:
                 # Past last step — cadence complete
                 continue
 
             # Evaluate condition
-            if self._evaluate_condition(current_step_def.condition, state):
+            if self._evaluate_condition(current_step_def.condition, state, lead_status=lead_status):
                 actions.append(CadenceAction(
                     email=state.email,
                     step=current_step_def,
@@ -313,18 +333,29 @@ class CadenceEngine:
 
         return actions
 
-    def _evaluate_condition(self, condition: str, state: LeadCadenceState) -> bool:
-        """Evaluate whether a cadence step's condition is met."""
+    def _evaluate_condition(
+        self,
+        condition: str,
+        state: LeadCadenceState,
+        lead_status: Any = _UNSET,
+    ) -> bool:
+        """
+        Evaluate whether a cadence step's condition is met.
+
+        ``lead_status`` lets bulk scans pass the signal record they already
+        fetched (None = no record); omitted, it is looked up per lead.
+        """
         if condition == "always":
             return True
 
         if condition == "has_linkedin_url":
             return bool(state.linkedin_url)
 
+        if lead_status is _UNSET and condition in ("not_replied", "linkedin_connected"):
+            lead_status = self._get_signal_manager().get_lead_status(state.email)
+
         if condition == "not_replied":
             # Check signal loop for reply
-            mgr = self._get_signal_manager()
-            lead_status = mgr.get_lead_status(state.email)
             if lead_status:
                 status = lead_status.get("status", "")
                 if status in ("replied", "linkedin_replied", "meeting_booked"):
@@ -336,8 +367,6 @@ class CadenceEngine:
             if state.linkedin_connected:
                 return True
             # Also check signal loop
-            mgr = self._get_signal_manager()
-            lead_status = mgr.get_lead_status(state.email)
             if lead_status and lead_status.get("linkedin_status") == "connected":
                 # Update cached state
                 state.linkedin_connected = True
@@ -32,6 +32,7 @@ Test Mode (no real API calls):
 """
 
 import hashlib
+import math
 import os
 import sys
 import json
@@ -39,6 +40,8 @@ import argparse
 import logging
 import random
 import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import nullcontext
 from datetime import datetime
 from pathlib import Path
 from typing import List, Dict, Any, Optional
@@ -58,6 +61,8 @@ from core.retry import retry, with_retry_queue, schedule_retry
 from core.alerts import send_warning, send_critical
 from core.event_log import log_event, EventType
 from core.context import estimate_tokens, get_context_zone, ContextZone
+from core.enrichment_cache import CacheLookup, EnrichmentCache, get_enrichment_cache
+from execution.rate_limiter import APIRateLimiter
 
 console = Console()
 enrich_logger = logging.getLogger("enricher_waterfall")
@@ -65,6 +70,22 @@ enrich_logger = logging.getLogger("enricher_waterfall")
 # XS-14: Overall enrichment timeout (seconds) — caps the entire waterfall chain
 ENRICHMENT_OVERALL_TIMEOUT = int(os.getenv("ENRICHMENT_OVERALL_TIMEOUT", "180"))
 
+# Leads enriched in parallel by enrich_batch (1 = sequential, the original behaviour)
+ENRICHMENT_CONCURRENCY = int(os.getenv("ENRICHMENT_CONCURRENCY", "1"))
+
+# Typical seconds one provider call holds a slot (BetterContact/Clay include polling).
+# In-flight cap per provider = quota rate x latency (Little's law), so concurrent
+# batches can saturate the APIRateLimiter quota without piling up behind it.
+PROVIDER_TYPICAL_LATENCY_SECONDS = {
+    "apollo": 2.0,
+    "bettercontact": 60.0,
+    "clay": 135.0,
+}
+
+# A cached provider result is only reused while these sections are fresh;
+# stale intent signals are dropped instead of served.
+CACHE_REQUIRED_FIELDS = ("contact", "company")
+
 
 class _EnrichmentTimeout(Exception):
     """Raised when enrichment exceeds the overall timeout."""
@@ -161,8 +182,14 @@ class WaterfallEnricher:
     # NOTE: Previously named ClayEnricher. Renamed because this module does NOT
     # use Clay's API — it uses Apollo.io + BetterContact waterfall.
 
-    def __init__(self, test_mode: bool = False):
+    def __init__(self, test_mode: bool = False, rate_limiter: Optional[APIRateLimiter] = None,
+                 cache: Optional[EnrichmentCache] = None):
         self.test_mode = test_mode
+        self._rate_limiter = rate_limiter
+        self._cache = cache
+        self._provider_slots: Dict[str, threading.BoundedSemaphore] = {}
+        self._provider_state = threading.local()
+        self._stats_lock = threading.Lock()
         self.test_stats = {
             "api_calls_simulated": 0,
             "successful_enrichments": 0,
@@ -210,6 +237,14 @@ class WaterfallEnricher:
                 self.provider = "mock_fallback"
                 self.api_key = "fallback_mock"
                 self.base_url = ""
+
+        # Result cache (ENRICHMENT_CACHE_ENABLED): provider calls are metered so
+        # cache hits can be credited in APIRateLimiter.get_cost_summary().
+        if not self.test_mode:
+            if self._cache is None:
+                self._cache = get_enrichment_cache()
+            if self._cache is not None and self._rate_limiter is None:
+                self._rate_limiter = APIRateLimiter()
     
     def enrich_lead(self, lead_id: str, linkedin_url: str, name: str = "", company: str = "",
                     buying_signals: List[str] = None, original_lead: Dict[str, Any] = None) -> Optional[EnrichedLead]:
@@ -238,23 +273,26 @@ class WaterfallEnricher:
     def _mock_enrich(self, lead_id: str, linkedin_url: str, name: str, company: str,
                      buying_signals: List[str], original_lead: Dict[str, Any]) -> Optional[EnrichedLead]:
         """Generate mock enrichment data for test mode."""
-        self.test_stats["api_calls_simulated"] += 1
-        self.test_stats["credits_used"] += 1
-        self.test_stats["simulated_cost_usd"] += 0.15  # ~$0.15 per enrichment
-        
-        # Simulate >80% success rate as per Day 3 criteria
-        # Use fixed seed for reproducibility, but ensure >80% success
-        # Only fail the 5th lead (index-based) to get exactly 80% success rate
-        lead_index = self.test_stats["api_calls_simulated"]
-        should_fail = lead_index == 5  # Fail 1 out of 5 = 80% success
-        
+        with self._stats_lock:
+            self.test_stats["api_calls_simulated"] += 1
+            self.test_stats["credits_used"] += 1
+            self.test_stats["simulated_cost_usd"] += 0.15  # ~$0.15 per enrichment
+
+            # Simulate >80% success rate as per Day 3 criteria
+            # Use fixed seed for reproducibility, but ensure >80% success
+            # Only fail the 5th lead (index-based) to get exactly 80% success rate
+            lead_index = self.test_stats["api_calls_simulated"]
+            should_fail = lead_index == 5  # Fail 1 out of 5 = 80% success
+
+            if should_fail:
+                self.test_stats["failed_enrichments"] += 1
+            else:
+                self.test_stats["successful_enrichments"] += 1
+
         if should_fail:
-            self.test_stats["failed_enrichments"] += 1
             console.print(f"[dim]  Mock: Enrichment failed (simulated)[/dim]")
             return None
         
-        self.test_stats["successful_enrichments"] += 1
-        
         # Generate domain from company name
         company_clean = company.lower().replace(" ", "").replace(",", "").replace(".", "")
         company_clean = "".join(c for c in company_clean if c.isalnum())
@@ -409,18 +447,18 @@ class WaterfallEnricher:
 
         # Waterfall: Apollo (sync, fast) → BetterContact (async polling) → Clay (async callback)
         if self.provider == "apollo":
-            result = self._enrich_via_apollo(lead_id, linkedin_url, name, company)
+            result = self._call_provider("apollo", self._enrich_via_apollo, lead_id, linkedin_url, name, company)
             if result is None and self.bettercontact_key:
                 console.print(f"[dim]  Apollo miss — falling back to BetterContact[/dim]")
-                result = self._enrich_via_bettercontact(lead_id, linkedin_url, name, company)
+                result = self._call_provider("bettercontact", self._enrich_via_bettercontact, lead_id, linkedin_url, name, company)
             if result is None and self.clay_pipeline_enabled and self.clay_key and self.clay_webhook_url:
                 console.print(f"[dim]  Apollo+BC miss — falling back to Clay[/dim]")
-                result = self._enrich_via_clay(lead_id, linkedin_url, name, company)
+                result = self._call_provider("clay", self._enrich_via_clay, lead_id, linkedin_url, name, company)
         elif self.provider == "bettercontact":
-            result = self._enrich_via_bettercontact(lead_id, linkedin_url, name, company)
+            result = self._call_provider("bettercontact", self._enrich_via_bettercontact, lead_id, linkedin_url, name, company)
             if result is None and self.clay_pipeline_enabled and self.clay_key and self.clay_webhook_url:
                 console.print(f"[dim]  BC miss — falling back to Clay[/dim]")
-                result = self._enrich_via_clay(lead_id, linkedin_url, name, company)
+                result = self._call_provider("clay", self._enrich_via_clay, lead_id, linkedin_url, name, company)
         else:
             log_event(EventType.ENRICHMENT_FAILED, {
                 "lead_id": lead_id,
@@ -429,6 +467,171 @@ class WaterfallEnricher:
 
         return result
 
+    # ── Bounded parallelism (enrich_batch --concurrency) ────────────
+
+    def _call_provider(self, provider: str, func, *args) -> Optional[EnrichedLead]:
+        """Run one provider step of the waterfall, consulting the result cache first.
+
+        args are (lead_id, linkedin_url, name, company). A cached "not found"
+        returns None without calling the provider, so the waterfall moves on.
+        """
+        lead_id, linkedin_url = args[0], args[1]
+        cache_key = self._normalize_linkedin_url(linkedin_url) if self._cache is not None and linkedin_url else ""
+        if cache_key:
+            cached = self._cache.get(cache_key, provider, required_fields=CACHE_REQUIRED_FIELDS)
+            self._record_cache_lookup(provider, hit=cached is not None)
+            if cached is not None:
+                console.print(f"[dim]  {provider}: cache {'hit' if cached.found else 'negative hit'} for {linkedin_url}[/dim]")
+                return self._lead_from_cache(cached, provider, lead_id, linkedin_url)
+
+        self._provider_state.no_match = False
+        result = self._invoke_provider(provider, func, *args)
+
+        if cache_key:
+            if result is not None:
+                self._cache.put(cache_key, provider, self._cacheable_fields(result))
+            elif getattr(self._provider_state, "no_match", False):
+                self._cache.put_negative(cache_key, provider)
+        return result
+
+    def _invoke_provider(self, provider: str, func, *args) -> Optional[EnrichedLead]:
+        """Run one provider call inside its in-flight slot and the API rate limiter.
+
+        Outside a concurrent batch there are no slots, and without a limiter
+        this is a plain call, so single-lead enrichment behaves as before.
+        """
+        slot = self._provider_slots.get(provider)
+        limiter = self._rate_limiter
+        if slot is None and limiter is None:
+            return func(*args)
+        with slot if slot is not None else nullcontext():
+            if limiter is not None and provider in limiter.RATE_LIMITS:
+                return limiter.call(provider, func, *args)
+            return func(*args)
+
+    def _note_no_match(self) -> None:
+        """Mark the current provider call as a definite "not found" (negatively cacheable)."""
+        self._provider_state.no_match = True
+
+    def _record_cache_lookup(self, provider: str, hit: bool) -> None:
+        record = getattr(self._rate_limiter, "record_cache_lookup", None)
+        if record is None:
+            return
+        try:
+            record(provider, hit)
+        except Exception as exc:
+            enrich_logger.debug("Cache metrics write failed: %s", exc)
+
+    @staticmethod
+    def _cacheable_fields(lead: EnrichedLead) -> Dict[str, Any]:
+        """Sections of a provider result stored in the cache (lead-specific fields excluded)."""
+        return {
+            "contact": asdict(lead.contact),
+            "company": asdict(lead.company),
+            "intent": asdict(lead.intent),
+            "meta": {
+                "enrichment_sources": list(lead.enrichment_sources),
+                "raw_enrichment": lead.raw_enrichment,
+            },
+        }
+
+    def _lead_from_cache(self, cached: CacheLookup, provider: str, lead_id: str,
+                         linkedin_url: str) -> Optional[EnrichedLead]:
+        """Rebuild an EnrichedLead from a cache entry (None for a cached "not found")."""
+        if not cached.found:
+            return None
+        fields = cached.fields
+        contact = EnrichedContact(**fields["contact"])
+        company = EnrichedCompany(**fields["company"])
+        intent = IntentSignals(**fields["intent"]) if "intent" in fields else IntentSignals()
+        meta = fields.get("meta") or {}
+        raw = dict(meta.get("raw_enrichment") or {})
+        raw["cache"] = {
+            "provider": provider,
+            "fetched_at": datetime.utcfromtimestamp(cached.fetched_at).isoformat(),
+            "stale_fields": cached.stale_fields,
+        }
+        return EnrichedLead(
+            lead_id=lead_id,
+            linkedin_url=linkedin_url,
+            contact=contact,
+            company=company,
+            intent=intent,
+            enrichment_quality=self._calculate_quality(contact, company),
+            enriched_at=datetime.utcfromtimestamp(cached.fetched_at).isoformat(),
+            enrichment_sources=list(meta.get("enrichment_sources") or [provider]),
+            raw_enrichment=raw,
+        )
+
+    def _provider_slot_limits(self, concurrency: int) -> Dict[str, int]:
+        """Per-provider in-flight caps derived from the rate limiter quotas."""
+        quotas = (self._rate_limiter or APIRateLimiter).RATE_LIMITS
+        limits = {}
+        for provider, latency in PROVIDER_TYPICAL_LATENCY_SECONDS.items():
+            quota = quotas.get(provider)
+            if quota:
+                cap = max(1, math.ceil(quota["calls"] / quota["period"] * latency))
+            else:
+                cap = concurrency
+            limits[provider] = min(concurrency, cap)
+        return limits
+
+    @staticmethod
+    def _lead_enrich_args(lead: Dict[str, Any]) -> tuple:
+        """Positional enrich_lead() arguments for a raw lead record."""
+        return (
+            lead.get("lead_id", lead.get("id", "")),
+            lead.get("linkedin_url", ""),
+            lead.get("name", f"{lead.get('first_name', '')} {lead.get('last_name', '')}".strip()),
+            lead.get("company", ""),
+            lead.get("buying_signals", []),
+            lead,
+        )
+
+    def _enrich_leads_concurrently(self, leads: List[Dict[str, Any]], concurrency: int,
+                                   on_progress=None) -> List[Optional[EnrichedLead]]:
+        """
+        Enrich leads with at most `concurrency` in flight.
+
+        Results are returned in input order (None for skipped or failed leads).
+        A lead that raises is logged and recorded as failed; the batch continues.
+        """
+        if self._rate_limiter is None and not self.test_mode:
+            self._rate_limiter = APIRateLimiter()
+        self._provider_slots = {
+            provider: threading.BoundedSemaphore(limit)
+            for provider, limit in self._provider_slot_limits(concurrency).items()
+        }
+        results: List[Optional[EnrichedLead]] = [None] * len(leads)
+        try:
+            with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="enricher") as pool:
+                futures = {}
+                for idx, lead in enumerate(leads):
+                    args = self._lead_enrich_args(lead)
+                    if not args[1]:
+                        if on_progress:
+                            on_progress()
+                        continue
+                    futures[pool.submit(self.enrich_lead, *args)] = idx
+
+                for future in as_completed(futures):
+                    idx = futures[future]
+                    try:
+                        results[idx] = future.result()
+                    except Exception as exc:
+                        lead_id = self._lead_enrich_args(leads[idx])[0]
+                        enrich_logger.warning("Enrichment failed for %s: %s", lead_id, exc)
+                        log_event(EventType.ENRICHMENT_FAILED, {
+                            "lead_id": lead_id,
+                            "reason": "batch_worker_error",
+                            "error": str(exc)[:200],
+                        })
+                    if on_progress:
+                        on_progress()
+        finally:
+            self._provider_slots = {}
+        return results
+
     def _enrich_via_apollo(self, lead_id: str, linkedin_url: str, name: str = "", company: str = "") -> Optional[EnrichedLead]:
         """Enrich via Apollo.io People Match API."""
         import requests
@@ -485,6 +688,7 @@ class WaterfallEnricher:
         elif response.status_code == 404:
             # No match found — not retryable, return None
             console.print(f"[dim]  Apollo: no match for {linkedin_url}[/dim]")
+            self._note_no_match()
             log_event(EventType.ENRICHMENT_FAILED, {"lead_id": lead_id, "reason": "no_match"})
             return None
         else:
@@ -588,6 +792,7 @@ class WaterfallEnricher:
                     return result
                 else:
                     console.print(f"[dim]  BetterContact: no match for {linkedin_url}[/dim]")
+                    self._note_no_match()
                     log_event(EventType.ENRICHMENT_FAILED, {"lead_id": lead_id, "reason": "bettercontact_no_match"})
                     return None
 
@@ -961,12 +1166,15 @@ class WaterfallEnricher:
         
         return min(score, 100)
     
-    def enrich_batch(self, leads_file: Path) -> List[EnrichedLead]:
+    def enrich_batch(self, leads_file: Path, concurrency: Optional[int] = None) -> List[EnrichedLead]:
         """
         Enrich a batch of leads from a JSON file.
         
         Includes context zone monitoring to warn when approaching Dumb Zone.
+        With concurrency > 1 (default: ENRICHMENT_CONCURRENCY) leads are enriched
+        on a bounded thread pool; output order still matches the input file.
         """
+        concurrency = max(1, int(concurrency or ENRICHMENT_CONCURRENCY))
         
         console.print(f"\n[bold blue]💎 ENRICHER: Processing {leads_file}[/bold blue]")
         
@@ -1000,19 +1208,22 @@ class WaterfallEnricher:
             
             task = progress.add_task("Enriching leads...", total=len(leads))
             
-            for lead in leads:
-                lead_id = lead.get("lead_id", lead.get("id", ""))
-                linkedin_url = lead.get("linkedin_url", "")
-                name = lead.get("name", f"{lead.get('first_name', '')} {lead.get('last_name', '')}".strip())
-                company = lead.get("company", "")
-                buying_signals = lead.get("buying_signals", [])
-                
-                if linkedin_url:
-                    result = self.enrich_lead(lead_id, linkedin_url, name, company, buying_signals, lead)
-                    if result:
-                        enriched.append(result)
-                
-                progress.update(task, advance=1)
+            if concurrency > 1:
+                console.print(f"[dim]Concurrency: {concurrency} leads in flight[/dim]")
+                results = self._enrich_leads_concurrently(
+                    leads, concurrency, on_progress=lambda: progress.update(task, advance=1)
+                )
+                enriched = [r for r in results if r]
+            else:
+                for lead in leads:
+                    lead_id, linkedin_url, name, company, buying_signals, _ = self._lead_enrich_args(lead)
+                    
+                    if linkedin_url:
+                        result = self.enrich_lead(lead_id, linkedin_url, name, company, buying_signals, lead)
+                        if result:
+                            enriched.append(result)
+                    
+                    progress.update(task, advance=1)
         
         console.print(f"\n[green]✅ Enriched {len(enriched)}/{len(leads)} leads[/green]")
         
@@ -1105,6 +1316,8 @@ def main():
     parser.add_argument("--company", default="", help="Lead company")
     parser.add_argument("--test-mode", action="store_true", 
                         help="Run in test mode with mock data (no real API calls)")
+    parser.add_argument("--concurrency", type=int, default=None,
+                        help="Leads enriched in parallel with --input (default: ENRICHMENT_CONCURRENCY or 1)")
     
     args = parser.parse_args()
     
@@ -1118,7 +1331,7 @@ def main():
         enricher = WaterfallEnricher(test_mode=args.test_mode)
 
         if args.input:
-            enriched = enricher.enrich_batch(args.input)
+            enriched = enricher.enrich_batch(args.input, concurrency=args.concurrency)
             _enriched_count = len(enriched) if enriched else 0
             if enriched:
                 if args.test_mode:
@@ -21,6 +21,8 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from rich.console import Console
 
+from core.event_log import iter_events
+
 console = Console()
 
 HIVE_MIND = Path(__file__).parent.parent / ".hive-mind"
@@ -133,22 +135,16 @@ def find_lead_data(lead_id: str = None, email: str = None) -> Dict[str, Any]:
     
     # Search event log
     events_file = HIVE_MIND / "events.jsonl"
-    if events_file.exists():
-        related_events = []
-        try:
-            with open(events_file, "r") as f:
-                for line in f:
-                    try:
-                        event = json.loads(line.strip())
-                        payload = event.get("payload", {})
-                        if matches_lead(payload) or payload.get("lead_id") == lead_id:
-                            related_events.append(event)
-                    except json.JSONDecodeError:
-                        continue
-        except IOError:
-            pass
-        if related_events:
-            data["data_sources"]["events"] = related_events
+    related_events = []
+    try:
+        for event in iter_events(events_file=events_file):
+            payload = event.get("payload", {})
+            if matches_lead(payload) or payload.get("lead_id") == lead_id:
+                related_events.append(event)
+    except IOError:
+        pass
+    if related_events:
+        data["data_sources"]["events"] = related_events
     
     # Search outbox (pending communications)
     outbox_dir = HIVE_MIND / "outbox"
@@ -43,6 +43,8 @@ load_dotenv()
 
 from rich.console import Console
 
+from core.suppression_index import get_suppression_index
+
 _is_windows = platform.system() == "Windows"
 console = Console(force_terminal=not _is_windows)
 
@@ -547,6 +549,13 @@ class HeyReachDispatcher:
             self._client._max_retries = hr_config.get("retry_attempts", 2)
         return self._client
 
+    def _get_suppression_index(self):
+        """Shared unsubscribe/bounce index (.hive-mind/unsubscribes.jsonl)."""
+        index = getattr(self, "suppression_index", None)
+        if index is None:
+            index = self.suppression_index = get_suppression_index()
+        return index
+
     # -------------------------------------------------------------------------
     # Lead loading — only leads with LinkedIn URLs
     # -------------------------------------------------------------------------
@@ -568,6 +577,8 @@ class HeyReachDispatcher:
         if not self.shadow_dir.exists():
             return eligible
 
+        suppression = self._get_suppression_index()
+
         for email_file in sorted(self.shadow_dir.glob("*.json")):
             try:
                 with open(email_file, "r", encoding="utf-8") as f:
@@ -601,6 +612,12 @@ class HeyReachDispatcher:
                 if tier_filter and data.get("tier") != tier_filter:
                     continue
 
+                # Unsubscribed or bounced by email — don't follow up on LinkedIn either
+                if suppression.contains(data.get("to") or ""):
+                    logger.warning("Skipping lead %s: recipient is on the suppression list",
+                                   email_file.name)
+                    continue
+
                 data["_file_path"] = str(email_file)
                 data["_shadow_email_id"] = shadow_email_id
                 eligible.append(data)
@@ -36,6 +36,8 @@ load_dotenv()
 
 from rich.console import Console
 
+from core.suppression_index import get_suppression_index
+
 _is_windows = platform.system() == "Windows"
 console = Console(force_terminal=not _is_windows)
 
@@ -287,6 +289,13 @@ class InstantlyDispatcher:
         )
         return {d.lower().strip() for d in domains if d}
 
+    def _get_suppression_index(self):
+        """Shared unsubscribe/bounce index (.hive-mind/unsubscribes.jsonl)."""
+        index = getattr(self, "suppression_index", None)
+        if index is None:
+            index = self.suppression_index = get_suppression_index()
+        return index
+
     def _get_max_leads_per_domain(self) -> int:
         """Max leads from the same recipient domain in a single dispatch batch."""
         return self.config.get("guardrails", {}).get("deliverability", {}).get(
@@ -382,9 +391,11 @@ class InstantlyDispatcher:
         require_valid_format = self.config.get("guardrails", {}).get(
             "deliverability", {}
         ).get("require_valid_email_format", True)
+        suppression = self._get_suppression_index()
         domain_counts: Dict[str, int] = {}
         rejected_excluded = 0
         rejected_email_exclusion = 0
+        rejected_suppressed = 0
         rejected_concentration = 0
         rejected_format = 0
 
@@ -467,6 +478,23 @@ class InstantlyDispatcher:
                     )
                     continue
 
+                # Guard 5: Suppression list (unsubscribed / bounced recipients)
+                if suppression.contains(to_email):
+                    rejected_suppressed += 1
+                    self._log_deliverability_rejection(
+                        reason_code="suppressed_recipient",
+                        to_email=to_email,
+                        email_domain=email_domain,
+                        shadow_email_id=shadow_email_id,
+                        file_name=email_file.name,
+                        scope_enforced=scope_enforced,
+                    )
+                    logger.warning(
+                        "REJECTED (suppressed): %s in %s",
+                        to_email, email_file.name,
+                    )
+                    continue
+
                 # Guard 3: Domain concentration cap
                 domain_counts[email_domain] = domain_counts.get(email_domain, 0) + 1
                 if domain_counts[email_domain] > max_per_domain:
@@ -497,12 +525,16 @@ class InstantlyDispatcher:
                 logger.warning("Failed to read %s: %s", email_file.name, e)
 
         # Log deliverability guard summary
-        total_rejected = rejected_excluded + rejected_email_exclusion + rejected_concentration + rejected_format
+        total_rejected = (
+            rejected_excluded + rejected_email_exclusion + rejected_suppressed
+            + rejected_concentration + rejected_format
+        )
         if total_rejected > 0:
             console.print(
                 f"[yellow]Deliverability guards rejected {total_rejected} leads: "
                 f"{rejected_excluded} excluded domain, "
                 f"{rejected_email_exclusion} excluded email, "
+                f"{rejected_suppressed} suppressed, "
                 f"{rejected_concentration} domain concentration, "
                 f"{rejected_format} bad format[/yellow]"
             )
@@ -24,6 +24,7 @@ import argparse
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from execution.unified_agent_registry import UnifiedAgentRegistry, AgentSwarm
+from core.event_log import segments_dir
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -233,10 +234,11 @@ class ProductionChecklist:
         
         # Check 4.3: Audit logging
         event_log_path = Path(__file__).parent.parent / ".hive-mind" / "events.jsonl"
+        event_log_active = event_log_path.exists() or segments_dir(event_log_path).is_dir()
         self._add_check(
             "Audit Log Active",
-            event_log_path.exists(),
-            f"Logging to {event_log_path}" if event_log_path.exists() else "NOT INITIALIZED",
+            event_log_active,
+            f"Logging to {segments_dir(event_log_path)}" if event_log_active else "NOT INITIALIZED",
             critical=False
         )
         
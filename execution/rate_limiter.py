@@ -5,12 +5,17 @@ API Rate Limiter
 Centralized rate limiting for all API integrations.
 
 Features:
-- Per-service rate limits
-- Automatic backoff and retry
-- Redis-based distributed rate limiting
-- Cost tracking per API call
+- Per-service rate limits (GCRA buckets: never more than `calls` in any
+  rolling `period`; optional `burst` trades even spacing for bursts)
+- Shared quotas across processes: Redis (Lua-scripted, multi-host) or
+  SQLite (single host); O(1) in-memory buckets otherwise
+- Blocking call() plus async acquire() for httpx-based clients
+- Cost tracking per API call (buffered, batched appends to api_costs.jsonl)
 - Quota management
 
+Backend selection: APIRateLimiter(use_redis=True) or RATE_LIMIT_BACKEND
+(memory | sqlite | redis). Redis uses REDIS_URL, else REDIS_HOST/REDIS_PORT.
+
 Usage:
     from execution.rate_limiter import APIRateLimiter
     
@@ -21,17 +26,25 @@ Usage:
     
     # Clay call (60 req/min)
     result = limiter.call('clay', lambda: enrich_lead(email))
+    
+    # Async clients
+    await limiter.acquire('apollo')
 """
 
 import os
 import sys
 import time
 import json
+import math
+import asyncio
+import atexit
+import sqlite3
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Callable, Any, Dict, Optional
+from typing import Callable, Any, Dict, List, Optional, Tuple
 from functools import wraps
 import threading
+import weakref
 
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -40,11 +53,66 @@ from dotenv import load_dotenv
 load_dotenv()
 
 
+# GCRA in Redis: KEYS[1] holds the theoretical arrival time (TAT, seconds).
+# ARGV: emission interval, burst tolerance, tokens. Returns {allowed, retry_after}
+# as strings so fractional seconds survive the Lua -> Redis reply conversion.
+GCRA_LUA = """
+if redis.replicate_commands then redis.replicate_commands() end
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+local interval = tonumber(ARGV[1])
+local tolerance = tonumber(ARGV[2])
+local tokens = tonumber(ARGV[3])
+local tat = tonumber(redis.call('GET', KEYS[1]) or now)
+if tat < now then tat = now end
+local new_tat = tat + interval * tokens
+local wait = new_tat - interval - tolerance - now
+if wait > 0 then
+    return {'0', tostring(wait)}
+end
+redis.call('SET', KEYS[1], tostring(new_tat), 'PX', math.ceil((new_tat - now) * 1000) + 1000)
+return {'1', '0'}
+"""
+
+COST_LOG_BATCH_SIZE = int(os.getenv('COST_LOG_BATCH_SIZE', 50))
+COST_LOG_FLUSH_SECONDS = float(os.getenv('COST_LOG_FLUSH_SECONDS', 5))
+# After a Redis error, calls use local buckets for this long (doubling per
+# consecutive failure up to the max) before Redis is tried again
+REDIS_RETRY_SECONDS = float(os.getenv('RATE_LIMIT_REDIS_RETRY_SECONDS', 1))
+REDIS_RETRY_MAX_SECONDS = float(os.getenv('RATE_LIMIT_REDIS_RETRY_MAX_SECONDS', 30))
+
+# Limiters whose buffered cost-log lines are flushed at exit
+_live_limiters: "weakref.WeakSet[APIRateLimiter]" = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_cost_logs() -> None:
+    for limiter in list(_live_limiters):
+        limiter.flush_cost_log()
+
+
 class RateLimitExceeded(Exception):
     """Raised when rate limit is exceeded."""
     pass
 
 
+def gcra_update(tat: float, now: float, interval: float, tolerance: float,
+                tokens: int = 1) -> Tuple[float, float]:
+    """
+    One GCRA step.
+    
+    Returns (new_tat, retry_after): retry_after is 0 when the request is
+    allowed (new_tat then replaces the stored TAT), otherwise the seconds to
+    wait and new_tat is the unchanged TAT.
+    """
+    tat = max(tat, now)
+    new_tat = tat + interval * tokens
+    wait = new_tat - interval - tolerance - now
+    if wait > 0:
+        return tat, wait
+    return new_tat, 0.0
+
+
 class APIRateLimiter:
     """
     Rate limiter for API calls with cost tracking.
@@ -55,6 +123,11 @@ class APIRateLimiter:
     - GoHighLevel: 100 requests
     - Instantly: 60 requests
     - Anthropic: 50 requests
+    
+    Each limit is a GCRA bucket. By default calls are spaced period/calls
+    apart. With `burst` set, up to `burst` calls go at once and the rest of
+    the quota is spread over the period, so no rolling window of `period`
+    seconds ever sees more than `calls` grants.
     """
     
     RATE_LIMITS = {
@@ -65,6 +138,8 @@ class APIRateLimiter:
         'anthropic': {'calls': 50, 'period': 60},    # 50 per minute
         'rb2b': {'calls': 100, 'period': 60},        # 100 per minute
         'exa': {'calls': 10, 'period': 60},          # 10 per minute
+        'apollo': {'calls': 100, 'period': 60},      # 100 per minute (people/match)
+        'bettercontact': {'calls': 60, 'period': 60},  # 60 per minute (async submit)
     }
     
     # Estimated costs per API call (in USD)
@@ -76,17 +151,28 @@ class APIRateLimiter:
         'anthropic': 0.015,   # ~$0.015 per Claude call (avg)
         'rb2b': 0.05,         # ~$0.05 per identification
         'exa': 0.02,          # ~$0.02 per search
+        'apollo': 0.03,       # ~1 credit per people match
+        'bettercontact': 0.05,  # ~$0.04-0.05 per verified email
     }
     
-    def __init__(self, use_redis: bool = False):
+    def __init__(self, use_redis: bool = False, backend: Optional[str] = None,
+                 redis_url: Optional[str] = None, sqlite_path: Optional[Path] = None,
+                 key_prefix: Optional[str] = None):
         """
         Initialize rate limiter.
         
         Args:
             use_redis: Use Redis for distributed rate limiting (recommended for production)
+            backend: 'memory', 'sqlite' or 'redis' (default: RATE_LIMIT_BACKEND or memory)
+            redis_url: Redis URL (default: REDIS_URL, else REDIS_HOST/REDIS_PORT)
+            sqlite_path: Shared bucket DB for the sqlite backend
+            key_prefix: Namespace for shared bucket keys
         """
-        self.use_redis = use_redis
-        self.call_history: Dict[str, list] = {}
+        self.backend = 'redis' if use_redis else (
+            backend or os.getenv('RATE_LIMIT_BACKEND') or 'memory'
+        ).strip().lower()
+        self.key_prefix = key_prefix or (os.getenv('STATE_REDIS_PREFIX') or 'caio') + ':ratelimit'
+        self._tat: Dict[str, float] = {}
         self.cost_tracker: Dict[str, float] = {}
         self.lock = threading.Lock()
         
@@ -94,22 +180,152 @@ class APIRateLimiter:
         self.data_dir = Path(__file__).parent.parent / ".hive-mind"
         self.data_dir.mkdir(parents=True, exist_ok=True)
         self.cost_log = self.data_dir / "api_costs.jsonl"
+        self._log_buffer: List[str] = []
+        self._log_buffer_since = 0.0
+        self._log_lock = threading.Lock()
+        _live_limiters.add(self)
         
-        # Initialize Redis if enabled
-        if use_redis:
-            try:
-                import redis
+        self.sqlite_path = Path(sqlite_path or os.getenv('RATE_LIMIT_SQLITE_PATH')
+                                or self.data_dir / "rate_limits.db")
+        self._local = threading.local()
+        
+        self.redis = None
+        self._redis_failures = 0
+        self._redis_retry_at = 0.0
+        if self.backend == 'redis':
+            self._init_redis(redis_url)
+        elif self.backend == 'sqlite':
+            self._init_sqlite()
+        self.use_redis = self.backend == 'redis'
+    
+    def _init_redis(self, redis_url: Optional[str]):
+        try:
+            import redis
+            url = redis_url or os.getenv('REDIS_URL')
+            if url:
+                self.redis = redis.Redis.from_url(url, decode_responses=True,
+                                                  socket_connect_timeout=2, socket_timeout=2)
+            else:
                 self.redis = redis.Redis(
                     host=os.getenv('REDIS_HOST', 'localhost'),
                     port=int(os.getenv('REDIS_PORT', 6379)),
                     decode_responses=True
                 )
-                self.redis.ping()
-                print("✅ Redis connected for distributed rate limiting")
+            self.redis.ping()
+            self._gcra_script = self.redis.register_script(GCRA_LUA)
+            print("✅ Redis connected for distributed rate limiting")
+        except Exception as e:
+            print(f"⚠️  Redis connection failed: {e}")
+            print("   Falling back to in-memory rate limiting")
+            self.redis = None
+            self.backend = 'memory'
+    
+    def _init_sqlite(self):
+        self.sqlite_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = self._sqlite()
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS rate_buckets (key TEXT PRIMARY KEY, tat REAL NOT NULL)"
+        )
+    
+    def _sqlite(self) -> sqlite3.Connection:
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(str(self.sqlite_path), timeout=30, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+    
+    def _burst(self, service: str) -> int:
+        limit = self.RATE_LIMITS[service]
+        return max(1, min(limit.get('burst', 1), limit['calls']))
+    
+    def _bucket_params(self, service: str) -> Tuple[float, float]:
+        """
+        (emission interval, burst tolerance) for a service.
+        
+        A full burst plus one call per interval for the rest of the period
+        adds up to exactly `calls`.
+        """
+        limit = self.RATE_LIMITS[service]
+        burst = self._burst(service)
+        interval = limit['period'] / (limit['calls'] - burst + 1)
+        return interval, interval * (burst - 1)
+    
+    def try_acquire(self, service: str, tokens: int = 1) -> float:
+        """
+        Take `tokens` from the service bucket without blocking.
+        
+        If a Redis call fails, this call and those during the backoff that
+        follows use the in-memory bucket; Redis stays the backend and is
+        retried once the backoff expires.
+        
+        Returns:
+            0.0 if granted, otherwise seconds until the request could succeed
+        """
+        service = service.lower()
+        if service not in self.RATE_LIMITS:
+            raise ValueError(f"Unknown service: {service}")
+        interval, tolerance = self._bucket_params(service)
+        key = f"{self.key_prefix}:{service}"
+        
+        if self.backend == 'redis' and self.redis is not None and time.time() >= self._redis_retry_at:
+            try:
+                allowed, wait = self._gcra_script(keys=[key], args=[interval, tolerance, tokens])
             except Exception as e:
-                print(f"⚠️  Redis connection failed: {e}")
-                print("   Falling back to in-memory rate limiting")
-                self.use_redis = False
+                self._redis_failed(e)
+            else:
+                if self._redis_failures:
+                    print("✅ Redis rate limiting restored")
+                    self._redis_failures = 0
+                return 0.0 if allowed == '1' else float(wait)
+        
+        if self.backend == 'sqlite':
+            conn = self._sqlite()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = conn.execute("SELECT tat FROM rate_buckets WHERE key = ?", (key,)).fetchone()
+                now = time.time()
+                new_tat, wait = gcra_update(row[0] if row else now, now, interval, tolerance, tokens)
+                if not wait:
+                    conn.execute(
+                        "INSERT INTO rate_buckets (key, tat) VALUES (?, ?) "
+                        "ON CONFLICT(key) DO UPDATE SET tat = excluded.tat",
+                        (key, new_tat),
+                    )
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            return wait
+        
+        with self.lock:
+            now = time.time()
+            new_tat, wait = gcra_update(self._tat.get(service, now), now, interval, tolerance, tokens)
+            if not wait:
+                self._tat[service] = new_tat
+            return wait
+    
+    def _redis_failed(self, error: Exception):
+        """Back off from Redis after a failed call."""
+        with self.lock:
+            self._redis_failures += 1
+            backoff = min(REDIS_RETRY_MAX_SECONDS, REDIS_RETRY_SECONDS * 2 ** (self._redis_failures - 1))
+            self._redis_retry_at = time.time() + backoff
+            if self._redis_failures == 1:
+                print(f"⚠️  Redis rate limit call failed: {error}")
+                print(f"   Using in-memory rate limiting, retrying Redis in {backoff:g}s")
+    
+    async def acquire(self, service: str, tokens: int = 1) -> None:
+        """Wait (without blocking the event loop) until the service bucket grants `tokens`."""
+        while True:
+            if self.backend == 'memory':
+                wait = self.try_acquire(service, tokens)
+            else:
+                wait = await asyncio.to_thread(self.try_acquire, service, tokens)
+            if not wait:
+                return
+            await asyncio.sleep(wait)
     
     def call(self, service: str, func: Callable, *args, **kwargs) -> Any:
         """
@@ -131,12 +347,9 @@ class APIRateLimiter:
         if service not in self.RATE_LIMITS:
             raise ValueError(f"Unknown service: {service}")
         
-        # Wait for rate limit availability
+        # Wait for rate limit availability (takes the token)
         self._wait_for_availability(service)
         
-        # Record call
-        self._record_call(service)
-        
         # Track cost
         self._track_cost(service)
         
@@ -157,45 +370,14 @@ class APIRateLimiter:
             raise
     
     def _wait_for_availability(self, service: str):
-        """Wait until rate limit allows next call."""
-        limit = self.RATE_LIMITS[service]
-        max_calls = limit['calls']
-        period = limit['period']
-        
+        """Block until the service bucket grants a call."""
         while True:
-            with self.lock:
-                now = time.time()
-                
-                # Get call history for this service
-                if service not in self.call_history:
-                    self.call_history[service] = []
-                
-                # Remove old calls outside the time window
-                cutoff = now - period
-                self.call_history[service] = [
-                    t for t in self.call_history[service] if t > cutoff
-                ]
-                
-                # Check if we can make another call
-                if len(self.call_history[service]) < max_calls:
-                    return  # Rate limit available
-                
-                # Calculate wait time
-                oldest_call = min(self.call_history[service])
-                wait_time = (oldest_call + period) - now
-            
-            if wait_time > 0:
-                print(f"⏳ Rate limit reached for {service}. Waiting {wait_time:.1f}s...")
-                time.sleep(wait_time + 0.1)  # Add small buffer
-            else:
+            wait_time = self.try_acquire(service)
+            if not wait_time:
                 return
-    
-    def _record_call(self, service: str):
-        """Record API call timestamp."""
-        with self.lock:
-            if service not in self.call_history:
-                self.call_history[service] = []
-            self.call_history[service].append(time.time())
+            if wait_time > 1:
+                print(f"⏳ Rate limit reached for {service}. Waiting {wait_time:.1f}s...")
+            time.sleep(wait_time)
     
     def _track_cost(self, service: str):
         """Track API call cost."""
@@ -206,6 +388,29 @@ class APIRateLimiter:
                 self.cost_tracker[service] = 0.0
             self.cost_tracker[service] += cost
     
+    def _append_cost_log(self, entry: Dict[str, Any]):
+        """Buffer a cost-log line; flushed in batches by size or age."""
+        with self._log_lock:
+            if not self._log_buffer:
+                self._log_buffer_since = time.monotonic()
+            self._log_buffer.append(json.dumps(entry) + '\n')
+            due = (len(self._log_buffer) >= COST_LOG_BATCH_SIZE
+                   or time.monotonic() - self._log_buffer_since >= COST_LOG_FLUSH_SECONDS)
+        if due:
+            self.flush_cost_log()
+    
+    def flush_cost_log(self):
+        """Append buffered cost-log lines to api_costs.jsonl in a single write."""
+        with self._log_lock:
+            if not self._log_buffer:
+                return
+            lines, self._log_buffer = self._log_buffer, []
+            try:
+                with open(self.cost_log, 'a') as f:
+                    f.write(''.join(lines))
+            except OSError as e:
+                print(f"⚠️  Cost log write failed: {e}")
+    
     def _log_call(self, service: str, success: bool, duration: float = 0, error: str = None):
         """Log API call details."""
         log_entry = {
@@ -217,8 +422,24 @@ class APIRateLimiter:
             'error': error
         }
         
-        with open(self.cost_log, 'a') as f:
-            f.write(json.dumps(log_entry) + '\n')
+        self._append_cost_log(log_entry)
+    
+    def record_cache_lookup(self, service: str, hit: bool):
+        """
+        Log a result-cache lookup made instead of (or before) an API call.
+
+        Hits are credited with the call cost they avoided; they are reported
+        under 'cache' in get_cost_summary() and never counted as API calls.
+        """
+        service = service.lower()
+        log_entry = {
+            'timestamp': datetime.utcnow().isoformat(),
+            'service': service,
+            'cache': 'hit' if hit else 'miss',
+            'saved_usd': self.COSTS.get(service, 0.0) if hit else 0.0,
+        }
+        
+        self._append_cost_log(log_entry)
     
     def get_cost_summary(self, days: int = 7) -> Dict[str, Any]:
         """
@@ -230,6 +451,7 @@ class APIRateLimiter:
         Returns:
             Dictionary with cost breakdown by service
         """
+        self.flush_cost_log()
         if not self.cost_log.exists():
             return {"error": "No cost log found"}
         
@@ -237,6 +459,7 @@ class APIRateLimiter:
         costs_by_service = {}
         total_calls = 0
         successful_calls = 0
+        cache_by_service = {}
         
         with open(self.cost_log, 'r') as f:
             for line in f:
@@ -247,6 +470,16 @@ class APIRateLimiter:
                     if timestamp >= cutoff:
                         service = entry['service']
                         
+                        if 'cache' in entry:
+                            stats = cache_by_service.setdefault(
+                                service, {'lookups': 0, 'hits': 0, 'saved_usd': 0.0}
+                            )
+                            stats['lookups'] += 1
+                            if entry['cache'] == 'hit':
+                                stats['hits'] += 1
+                                stats['saved_usd'] += entry.get('saved_usd', 0.0)
+                            continue
+                        
                         if service not in costs_by_service:
                             costs_by_service[service] = {
                                 'total_cost': 0.0,
@@ -278,6 +511,12 @@ class APIRateLimiter:
         
         total_cost = sum(s['total_cost'] for s in costs_by_service.values())
         
+        for stats in cache_by_service.values():
+            stats['hit_rate'] = round(stats['hits'] / stats['lookups'] * 100, 2)
+            stats['saved_usd'] = round(stats['saved_usd'], 2)
+        cache_lookups = sum(s['lookups'] for s in cache_by_service.values())
+        cache_hits = sum(s['hits'] for s in cache_by_service.values())
+        
         return {
             'period_days': days,
             'total_cost_usd': round(total_cost, 2),
@@ -285,36 +524,55 @@ class APIRateLimiter:
             'successful_calls': successful_calls,
             'success_rate': round((successful_calls / total_calls * 100) if total_calls > 0 else 0, 2),
             'by_service': costs_by_service,
-            'projected_monthly_cost': round(total_cost / days * 30, 2)
+            'projected_monthly_cost': round(total_cost / days * 30, 2),
+            'cache': {
+                'lookups': cache_lookups,
+                'hits': cache_hits,
+                'hit_rate': round((cache_hits / cache_lookups * 100) if cache_lookups > 0 else 0, 2),
+                'dollars_saved': round(sum(s['saved_usd'] for s in cache_by_service.values()), 2),
+                'by_service': cache_by_service,
+            }
         }
     
+    def _peek_tat(self, service: str) -> Optional[float]:
+        """Stored TAT for a service bucket (None if unused or unreadable)."""
+        key = f"{self.key_prefix}:{service}"
+        try:
+            if self.backend == 'redis' and self.redis is not None:
+                raw = self.redis.get(key)
+                return float(raw) if raw else None
+            if self.backend == 'sqlite':
+                row = self._sqlite().execute(
+                    "SELECT tat FROM rate_buckets WHERE key = ?", (key,)
+                ).fetchone()
+                return row[0] if row else None
+        except Exception:
+            return None
+        with self.lock:
+            return self._tat.get(service)
+    
     def get_current_usage(self) -> Dict[str, Any]:
         """Get current rate limit usage for all services."""
         usage = {}
+        now = time.time()
         
-        with self.lock:
-            now = time.time()
+        for service, limit in self.RATE_LIMITS.items():
+            interval, tolerance = self._bucket_params(service)
+            burst = self._burst(service)
+            tat = self._peek_tat(service)
+            if tat is None or tat <= now:
+                remaining = burst
+            else:
+                remaining = max(0, min(burst, math.floor((tolerance - (tat - now)) / interval) + 1))
+            in_use = burst - remaining
             
-            for service, limit in self.RATE_LIMITS.items():
-                if service in self.call_history:
-                    cutoff = now - limit['period']
-                    recent_calls = [t for t in self.call_history[service] if t > cutoff]
-                    
-                    usage[service] = {
-                        'current_calls': len(recent_calls),
-                        'max_calls': limit['calls'],
-                        'period_seconds': limit['period'],
-                        'usage_percent': (len(recent_calls) / limit['calls']) * 100,
-                        'calls_remaining': limit['calls'] - len(recent_calls)
-                    }
-                else:
-                    usage[service] = {
-                        'current_calls': 0,
-                        'max_calls': limit['calls'],
-                        'period_seconds': limit['period'],
-                        'usage_percent': 0,
-                        'calls_remaining': limit['calls']
-                    }
+            usage[service] = {
+                'current_calls': in_use,
+                'max_calls': limit['calls'],
+                'period_seconds': limit['period'],
+                'usage_percent': (in_use / burst) * 100,
+                'calls_remaining': remaining
+            }
         
         return usage
 
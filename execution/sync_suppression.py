@@ -36,6 +36,7 @@ from rich.panel import Panel
 
 from core.safety import safe_operation
 from core.event_log import log_event, EventType
+from core.suppression_index import get_suppression_index
 
 console = Console()
 
@@ -264,6 +265,22 @@ def save_sync_state(state: Dict[str, Any]) -> None:
         json.dump(state, f, indent=2, default=str)
 
 
+def record_local_suppression(emails, source: str) -> int:
+    """
+    Add emails to the local suppression list used by the dispatchers and
+    webhook handlers, and refresh its Bloom filter snapshot if anything changed.
+    """
+    index = get_suppression_index()
+    added = index.add_many(sorted(e for e in emails if e), source=source)
+    if added:
+        console.print(f"Added {added} emails to local suppression list")
+        try:
+            index.save_bloom()
+        except OSError as e:
+            console.print(f"[yellow]Could not save suppression bloom filter: {e}[/yellow]")
+    return added
+
+
 @safe_operation(operation_type="crm_write")
 def sync_instantly_to_ghl(dry_run: bool = False) -> SyncResult:
     """
@@ -296,6 +313,8 @@ def sync_instantly_to_ghl(dry_run: bool = False) -> SyncResult:
     all_suppressed = set(unsubscribes + blocklist)
     
     console.print(f"Found {len(all_suppressed)} suppressed emails in Instantly")
+    if not dry_run:
+        record_local_suppression(all_suppressed, source="instantly_sync")
     
     state = load_sync_state()
     already_synced = set(state.get("synced_emails", []))
@@ -390,6 +409,8 @@ def sync_ghl_to_instantly(dry_run: bool = False) -> SyncResult:
     dnc_emails = [c.get("email") for c in dnc_contacts if c.get("email")]
     
     console.print(f"Found {len(dnc_emails)} DNC contacts in GHL")
+    if not dry_run:
+        record_local_suppression(dnc_emails, source="ghl_dnc")
     
     existing_blocklist = set(instantly.get_blocklist())
     console.print(f"Existing blocklist size: {len(existing_blocklist)}")
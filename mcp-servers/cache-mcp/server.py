@@ -7,6 +7,8 @@ Intelligent caching layer for all API calls with multi-tier storage.
 Cache Types:
 - memory (hot): Fast in-memory cache for frequently accessed data
 - disk (warm): Persistent disk cache for less frequent access
+  (SQLite WAL index; small values inline, large values in .cache files,
+  disk-size-bounded LRU eviction)
 - skip (real-time): Bypass cache for real-time requirements
 
 TTL Configuration:
@@ -29,9 +31,12 @@ import os
 import sys
 import json
 import gzip
+import time
 import hashlib
+import sqlite3
 import asyncio
 import argparse
+import threading
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, Any, Optional, List, Literal
@@ -68,6 +73,11 @@ TTL_CONFIG = {
 }
 
 COMPRESSION_THRESHOLD = 1024
+INLINE_VALUE_MAX_BYTES = 4096
+DISK_CACHE_MAX_MB = float(os.getenv("CACHE_DISK_MAX_MB", "512"))
+ACCESS_FLUSH_EVERY = 256
+ACCESS_FLUSH_SECONDS = 5.0
+EXPIRY_SWEEP_SECONDS = 60.0
 
 
 @dataclass
@@ -159,78 +169,172 @@ class MemoryCache:
 
 
 class DiskCache:
-    """Persistent disk cache with compression."""
+    """
+    Persistent disk cache with compression.
+    
+    Metadata lives in a SQLite (WAL) index (cache_dir/index.db). Values up to
+    INLINE_VALUE_MAX_BYTES (after compression) are stored inline in the index;
+    larger ones go to per-key .cache files. Hit statistics are buffered and
+    written in batches, expired rows are removed by an indexed sweep, and the
+    on-disk total is bounded by LRU eviction (max_size_mb).
+    """
     
-    def __init__(self, cache_dir: Optional[Path] = None):
+    def __init__(self, cache_dir: Optional[Path] = None, max_size_mb: float = DISK_CACHE_MAX_MB):
         self.cache_dir = cache_dir or Path(__file__).parent.parent.parent / ".hive-mind" / "cache"
         self.cache_dir.mkdir(parents=True, exist_ok=True)
-        self.index_path = self.cache_dir / "index.json"
-        self.index: Dict[str, Dict] = self._load_index()
-    
-    def _load_index(self) -> Dict[str, Dict]:
-        if self.index_path.exists():
-            try:
-                with open(self.index_path) as f:
-                    return json.load(f)
-            except Exception:
-                pass
-        return {}
-    
-    def _save_index(self):
-        with open(self.index_path, "w") as f:
-            json.dump(self.index, f)
+        self.db_path = self.cache_dir / "index.db"
+        self.max_size_bytes = int(max_size_mb * 1024 * 1024)
+        self._lock = threading.RLock()
+        self._pending_access: Dict[str, List] = {}
+        self._last_access_flush = time.monotonic()
+        self._last_sweep = time.monotonic()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS entries (
+                key TEXT PRIMARY KEY,
+                data_type TEXT NOT NULL,
+                created_at TEXT NOT NULL,
+                expires_at TEXT NOT NULL,
+                expires_ts REAL NOT NULL,
+                size_bytes INTEGER NOT NULL,
+                compressed INTEGER NOT NULL,
+                value BLOB,
+                access_count INTEGER NOT NULL DEFAULT 0,
+                last_accessed TEXT NOT NULL DEFAULT '',
+                last_used_ts REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_entries_expires ON entries(expires_ts);
+            CREATE INDEX IF NOT EXISTS idx_entries_lru ON entries(last_used_ts);
+            CREATE INDEX IF NOT EXISTS idx_entries_type ON entries(data_type);
+            """
+        )
+        self._migrate_json_index()
+        self.current_size = self._conn.execute(
+            "SELECT COALESCE(SUM(size_bytes), 0) FROM entries"
+        ).fetchone()[0]
+    
+    def _migrate_json_index(self):
+        """One-time import of the legacy index.json (values stay in their .cache files)."""
+        legacy = self.cache_dir / "index.json"
+        if not legacy.exists():
+            return
+        try:
+            with open(legacy) as f:
+                index = json.load(f)
+            rows = []
+            for key, meta in index.items():
+                expires_ts = self._utc_ts(meta["expires_at"])
+                rows.append((
+                    key, meta["data_type"], meta["created_at"], meta["expires_at"], expires_ts,
+                    meta.get("size_bytes", 0), int(bool(meta.get("compressed"))),
+                    meta.get("access_count", 0), meta.get("last_accessed", ""), time.time(),
+                ))
+            with self._lock:
+                self._conn.execute("BEGIN")
+                self._conn.executemany(
+                    "INSERT OR IGNORE INTO entries (key, data_type, created_at, expires_at, expires_ts, "
+                    "size_bytes, compressed, value, access_count, last_accessed, last_used_ts) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, NULL, ?, ?, ?)",
+                    rows,
+                )
+                self._conn.execute("COMMIT")
+            legacy.rename(legacy.with_suffix(".json.migrated"))
+            logger.info(f"Migrated {len(rows)} disk cache entries from index.json")
+        except Exception as e:
+            logger.error(f"Failed to migrate cache index.json: {e}")
+    
+    @staticmethod
+    def _utc_ts(iso: str) -> float:
+        """Epoch for the naive-UTC ISO timestamps used by CacheEntry."""
+        return (datetime.fromisoformat(iso) - datetime(1970, 1, 1)).total_seconds()
     
     def _key_to_path(self, key: str) -> Path:
         hash_key = hashlib.sha256(key.encode()).hexdigest()[:16]
         return self.cache_dir / f"{hash_key}.cache"
     
     def get(self, key: str) -> Optional[CacheEntry]:
-        if key not in self.index:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT data_type, created_at, expires_at, expires_ts, size_bytes, compressed, value, "
+                "access_count, last_accessed FROM entries WHERE key = ?",
+                (key,),
+            ).fetchone()
+        if row is None:
             return None
         
-        meta = self.index[key]
-        if datetime.fromisoformat(meta["expires_at"]) < datetime.utcnow():
+        data_type, created_at, expires_at, expires_ts, size_bytes, compressed, data, access_count, _ = row
+        now = time.time()
+        if expires_ts < now:
             self.delete(key)
             return None
         
-        file_path = self._key_to_path(key)
-        if not file_path.exists():
-            del self.index[key]
-            self._save_index()
-            return None
-        
         try:
-            with open(file_path, "rb") as f:
-                data = f.read()
+            if data is None:
+                file_path = self._key_to_path(key)
+                if not file_path.exists():
+                    self._delete_rows([key])
+                    return None
+                with open(file_path, "rb") as f:
+                    data = f.read()
             
-            if meta.get("compressed"):
+            if compressed:
                 data = gzip.decompress(data)
             
             value = json.loads(data.decode("utf-8"))
-            
-            meta["access_count"] = meta.get("access_count", 0) + 1
-            meta["last_accessed"] = datetime.utcnow().isoformat()
-            self._save_index()
-            
-            return CacheEntry(
-                key=key,
-                value=value,
-                data_type=meta["data_type"],
-                tier="disk",
-                created_at=meta["created_at"],
-                expires_at=meta["expires_at"],
-                size_bytes=meta["size_bytes"],
-                compressed=meta.get("compressed", False),
-                access_count=meta.get("access_count", 1),
-                last_accessed=meta.get("last_accessed", "")
-            )
         except Exception as e:
             logger.error(f"Failed to read cache: {e}")
             return None
+        
+        last_accessed = datetime.utcnow().isoformat()
+        pending = self._record_access(key, now, last_accessed)
+        
+        return CacheEntry(
+            key=key,
+            value=value,
+            data_type=data_type,
+            tier="disk",
+            created_at=created_at,
+            expires_at=expires_at,
+            size_bytes=size_bytes,
+            compressed=bool(compressed),
+            access_count=access_count + pending,
+            last_accessed=last_accessed
+        )
+    
+    def _record_access(self, key: str, now: float, last_accessed: str) -> int:
+        """Buffer a hit; returns the buffered hit count for the key."""
+        with self._lock:
+            pending = self._pending_access.setdefault(key, [0, now, last_accessed])
+            pending[0] += 1
+            pending[1] = now
+            pending[2] = last_accessed
+            count = pending[0]
+            if (len(self._pending_access) >= ACCESS_FLUSH_EVERY
+                    or time.monotonic() - self._last_access_flush >= ACCESS_FLUSH_SECONDS):
+                self.flush_access_stats()
+        return count
+    
+    def flush_access_stats(self):
+        """Write buffered access counts / LRU timestamps in one transaction."""
+        with self._lock:
+            self._last_access_flush = time.monotonic()
+            if not self._pending_access:
+                return
+            rows = [(c, ts, la, k) for k, (c, ts, la) in self._pending_access.items()]
+            self._pending_access.clear()
+            self._conn.execute("BEGIN")
+            self._conn.executemany(
+                "UPDATE entries SET access_count = access_count + ?, last_used_ts = ?, "
+                "last_accessed = ? WHERE key = ?",
+                rows,
+            )
+            self._conn.execute("COMMIT")
     
     def set(self, entry: CacheEntry) -> bool:
         try:
-            file_path = self._key_to_path(entry.key)
             data = json.dumps(entry.value).encode("utf-8")
             compressed = False
             
@@ -238,49 +342,137 @@ class DiskCache:
                 data = gzip.compress(data)
                 compressed = True
             
-            with open(file_path, "wb") as f:
-                f.write(data)
+            file_path = self._key_to_path(entry.key)
+            inline = len(data) <= INLINE_VALUE_MAX_BYTES
+            if not inline:
+                with open(file_path, "wb") as f:
+                    f.write(data)
             
-            self.index[entry.key] = {
-                "data_type": entry.data_type,
-                "created_at": entry.created_at,
-                "expires_at": entry.expires_at,
-                "size_bytes": len(data),
-                "compressed": compressed,
-                "access_count": 0,
-                "last_accessed": ""
-            }
-            self._save_index()
+            with self._lock:
+                self._pending_access.pop(entry.key, None)
+                old = self._conn.execute(
+                    "SELECT size_bytes, value IS NULL FROM entries WHERE key = ?", (entry.key,)
+                ).fetchone()
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO entries (key, data_type, created_at, expires_at, expires_ts, "
+                    "size_bytes, compressed, value, access_count, last_accessed, last_used_ts) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, 0, '', ?)",
+                    (
+                        entry.key, entry.data_type, entry.created_at, entry.expires_at,
+                        self._utc_ts(entry.expires_at), len(data), int(compressed),
+                        data if inline else None, time.time(),
+                    ),
+                )
+                if old:
+                    self.current_size -= old[0]
+                    if old[1] and inline and file_path.exists():
+                        file_path.unlink()
+                self.current_size += len(data)
+                self._maybe_sweep()
+                if self.current_size > self.max_size_bytes:
+                    self.evict_lru()
             return True
         except Exception as e:
             logger.error(f"Failed to write cache: {e}")
             return False
     
+    def _delete_rows(self, keys: List[str]) -> int:
+        """Delete index rows (and any value files) for keys; returns rows removed."""
+        removed = 0
+        with self._lock:
+            for key in keys:
+                self._pending_access.pop(key, None)
+            self._conn.execute("BEGIN")
+            for key in keys:
+                row = self._conn.execute(
+                    "SELECT size_bytes, value IS NULL FROM entries WHERE key = ?", (key,)
+                ).fetchone()
+                if row is None:
+                    continue
+                self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+                self.current_size -= row[0]
+                removed += 1
+                if row[1]:
+                    self._key_to_path(key).unlink(missing_ok=True)
+            self._conn.execute("COMMIT")
+        return removed
+    
     def delete(self, key: str) -> bool:
-        if key not in self.index:
-            return False
-        
-        file_path = self._key_to_path(key)
-        if file_path.exists():
-            file_path.unlink()
-        
-        del self.index[key]
-        self._save_index()
-        return True
+        return self._delete_rows([key]) > 0
+    
+    def delete_by_data_type(self, data_type: str) -> int:
+        with self._lock:
+            keys = [r[0] for r in self._conn.execute(
+                "SELECT key FROM entries WHERE data_type = ?", (data_type,)
+            )]
+        return self._delete_rows(keys)
+    
+    def delete_matching(self, pattern: str) -> int:
+        """Delete entries whose key contains pattern."""
+        with self._lock:
+            keys = [r[0] for r in self._conn.execute(
+                "SELECT key FROM entries WHERE instr(key, ?) > 0", (pattern,)
+            )]
+        return self._delete_rows(keys)
+    
+    def _maybe_sweep(self):
+        if time.monotonic() - self._last_sweep >= EXPIRY_SWEEP_SECONDS:
+            self.sweep_expired()
+    
+    def sweep_expired(self) -> int:
+        """Remove expired entries using the expires_ts index."""
+        with self._lock:
+            self._last_sweep = time.monotonic()
+            keys = [r[0] for r in self._conn.execute(
+                "SELECT key FROM entries WHERE expires_ts < ?", (time.time(),)
+            )]
+        return self._delete_rows(keys) if keys else 0
+    
+    def evict_lru(self) -> int:
+        """Evict least-recently-used entries until the disk total fits max_size_bytes."""
+        with self._lock:
+            self.flush_access_stats()
+            evict = []
+            excess = self.current_size - self.max_size_bytes
+            if excess <= 0:
+                return 0
+            for key, size in self._conn.execute(
+                "SELECT key, size_bytes FROM entries ORDER BY last_used_ts"
+            ):
+                evict.append(key)
+                excess -= size
+                if excess <= 0:
+                    break
+            return self._delete_rows(evict)
     
     def clear(self):
-        for file in self.cache_dir.glob("*.cache"):
-            file.unlink()
-        self.index.clear()
-        self._save_index()
+        with self._lock:
+            for file in self.cache_dir.glob("*.cache"):
+                file.unlink()
+            self._pending_access.clear()
+            self._conn.execute("DELETE FROM entries")
+            self.current_size = 0
+    
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
     
     def stats(self) -> Dict[str, Any]:
-        total_size = sum(m.get("size_bytes", 0) for m in self.index.values())
+        with self._lock:
+            entries, compressed_count = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(compressed), 0) FROM entries"
+            ).fetchone()
         return {
-            "entries": len(self.index),
-            "size_bytes": total_size,
-            "compressed_count": sum(1 for m in self.index.values() if m.get("compressed"))
+            "entries": entries,
+            "size_bytes": self.current_size,
+            "max_size_bytes": self.max_size_bytes,
+            "compressed_count": compressed_count
         }
+    
+    def close(self):
+        with self._lock:
+            self.flush_access_stats()
+            self._conn.close()
 
 
 class CacheMCPServer:
@@ -295,10 +487,10 @@ class CacheMCPServer:
     - Hit/miss tracking for cost analysis
     """
     
-    def __init__(self, dry_run: bool = False):
+    def __init__(self, dry_run: bool = False, cache_dir: Optional[Path] = None):
         self.dry_run = dry_run
         self.memory = MemoryCache()
-        self.disk = DiskCache()
+        self.disk = DiskCache(cache_dir)
         self.stats = CacheStats()
         
         self.api_costs = {
@@ -433,11 +625,9 @@ class CacheMCPServer:
                     self.stats.evictions += 1
             
             if tier in ("disk", "both"):
-                keys_to_delete = [k for k, m in self.disk.index.items() if m.get("data_type") == data_type]
-                for k in keys_to_delete:
-                    self.disk.delete(k)
-                    invalidated["disk"] += 1
-                    self.stats.evictions += 1
+                removed = self.disk.delete_by_data_type(data_type)
+                invalidated["disk"] += removed
+                self.stats.evictions += removed
         
         elif pattern:
             if tier in ("memory", "both"):
@@ -448,11 +638,9 @@ class CacheMCPServer:
                     self.stats.evictions += 1
             
             if tier in ("disk", "both"):
-                keys_to_delete = [k for k in self.disk.index.keys() if pattern in k]
-                for k in keys_to_delete:
-                    self.disk.delete(k)
-                    invalidated["disk"] += 1
-                    self.stats.evictions += 1
+                removed = self.disk.delete_matching(pattern)
+                invalidated["disk"] += removed
+                self.stats.evictions += removed
         
         return {"success": True, "invalidated": invalidated}
     
@@ -512,7 +700,7 @@ class CacheMCPServer:
             "service": "cache-mcp",
             "timestamp": datetime.utcnow().isoformat(),
             "memory_entries": len(self.memory.cache),
-            "disk_entries": len(self.disk.index),
+            "disk_entries": len(self.disk),
             "dry_run": self.dry_run
         }
 
@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""
+One-time backfill: build shadow queue status indexes from existing email keys.
+
+Emails pushed before the per-status sorted sets existed are only reachable
+via SCAN. This walks {prefix}:shadow:email:* once and indexes each record
+under its current status so history/approved lookups can use list_by_status().
+
+Usage:
+  python scripts/backfill_shadow_status_indexes.py
+  python scripts/backfill_shadow_status_indexes.py --dry-run --batch-size 1000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from core.shadow_queue import _prefix, backfill_status_indexes
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Backfill shadow queue per-status Redis indexes.")
+    parser.add_argument("--batch-size", type=int, default=500, help="Keys per MGET/pipeline batch.")
+    parser.add_argument("--dry-run", action="store_true", help="Count what would be indexed without writing.")
+    args = parser.parse_args()
+
+    summary = backfill_status_indexes(batch_size=max(1, args.batch_size), dry_run=args.dry_run)
+    summary["prefix"] = _prefix()
+    print(json.dumps(summary, indent=2))
+    return 0 if "error" not in summary else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+cache-mcp DiskCache read benchmark: whole-file JSON index vs SQLite index.
+
+Fills a DiskCache with --entries enrichment-sized values, then times random
+get() hits. The "json_index" mode reproduces the previous DiskCache, which
+rewrote index.json on every hit to bump access_count; "sqlite" is the
+current SQLite (WAL) index with buffered access stats. The legacy mode is
+slow at large sizes, so it runs at most --legacy-gets lookups.
+
+Usage:
+  python scripts/benchmark_disk_cache.py
+  python scripts/benchmark_disk_cache.py --entries 10000 100000 --gets 20000
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib.util
+import json
+import logging
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+_spec = importlib.util.spec_from_file_location(
+    "cache_mcp_server", PROJECT_ROOT / "mcp-servers" / "cache-mcp" / "server.py"
+)
+cache_server = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(cache_server)
+
+CacheEntry = cache_server.CacheEntry
+DiskCache = cache_server.DiskCache
+
+
+class JsonIndexDiskCache:
+    """The pre-SQLite DiskCache: one .cache file per key, index.json rewritten per hit."""
+
+    def __init__(self, cache_dir: Path):
+        self.cache_dir = cache_dir
+        self.index_path = cache_dir / "index.json"
+        self.index: Dict[str, Dict] = {}
+
+    def _save_index(self):
+        with open(self.index_path, "w") as f:
+            json.dump(self.index, f)
+
+    def _key_to_path(self, key: str) -> Path:
+        return DiskCache._key_to_path(self, key)
+
+    def load(self, entry: CacheEntry) -> None:
+        """Bulk-fill helper (no per-entry index rewrite, unlike the original set())."""
+        data = json.dumps(entry.value).encode("utf-8")
+        self._key_to_path(entry.key).write_bytes(data)
+        self.index[entry.key] = {
+            "data_type": entry.data_type, "created_at": entry.created_at,
+            "expires_at": entry.expires_at, "size_bytes": len(data),
+            "compressed": False, "access_count": 0, "last_accessed": "",
+        }
+
+    def get(self, key: str) -> Optional[Any]:
+        meta = self.index.get(key)
+        if meta is None or datetime.fromisoformat(meta["expires_at"]) < datetime.utcnow():
+            return None
+        value = json.loads(self._key_to_path(key).read_bytes().decode("utf-8"))
+        meta["access_count"] = meta.get("access_count", 0) + 1
+        meta["last_accessed"] = datetime.utcnow().isoformat()
+        self._save_index()
+        return value
+
+    def close(self):
+        pass
+
+
+def _entry(n: int) -> CacheEntry:
+    now = datetime.utcnow()
+    return CacheEntry(
+        key=f"enrichment:linkedin.com/in/lead-{n}",
+        value={"email": f"lead{n}@example.com", "company": f"Company {n % 997}", "title": "VP Sales"},
+        data_type="enrichment", tier="disk",
+        created_at=now.isoformat(), expires_at=(now + timedelta(days=7)).isoformat(),
+        size_bytes=0, compressed=False,
+    )
+
+
+def _run(mode: str, entries: int, gets: int, cache_dir: Path) -> Dict[str, Any]:
+    if mode == "json_index":
+        cache = JsonIndexDiskCache(cache_dir)
+        for n in range(entries):
+            cache.load(_entry(n))
+        cache._save_index()
+    else:
+        cache = DiskCache(cache_dir=cache_dir, max_size_mb=10_000)
+        for n in range(entries):
+            cache.set(_entry(n))
+
+    rng = random.Random(7)
+    keys = [_entry(rng.randrange(entries)).key for _ in range(gets)]
+    start = time.perf_counter()
+    for key in keys:
+        assert cache.get(key) is not None
+    elapsed = time.perf_counter() - start
+    cache.close()
+    return {"gets": gets, "gets_per_s": round(gets / elapsed, 1)}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark cache-mcp DiskCache lookups.")
+    parser.add_argument("--entries", type=int, nargs="+", default=[10_000, 100_000], help="Entries in the cache.")
+    parser.add_argument("--gets", type=int, default=10_000, help="Random lookups per run.")
+    parser.add_argument("--legacy-gets", type=int, default=200, help="Lookup cap for the json_index mode.")
+    parser.add_argument("--skip-legacy", action="store_true", help="Only benchmark the SQLite index.")
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+
+    results = []
+    modes = ["sqlite"] if args.skip_legacy else ["json_index", "sqlite"]
+    for entries in args.entries:
+        for mode in modes:
+            gets = min(args.gets, args.legacy_gets) if mode == "json_index" else args.gets
+            with tempfile.TemporaryDirectory() as tmp:
+                row = {"mode": mode, "entries": entries, **_run(mode, entries, gets, Path(tmp))}
+            results.append(row)
+            print(json.dumps(row), file=sys.stderr)
+
+    print(json.dumps({"results": results}, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
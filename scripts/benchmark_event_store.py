@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Event store benchmark: single events.jsonl vs day-partitioned segments.
+
+Writes --events synthetic events spread over --days days twice: once as the
+legacy single events.jsonl and once through core.event_log.write_events
+(day segments + sidecar type index). Then times the reads the reports and
+dashboard do: a one-day range (daily report), a seven-day range (weekly
+report), a one-day range for a rare event type, and a total count
+(/api/compound-metrics event volume).
+
+Usage:
+  python scripts/benchmark_event_store.py
+  python scripts/benchmark_event_store.py --events 1000000 --days 30
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from core.event_log import count_events, iter_events, write_events
+
+EVENT_TYPES = ["campaign_sent", "lead_segmented", "enrichment_completed", "reply_received", "meeting_booked"]
+WEIGHTS = [50, 25, 20, 4, 1]
+BATCH = 50_000
+
+
+def _generate(n: int, days: int, seed: int = 5):
+    rng = random.Random(seed)
+    start = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    step = days * 86400 / n
+    for i in range(n):
+        ts = start + timedelta(seconds=i * step)
+        yield {
+            "timestamp": ts.isoformat(),
+            "event_id": f"evt-{i:09d}",
+            "event_type": rng.choices(EVENT_TYPES, WEIGHTS)[0],
+            "payload": {"lead_id": f"lead-{rng.randrange(100_000)}", "campaign_id": f"c{i % 37}"},
+        }
+
+
+def _legacy_read(path: Path, start=None, end=None, types=None) -> int:
+    """The previous reporting.load_events: parse every line and timestamp."""
+    count = 0
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            event = json.loads(line)
+            ts = datetime.fromisoformat(event["timestamp"].replace("Z", "+00:00"))
+            if start and ts < start:
+                continue
+            if end and ts >= end:
+                continue
+            if types and event["event_type"] not in types:
+                continue
+            count += 1
+    return count
+
+
+def _timed(fn: Callable[[], int]) -> Dict[str, Any]:
+    start = time.perf_counter()
+    matched = fn()
+    return {"matched": matched, "seconds": round(time.perf_counter() - start, 3)}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the partitioned event store.")
+    parser.add_argument("--events", type=int, default=10_000_000, help="Synthetic events to write.")
+    parser.add_argument("--days", type=int, default=90, help="Days the events are spread over.")
+    parser.add_argument("--skip-legacy", action="store_true", help="Only benchmark the segmented store.")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        legacy = Path(tmp) / "legacy" / "events.jsonl"
+        store = Path(tmp) / "store" / "events.jsonl"
+        legacy.parent.mkdir()
+        store.parent.mkdir()
+
+        start = time.perf_counter()
+        batch = []
+        with open(legacy, "w", encoding="utf-8") as legacy_f:
+            for event in _generate(args.events, args.days):
+                if not args.skip_legacy:
+                    legacy_f.write(json.dumps(event) + "\n")
+                batch.append(event)
+                if len(batch) >= BATCH:
+                    write_events(batch, store)
+                    batch = []
+        write_events(batch, store)
+        print(json.dumps({"setup_seconds": round(time.perf_counter() - start, 1)}), file=sys.stderr)
+
+        day = datetime(2026, 1, 1, tzinfo=timezone.utc) + timedelta(days=args.days // 2)
+        queries = {
+            "daily_report": (day, day + timedelta(days=1), None),
+            "weekly_report": (day, day + timedelta(days=7), None),
+            "daily_meetings": (day, day + timedelta(days=1), ["meeting_booked"]),
+        }
+
+        results = []
+        for name, (q_start, q_end, q_types) in queries.items():
+            row = {"query": name}
+            if not args.skip_legacy:
+                row["legacy"] = _timed(lambda: _legacy_read(legacy, q_start, q_end, q_types))
+            row["segmented"] = _timed(
+                lambda: sum(1 for _ in iter_events(q_start, q_end, q_types, events_file=store))
+            )
+            results.append(row)
+            print(json.dumps(row), file=sys.stderr)
+
+        row = {"query": "total_count"}
+        if not args.skip_legacy:
+            row["legacy"] = _timed(lambda: sum(1 for _ in open(legacy, "rb")))
+        row["segmented"] = _timed(lambda: count_events(events_file=store))
+        results.append(row)
+        print(json.dumps(row), file=sys.stderr)
+
+    print(json.dumps({"events": args.events, "days": args.days, "results": results}, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+LLM adapter HTTP client benchmark: one-off client per call vs pooled client.
+
+Starts a local mock LLM server (Anthropic /messages and OpenAI
+/chat/completions shapes, HTTP/1.1 keep-alive) and times adapter.complete()
+calls with and without the gateway's HTTPClientPool. --handshake-ms adds a
+delay to every new server connection to stand in for TCP+TLS setup, which
+is what the pool saves on real provider endpoints.
+
+Usage:
+  python scripts/benchmark_llm_http_pool.py
+  python scripts/benchmark_llm_http_pool.py --calls 200 --handshake-ms 40 --provider openai
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import statistics
+import sys
+import threading
+import time
+from dataclasses import replace
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, List
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from core.llm_routing_gateway import (
+    PROVIDER_CONFIGS,
+    ClaudeAdapter,
+    HTTPClientPool,
+    HTTPPoolSettings,
+    LLMProviderType,
+    OpenAIAdapter,
+)
+
+
+def _make_handler(handshake_s: float):
+    class MockLLMHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        disable_nagle_algorithm = True
+
+        def setup(self):
+            super().setup()
+            if handshake_s:
+                time.sleep(handshake_s)
+
+        def log_message(self, *args):
+            pass
+
+        def do_POST(self):
+            length = int(self.headers.get("content-length") or 0)
+            self.rfile.read(length)
+            if self.path.endswith("/messages"):
+                body = {"content": [{"text": "ok"}], "usage": {"input_tokens": 12, "output_tokens": 3}}
+            else:
+                body = {"choices": [{"message": {"content": "ok"}}], "usage": {"prompt_tokens": 12, "completion_tokens": 3}}
+            raw = json.dumps(body).encode()
+            self.send_response(200)
+            self.send_header("content-type", "application/json")
+            self.send_header("content-length", str(len(raw)))
+            self.end_headers()
+            self.wfile.write(raw)
+
+    return MockLLMHandler
+
+
+def _percentile(samples: List[float], pct: float) -> float:
+    ordered = sorted(samples)
+    idx = min(len(ordered) - 1, max(0, int(round(pct / 100.0 * (len(ordered) - 1)))))
+    return ordered[idx]
+
+
+async def _run(adapter, calls: int) -> List[float]:
+    latencies = []
+    messages = [{"role": "user", "content": "Write a one-line subject."}]
+    for _ in range(calls):
+        start = time.perf_counter()
+        await adapter.complete(messages=messages, max_tokens=50, temperature=0.2)
+        latencies.append((time.perf_counter() - start) * 1000.0)
+    return latencies
+
+
+async def _bench(base_url: str, provider: str, calls: int) -> Dict[str, Any]:
+    if provider == "openai":
+        cls, ptype = OpenAIAdapter, LLMProviderType.OPENAI_GPT4
+    else:
+        cls, ptype = ClaudeAdapter, LLMProviderType.CLAUDE_SONNET
+    config = replace(PROVIDER_CONFIGS[ptype], base_url=base_url)
+
+    results = []
+    pool = HTTPClientPool(HTTPPoolSettings())
+    for mode, client_pool in (("per_request_client", None), ("pooled_client", pool)):
+        adapter = cls(config, client_pool)
+        adapter.api_key = "benchmark-key"
+        latencies = await _run(adapter, calls)
+        row = {
+            "mode": mode,
+            "calls": calls,
+            "mean_ms": round(statistics.mean(latencies), 3),
+            "p50_ms": round(statistics.median(latencies), 3),
+            "p99_ms": round(_percentile(latencies, 99), 3),
+        }
+        if client_pool is not None:
+            row["pool"] = client_pool.get_stats()
+        results.append(row)
+    await pool.aclose()
+    return {"provider": provider, "results": results}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark pooled vs per-request LLM HTTP clients.")
+    parser.add_argument("--calls", type=int, default=100, help="Sequential calls per mode.")
+    parser.add_argument("--handshake-ms", type=float, default=20.0, help="Simulated setup cost per new connection.")
+    parser.add_argument("--provider", choices=("claude", "openai"), default="claude")
+    args = parser.parse_args()
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _make_handler(args.handshake_ms / 1000.0))
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}/v1"
+    try:
+        report = asyncio.run(_bench(base_url, args.provider, args.calls))
+    finally:
+        server.shutdown()
+
+    report["handshake_ms"] = args.handshake_ms
+    print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
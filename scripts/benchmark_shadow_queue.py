@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+Shadow queue read-path benchmark.
+
+Measures Redis round trips and p50/p99 latency of list_pending() for:
+  - legacy:  one GET per pending id + one ZREM per stale entry (pre-batching)
+  - batched: ZREVRANGE + single MGET + one stale-cleanup call
+  - cached:  batched path behind the in-process page cache
+
+Runs against REDIS_URL when set, otherwise an in-process fakeredis server.
+Use --rtt-ms to add simulated network latency per round trip (useful with
+fakeredis, where a round trip is otherwise nearly free).
+
+Usage:
+  python scripts/benchmark_shadow_queue.py
+  python scripts/benchmark_shadow_queue.py --emails 200 --limit 20 --iterations 500 --rtt-ms 1.5
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+import uuid
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+import core.shadow_queue as sq
+
+
+class CountingRedis:
+    """Client proxy that counts round trips (a pipeline execute counts as one)."""
+
+    def __init__(self, client: Any, rtt_ms: float = 0.0):
+        self._client = client
+        self._rtt = rtt_ms / 1000.0
+        self.round_trips = 0
+
+    def _trip(self) -> None:
+        self.round_trips += 1
+        if self._rtt:
+            time.sleep(self._rtt)
+
+    def pipeline(self, transaction: bool = True) -> "CountingPipeline":
+        return CountingPipeline(self, self._client.pipeline(transaction=transaction))
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._client, name)
+        if not callable(attr):
+            return attr
+
+        def _call(*args, **kwargs):
+            # scan_iter is counted once even though it may page several SCANs.
+            self._trip()
+            return attr(*args, **kwargs)
+
+        return _call
+
+
+class CountingPipeline:
+    def __init__(self, owner: CountingRedis, pipe: Any):
+        self._owner = owner
+        self._pipe = pipe
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._pipe, name)
+
+    def execute(self) -> List[Any]:
+        self._owner._trip()
+        return self._pipe.execute()
+
+
+def _connect() -> Any:
+    url = (os.getenv("REDIS_URL") or "").strip()
+    if url:
+        import redis
+        return redis.Redis.from_url(url, decode_responses=True)
+    try:
+        import fakeredis
+    except ImportError:
+        raise SystemExit("Set REDIS_URL or `pip install fakeredis` to run this benchmark.")
+    return fakeredis.FakeRedis(decode_responses=True)
+
+
+def _legacy_list_pending(r: Any, limit: int) -> List[Dict[str, Any]]:
+    """The pre-batching read loop, kept here for comparison only."""
+    pending = []
+    for eid in r.zrevrange(sq._index_key(), 0, limit - 1):
+        raw = r.get(sq._key(eid))
+        if not raw:
+            r.zrem(sq._index_key(), eid)
+            continue
+        data = json.loads(raw)
+        if data.get("status") == "pending":
+            pending.append(data)
+        else:
+            r.zrem(sq._index_key(), eid)
+    return pending
+
+
+def _seed(count: int) -> None:
+    for i in range(count):
+        sq.push({
+            "email_id": f"bench_{i:06d}",
+            "status": "pending",
+            "to": f"lead{i}@example.com",
+            "subject": "Benchmark subject",
+            "body": "Benchmark body " * 40,
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+        })
+
+
+def _percentile(samples: List[float], pct: float) -> float:
+    ordered = sorted(samples)
+    idx = min(len(ordered) - 1, max(0, int(round(pct / 100.0 * (len(ordered) - 1)))))
+    return ordered[idx]
+
+
+def _run(mode: str, counting: CountingRedis, limit: int, iterations: int) -> Dict[str, Any]:
+    os.environ["SHADOW_QUEUE_PAGE_CACHE_TTL_SECONDS"] = "2" if mode == "cached" else "0"
+    sq.invalidate_page_cache()
+    counting.round_trips = 0
+    latencies: List[float] = []
+    returned = 0
+    for _ in range(iterations):
+        start = time.perf_counter()
+        if mode == "legacy":
+            page = _legacy_list_pending(counting, limit)
+        else:
+            page = sq.list_pending(limit=limit)
+        latencies.append((time.perf_counter() - start) * 1000.0)
+        returned = len(page)
+    return {
+        "mode": mode,
+        "iterations": iterations,
+        "returned_per_call": returned,
+        "round_trips_per_call": round(counting.round_trips / iterations, 2),
+        "p50_ms": round(statistics.median(latencies), 3),
+        "p99_ms": round(_percentile(latencies, 99), 3),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark shadow queue list_pending() read paths.")
+    parser.add_argument("--emails", type=int, default=200, help="Pending emails to seed.")
+    parser.add_argument("--limit", type=int, default=20, help="Page size passed to list_pending().")
+    parser.add_argument("--iterations", type=int, default=300, help="Reads per mode.")
+    parser.add_argument("--rtt-ms", type=float, default=0.0, help="Simulated latency per round trip.")
+    args = parser.parse_args()
+
+    os.environ["CONTEXT_REDIS_PREFIX"] = f"caio:bench:{uuid.uuid4().hex[:8]}"
+    raw_client = _connect()
+    counting = CountingRedis(raw_client, rtt_ms=args.rtt_ms)
+    sq._client = counting
+    sq._init_done = True
+
+    try:
+        _seed(args.emails)
+        results = [_run(mode, counting, args.limit, args.iterations) for mode in ("legacy", "batched", "cached")]
+    finally:
+        keys = list(raw_client.scan_iter(match=f"{sq._prefix()}:*", count=500))
+        if keys:
+            raw_client.delete(*keys)
+
+    print(json.dumps({
+        "backend": "redis" if os.getenv("REDIS_URL") else "fakeredis",
+        "emails": args.emails,
+        "limit": args.limit,
+        "rtt_ms": args.rtt_ms,
+        "results": results,
+    }, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
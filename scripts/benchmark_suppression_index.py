@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Suppression check micro-benchmark: JSONL re-scan vs SuppressionIndex.
+
+Writes a synthetic unsubscribes.jsonl with --entries lines and times:
+  - the previous _is_suppressed, which parsed every line on each call
+  - SuppressionIndex in exact mode (one load, then set lookups + tail stat)
+  - SuppressionIndex in bloom mode, starting from a saved .bloom snapshot
+
+Usage:
+  python scripts/benchmark_suppression_index.py
+  python scripts/benchmark_suppression_index.py --entries 1000000 --checks 100000 --scan-checks 3
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from core.suppression_index import SuppressionIndex
+
+
+def _scan_is_suppressed(path: Path, email: str) -> bool:
+    """The pre-index implementation from webhooks/instantly_webhook.py."""
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                if json.loads(line.strip()).get("email") == email:
+                    return True
+            except (json.JSONDecodeError, KeyError):
+                continue
+    return False
+
+
+def _write_list(path: Path, entries: int) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        for i in range(entries):
+            f.write(json.dumps({"email": f"user{i}@domain{i % 5000}.com", "at": "2026-01-01T00:00:00+00:00"}) + "\n")
+
+
+def _probe_emails(entries: int, checks: int) -> List[str]:
+    rng = random.Random(7)
+    # Half suppressed, half not
+    emails = []
+    for i in range(checks):
+        n = rng.randrange(entries)
+        emails.append(f"user{n}@domain{n % 5000}.com" if i % 2 else f"prospect{i}@example.com")
+    return emails
+
+
+def _time_checks(fn, emails: List[str]) -> Dict[str, Any]:
+    start = time.perf_counter()
+    hits = sum(1 for email in emails if fn(email))
+    elapsed = time.perf_counter() - start
+    return {
+        "checks": len(emails),
+        "hits": hits,
+        "us_per_check": round(elapsed / len(emails) * 1e6, 3),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark suppression list membership checks.")
+    parser.add_argument("--entries", type=int, default=1_000_000, help="Lines in the suppression list.")
+    parser.add_argument("--checks", type=int, default=100_000, help="Membership checks for the index modes.")
+    parser.add_argument("--scan-checks", type=int, default=3, help="Checks for the full-scan baseline.")
+    args = parser.parse_args()
+
+    report: Dict[str, Any] = {"entries": args.entries}
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "unsubscribes.jsonl"
+        _write_list(path, args.entries)
+        report["file_mb"] = round(path.stat().st_size / 1e6, 1)
+        emails = _probe_emails(args.entries, args.checks)
+
+        if args.scan_checks:
+            report["jsonl_scan"] = _time_checks(lambda e: _scan_is_suppressed(path, e), emails[:args.scan_checks])
+
+        start = time.perf_counter()
+        exact = SuppressionIndex(path, mode="exact")
+        report["exact"] = {"load_s": round(time.perf_counter() - start, 3), **_time_checks(exact.contains, emails)}
+
+        start = time.perf_counter()
+        exact.save_bloom()
+        report["bloom_snapshot"] = {
+            "save_s": round(time.perf_counter() - start, 3),
+            "bytes": exact.bloom_path.stat().st_size,
+        }
+
+        start = time.perf_counter()
+        bloom = SuppressionIndex(path, mode="bloom")
+        load_s = time.perf_counter() - start
+        report["bloom"] = {"load_s": round(load_s, 3), **_time_checks(bloom.contains, emails)}
+        report["bloom"]["estimated_error_rate"] = bloom.get_stats()["bloom_estimated_error_rate"]
+
+    if "jsonl_scan" in report:
+        report["speedup_exact_vs_scan"] = round(
+            report["jsonl_scan"]["us_per_check"] / max(report["exact"]["us_per_check"], 1e-9)
+        )
+    print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Trace envelope read benchmark: whole-file splitlines vs tail reader + index.
+
+Writes --traces synthetic envelopes (with their sidecar index) into a temp
+trace file, then times what the dashboard and diagnose CLI do: the newest
+200 traces (/api/traces/recent), the newest 200 for a rare agent, a
+correlation-id lookup (diagnose --correlation-id) and the total count
+(/api/compound-metrics). "full_read" is the previous
+read_text().splitlines() approach.
+
+Usage:
+  python scripts/benchmark_trace_reader.py
+  python scripts/benchmark_trace_reader.py --traces 50000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from core.trace_envelope import _index_line, count_traces, find_traces, tail_traces
+
+AGENTS = ["HUNTER", "ENRICHER", "SEGMENTOR", "CRAFTER", "GATEKEEPER", "AUDITOR"]
+WEIGHTS = [30, 30, 20, 15, 4, 1]
+
+
+def _write(path: Path, n: int, seed: int = 9) -> None:
+    rng = random.Random(seed)
+    offset = 0
+    with open(path, "wb") as data, open(path.with_name(path.name + ".idx"), "w", encoding="utf-8") as index:
+        for i in range(n):
+            envelope = {
+                "timestamp": f"2026-03-01T00:00:{i % 60:02d}+00:00",
+                "correlation_id": f"corr-{i // 8}",
+                "case_id": f"case-{i // 200}",
+                "agent": rng.choices(AGENTS, WEIGHTS)[0],
+                "tool_name": "UnifiedIntegrationGateway.execute:ghl.send_email",
+                "tool_input_summary": json.dumps({"lead_id": f"lead-{i}", "body": "x" * 300}),
+                "tool_output_summary": json.dumps({"success": True}),
+                "retrieved_context_refs": [f"lead-{i}"],
+                "status": "success",
+                "duration_ms": 12.5,
+                "error_code": None,
+                "error_message": None,
+            }
+            line = (json.dumps(envelope) + "\n").encode("utf-8")
+            data.write(line)
+            index.write(_index_line(envelope, offset, len(line)))
+            offset += len(line)
+
+
+def _full_read(path: Path):
+    return path.read_text(encoding="utf-8", errors="replace").splitlines()
+
+
+def _full_recent(path: Path, limit: int, agent: str = "") -> int:
+    traces = []
+    for line in reversed(_full_read(path)):
+        entry = json.loads(line)
+        if agent and entry.get("agent") != agent:
+            continue
+        traces.append(entry)
+        if len(traces) >= limit:
+            break
+    return len(traces)
+
+
+def _timed(fn: Callable[[], int]) -> Dict[str, Any]:
+    start = time.perf_counter()
+    matched = fn()
+    return {"matched": matched, "seconds": round(time.perf_counter() - start, 4)}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark trace envelope reads.")
+    parser.add_argument("--traces", type=int, default=200_000, help="Synthetic trace envelopes to write.")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "tool_trace_envelopes.jsonl"
+        _write(path, args.traces)
+        corr = f"corr-{args.traces // 16}"
+
+        queries = {
+            "recent_200": (
+                lambda: _full_recent(path, 200),
+                lambda: len(tail_traces(200, trace_file=path)),
+            ),
+            "recent_200_rare_agent": (
+                lambda: _full_recent(path, 200, "AUDITOR"),
+                lambda: len(tail_traces(200, agent="AUDITOR", trace_file=path)),
+            ),
+            "correlation_lookup": (
+                lambda: sum(1 for line in _full_read(path) if json.loads(line)["correlation_id"] == corr),
+                lambda: len(find_traces(correlation_id=corr, trace_file=path)),
+            ),
+            "total_count": (
+                lambda: len(_full_read(path)),
+                lambda: count_traces(path),
+            ),
+        }
+
+        results = []
+        for name, (full, indexed) in queries.items():
+            row = {"query": name, "full_read": _timed(full), "indexed": _timed(indexed)}
+            results.append(row)
+            print(json.dumps(row), file=sys.stderr)
+
+        size_mb = round(path.stat().st_size / 1024 / 1024, 1)
+
+    print(json.dumps({"traces": args.traces, "file_mb": size_mb, "results": results}, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
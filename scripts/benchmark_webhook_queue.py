@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Webhook queue ingestion benchmark: whole-file JSON rewrite vs segmented log.
+
+Posts bursts of Instantly events through the Flask routes
+(/webhooks/instantly, via the Flask test client) into a queue that already
+holds --backlog events, then acks them the way process_queue does. The
+"json_rewrite" mode reproduces the previous EventQueue, which rewrote
+webhook_queue.json on every add and ack; "segmented" is the current
+append-only EventQueue.
+
+Usage:
+  python scripts/benchmark_webhook_queue.py
+  python scripts/benchmark_webhook_queue.py --events 5000 --backlog 0 2000 20000 --threads 8
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+import webhooks.webhook_server as ws
+from webhooks.webhook_server import EventQueue, WebhookEvent, create_app
+
+
+class JsonRewriteQueue(EventQueue):
+    """The pre-segment EventQueue: every add/ack rewrites one JSON file."""
+
+    def __init__(self, queue_file: Path):
+        self.queue_file = queue_file
+        self._lock = threading.Lock()
+        self._events: List[WebhookEvent] = []
+        self.stats = {"total_received": 0, "processed": 0}
+
+    def _save(self):
+        with open(self.queue_file, "w", encoding="utf-8") as f:
+            json.dump({"events": [e.to_dict() for e in self._events]}, f, indent=2)
+
+    def add(self, event: WebhookEvent):
+        with self._lock:
+            self._events.append(event)
+            self.stats["total_received"] += 1
+            self._save()
+
+    def get_unprocessed(self) -> List[WebhookEvent]:
+        with self._lock:
+            return [e for e in self._events if not e.processed]
+
+    def mark_processed(self, event_id: str, error=None):
+        with self._lock:
+            for event in self._events:
+                if event.event_id == event_id:
+                    event.processed = True
+                    self.stats["processed"] += 1
+                    break
+            self._save()
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {**self.stats, "queue_size": len(self._events)}
+
+    def close(self):
+        pass
+
+
+def _prefill(queue: EventQueue, backlog: int) -> None:
+    now = datetime.now(timezone.utc).isoformat()
+    for n in range(backlog):
+        queue.add(WebhookEvent(
+            source="instantly", event_type="email_opened", payload={"n": n},
+            received_at=now, event_id=f"backlog_{n}",
+        ))
+
+
+def _run(queue: EventQueue, events: int, threads: int) -> Dict[str, Any]:
+    app = create_app(queue)
+    per_thread = max(1, events // threads)
+
+    def post():
+        client = app.test_client()
+        for n in range(per_thread):
+            client.post("/webhooks/instantly", json={"event_type": "email_replied", "n": n})
+
+    workers = [threading.Thread(target=post) for _ in range(threads)]
+    start = time.perf_counter()
+    for t in workers:
+        t.start()
+    for t in workers:
+        t.join()
+    ingest_s = time.perf_counter() - start
+
+    pending = queue.get_unprocessed()[-per_thread * threads:]
+    start = time.perf_counter()
+    for event in pending:
+        queue.mark_processed(event.event_id)
+    ack_s = time.perf_counter() - start
+
+    sent = per_thread * threads
+    return {
+        "events": sent,
+        "ingest_events_per_s": round(sent / ingest_s, 1),
+        "ack_events_per_s": round(len(pending) / ack_s, 1) if ack_s else None,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark webhook queue ingestion through the Flask routes.")
+    parser.add_argument("--events", type=int, default=1000, help="Events posted per run.")
+    parser.add_argument("--threads", type=int, default=4, help="Concurrent posting threads.")
+    parser.add_argument("--backlog", type=int, nargs="+", default=[0, 2000], help="Events already queued.")
+    parser.add_argument("--skip-legacy", action="store_true", help="Only benchmark the segmented queue.")
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+    ws.INSTANTLY_WEBHOOK_SECRET = ""
+
+    results = []
+    modes = ["segmented"] if args.skip_legacy else ["json_rewrite", "segmented"]
+    for backlog in args.backlog:
+        for mode in modes:
+            with tempfile.TemporaryDirectory() as tmp:
+                queue_file = Path(tmp) / "webhook_queue.json"
+                queue = JsonRewriteQueue(queue_file) if mode == "json_rewrite" else EventQueue(queue_file)
+                _prefill(queue, backlog)
+                row = {"mode": mode, "backlog": backlog, **_run(queue, args.events, args.threads)}
+                queue.close()
+            results.append(row)
+            print(json.dumps(row), file=sys.stderr)
+
+    print(json.dumps({"threads": args.threads, "results": results}, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
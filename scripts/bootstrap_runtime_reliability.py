@@ -101,9 +101,9 @@ def main() -> int:
     parser.add_argument("--redis-url", default=None, help="Redis URL override.")
     parser.add_argument(
         "--state-backend",
-        choices=["file", "redis"],
+        choices=["file", "redis", "sqlite"],
         default=None,
-        help="State backend override (file|redis).",
+        help="State backend override (file|redis|sqlite).",
     )
     parser.add_argument("--state-redis-prefix", default=None, help="State Redis prefix override.")
     parser.add_argument("--inngest-signing-key", default=None, help="Inngest signing key override.")
@@ -25,8 +25,13 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
 HIVE_MIND = PROJECT_ROOT / ".hive-mind"
 
+from core.event_log import recent_events
+from core.trace_envelope import find_traces, tail_traces
+
 # Data source paths
 EVENTS_FILE = HIVE_MIND / "events.jsonl"
 TRACES_FILE = HIVE_MIND / "traces" / "tool_trace_envelopes.jsonl"
@@ -86,14 +91,13 @@ def diagnose_case(case_id: str) -> Dict[str, Any]:
     }
 
     # Search traces
-    traces = _read_jsonl(TRACES_FILE)
-    result["traces"] = _filter_by_id(traces, "case_id", case_id)
+    result["traces"] = find_traces(case_id=case_id, trace_file=TRACES_FILE)
 
     # If we found traces, extract correlation_ids to search events
     corr_ids = {t.get("correlation_id") for t in result["traces"] if t.get("correlation_id")}
 
     # Search events
-    events = _read_jsonl(EVENTS_FILE)
+    events = recent_events(events_file=EVENTS_FILE)
     for event in events:
         meta = event.get("metadata") or {}
         if meta.get("case_id") == case_id or meta.get("correlation_id") in corr_ids:
@@ -133,10 +137,9 @@ def diagnose_correlation(correlation_id: str) -> Dict[str, Any]:
         "circuit_breakers": _read_json(BREAKERS_FILE),
     }
 
-    traces = _read_jsonl(TRACES_FILE)
-    result["traces"] = _filter_by_id(traces, "correlation_id", correlation_id)
+    result["traces"] = find_traces(correlation_id=correlation_id, trace_file=TRACES_FILE)
 
-    events = _read_jsonl(EVENTS_FILE)
+    events = recent_events(events_file=EVENTS_FILE)
     for event in events:
         meta = event.get("metadata") or {}
         if meta.get("correlation_id") == correlation_id:
@@ -171,10 +174,10 @@ def get_breaker_status() -> Dict[str, Any]:
 
 def get_recent_errors(limit: int = 20) -> Dict[str, Any]:
     """Get recent errors from traces and events."""
-    traces = _read_jsonl(TRACES_FILE)
+    traces = tail_traces(500, trace_file=TRACES_FILE)[::-1]
     error_traces = [t for t in traces if t.get("status") == "failure" or t.get("error_code")]
 
-    events = _read_jsonl(EVENTS_FILE)
+    events = recent_events(events_file=EVENTS_FILE)
     error_events = [e for e in events if e.get("event_type") in ("system_error", "compliance_failed", "enrichment_failed", "scrape_failed")]
 
     retries = _read_jsonl(RETRY_QUEUE, limit=limit)
@@ -195,8 +198,8 @@ def get_recent_errors(limit: int = 20) -> Dict[str, Any]:
 def get_health_summary() -> Dict[str, Any]:
     """Get local health summary from available data."""
     breakers = _read_json(BREAKERS_FILE)
-    events = _read_jsonl(EVENTS_FILE, limit=100)
-    traces = _read_jsonl(TRACES_FILE, limit=100)
+    events = recent_events(100, events_file=EVENTS_FILE)
+    traces = tail_traces(100, trace_file=TRACES_FILE)[::-1]
 
     # Count recent statuses
     trace_statuses: Dict[str, int] = {}
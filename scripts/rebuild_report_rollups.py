@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+Rebuild the per-day report rollups from scratch.
+
+Reports consume new events into .hive-mind/report_rollups.db on their own;
+run this after editing or restoring event files by hand, or to verify the
+rollups against a full re-read of the event store.
+
+Usage:
+  python scripts/rebuild_report_rollups.py
+  python scripts/rebuild_report_rollups.py --events-file /path/to/.hive-mind/events.jsonl
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from core import reporting
+from core.report_rollups import get_report_rollups
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Rebuild report rollups from the event store.")
+    parser.add_argument("--events-file", type=Path, default=reporting.EVENTS_FILE,
+                        help="Legacy events.jsonl path; day segments are read from its events/ directory.")
+    args = parser.parse_args()
+
+    rollups = get_report_rollups(args.events_file)
+    start = time.perf_counter()
+    consumed = rollups.rebuild()
+    print(json.dumps({
+        "events": consumed,
+        "db_path": str(rollups.db_path),
+        "seconds": round(time.perf_counter() - start, 2),
+    }, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Rebuild (repair) the shadow email filesystem index.
+
+Directories written by older versions contain files not named
+{email_id}.json, which forces get_email()/update_status() into a full scan on
+a miss. This writes a complete .email_index.jsonl manifest for the directory
+and can optionally rename files to the canonical scheme.
+
+Usage:
+  python scripts/rebuild_shadow_file_index.py
+  python scripts/rebuild_shadow_file_index.py --shadow-dir .hive-mind/shadow_mode_emails --rename
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from core.shadow_queue import rebuild_file_index
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Rebuild the shadow email ID -> file index.")
+    parser.add_argument(
+        "--shadow-dir",
+        default=".hive-mind/shadow_mode_emails",
+        help="Shadow email directory (relative paths resolve from the project root).",
+    )
+    parser.add_argument("--rename", action="store_true", help="Rename files to {email_id}.json when the name is free.")
+    args = parser.parse_args()
+
+    shadow_dir = Path(args.shadow_dir)
+    if not shadow_dir.is_absolute():
+        shadow_dir = (PROJECT_ROOT / shadow_dir).resolve()
+    if not shadow_dir.exists():
+        print(json.dumps({"shadow_dir": str(shadow_dir), "error": "not_found"}, indent=2))
+        return 1
+
+    summary = rebuild_file_index(shadow_dir, rename_to_canonical=args.rename)
+    print(json.dumps(summary, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -9,6 +9,9 @@ from unittest.mock import patch, MagicMock
 import tempfile
 import shutil
 
+import sqlite3
+
+from core import audit_trail as audit_trail_module
 from core.audit_trail import (
     AuditTrail, AuditEntry, get_audit_trail,
     PIIRedactor, PIIType, ApprovalStatus
@@ -452,6 +455,77 @@ async def test_metrics_aggregation(audit_trail):
     assert stats["failures"] == 1
 
 
+@pytest.mark.asyncio
+async def test_concurrent_writes_are_batched(audit_trail):
+    """Concurrent log_action calls share transactions and keep unique IDs."""
+    await audit_trail.initialize()
+    with patch.object(audit_trail, "_write_batch", wraps=audit_trail._write_batch) as spy:
+        ids = await asyncio.gather(*[
+            audit_trail.log_action("BatchAgent", "action", {"n": n}, "success", "LOW", duration_ms=10)
+            for n in range(50)
+        ])
+
+    assert sorted(ids) == list(range(min(ids), min(ids) + 50))
+    assert spy.call_count < 50
+
+    logs = await audit_trail.get_logs(agent_name="BatchAgent", limit=100)
+    assert {log["id"]: log["action_details"]["n"] for log in logs} == dict(zip(ids, range(50)))
+    stats = await audit_trail.get_agent_stats("BatchAgent")
+    assert stats["total_actions"] == 50
+    assert stats["avg_duration"] == 10
+
+
+@pytest.mark.asyncio
+async def test_fire_and_forget_writes_with_backpressure(temp_dir):
+    """wait=False returns immediately; flush() commits everything queued."""
+    trail = AuditTrail(db_path=temp_dir / "audit.db", backup_dir=temp_dir / "backup",
+                       batch_size=3, max_queue_size=5)
+
+    for n in range(20):
+        assert await trail.log_action("QueuedAgent", "action", {"n": n}, "success", "LOW",
+                                      wait=False) is None
+        assert trail._queue.qsize() <= 5
+
+    await trail.flush()
+    assert trail._queue.qsize() == 0
+    stats = await trail.get_agent_stats("QueuedAgent")
+    assert stats["total_actions"] == 20
+    await trail.close()
+
+
+def _log_without_waiting(trail, agent_name, count):
+    """Queue entries with wait=False in a loop that exits right away."""
+    async def fire_and_exit():
+        for n in range(count):
+            await trail.log_action(agent_name, "action", {"n": n}, "success", "LOW", wait=False)
+    asyncio.run(fire_and_exit())
+
+
+def test_entries_left_by_an_exited_loop_are_written(temp_dir):
+    """A new event loop writes what the previous loop left queued before replacing the queue."""
+    trail = AuditTrail(db_path=temp_dir / "audit.db", backup_dir=temp_dir / "backup", batch_size=2)
+    _log_without_waiting(trail, "LoopAgent", 10)  # the writer is cancelled mid-queue
+
+    async def log_and_count():
+        await trail.log_action("LoopAgent", "action", {"n": 10}, "success", "LOW")
+        return (await trail.get_agent_stats("LoopAgent"))["total_actions"]
+
+    assert asyncio.run(log_and_count()) == 11
+    asyncio.run(trail.close())
+
+
+def test_queued_entries_are_written_at_exit(temp_dir):
+    """The atexit hook commits entries no loop got around to writing."""
+    trail = AuditTrail(db_path=temp_dir / "audit.db", backup_dir=temp_dir / "backup", batch_size=2)
+    _log_without_waiting(trail, "ExitAgent", 10)
+
+    audit_trail_module._drain_audit_trails()
+    with sqlite3.connect(str(temp_dir / "audit.db")) as conn:
+        count = conn.execute("SELECT COUNT(*) FROM audit_log WHERE agent_name = 'ExitAgent'").fetchone()[0]
+    assert count == 10
+    asyncio.run(trail.close())
+
+
 @pytest.mark.asyncio
 async def test_risk_levels(audit_trail):
     """Test different risk levels are stored correctly."""
@@ -627,6 +701,22 @@ class TestPIIRedactor:
         assert "[EMAIL_REDACTED]" in summary
         assert "Public" in summary
 
+    def test_redact_many_matches_redact_string(self):
+        """Batch redaction matches per-string redaction."""
+        texts = ["mail a@b.com", "plain text", "ip 10.0.0.1", "mail a@b.com"]
+        assert PIIRedactor.redact_many(texts) == [PIIRedactor.redact_string(t) for t in texts]
+
+    def test_redact_values_single_pass(self):
+        """Dicts and strings are redacted together with redact_dict semantics."""
+        details = {"recipient": "x@y.com", "password": "p", "tags": ["a@b.com", 3]}
+        with patch.object(PIIRedactor, "redact_many", wraps=PIIRedactor.redact_many) as spy:
+            result = PIIRedactor.redact_values([details, "lead x@y.com", None])
+        assert spy.call_count == 1
+        assert result[0] == PIIRedactor.redact_dict(details)
+        assert result[1] == "lead [EMAIL_REDACTED]"
+        assert result[2] is None
+        assert details["recipient"] == "x@y.com"
+
 
 class TestApprovalStatus:
     """Tests for ApprovalStatus enum."""
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Tests for the cache-mcp DiskCache (SQLite index, inline values, LRU eviction).
+"""
+
+import importlib.util
+import json
+import os
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+spec = importlib.util.spec_from_file_location(
+    "cache_mcp_server",
+    PROJECT_ROOT / "mcp-servers" / "cache-mcp" / "server.py"
+)
+cache_module = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(cache_module)
+
+DiskCache = cache_module.DiskCache
+CacheEntry = cache_module.CacheEntry
+CacheMCPServer = cache_module.CacheMCPServer
+
+
+def _entry(key, value, data_type="enrichment", ttl=timedelta(hours=1)):
+    now = datetime.utcnow()
+    return CacheEntry(
+        key=key, value=value, data_type=data_type, tier="disk",
+        created_at=now.isoformat(), expires_at=(now + ttl).isoformat(),
+        size_bytes=0, compressed=False,
+    )
+
+
+@pytest.fixture
+def disk(tmp_path):
+    cache = DiskCache(cache_dir=tmp_path)
+    yield cache
+    cache.close()
+
+
+class TestDiskCache:
+
+    def test_small_values_stored_inline(self, disk, tmp_path):
+        assert disk.set(_entry("lead:1", {"email": "a@b.com"}))
+        assert list(tmp_path.glob("*.cache")) == []
+        assert disk.get("lead:1").value == {"email": "a@b.com"}
+
+    def test_large_values_use_file_and_compress(self, disk, tmp_path):
+        value = {"blob": os.urandom(8000).hex()}
+        assert disk.set(_entry("lead:big", value))
+        assert len(list(tmp_path.glob("*.cache"))) == 1
+        hit = disk.get("lead:big")
+        assert hit.value == value and hit.compressed
+        assert disk.delete("lead:big")
+        assert list(tmp_path.glob("*.cache")) == []
+
+    def test_access_stats_are_buffered(self, disk):
+        disk.set(_entry("k", 1))
+        for _ in range(3):
+            hit = disk.get("k")
+        assert hit.access_count == 3
+        row = disk._conn.execute("SELECT access_count FROM entries WHERE key='k'").fetchone()
+        assert row[0] == 0
+        disk.flush_access_stats()
+        row = disk._conn.execute("SELECT access_count FROM entries WHERE key='k'").fetchone()
+        assert row[0] == 3
+
+    def test_expired_entries_swept(self, disk):
+        disk.set(_entry("old", 1, ttl=timedelta(seconds=-1)))
+        disk.set(_entry("new", 2))
+        assert disk.sweep_expired() == 1
+        assert len(disk) == 1
+        assert disk.get("old") is None
+
+    def test_lru_eviction_bounds_disk_size(self, tmp_path):
+        disk = DiskCache(cache_dir=tmp_path, max_size_mb=0.001)  # ~1 KB
+        try:
+            disk.set(_entry("a", "x" * 400))
+            time.sleep(0.01)
+            disk.set(_entry("b", "y" * 400))
+            time.sleep(0.01)
+            disk.get("a")
+            time.sleep(0.01)
+            disk.set(_entry("c", "z" * 400))
+            assert disk.current_size <= disk.max_size_bytes
+            assert disk.get("b") is None
+            assert disk.get("a") is not None
+        finally:
+            disk.close()
+
+    def test_legacy_json_index_migrated(self, tmp_path):
+        legacy = DiskCache(cache_dir=tmp_path)
+        value = {"v": os.urandom(8000).hex()}
+        legacy.set(_entry("big", value))
+        legacy.close()
+        (tmp_path / "index.db").unlink()
+        (tmp_path / "index.json").write_text(json.dumps({
+            "big": {
+                "data_type": "company",
+                "created_at": datetime.utcnow().isoformat(),
+                "expires_at": (datetime.utcnow() + timedelta(days=1)).isoformat(),
+                "size_bytes": 100,
+                "compressed": True,
+            }
+        }))
+        disk = DiskCache(cache_dir=tmp_path)
+        try:
+            assert disk.get("big").value == value
+            assert not (tmp_path / "index.json").exists()
+        finally:
+            disk.close()
+
+
+class TestCacheServerInvalidate:
+
+    async def test_invalidate_by_type_and_pattern(self, tmp_path):
+        server = CacheMCPServer(cache_dir=tmp_path)
+        await server.cache_set("company:acme", {"n": 1}, "company", tier="disk")
+        await server.cache_set("company:globex", {"n": 2}, "company", tier="disk")
+        await server.cache_set("intent:acme", {"n": 3}, "intent", tier="disk")
+
+        result = await server.cache_invalidate(pattern="acme", tier="disk")
+        assert result["invalidated"]["disk"] == 2
+        result = await server.cache_invalidate(data_type="company", tier="disk")
+        assert result["invalidated"]["disk"] == 1
+        assert len(server.disk) == 0
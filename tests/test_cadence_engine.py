@@ -6,6 +6,7 @@ Tests for XS-05 (step idempotency) and core cadence state transitions.
 """
 
 import sys
+from dataclasses import asdict
 from datetime import datetime, date, timezone
 from pathlib import Path
 from unittest.mock import patch, MagicMock
@@ -190,3 +191,52 @@ class TestStepCompletion:
 
         assert state.current_step == 3
         assert state.status == "active"
+
+
+# =============================================================================
+# TEST: Due-action scan
+# =============================================================================
+
+class TestDueActionScan:
+    """get_due_actions reads only due leads and fetches signals in one call."""
+
+    def _engine_with(self, states, lead_statuses):
+        engine = _make_engine()
+        engine.get_cadence_definition = MagicMock(return_value=({}, _make_steps()))
+        engine.get_exit_statuses = MagicMock(return_value=["replied", "bounced"])
+        engine._state_store.list_due_cadence_lead_states.return_value = [
+            asdict(s) for s in states
+        ]
+        mgr = MagicMock()
+        mgr.get_lead_statuses.return_value = lead_statuses
+        engine._signal_mgr = mgr
+        return engine, mgr
+
+    def test_bulk_signal_lookup_once_per_scan(self):
+        states = [
+            _make_active_state(email="a@example.com", current_step=1),
+            _make_active_state(email="b@example.com", current_step=2),
+            _make_active_state(email="c@example.com", current_step=1),
+        ]
+        engine, mgr = self._engine_with(states, {"c@example.com": {"status": "bounced"}})
+
+        actions = engine.get_due_actions()
+
+        assert [a.email for a in actions] == ["a@example.com", "b@example.com"]
+        assert actions[1].step.action == "followup"
+        mgr.get_lead_statuses.assert_called_once()
+        mgr.get_lead_status.assert_not_called()
+        engine._state_store.list_due_cadence_lead_states.assert_called_once_with(
+            "default_21day", date.today().isoformat()
+        )
+
+    def test_not_replied_uses_prefetched_status(self):
+        states = [_make_active_state(email="r@example.com", current_step=2)]
+        engine, mgr = self._engine_with(states, {"r@example.com": {"status": "meeting_booked"}})
+
+        with patch.object(engine, "_advance_to_next_step") as advance:
+            actions = engine.get_due_actions()
+
+        assert actions == []
+        advance.assert_called_once()
+        mgr.get_lead_status.assert_not_called()
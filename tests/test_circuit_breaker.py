@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+CircuitBreakerRegistry persistence tests (write-behind + shared Redis state).
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from core import circuit_breaker
+from core.circuit_breaker import (
+    PERSIST_WRITE_BEHIND,
+    CircuitBreakerRegistry,
+    CircuitState,
+)
+
+
+class _FakeRedisClient:
+    _shared: dict[str, str] = {}
+
+    @classmethod
+    def from_url(cls, *args, **kwargs):
+        return cls()
+
+    def ping(self):
+        return True
+
+    def get(self, key: str):
+        return self._shared.get(key)
+
+    def set(self, key: str, value: str):
+        self._shared[key] = value
+        return True
+
+
+@pytest.fixture
+def fake_redis(monkeypatch):
+    _FakeRedisClient._shared = {}
+    monkeypatch.setattr(circuit_breaker, "redis", SimpleNamespace(Redis=_FakeRedisClient))
+    return _FakeRedisClient._shared
+
+
+def _saved_breaker(state_file: Path, name: str) -> dict:
+    data = json.loads(state_file.read_text())
+    return next(b for b in data["breakers"] if b["name"] == name)
+
+
+def test_write_behind_defers_counter_updates(tmp_path: Path):
+    state_file = tmp_path / "circuit_breakers.json"
+    registry = CircuitBreakerRegistry(
+        state_file=state_file, persist_mode=PERSIST_WRITE_BEHIND, flush_interval_seconds=3600
+    )
+    registry.register("svc", failure_threshold=3, recovery_timeout=60)
+
+    registry.record_failure("svc")
+    registry.record_success("svc")
+    registry.record_failure("svc")
+    assert _saved_breaker(state_file, "svc")["failure_count"] == 0
+
+    registry.flush()
+    assert _saved_breaker(state_file, "svc")["failure_count"] == 1
+
+
+def test_write_behind_persists_transitions_immediately(tmp_path: Path):
+    state_file = tmp_path / "circuit_breakers.json"
+    registry = CircuitBreakerRegistry(
+        state_file=state_file, persist_mode=PERSIST_WRITE_BEHIND, flush_interval_seconds=3600
+    )
+    registry.register("svc", failure_threshold=2, recovery_timeout=60)
+
+    registry.record_failure("svc")
+    registry.record_failure("svc")
+
+    saved = _saved_breaker(state_file, "svc")
+    assert saved["state"] == "open"
+    assert saved["failure_count"] == 2
+
+
+def test_save_state_leaves_no_temp_files(tmp_path: Path):
+    state_file = tmp_path / "circuit_breakers.json"
+    registry = CircuitBreakerRegistry(state_file=state_file)
+    registry.record_failure("ghl_api")
+
+    assert [p.name for p in tmp_path.iterdir()] == ["circuit_breakers.json"]
+
+
+def test_shared_state_propagates_open_between_workers(tmp_path: Path, fake_redis):
+    worker_a = CircuitBreakerRegistry(
+        state_file=tmp_path / "a.json", redis_url="redis://fake", redis_sync_seconds=0
+    )
+    worker_b = CircuitBreakerRegistry(
+        state_file=tmp_path / "b.json", redis_url="redis://fake", redis_sync_seconds=0
+    )
+    for registry in (worker_a, worker_b):
+        registry.register("svc", failure_threshold=2, recovery_timeout=60)
+
+    worker_a.record_failure("svc")
+    worker_a.record_failure("svc")
+
+    assert worker_b.is_available("svc") is False
+    assert worker_b.get_breaker("svc").state == CircuitState.OPEN
+
+    worker_a.force_close("svc")
+    assert worker_b.is_available("svc") is True
+    assert worker_b.get_breaker("svc").state == CircuitState.CLOSED
+
+
+def test_shared_state_reads_are_throttled(tmp_path: Path, fake_redis):
+    worker_a = CircuitBreakerRegistry(state_file=tmp_path / "a.json", redis_url="redis://fake")
+    worker_b = CircuitBreakerRegistry(
+        state_file=tmp_path / "b.json", redis_url="redis://fake", redis_sync_seconds=3600
+    )
+    worker_b.is_available("ghl_api")
+
+    worker_a.force_open("ghl_api")
+
+    assert worker_b.is_available("ghl_api") is True
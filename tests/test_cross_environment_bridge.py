@@ -37,6 +37,12 @@ class FakeRedis:
     def get(self, key: str) -> Optional[str]:
         return self._store.get(key)
 
+    def mget(self, keys: List[str]) -> List[Optional[str]]:
+        return [self._store.get(k) for k in keys]
+
+    def pipeline(self, transaction: bool = True) -> "FakePipeline":
+        return FakePipeline(self)
+
     def set(self, key: str, value: str, ex=None):
         self._store[key] = value
 
@@ -66,6 +72,27 @@ class FakeRedis:
             self._store.pop(key, None)
 
 
+class FakePipeline:
+    """Buffers commands and replays them against FakeRedis on execute()."""
+
+    def __init__(self, redis: "FakeRedis"):
+        self._redis = redis
+        self._ops: List[Any] = []
+
+    def __getattr__(self, name: str):
+        method = getattr(self._redis, name)
+
+        def _queue(*args, **kwargs):
+            self._ops.append((method, args, kwargs))
+            return self
+
+        return _queue
+
+    def execute(self) -> List[Any]:
+        ops, self._ops = self._ops, []
+        return [method(*args, **kwargs) for method, args, kwargs in ops]
+
+
 class BrokenRedis:
     """Redis client that raises on every operation — simulates Redis outage."""
 
@@ -511,3 +511,101 @@ class TestClayWaterfallIntegration:
         e.clay_webhook_url = "https://webhook.test"
         result = e._enrich_via_clay("lead1", "https://linkedin.com/in/jdoe", "John Doe", "Acme")
         assert result is None
+
+
+# ── Concurrent batch enrichment ──────────────────────────────────
+
+def _write_batch(tmp_path: Path, count: int) -> Path:
+    import json
+
+    leads = [
+        {"lead_id": f"lead_{i:03d}", "linkedin_url": f"https://linkedin.com/in/lead{i}", "name": f"Lead {i}", "company": "Acme"}
+        for i in range(count)
+    ]
+    leads.append({"lead_id": "no_url", "name": "Nobody"})
+    path = tmp_path / "leads.json"
+    path.write_text(json.dumps({"leads": leads}), encoding="utf-8")
+    return path
+
+
+class _UnlimitedRateLimiter:
+    """Stand-in limiter that records calls without touching .hive-mind."""
+
+    RATE_LIMITS = {"apollo": {"calls": 600, "period": 60}, "bettercontact": {"calls": 60, "period": 60}}
+
+    def __init__(self):
+        self.calls = []
+
+    def call(self, service, func, *args, **kwargs):
+        self.calls.append(service)
+        return func(*args, **kwargs)
+
+
+class TestConcurrentBatch:
+
+    @pytest.fixture
+    def live_enricher(self, monkeypatch):
+        monkeypatch.setenv("APOLLO_API_KEY", "apollo_key")
+        monkeypatch.delenv("BETTERCONTACT_API_KEY", raising=False)
+        monkeypatch.delenv("CLAY_PIPELINE_ENABLED", raising=False)
+        return WaterfallEnricher(test_mode=False, rate_limiter=_UnlimitedRateLimiter())
+
+    def test_results_keep_input_order(self, live_enricher, tmp_path):
+        """Slow early leads finish last but are still returned first."""
+        import time as _time
+
+        def apollo(lead_id, linkedin_url, name="", company=""):
+            _time.sleep(0.05 if lead_id.endswith(("0", "1")) else 0.0)
+            return live_enricher._parse_apollo_response(lead_id, linkedin_url, {"email": f"{lead_id}@acme.com"})
+
+        live_enricher._enrich_via_apollo = apollo
+        enriched = live_enricher.enrich_batch(_write_batch(tmp_path, 12), concurrency=6)
+        assert [e.lead_id for e in enriched] == [f"lead_{i:03d}" for i in range(12)]
+        assert live_enricher._rate_limiter.calls == ["apollo"] * 12
+
+    def test_failed_lead_does_not_abort_batch(self, live_enricher, tmp_path, monkeypatch):
+        """An exception for one lead is isolated; other leads still enrich."""
+        import execution.enricher_waterfall as ew
+
+        def flaky(self, lead_id, linkedin_url, name="", company=""):
+            if lead_id == "lead_002":
+                raise RuntimeError("provider exploded")
+            return self._parse_apollo_response(lead_id, linkedin_url, {"email": f"{lead_id}@acme.com"})
+
+        monkeypatch.setattr(ew.WaterfallEnricher, "_enrich_with_retry", flaky)
+        enriched = live_enricher.enrich_batch(_write_batch(tmp_path, 5), concurrency=3)
+        assert [e.lead_id for e in enriched] == ["lead_000", "lead_001", "lead_003", "lead_004"]
+
+    def test_provider_in_flight_bounded_by_quota(self, live_enricher, tmp_path, monkeypatch):
+        """Apollo in-flight calls never exceed quota rate x typical latency."""
+        import threading
+        import time as _time
+        import execution.enricher_waterfall as ew
+
+        monkeypatch.setitem(ew.PROVIDER_TYPICAL_LATENCY_SECONDS, "apollo", 0.3)  # 10/s x 0.3s = 3
+        assert live_enricher._provider_slot_limits(8)["apollo"] == 3
+
+        lock = threading.Lock()
+        state = {"active": 0, "peak": 0}
+
+        def apollo(lead_id, linkedin_url, name="", company=""):
+            with lock:
+                state["active"] += 1
+                state["peak"] = max(state["peak"], state["active"])
+            _time.sleep(0.02)
+            with lock:
+                state["active"] -= 1
+            return None
+
+        live_enricher._enrich_via_apollo = apollo
+        assert live_enricher.enrich_batch(_write_batch(tmp_path, 16), concurrency=8) == []
+        assert 1 < state["peak"] <= 3
+        assert live_enricher._provider_slots == {}
+
+    def test_mock_mode_concurrent_stats_consistent(self, enricher, tmp_path):
+        """Test-mode counters stay exact when leads run on the pool."""
+        enriched = enricher.enrich_batch(_write_batch(tmp_path, 20), concurrency=4)
+        stats = enricher.test_stats
+        assert stats["api_calls_simulated"] == 20
+        assert stats["successful_enrichments"] + stats["failed_enrichments"] == 20
+        assert len(enriched) == stats["successful_enrichments"]
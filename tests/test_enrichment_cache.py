@@ -0,0 +1,151 @@
+"""Tests for core/enrichment_cache.py and its use by the enrichment waterfall."""
+
+from __future__ import annotations
+
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import core.enrichment_cache as ec
+from core.enrichment_cache import EnrichmentCache
+from execution.enricher_waterfall import WaterfallEnricher
+from execution.rate_limiter import APIRateLimiter
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return EnrichmentCache(db_path=tmp_path / "cache.db", max_entries=1000)
+
+
+@pytest.fixture
+def limiter(tmp_path):
+    lim = APIRateLimiter()
+    lim.cost_log = tmp_path / "api_costs.jsonl"
+    return lim
+
+
+def _fields(email="jdoe@acme.com"):
+    return {
+        "contact": {"work_email": email},
+        "company": {"name": "Acme"},
+        "intent": {"signals": ["hiring"]},
+    }
+
+
+class TestEnrichmentCache:
+
+    def test_put_then_get(self, cache):
+        cache.put("linkedin.com/in/jdoe", "apollo", _fields())
+        hit = cache.get("linkedin.com/in/jdoe", "apollo", required_fields=("contact",))
+        assert hit is not None and hit.found
+        assert hit.fields["contact"]["work_email"] == "jdoe@acme.com"
+        assert cache.get("linkedin.com/in/jdoe", "bettercontact") is None
+
+    def test_stale_optional_field_dropped(self, cache, monkeypatch):
+        cache.put("k", "apollo", _fields())
+        real_time = time.time
+        monkeypatch.setattr(ec.time, "time", lambda: real_time() + 8 * ec.DAY_SECONDS)
+        hit = cache.get("k", "apollo", required_fields=("contact", "company"))
+        assert hit is not None
+        assert "intent" not in hit.fields
+        assert hit.stale_fields == ["intent"]
+
+    def test_stale_required_field_is_miss(self, cache, monkeypatch):
+        cache.put("k", "apollo", _fields())
+        real_time = time.time
+        monkeypatch.setattr(ec.time, "time", lambda: real_time() + 31 * ec.DAY_SECONDS)
+        assert cache.get("k", "apollo", required_fields=("contact",)) is None
+        assert cache.get("k", "apollo", required_fields=("company",)) is not None
+
+    def test_negative_entry_expires_sooner(self, cache, monkeypatch):
+        cache.put_negative("k", "apollo")
+        hit = cache.get("k", "apollo", required_fields=("contact",))
+        assert hit is not None and hit.found is False
+        real_time = time.time
+        monkeypatch.setattr(ec.time, "time", lambda: real_time() + cache.negative_ttl + 1)
+        assert cache.get("k", "apollo") is None
+
+    def test_lru_eviction_keeps_recently_read(self, tmp_path):
+        small = EnrichmentCache(db_path=tmp_path / "lru.db", max_entries=3)
+        for i in range(3):
+            small.put(f"k{i}", "apollo", _fields())
+            time.sleep(0.01)
+        assert small.get("k0", "apollo") is not None  # refresh k0
+        small.put("k3", "apollo", _fields())
+        assert small.evict()["evicted"] == 1
+        assert small.get("k1", "apollo") is None
+        assert small.get("k0", "apollo") is not None
+
+    def test_stats_hit_rate(self, cache):
+        cache.put("k", "apollo", _fields())
+        cache.get("k", "apollo")
+        cache.get("missing", "apollo")
+        stats = cache.get_stats()
+        assert stats["entries"] == 1
+        assert stats["hits"] == 1 and stats["misses"] == 1
+        assert stats["hit_rate"] == 50.0
+
+
+class TestWaterfallCache:
+
+    @pytest.fixture
+    def enricher(self, monkeypatch, cache, limiter):
+        monkeypatch.setenv("APOLLO_API_KEY", "apollo_key")
+        monkeypatch.delenv("BETTERCONTACT_API_KEY", raising=False)
+        monkeypatch.delenv("CLAY_PIPELINE_ENABLED", raising=False)
+        e = WaterfallEnricher(test_mode=False, rate_limiter=limiter, cache=cache)
+        e.calls = []
+
+        def apollo(lead_id, linkedin_url, name="", company=""):
+            e.calls.append(lead_id)
+            if "nomatch" in linkedin_url:
+                e._note_no_match()
+                return None
+            return e._parse_apollo_response(lead_id, linkedin_url, {
+                "email": "jdoe@acme.com", "email_status": "verified",
+                "organization": {"name": "Acme", "primary_domain": "acme.com"},
+            })
+
+        e._enrich_via_apollo = apollo
+        return e
+
+    def test_second_lookup_served_from_cache(self, enricher):
+        first = enricher._enrich_with_retry("lead_a", "https://www.linkedin.com/in/jdoe/")
+        second = enricher._enrich_with_retry("lead_b", "http://linkedin.com/in/JDoe")
+        assert enricher.calls == ["lead_a"]
+        assert second.lead_id == "lead_b"
+        assert second.contact.work_email == first.contact.work_email
+        assert second.enrichment_quality == first.enrichment_quality
+        assert second.raw_enrichment["cache"]["provider"] == "apollo"
+
+    def test_not_found_is_negatively_cached(self, enricher):
+        assert enricher._enrich_with_retry("lead_a", "https://linkedin.com/in/nomatch") is None
+        assert enricher._enrich_with_retry("lead_a", "https://linkedin.com/in/nomatch") is None
+        assert enricher.calls == ["lead_a"]
+
+    def test_unconfirmed_miss_not_cached(self, enricher):
+        enricher._enrich_via_apollo = lambda *a: enricher.calls.append(a[0])
+        enricher._enrich_with_retry("lead_a", "https://linkedin.com/in/x")
+        enricher._enrich_with_retry("lead_a", "https://linkedin.com/in/x")
+        assert enricher.calls == ["lead_a", "lead_a"]
+
+    def test_cost_summary_reports_hit_rate_and_savings(self, enricher, limiter):
+        for lead_id in ("a", "b", "c", "d"):
+            enricher._enrich_with_retry(lead_id, "https://linkedin.com/in/jdoe")
+        summary = limiter.get_cost_summary(days=1)
+        assert summary["total_calls"] == 1
+        assert summary["cache"]["lookups"] == 4
+        assert summary["cache"]["hits"] == 3
+        assert summary["cache"]["hit_rate"] == 75.0
+        assert summary["cache"]["dollars_saved"] == round(3 * APIRateLimiter.COSTS["apollo"], 2)
+
+    def test_cache_disabled_by_default(self, monkeypatch):
+        monkeypatch.setenv("APOLLO_API_KEY", "apollo_key")
+        monkeypatch.delenv("ENRICHMENT_CACHE_ENABLED", raising=False)
+        e = WaterfallEnricher(test_mode=False)
+        assert e._cache is None
+        assert e._rate_limiter is None
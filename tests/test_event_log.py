@@ -0,0 +1,141 @@
+"""Tests for the day-partitioned event store in core/event_log.py."""
+
+import json
+import random
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from core import event_log, reporting
+from core.event_log import (
+    EventType,
+    count_events,
+    iter_events,
+    log_event,
+    migrate_legacy_events,
+    recent_events,
+    segments_dir,
+    write_events,
+)
+
+BASE = datetime(2026, 3, 1, tzinfo=timezone.utc)
+TYPES = ["campaign_sent", "reply_received", "meeting_booked", "system_error"]
+
+
+def _events(n, days=5, seed=11):
+    rng = random.Random(seed)
+    events = []
+    for i in range(n):
+        ts = BASE + timedelta(seconds=rng.randrange(days * 86400))
+        events.append({
+            "timestamp": ts.isoformat(),
+            "event_id": f"e{i}",
+            "event_type": rng.choices(TYPES, weights=[70, 20, 5, 5])[0],
+            "payload": {"n": i},
+        })
+    events.sort(key=lambda e: e["timestamp"])
+    return events
+
+
+def _linear(events, start=None, end=None, types=None):
+    out = []
+    for e in events:
+        ts = datetime.fromisoformat(e["timestamp"])
+        if start and ts < start:
+            continue
+        if end and ts >= end:
+            continue
+        if types and e["event_type"] not in types:
+            continue
+        out.append(e)
+    return out
+
+
+@pytest.fixture
+def events_file(tmp_path):
+    return tmp_path / "events.jsonl"
+
+
+class TestSegments:
+
+    def test_events_partitioned_by_day_with_index(self, events_file):
+        events = _events(300)
+        assert write_events(events, events_file) == 300
+
+        segments = sorted(p.name for p in segments_dir(events_file).glob("*.jsonl"))
+        assert segments == [f"2026-03-0{d}.jsonl" for d in range(1, 6)]
+
+        segment = segments_dir(events_file) / "2026-03-02.jsonl"
+        data = segment.read_bytes()
+        for line in segment.with_suffix(".idx").read_text().splitlines():
+            event_type, offset, length = line.split("\t")
+            event = json.loads(data[int(offset):int(offset) + int(length)])
+            assert event["event_type"] == event_type
+            assert event["timestamp"].startswith("2026-03-02")
+
+    @pytest.mark.parametrize("start,end,types", [
+        (None, None, None),
+        (BASE + timedelta(days=1), BASE + timedelta(days=2), None),
+        (BASE + timedelta(hours=30), BASE + timedelta(hours=75), None),
+        (BASE + timedelta(hours=30), None, ["meeting_booked"]),
+        (None, BASE + timedelta(days=3), ["campaign_sent", "reply_received"]),
+        (BASE + timedelta(days=9), None, None),
+    ])
+    def test_range_and_type_queries_match_linear_filter(self, events_file, start, end, types):
+        events = _events(500)
+        write_events(events, events_file)
+
+        expected = _linear(events, start, end, types)
+        assert list(iter_events(start, end, types, events_file=events_file)) == expected
+        assert count_events(start, end, types, events_file=events_file) == len(expected)
+
+    def test_unindexed_tail_is_still_read(self, events_file):
+        write_events(_events(20, days=1), events_file)
+        segment = segments_dir(events_file) / "2026-03-01.jsonl"
+        late = {"timestamp": "2026-03-01T23:59:00+00:00", "event_type": "meeting_booked", "payload": {}}
+        with open(segment, "a") as f:
+            f.write(json.dumps(late) + "\n")
+
+        assert list(iter_events(event_types=["meeting_booked"], events_file=events_file))[-1] == late
+
+    def test_recent_events(self, events_file):
+        events = _events(200)
+        write_events(events, events_file)
+        assert recent_events(50, events_file=events_file) == events[-50:]
+        assert recent_events(0, events_file=events_file) == []
+
+    def test_log_event_writes_today_segment(self, events_file, monkeypatch):
+        monkeypatch.setattr(event_log, "EVENTS_FILE", events_file)
+        event_id = log_event(EventType.MEETING_BOOKED, {"lead_id": "L1"})
+
+        today = datetime.now(timezone.utc).date().isoformat()
+        assert (segments_dir(events_file) / f"{today}.idx").read_text().startswith("meeting_booked\t0\t")
+        assert [e["event_id"] for e in iter_events(events_file=events_file)] == [event_id]
+
+
+class TestLegacyFile:
+
+    def test_legacy_file_read_then_migrated(self, events_file):
+        old, new = _events(100, seed=1), _events(50, seed=2)
+        events_file.write_text("".join(json.dumps(e) + "\n" for e in old) + "not json\n")
+        write_events(new, events_file)
+        start, end = BASE + timedelta(days=1), BASE + timedelta(days=3)
+
+        before = list(iter_events(start, end, events_file=events_file))
+        assert before == _linear(old, start, end) + _linear(new, start, end)
+
+        assert migrate_legacy_events(events_file) == 100
+        assert not events_file.exists()
+        after = list(iter_events(start, end, events_file=events_file))
+        assert sorted(e["event_id"] for e in after) == sorted(e["event_id"] for e in before)
+        assert count_events(events_file=events_file) == 150
+
+    def test_reporting_load_events_uses_store(self, events_file, monkeypatch):
+        monkeypatch.setattr(reporting, "EVENTS_FILE", events_file)
+        events = _events(100)
+        write_events(events, events_file)
+        start = BASE + timedelta(days=2)
+
+        assert reporting.load_events(start, start + timedelta(days=1)) == _linear(
+            events, start, start + timedelta(days=1)
+        )
@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+Tests for GHLLocalSync's indexed local mirror (FTS search, tag/stage indexes,
+incremental upserts, sync-only dateUpdated watermark).
+"""
+
+import json
+import random
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from core.ghl_local_sync import GHLLocalSync
+
+
+def _linear_search(contacts, query):
+    """The pre-index search_contacts_local: substring over joined fields."""
+    q = query.lower()
+    return [
+        c for c in contacts
+        if q in " ".join([
+            c.get("firstName", ""), c.get("lastName", ""),
+            c.get("email", ""), c.get("companyName", ""),
+        ]).lower()
+    ]
+
+
+def _make_contacts(n, seed=3):
+    rng = random.Random(seed)
+    first = ["Ana", "Ben", "Chloé", "Dev", "Eve", "Finn"]
+    last = ["Smith", "O'Neil", "Garcia", "Lee", "Nguyen"]
+    companies = ["Acme Corp", "Globex", "Initech", "Umbrella \"Labs\""]
+    tags = ["Hot", "cold", "webinar", "VIP", "nurture"]
+    stages = ["Qualified", "Demo Booked", "Closed Won"]
+    contacts = []
+    for i in range(n):
+        f, l = rng.choice(first), rng.choice(last)
+        contact = {
+            "id": f"c{i}",
+            "firstName": f,
+            "lastName": l,
+            "email": f"{f.lower()}.{i}@{rng.choice(['acme.com', 'globex.io'])}",
+            "companyName": rng.choice(companies),
+            "tags": rng.sample(tags, rng.randint(0, 3)),
+            "dateUpdated": f"2026-01-{1 + i % 28:02d}T10:00:00Z",
+        }
+        kind = i % 4
+        if kind == 1:
+            contact["pipelineStage"] = rng.choice(stages)
+        elif kind == 2:
+            contact["customField"] = {"pipeline_stage": rng.choice(stages)}
+        elif kind == 3:
+            contact["customFields"] = [{"key": "pipeline_stage", "value": rng.choice(stages)}]
+        contacts.append(contact)
+    return contacts
+
+
+@pytest.fixture
+def sync(tmp_path, monkeypatch):
+    monkeypatch.delenv("GHL_API_KEY", raising=False)
+    instance = GHLLocalSync(data_dir=tmp_path)
+    contacts = _make_contacts(200)
+    for contact in contacts:
+        instance._contacts[contact["id"]] = contact
+    # As if the contacts came from an earlier sync page
+    instance._upsert_contacts(contacts, watermark="2026-01-28T10:00:00Z")
+    return instance
+
+
+class TestIndexedSearch:
+
+    @pytest.mark.parametrize("query", ["acme", "ACME", "an", "a", "smith", "ana smith",
+                                       "o'neil", "\"labs\"", "globex.io", "chloé", "", "zzz"])
+    def test_search_matches_linear_scan(self, sync, query):
+        contacts = list(sync._contacts.values())
+        assert sync.search_contacts_local(query) == _linear_search(contacts, query)
+
+    def test_search_by_tags(self, sync):
+        contacts = list(sync._contacts.values())
+        expected_any = [c for c in contacts if {"hot", "vip"} & {t.lower() for t in c["tags"]}]
+        expected_all = [c for c in contacts if {"hot", "vip"} <= {t.lower() for t in c["tags"]}]
+
+        assert sync.search_by_tags(["HOT", "vip"]) == expected_any
+        assert sync.search_by_tags(["hot", "VIP"], match_all=True) == expected_all
+        assert sync.search_by_tags([]) == []
+
+    def test_search_by_pipeline_stage(self, sync):
+        results = sync.search_by_pipeline_stage(["demo booked"])
+        ids = [c["id"] for c in results]
+
+        assert len(ids) == len(set(ids))
+        assert ids == sorted(ids, key=lambda cid: int(cid[1:]))
+        for contact in results:
+            custom = contact.get("customField") or {}
+            custom_list = contact.get("customFields") or []
+            assert "Demo Booked" in (
+                contact.get("pipelineStage"),
+                custom.get("pipeline_stage"),
+                *(cf["value"] for cf in custom_list),
+            )
+        assert len(results) == sum(
+            1 for c in sync._contacts.values()
+            if "Demo Booked" in json.dumps(c)
+        )
+
+
+class TestIncrementalStore:
+
+    def test_unchanged_contacts_are_skipped(self, sync):
+        contact = dict(sync._contacts["c5"], _synced_at="2026-02-01T00:00:00Z")
+        assert sync._upsert_contacts([contact]) == 0
+
+        contact["tags"] = ["new-tag"]
+        assert sync._upsert_contacts([contact]) == 1
+
+    def test_resynced_unchanged_contact_is_not_stale_after_reload(self, sync, tmp_path):
+        contact = {"id": "c900", "email": "quiet@acme.com", "_synced_at": "2025-01-01T00:00:00+00:00"}
+        sync._upsert_contacts([contact])
+        recent = datetime.now(timezone.utc).isoformat()
+        assert sync._upsert_contacts([dict(contact, _synced_at=recent)]) == 0
+
+        reloaded = GHLLocalSync(data_dir=tmp_path)
+        assert reloaded._contacts["c900"]["_synced_at"] == recent
+        assert "c900" not in [c["id"] for c in reloaded.get_stale_contacts(inactive_days=30)]
+
+    async def test_webhook_update_reindexes_contact(self, sync):
+        old_tags = sync._contacts["c7"]["tags"]
+        await sync.handle_webhook_update("contact.updated", {
+            "id": "c7", "firstName": "Zed", "email": "zed@newco.com", "tags": ["renewal"],
+        })
+
+        assert [c["id"] for c in sync.search_contacts_local("zed@newco")] == ["c7"]
+        assert [c["id"] for c in sync.search_by_tags(["renewal"])] == ["c7"]
+        for tag in old_tags:
+            assert "c7" not in [c["id"] for c in sync.search_by_tags([tag])]
+
+    def test_reload_from_store(self, sync, tmp_path):
+        reloaded = GHLLocalSync(data_dir=tmp_path)
+
+        assert list(reloaded._contacts) == list(sync._contacts)
+        assert reloaded.search_contacts_local("initech") == sync.search_contacts_local("initech")
+
+    def test_legacy_json_imported_once(self, tmp_path):
+        (tmp_path / "contacts.json").write_text(json.dumps(_make_contacts(5)))
+        first = GHLLocalSync(data_dir=tmp_path)
+        assert len(first._contacts) == 5
+        assert first.get_stats()["contacts_watermark"] is None
+
+        (tmp_path / "contacts.json").write_text(json.dumps(_make_contacts(8)))
+        assert len(GHLLocalSync(data_dir=tmp_path)._contacts) == 5
+
+
+def _fake_ghl(sync, monkeypatch, pages):
+    """Serve each sync_contacts() request the next page of contacts; returns the request params."""
+    requests = []
+
+    class _Response:
+        status = 200
+
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, *exc):
+            return False
+
+        async def json(self):
+            return {"contacts": pages[len(requests) - 1]}
+
+    class _Session:
+        def get(self, url, params=None):
+            requests.append(dict(params))
+            return _Response()
+
+    async def _get_session():
+        return _Session()
+
+    sync.api_key, sync.location_id = "key", "loc"
+    monkeypatch.setattr(sync, "_get_session", _get_session)
+    return requests
+
+
+class TestDeltaSync:
+
+    async def test_webhook_and_lookups_do_not_move_watermark(self, sync, monkeypatch):
+        requests = _fake_ghl(sync, monkeypatch, [
+            [{"id": "c500", "email": "missed@acme.com", "dateUpdated": "2026-02-05T00:00:00Z"}],
+            [],
+        ])
+        await sync.handle_webhook_update("contact.updated", {
+            "id": "c7", "email": "b@acme.com", "dateUpdated": "2026-03-01T00:00:00Z",
+        })
+        sync._upsert_contacts([{"id": "c8", "email": "c@acme.com", "dateUpdated": "2026-03-02T00:00:00Z"}])
+        assert sync._contacts_watermark() == "2026-01-28T10:00:00Z"
+
+        assert await sync.sync_contacts(full=False) == 1
+        assert requests[0]["startAfter"] == "2026-01-28T10:00:00Z"
+        assert "c500" in sync._contacts
+        assert sync._contacts_watermark() == "2026-02-05T00:00:00Z"
+
+        await sync.sync_contacts(full=False)
+        assert requests[1]["startAfter"] == "2026-02-05T00:00:00Z"
+
+    async def test_incremental_sync_uses_watermark(self, sync, monkeypatch):
+        requests = _fake_ghl(sync, monkeypatch, [[
+            dict(sync._contacts["c27"]),  # at the watermark, unchanged
+            {"id": "c999", "email": "new@acme.com", "dateUpdated": "2026-02-01T00:00:00Z"},
+            {"id": "c998", "email": "old@acme.com", "dateUpdated": "2025-01-01T00:00:00Z"},
+        ]])
+
+        assert await sync.sync_contacts(full=False) == 1
+        assert requests[0]["startAfter"] == "2026-01-28T10:00:00Z"
+        assert "c998" not in sync._contacts
+        assert sync._contacts_watermark() == "2026-02-01T00:00:00Z"
+        assert sync.stats.contacts_unchanged == 2
@@ -15,7 +15,9 @@ from core.unified_health_monitor import (
     HealthMonitor,
     HeartbeatTracker,
     LatencyTracker,
+    LatencySketch,
     LatencyStats,
+    LATENCY_SKETCH_ACCURACY,
     AlertManager,
     AlertCondition,
     ComponentHealth,
@@ -154,6 +156,74 @@ class TestLatencyTracker:
         assert "comp1" in all_stats
         assert "comp2" in all_stats
 
+    def test_percentiles_within_sketch_accuracy(self):
+        """Sketch percentiles stay within 1% of exact sorted-sample percentiles."""
+        import random
+
+        def exact(values, q):
+            idx = (len(values) - 1) * q
+            lower = int(idx)
+            upper = min(lower + 1, len(values) - 1)
+            return values[lower] * (1 - (idx - lower)) + values[upper] * (idx - lower)
+
+        rng = random.Random(5)
+        for values in (
+            [rng.lognormvariate(4, 1.5) for _ in range(20000)],
+            [rng.uniform(0.5, 8000) for _ in range(5000)],
+            [float(rng.choice([3, 40, 40, 40, 900])) for _ in range(1000)],
+        ):
+            sketch = LatencySketch()
+            for v in values:
+                sketch.add(v)
+            values.sort()
+            for q, estimate in zip((0.5, 0.9, 0.95, 0.99, 0.999), sketch.quantiles([0.5, 0.9, 0.95, 0.99, 0.999])):
+                assert abs(estimate - exact(values, q)) <= LATENCY_SKETCH_ACCURACY * exact(values, q) + 1e-9
+
+    def test_merged_sketches_match_single_sketch(self):
+        """Merging per-bucket sketches gives the same percentiles as one sketch."""
+        whole, parts = LatencySketch(), [LatencySketch() for _ in range(4)]
+        for i in range(1, 2001):
+            whole.add(i * 1.7)
+            parts[i % 4].add(i * 1.7)
+        merged = LatencySketch()
+        for part in parts:
+            merged.merge(part)
+        assert merged.count == whole.count
+        assert merged.quantiles([0.5, 0.95, 0.99]) == whole.quantiles([0.5, 0.95, 0.99])
+
+    def test_multiple_windows(self):
+        """Each configured window only sees samples recorded inside it."""
+        now = [1000.0]
+        with patch("core.unified_health_monitor.time.monotonic", lambda: now[0]):
+            tracker = LatencyTracker(window_seconds=300, windows=(60, 300, 900))
+            tracker.record_latency("api", 1000)
+            now[0] += 400
+            tracker.record_latency("api", 500)
+            now[0] += 120
+            tracker.record_latency("api", 10)
+
+            windows = tracker.get_window_stats("api")
+            assert set(windows) == {"60", "300", "900"}
+            assert windows["60"].samples == 1 and windows["60"].p99_ms == 10
+            assert windows["300"].samples == 2 and windows["300"].p99_ms <= 500
+            assert windows["900"].samples == 3 and windows["900"].p99_ms > 500
+            assert tracker.get_percentiles("api").samples == 2
+
+            now[0] += 1000
+            assert tracker.get_percentiles("api", 900).samples == 0
+
+    def test_memory_bounded_by_buckets(self):
+        """Sample volume does not grow the per-component state."""
+        now = [0.0]
+        with patch("core.unified_health_monitor.time.monotonic", lambda: now[0]):
+            tracker = LatencyTracker(window_seconds=60, windows=(60, 300))
+            for i in range(50000):
+                now[0] = i * 0.05
+                tracker.record_latency("api", 10 + i % 500)
+            buckets = tracker._buckets["api"]
+            assert len(buckets) <= 300 / tracker.bucket_seconds
+            assert all(len(sketch.counts) < 400 for _, sketch in buckets)
+
 
 # =============================================================================
 # ALERT MANAGER TESTS
@@ -21,6 +21,7 @@ from unittest.mock import patch, AsyncMock, MagicMock, PropertyMock
 PROJECT_ROOT = Path(__file__).parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
+from core.suppression_index import SuppressionIndex
 from execution.heyreach_dispatcher import (
     LinkedInDailyCeiling,
     HeyReachDispatcher,
@@ -89,6 +90,7 @@ def dispatcher(tmp_path):
                 }
             }
         }
+        d.suppression_index = SuppressionIndex(tmp_path / "unsubscribes.jsonl", mode="exact")
         d._client = None
         return d
 
@@ -326,6 +328,15 @@ class TestLeadEligibility:
         eligible = dispatcher._load_linkedin_eligible()
         assert len(eligible) == 0
 
+    def test_suppressed_email_rejected(self, dispatcher):
+        """Leads whose email unsubscribed or bounced are not sent to LinkedIn."""
+        dispatcher.suppression_index.add("john@acme.com")
+        data = _make_shadow_email(email_id="unsub_001")
+        _write_shadow_email(dispatcher.shadow_dir, data)
+
+        eligible = dispatcher._load_linkedin_eligible()
+        assert len(eligible) == 0
+
     def test_no_linkedin_url_rejected(self, dispatcher):
         """Leads without LinkedIn URL are filtered out."""
         data = _make_shadow_email(email_id="no_li_001", linkedin_url="")
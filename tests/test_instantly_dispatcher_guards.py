@@ -19,6 +19,7 @@ import pytest
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from core.suppression_index import SuppressionIndex
 from execution.instantly_dispatcher import InstantlyDispatcher, DailyCeilingTracker, _atomic_json_write
 
 PROJECT_ROOT = Path(__file__).parent.parent
@@ -40,6 +41,7 @@ def dispatcher(tmp_path, monkeypatch):
     d.ceiling._redis = None
     d.ceiling._redis_prefix = ""
     d.config = _load_production_config()
+    d.suppression_index = SuppressionIndex(tmp_path / "unsubscribes.jsonl", mode="exact")
     d._client = None
     return d
 
@@ -214,6 +216,30 @@ class TestGuard4IndividualExclusion:
         assert len(result) == 1
 
 
+# ── Guard 5: Suppression list ────────────────────────────────────
+
+
+class TestGuard5SuppressionList:
+
+    def test_suppressed_email_blocked_in_loading(self, dispatcher):
+        """Unsubscribed recipients are rejected, case-insensitively."""
+        dispatcher.suppression_index.add("Gone@SafeDomain.com", source="test")
+        _write_shadow_email(dispatcher.shadow_dir, "unsub_001", "gone@safedomain.com")
+        _write_shadow_email(dispatcher.shadow_dir, "safe_001", "prospect@safedomain.com")
+        result = dispatcher._load_approved_emails()
+        assert [r["to"] for r in result] == ["prospect@safedomain.com"]
+        rejection = json.loads(dispatcher.deliverability_rejection_log.read_text(encoding="utf-8"))
+        assert rejection["reason_code"] == "suppressed_recipient"
+
+    def test_unsubscribe_appended_by_other_writer_is_seen(self, dispatcher):
+        """Lines appended after the index loaded are picked up on the next check."""
+        dispatcher._load_approved_emails()
+        with open(dispatcher.suppression_index.path, "a", encoding="utf-8") as f:
+            f.write(json.dumps({"email": "late@safedomain.com", "at": "2026-01-01T00:00:00+00:00"}) + "\n")
+        _write_shadow_email(dispatcher.shadow_dir, "late_001", "late@safedomain.com")
+        assert dispatcher._load_approved_emails() == []
+
+
 # ── Canary safety gate ───────────────────────────────────────────
 
 
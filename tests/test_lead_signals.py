@@ -0,0 +1,179 @@
+"""Tests for the SQLite-backed LeadStatusManager in core/lead_signals.py."""
+
+import json
+import sys
+import threading
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.activity_timeline import ActivityTimeline
+from core.lead_signals import LeadStatusManager
+
+
+@pytest.fixture
+def hive(tmp_path):
+    return tmp_path / ".hive-mind"
+
+
+@pytest.fixture
+def mgr(hive):
+    return LeadStatusManager(hive_dir=hive)
+
+
+def _aged(mgr, email, status, age, open_count=0):
+    """Store a record whose last activity was `age` ago."""
+    ts = (datetime.now(timezone.utc) - age).isoformat()
+    mgr._save_record({
+        "email": email, "status": status, "status_history": [], "signals": [],
+        "created_at": ts, "updated_at": ts, "open_count": open_count, "reply_count": 0,
+        "linkedin_status": None,
+    })
+
+
+def _brute_force_summary(mgr):
+    counts = {}
+    for record in mgr.get_all_lead_statuses():
+        counts[record["status"]] = counts.get(record["status"], 0) + 1
+    return counts
+
+
+class TestStore:
+
+    def test_update_and_lookup_case_insensitive(self, mgr):
+        mgr.update_lead_status("Jane@Acme.com", "dispatched", "test")
+        record = mgr.update_lead_status("jane@acme.com", "opened", "test", {"campaign_id": "c1"})
+        assert record["email"] == "Jane@Acme.com"
+        assert record["open_count"] == 1
+        assert [h["to"] for h in record["status_history"]] == ["dispatched", "opened"]
+        assert mgr.get_lead_status("JANE@ACME.COM")["status"] == "opened"
+        assert mgr.get_lead_status("nobody@acme.com") is None
+
+    def test_summary_counters_follow_transitions(self, mgr):
+        for i in range(5):
+            mgr.update_lead_status(f"l{i}@acme.com", "dispatched", "test")
+        mgr.handle_email_opened("l0@acme.com")
+        mgr.handle_email_replied("l1@acme.com", "Interested")
+        mgr.handle_email_bounced("l2@acme.com")
+        mgr.handle_email_opened("l0@acme.com")  # second open -> engaged_not_replied
+        summary = mgr.get_status_summary()
+        assert summary == {"dispatched": 2, "engaged_not_replied": 1, "replied": 1, "bounced": 1}
+        assert summary == _brute_force_summary(mgr)
+
+    def test_rebuild_status_counts(self, mgr):
+        mgr.update_lead_status("a@acme.com", "sent", "test")
+        mgr._get_connection().execute("UPDATE lead_status_counts SET count = 99")
+        mgr._get_connection().commit()
+        assert mgr.rebuild_status_counts() == {"sent": 1}
+
+    def test_bulk_lookup(self, mgr):
+        mgr.update_lead_status("a@acme.com", "sent", "test")
+        mgr.update_lead_status("b@acme.com", "opened", "test")
+        statuses = mgr.get_lead_statuses(["A@acme.com", "b@acme.com", "c@acme.com", ""])
+        assert set(statuses) == {"a@acme.com", "b@acme.com"}
+        assert statuses["b@acme.com"]["status"] == "opened"
+
+    def test_linkedin_accept_persists_flag(self, mgr):
+        mgr.handle_linkedin_connection_accepted("https://linkedin.com/in/x", email="x@acme.com")
+        assert mgr.get_lead_status("x@acme.com")["linkedin_status"] == "connected"
+        assert mgr.get_status_summary() == {"linkedin_connected": 1}
+
+    def test_concurrent_updates_keep_every_signal(self, hive):
+        def worker():
+            local = LeadStatusManager(hive_dir=hive)
+            for _ in range(20):
+                local.update_lead_status("busy@acme.com", "opened", "test")
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        mgr = LeadStatusManager(hive_dir=hive)
+        record = mgr.get_lead_status("busy@acme.com")
+        assert len(record["signals"]) == 80
+        assert record["open_count"] == 80
+        assert mgr.get_status_summary() == {"opened": 1}
+
+
+class TestDecayDetection:
+
+    def test_range_queries_flag_decayed_leads(self, mgr):
+        _aged(mgr, "ghost@acme.com", "sent", timedelta(hours=80))
+        _aged(mgr, "fresh@acme.com", "dispatched", timedelta(hours=10))
+        _aged(mgr, "stall@acme.com", "opened", timedelta(days=8))
+        _aged(mgr, "keen@acme.com", "opened", timedelta(days=1), open_count=3)
+        _aged(mgr, "once@acme.com", "opened", timedelta(days=1), open_count=1)
+
+        results = mgr.detect_engagement_decay()
+        assert [r["email"] for r in results["ghosted"]] == ["ghost@acme.com"]
+        assert [r["email"] for r in results["stalled"]] == ["stall@acme.com"]
+        assert results["engaged_not_replied"] == [{"email": "keen@acme.com", "open_count": 3}]
+        assert mgr.get_status_summary() == {
+            "ghosted": 1, "dispatched": 1, "stalled": 1, "engaged_not_replied": 1, "opened": 1,
+        }
+
+    def test_second_scan_finds_nothing_new(self, mgr):
+        _aged(mgr, "ghost@acme.com", "sent", timedelta(hours=80))
+        mgr.detect_engagement_decay()
+        assert mgr.detect_engagement_decay()["ghosted"] == []
+
+
+class TestLegacyMigration:
+
+    def _write_legacy(self, hive, email, status):
+        status_dir = hive / "lead_status"
+        status_dir.mkdir(parents=True, exist_ok=True)
+        name = email.lower().replace("@", "_at_").replace(".", "_") + ".json"
+        (status_dir / name).write_text(json.dumps({
+            "email": email, "status": status, "status_history": [], "signals": [],
+            "updated_at": "2026-01-01T00:00:00+00:00", "open_count": 0, "reply_count": 0,
+        }), encoding="utf-8")
+
+    def test_files_imported_once(self, hive):
+        self._write_legacy(hive, "a@acme.com", "sent")
+        self._write_legacy(hive, "b@acme.com", "replied")
+        (hive / "lead_status" / "broken.json").write_text("{", encoding="utf-8")
+
+        mgr = LeadStatusManager(hive_dir=hive)
+        assert mgr.get_status_summary() == {"sent": 1, "replied": 1}
+        mgr.update_lead_status("a@acme.com", "opened", "test")
+
+        # Re-opening does not re-import over newer store data
+        again = LeadStatusManager(hive_dir=hive)
+        assert again.get_lead_status("a@acme.com")["status"] == "opened"
+        assert again.migrate_from_files(force=True) == 0
+        assert again.get_status_summary() == {"opened": 1, "replied": 1}
+
+    def test_bootstrap_skips_tracked_leads(self, mgr, hive):
+        shadow = hive / "shadow_mode_emails"
+        shadow.mkdir(parents=True)
+        for i, to in enumerate(["a@acme.com", "b@acme.com"]):
+            (shadow / f"e{i}.json").write_text(json.dumps({
+                "to": to, "status": "approved", "email_id": f"e{i}",
+                "timestamp": "2026-01-01T00:00:00+00:00",
+            }), encoding="utf-8")
+        mgr.update_lead_status("a@acme.com", "replied", "test")
+        assert mgr.bootstrap_from_shadow_emails() == 1
+        assert mgr.get_status_summary() == {"replied": 1, "approved": 1}
+
+
+class TestActivityTimeline:
+
+    def test_funnel_and_timeline_read_store(self, mgr, hive):
+        mgr.update_lead_status("a@acme.com", "dispatched", "instantly_dispatch:campaign")
+        mgr.handle_email_opened("a@acme.com", "c1")
+        mgr.update_lead_status("b@acme.com", "bounced", "instantly_webhook:bounce")
+
+        timeline = ActivityTimeline(hive_dir=hive)
+        funnel = timeline.get_funnel_summary()
+        assert funnel["total_leads"] == 2
+        assert funnel["engagement"]["opened"] == 1
+        assert funnel["terminal"]["bounced"] == 1
+        events = timeline._get_status_signal_events("a@acme.com")
+        assert [e["type"] for e in events] == ["dispatched", "opened"]
+        leads = timeline.get_all_leads_summary()
+        assert {l["email"] for l in leads} == {"a@acme.com", "b@acme.com"}
@@ -0,0 +1,381 @@
+"""Tests for core/llm_routing_gateway.py — pooled HTTP clients, response cache, hedging."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import sqlite3
+import sys
+import threading
+from dataclasses import replace
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.llm_response_cache import LLMResponseCache, make_cache_key
+from core.llm_routing_gateway import (
+    HEDGE_MIN_SAMPLES,
+    PROVIDER_CONFIGS,
+    ClaudeAdapter,
+    HTTPClientPool,
+    HTTPPoolSettings,
+    LLMProviderType,
+    LLMRoutingGateway,
+    OpenAIAdapter,
+    RollingLatencyHistogram,
+    TaskType,
+)
+
+
+class _MockLLMHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def log_message(self, *args):
+        pass
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("content-length") or 0))
+        if self.path.endswith("/messages"):
+            body = {"content": [{"text": "hello"}], "usage": {"input_tokens": 10, "output_tokens": 2}}
+        else:
+            body = {"choices": [{"message": {"content": "hello"}}], "usage": {"prompt_tokens": 10, "completion_tokens": 2}}
+        raw = json.dumps(body).encode()
+        self.send_response(200)
+        self.send_header("content-type", "application/json")
+        self.send_header("content-length", str(len(raw)))
+        self.end_headers()
+        self.wfile.write(raw)
+
+
+@pytest.fixture
+def mock_llm_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _MockLLMHandler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/v1"
+    server.shutdown()
+
+
+def _adapter(cls, ptype, base_url, pool):
+    adapter = cls(replace(PROVIDER_CONFIGS[ptype], base_url=base_url), pool)
+    adapter.api_key = "test-key"
+    return adapter
+
+
+MESSAGES = [{"role": "user", "content": "hi"}]
+
+
+def _established_to(port):
+    """Established client-side TCP connections to a local port (Linux only)."""
+    try:
+        rows = Path("/proc/net/tcp").read_text().splitlines()[1:]
+    except OSError:
+        pytest.skip("needs /proc/net/tcp")
+    return sum(1 for row in rows if row.split()[2].endswith(f":{port:04X}") and row.split()[3] == "01")
+
+
+class TestHTTPClientPool:
+
+    async def test_pooled_client_reuses_connection(self, mock_llm_url):
+        pool = HTTPClientPool(HTTPPoolSettings())
+        adapter = _adapter(ClaudeAdapter, LLMProviderType.CLAUDE_SONNET, mock_llm_url, pool)
+        for _ in range(5):
+            content, inp, out = await adapter.complete(MESSAGES, max_tokens=10, temperature=0.0)
+        assert (content, inp, out) == ("hello", 10, 2)
+        stats = pool.get_stats()
+        assert stats["clients_created"] == 1
+        assert stats["requests"] == 5
+        assert stats["connections_opened"] == 1
+        assert stats["connections_reused"] == 4
+        await pool.aclose()
+        assert pool.get_stats()["open_clients"] == 0
+
+    async def test_adapters_on_same_host_share_client(self, mock_llm_url):
+        pool = HTTPClientPool(HTTPPoolSettings())
+        sonnet = _adapter(ClaudeAdapter, LLMProviderType.CLAUDE_SONNET, mock_llm_url, pool)
+        opus = _adapter(ClaudeAdapter, LLMProviderType.CLAUDE_OPUS, mock_llm_url, pool)
+        gpt = _adapter(OpenAIAdapter, LLMProviderType.OPENAI_GPT4, mock_llm_url, pool)
+        await sonnet.complete(MESSAGES, max_tokens=10, temperature=0.0)
+        await opus.complete(MESSAGES, max_tokens=10, temperature=0.0)
+        await gpt.complete(MESSAGES, max_tokens=10, temperature=0.0)
+        assert pool.get_stats()["clients_created"] == 1
+        assert pool.get_stats()["connections_reused"] == 2
+        await pool.aclose()
+
+    def test_new_event_loop_gets_new_client(self, mock_llm_url):
+        pool = HTTPClientPool(HTTPPoolSettings())
+        adapter = _adapter(ClaudeAdapter, LLMProviderType.CLAUDE_SONNET, mock_llm_url, pool)
+        port = int(mock_llm_url.rsplit(":", 1)[1].split("/")[0])
+        asyncio.run(adapter.complete(MESSAGES, max_tokens=10, temperature=0.0))
+        assert _established_to(port) == 1
+        asyncio.run(adapter.complete(MESSAGES, max_tokens=10, temperature=0.0))
+        assert pool.get_stats()["clients_created"] == 2
+        # The first loop's kept-alive connection was shut down, not leaked
+        assert pool.get_stats()["clients_retired"] == 1
+        assert _established_to(port) == 1
+
+    def test_client_on_live_loop_is_closed_there(self, mock_llm_url):
+        pool = HTTPClientPool(HTTPPoolSettings())
+        adapter = _adapter(ClaudeAdapter, LLMProviderType.CLAUDE_SONNET, mock_llm_url, pool)
+        other = asyncio.new_event_loop()
+        thread = threading.Thread(target=other.run_forever, daemon=True)
+        thread.start()
+        try:
+            asyncio.run_coroutine_threadsafe(
+                adapter.complete(MESSAGES, max_tokens=10, temperature=0.0), other
+            ).result(timeout=5)
+            first = pool._clients[mock_llm_url][0]
+            asyncio.run(adapter.complete(MESSAGES, max_tokens=10, temperature=0.0))
+            asyncio.run_coroutine_threadsafe(asyncio.sleep(0.05), other).result(timeout=5)
+            assert first.is_closed
+        finally:
+            other.call_soon_threadsafe(other.stop)
+            thread.join(timeout=5)
+            other.close()
+
+    async def test_adapter_without_pool_uses_one_off_client(self, mock_llm_url):
+        adapter = _adapter(ClaudeAdapter, LLMProviderType.CLAUDE_SONNET, mock_llm_url, None)
+        content, _, _ = await adapter.complete(MESSAGES, max_tokens=10, temperature=0.0)
+        assert content == "hello"
+
+    def test_settings_from_env(self, monkeypatch):
+        monkeypatch.setenv("LLM_HTTP_MAX_CONNECTIONS", "7")
+        monkeypatch.setenv("LLM_HTTP_KEEPALIVE_EXPIRY", "12.5")
+        monkeypatch.setenv("LLM_HTTP2", "true")
+        settings = HTTPPoolSettings.from_env()
+        assert settings.max_connections == 7
+        assert settings.keepalive_expiry == 12.5
+        assert settings.http2 is True
+
+
+class TestGatewayOwnsPool:
+
+    async def test_gateway_adapters_share_pool_and_close(self):
+        gateway = LLMRoutingGateway(pool_settings=HTTPPoolSettings(max_connections=4))
+        pools = {id(adapter.client_pool) for adapter in gateway._adapters.values()}
+        assert pools == {id(gateway._http_pool)}
+        assert gateway.get_status()["http_pool"]["clients_created"] == 0
+        await gateway.aclose()
+
+
+# ── Response cache ───────────────────────────────────────────────
+
+@pytest.fixture
+def cached_gateway(tmp_path):
+    cache = LLMResponseCache(db_path=tmp_path / "responses.db", max_entries=100)
+    gateway = LLMRoutingGateway(response_cache=cache)
+    gateway._usage_by_task, gateway._usage_by_agent, gateway._routing_log = {}, {}, []
+    gateway.provider_calls = []
+
+    for provider_type, adapter in gateway._adapters.items():
+        adapter.api_key = "test-key"
+
+        async def complete(messages, max_tokens, temperature, system_prompt=None, _p=provider_type):
+            gateway.provider_calls.append(_p)
+            return f"answer from {_p.value}", 100, 50
+
+        adapter.complete = complete
+    return gateway
+
+
+class TestResponseCache:
+
+    def test_key_normalizes_whitespace_and_role_case(self):
+        a = make_cache_key("analysis", "m", [{"role": "User", "content": "score  this\nlead "}], None, 0.0, 100)
+        b = make_cache_key("analysis", "m", [{"role": "user", "content": "score this lead"}], "", 0.0, 100)
+        c = make_cache_key("analysis", "m", [{"role": "user", "content": "score this lead"}], None, 0.2, 100)
+        assert a == b
+        assert a != c
+
+    async def test_repeat_prompt_served_from_cache(self, cached_gateway):
+        kwargs = dict(messages=MESSAGES, task_type=TaskType.ANALYSIS, agent_name="SEGMENTOR", temperature=0.0)
+        first = await cached_gateway.complete(**kwargs)
+        second = await cached_gateway.complete(**kwargs)
+        assert cached_gateway.provider_calls == [LLMProviderType.CLAUDE_SONNET]
+        assert not first.cached and second.cached
+        assert second.content == first.content
+        assert second.cost_estimate == 0.0
+
+        report = cached_gateway.get_cost_report()
+        assert report["response_cache"]["hits"] == 1
+        assert report["response_cache"]["cost_saved"] == pytest.approx(first.cost_estimate)
+        task = report["by_task_type"]["analysis"]
+        assert task["requests"] == 2 and task["cache_hits"] == 1
+        assert task["tokens"] == 150  # the hit consumed no tokens
+
+    async def test_high_temperature_bypasses_cache(self, cached_gateway):
+        kwargs = dict(messages=MESSAGES, task_type=TaskType.CREATIVE, agent_name="CRAFTER", temperature=0.9)
+        await cached_gateway.complete(**kwargs)
+        await cached_gateway.complete(**kwargs)
+        assert len(cached_gateway.provider_calls) == 2
+        await cached_gateway.complete(**kwargs, use_cache=True)
+        await cached_gateway.complete(**kwargs, use_cache=True)
+        assert len(cached_gateway.provider_calls) == 3
+
+    async def test_failed_primary_result_cached_under_fallback_model(self, cached_gateway):
+        sonnet = cached_gateway._adapters[LLMProviderType.CLAUDE_SONNET]
+
+        async def boom(*args, **kwargs):
+            raise RuntimeError("overloaded")
+
+        sonnet.complete = boom
+        kwargs = dict(messages=MESSAGES, task_type=TaskType.ANALYSIS, agent_name="SEGMENTOR", temperature=0.0)
+        first = await cached_gateway.complete(**kwargs)
+        second = await cached_gateway.complete(**kwargs)
+        assert first.provider == LLMProviderType.GEMINI_PRO.value
+        assert second.cached and second.provider == LLMProviderType.GEMINI_PRO.value
+        assert cached_gateway.provider_calls == [LLMProviderType.GEMINI_PRO]
+
+    async def test_eviction_failure_does_not_fail_the_call(self, cached_gateway, monkeypatch):
+        def locked():
+            raise sqlite3.OperationalError("database is locked")
+
+        monkeypatch.setattr("core.llm_response_cache.EVICT_EVERY_WRITES", 1)
+        monkeypatch.setattr(cached_gateway._response_cache, "evict", locked)
+        kwargs = dict(messages=MESSAGES, task_type=TaskType.ANALYSIS, agent_name="SEGMENTOR", temperature=0.0)
+        response = await cached_gateway.complete(**kwargs)
+        assert response.provider == LLMProviderType.CLAUDE_SONNET.value
+        assert response.content == "answer from claude_sonnet"
+        assert (await cached_gateway.complete(**kwargs)).cached
+
+    def test_lru_eviction_and_task_ttl(self, tmp_path):
+        cache = LLMResponseCache(db_path=tmp_path / "lru.db", max_entries=2, task_ttls={"planning": 0})
+        cache.put("k1", "analysis", "m", {"content": "1"})
+        cache.put("k2", "analysis", "m", {"content": "2"})
+        assert cache.get("k1") is not None
+        cache.put("k3", "analysis", "m", {"content": "3"})
+        cache.put("k4", "planning", "m", {"content": "never stored"})
+        assert cache.evict()["evicted"] == 1
+        assert cache.get("k2") is None
+        assert cache.get("k1") is not None and cache.get("k3") is not None
+        assert cache.get("k4") is None
+
+
+# ── Hedged fallback ──────────────────────────────────────────────
+
+def _timed_adapters(gateway, delays, failures=()):
+    """Replace adapter.complete with asyncio.sleep-based fakes."""
+    gateway.calls, gateway.cancelled = [], []
+    for provider_type, adapter in gateway._adapters.items():
+        adapter.api_key = "test-key"
+
+        async def complete(messages, max_tokens, temperature, system_prompt=None, _p=provider_type):
+            gateway.calls.append(_p)
+            try:
+                await asyncio.sleep(delays.get(_p, 0.0))
+            except asyncio.CancelledError:
+                gateway.cancelled.append(_p)
+                raise
+            if _p in failures:
+                raise RuntimeError(f"{_p.value} down")
+            return f"answer from {_p.value}", 400, 100
+
+        adapter.complete = complete
+
+
+@pytest.fixture
+def hedging_gateway(monkeypatch):
+    monkeypatch.setenv("LLM_HEDGE_DEFAULT_DELAY_MS", "50")
+    monkeypatch.setenv("LLM_HEDGE_MIN_DELAY_MS", "10")
+    gateway = LLMRoutingGateway(hedging=True)
+    gateway._usage_by_task, gateway._usage_by_agent, gateway._routing_log = {}, {}, []
+    return gateway
+
+
+ANALYSIS = dict(messages=[{"role": "user", "content": "x" * 400}], task_type=TaskType.ANALYSIS, agent_name="SEGMENTOR")
+
+
+class TestHedgedFallback:
+
+    async def test_slow_primary_is_hedged_and_cancelled(self, hedging_gateway):
+        _timed_adapters(hedging_gateway, {LLMProviderType.CLAUDE_SONNET: 5.0, LLMProviderType.GEMINI_PRO: 0.01})
+        response = await hedging_gateway.complete(**ANALYSIS)
+        assert response.provider == LLMProviderType.GEMINI_PRO.value
+        assert response.hedged and response.fallback_used
+        assert response.latency_ms < 1000
+        assert hedging_gateway.cancelled == [LLMProviderType.CLAUDE_SONNET]
+
+        # The cancelled primary's prompt tokens are charged as hedge cost.
+        task = hedging_gateway.get_cost_report()["by_task_type"]["analysis"]
+        sonnet = hedging_gateway._adapters[LLMProviderType.CLAUDE_SONNET]
+        assert task["hedged_calls"] == 1
+        assert task["hedge_cost"] == pytest.approx(sonnet.calculate_cost(100, 0))
+        assert sonnet.get_stats()["requests"] == 1
+        assert sonnet.get_stats()["cancelled"] == 1 and sonnet.get_stats()["errors"] == 0
+        assert hedging_gateway.get_status()["hedging"]["secondary_wins"] == 1
+
+    async def test_fast_primary_never_launches_hedge(self, hedging_gateway):
+        _timed_adapters(hedging_gateway, {LLMProviderType.CLAUDE_SONNET: 0.0})
+        response = await hedging_gateway.complete(**ANALYSIS)
+        assert response.provider == LLMProviderType.CLAUDE_SONNET.value
+        assert not response.hedged
+        assert hedging_gateway.calls == [LLMProviderType.CLAUDE_SONNET]
+
+    async def test_primary_wins_after_hedge_launched(self, hedging_gateway):
+        _timed_adapters(hedging_gateway, {LLMProviderType.CLAUDE_SONNET: 0.1, LLMProviderType.GEMINI_PRO: 5.0})
+        response = await hedging_gateway.complete(**ANALYSIS)
+        assert response.provider == LLMProviderType.CLAUDE_SONNET.value
+        assert response.hedged and not response.fallback_used
+        assert hedging_gateway.cancelled == [LLMProviderType.GEMINI_PRO]
+        # The secondary barely ran; its cut-off time is not a latency sample
+        assert ("*", LLMProviderType.GEMINI_PRO.value) not in hedging_gateway._latency
+
+    async def test_fast_failure_falls_back_serially(self, hedging_gateway):
+        _timed_adapters(hedging_gateway, {}, failures={LLMProviderType.CLAUDE_SONNET})
+        response = await hedging_gateway.complete(**ANALYSIS)
+        assert response.provider == LLMProviderType.GEMINI_PRO.value
+        assert not response.hedged
+        assert response.fallback_chain[0].startswith("claude_sonnet:")
+
+    async def test_serial_mode_unchanged(self, hedging_gateway):
+        _timed_adapters(hedging_gateway, {LLMProviderType.CLAUDE_SONNET: 0.2})
+        response = await hedging_gateway.complete(**ANALYSIS, hedge=False)
+        assert response.provider == LLMProviderType.CLAUDE_SONNET.value
+        assert hedging_gateway.calls == [LLMProviderType.CLAUDE_SONNET]
+
+    async def test_cancelled_primary_latency_keeps_hedge_delay(self, hedging_gateway):
+        sonnet = LLMProviderType.CLAUDE_SONNET
+        _timed_adapters(hedging_gateway, {sonnet: 5.0, LLMProviderType.GEMINI_PRO: 0.02})
+        for _ in range(HEDGE_MIN_SAMPLES):
+            assert (await hedging_gateway.complete(**ANALYSIS)).hedged
+
+        # Each cancelled primary counts as at least as slow as it was allowed to run
+        hist = hedging_gateway._latency[(TaskType.ANALYSIS.value, sonnet.value)]
+        assert hist.count == HEDGE_MIN_SAMPLES
+        assert hedging_gateway.get_hedge_delay_ms(TaskType.ANALYSIS, sonnet) >= 50.0
+
+    def test_hedge_delay_tracks_task_p95(self, hedging_gateway):
+        sonnet = LLMProviderType.CLAUDE_SONNET
+        assert hedging_gateway.get_hedge_delay_ms(TaskType.ANALYSIS, sonnet) == 50.0  # default until sampled
+        for ms in [100.0] * 95 + [2000.0] * 5:
+            hedging_gateway._record_latency(TaskType.ANALYSIS, sonnet, ms)
+        delay = hedging_gateway.get_hedge_delay_ms(TaskType.ANALYSIS, sonnet)
+        assert 100.0 <= delay <= 125.0
+        # Other task types fall back to the provider-wide histogram.
+        assert hedging_gateway.get_hedge_delay_ms(TaskType.PLANNING, sonnet) == delay
+        report = hedging_gateway.get_latency_report()
+        assert report["by_provider"]["claude_sonnet"]["count"] == 100
+
+
+class TestRollingLatencyHistogram:
+
+    def test_percentiles_within_bucket_resolution(self):
+        hist = RollingLatencyHistogram(window=1000)
+        for ms in range(1, 1001):
+            hist.record(float(ms))
+        for pct, exact in ((50, 500), (95, 950), (99, 990)):
+            assert exact <= hist.percentile(pct) <= exact * 1.25
+
+    def test_window_forgets_old_samples(self):
+        hist = RollingLatencyHistogram(window=10)
+        for _ in range(10):
+            hist.record(5000.0)
+        for _ in range(10):
+            hist.record(30.0)
+        assert hist.count == 10
+        assert hist.percentile(99) < 100
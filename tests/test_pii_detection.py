@@ -606,5 +606,50 @@ class TestEmptyAndEdgeCases:
         assert not result.has_pii
 
 
+class TestBatchAndStreamingAPI:
+    """Tests for scan_many / redact_many / scan_stream."""
+    
+    DOCUMENT = (
+        "Hi team, reach me at jane.doe@acme.com or 555-123-4567. "
+        "Wire the deposit to account 123456789012 at our bank. "
+        "Backup contact: ops@globex.io, server 10.20.30.40. "
+    ) * 20
+    
+    def test_scan_many_matches_scan(self):
+        detector = PIIDetector()
+        texts = ["Email a@b.com", "nothing here", "SSN 123-45-6789", "Email a@b.com"]
+        results = detector.scan_many(texts)
+        
+        assert [r.summary for r in results] == [detector.scan(t).summary for t in texts]
+        assert results[0] is results[3]
+    
+    def test_redact_many(self):
+        detector = PIIDetector()
+        texts = ["Email a@b.com", "call 555-123-4567", ""]
+        
+        assert detector.redact_many(texts) == [detector.redact(t) for t in texts]
+        assert detector.redact_many(texts, pii_types=[PIIType.PHONE]) == [
+            "Email a@b.com", "call [PHONE_REDACTED]", ""
+        ]
+    
+    @pytest.mark.parametrize("chunk_size", [7, 64, 300, 5000])
+    def test_scan_stream_matches_whole_document(self, chunk_size):
+        detector = PIIDetector()
+        doc = self.DOCUMENT
+        chunks = [doc[i:i + chunk_size] for i in range(0, len(doc), chunk_size)]
+        
+        segments = list(detector.scan_stream(chunks, overlap=64))
+        whole = detector.scan(doc)
+        
+        assert "".join(s.redacted_text for s in segments) == whole.redacted_text
+        streamed = sorted((m.start, m.end, m.pii_type) for s in segments for m in s.matches)
+        assert streamed == sorted((m.start, m.end, m.pii_type) for m in whole.matches)
+        assert all(doc[m.start:m.end] == m.value for s in segments for m in s.matches
+                   if m.pii_type not in (PIIType.API_KEY, PIIType.PASSWORD))
+    
+    def test_scan_stream_empty(self):
+        assert list(PIIDetector().scan_stream([])) == []
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
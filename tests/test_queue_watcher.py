@@ -43,6 +43,12 @@ class FakeRedis:
     def get(self, key):
         return self._data.get(key)
 
+    def mget(self, keys):
+        return [self._data.get(k) for k in keys]
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
     def set(self, key, value, ex=None):
         self._data[key] = value
 
@@ -79,6 +85,27 @@ class FakeRedis:
         return list(self._data.keys())
 
 
+class FakePipeline:
+    """Buffers commands and replays them against FakeRedis on execute()."""
+
+    def __init__(self, redis):
+        self._redis = redis
+        self._ops = []
+
+    def __getattr__(self, name):
+        method = getattr(self._redis, name)
+
+        def _queue(*args, **kwargs):
+            self._ops.append((method, args, kwargs))
+            return self
+
+        return _queue
+
+    def execute(self):
+        ops, self._ops = self._ops, []
+        return [method(*args, **kwargs) for method, args, kwargs in ops]
+
+
 def _make_env(**overrides):
     """Build env dict that disables real Redis and sets watcher config."""
     env = {
@@ -0,0 +1,202 @@
+"""Tests for execution/rate_limiter.py (GCRA buckets, shared backends, cost log)."""
+
+from __future__ import annotations
+
+import json
+import multiprocessing
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from execution.rate_limiter import APIRateLimiter, gcra_update
+
+
+class SmallQuotaLimiter(APIRateLimiter):
+    RATE_LIMITS = {"svc": {"calls": 10, "period": 1, "burst": 10}}
+    COSTS = {"svc": 0.01}
+
+
+def _make_limiter(tmp_path: Path, backend: str = "memory") -> SmallQuotaLimiter:
+    lim = SmallQuotaLimiter(backend=backend, sqlite_path=tmp_path / "rate_limits.db")
+    lim.cost_log = tmp_path / "api_costs.jsonl"
+    return lim
+
+
+def _contend(sqlite_path: str, duration: float, start_at: float, results) -> None:
+    lim = SmallQuotaLimiter(backend="sqlite", sqlite_path=Path(sqlite_path))
+    while time.time() < start_at:
+        time.sleep(0.001)
+    granted = 0
+    while time.time() < start_at + duration:
+        if lim.try_acquire("svc") == 0:
+            granted += 1
+    results.put(granted)
+
+
+class TestGCRA:
+
+    def test_burst_then_refill(self):
+        interval, tolerance = 0.1, 0.9  # 10 per second, burst 10
+        tat, now = 0.0, 100.0
+        for _ in range(10):
+            tat, wait = gcra_update(tat, now, interval, tolerance)
+            assert wait == 0
+        _, wait = gcra_update(tat, now, interval, tolerance)
+        assert wait == pytest.approx(0.1)
+        _, wait = gcra_update(tat, now + 0.1, interval, tolerance)
+        assert wait == 0
+
+    def test_memory_bucket_denies_after_quota(self, tmp_path):
+        lim = _make_limiter(tmp_path)
+        assert all(lim.try_acquire("svc") == 0 for _ in range(10))
+        assert lim.try_acquire("svc") > 0
+        usage = lim.get_current_usage()["svc"]
+        assert usage["calls_remaining"] == 0
+        assert usage["current_calls"] == 10
+
+    @pytest.mark.parametrize("burst", [None, 1, 30, 100])
+    def test_rolling_window_never_exceeds_quota(self, tmp_path, monkeypatch, burst):
+        import execution.rate_limiter as rl
+        apollo = dict(APIRateLimiter.RATE_LIMITS["apollo"])
+        if burst is not None:
+            apollo["burst"] = burst
+        lim = APIRateLimiter(sqlite_path=tmp_path / "rate_limits.db")
+        lim.RATE_LIMITS = {"apollo": apollo}
+        clock = [1000.0]
+        monkeypatch.setattr(rl.time, "time", lambda: clock[0])
+
+        grants = []
+        for step in range(180_000):  # one attempt per ms for 3 minutes
+            clock[0] = 1000.0 + step / 1000
+            if lim.try_acquire("apollo") == 0:
+                grants.append(step)
+
+        busiest, first = 0, 0
+        for last, granted_at in enumerate(grants):
+            while granted_at - grants[first] >= 60_000:
+                first += 1
+            busiest = max(busiest, last - first + 1)
+        assert busiest == 100
+        assert len([step for step in grants if step < 60_000]) == 100
+
+    def test_redis_failure_falls_back_to_memory_until_retry(self, tmp_path, monkeypatch):
+        class _FlakyRedis:
+            down = True
+            calls = 0
+
+            @classmethod
+            def from_url(cls, *args, **kwargs):
+                return cls()
+
+            def ping(self):
+                return True
+
+            def register_script(self, script):
+                def _run(keys, args):
+                    _FlakyRedis.calls += 1
+                    if _FlakyRedis.down:
+                        raise ConnectionError("redis down")
+                    return ["1", "0"]
+                return _run
+
+        monkeypatch.setitem(sys.modules, "redis", SimpleNamespace(Redis=_FlakyRedis))
+        lim = SmallQuotaLimiter(use_redis=True, redis_url="redis://fake", key_prefix="test:rl")
+        lim.cost_log = tmp_path / "api_costs.jsonl"
+        assert lim.call("svc", lambda: "ok") == "ok"
+        # Only the failing call touched Redis; the backoff serves the rest locally
+        assert lim.backend == "redis" and lim.use_redis
+        assert all(lim.try_acquire("svc") == 0 for _ in range(9))
+        assert lim.try_acquire("svc") > 0
+        assert _FlakyRedis.calls == 1
+
+        _FlakyRedis.down = False
+        lim._redis_retry_at = 0.0
+        assert lim.try_acquire("svc") == 0
+        assert _FlakyRedis.calls == 2 and lim._redis_failures == 0
+
+    def test_unknown_service_rejected(self, tmp_path):
+        with pytest.raises(ValueError):
+            _make_limiter(tmp_path).try_acquire("nope")
+
+    async def test_async_acquire_waits_for_refill(self, tmp_path):
+        lim = _make_limiter(tmp_path)
+        for _ in range(10):
+            await lim.acquire("svc")
+        start = time.monotonic()
+        await lim.acquire("svc")
+        assert time.monotonic() - start >= 0.05
+
+    def test_redis_backend_uses_script(self, tmp_path, monkeypatch):
+        calls = []
+
+        class _FakeRedis:
+            @classmethod
+            def from_url(cls, *args, **kwargs):
+                return cls()
+
+            def ping(self):
+                return True
+
+            def register_script(self, script):
+                def _run(keys, args):
+                    calls.append((keys, args))
+                    return ["1", "0"] if len(calls) == 1 else ["0", "0.25"]
+                return _run
+
+        monkeypatch.setitem(sys.modules, "redis", SimpleNamespace(Redis=_FakeRedis))
+        lim = SmallQuotaLimiter(use_redis=True, redis_url="redis://fake", key_prefix="test:rl")
+        assert lim.backend == "redis"
+        assert lim.try_acquire("svc") == 0
+        assert lim.try_acquire("svc") == pytest.approx(0.25)
+        assert calls[0][0] == ["test:rl:svc"]
+
+
+class TestSharedQuota:
+
+    def test_sqlite_quota_holds_across_processes(self, tmp_path):
+        workers, duration = 4, 1.0
+        ctx = multiprocessing.get_context("spawn")
+        results = ctx.Queue()
+        start_at = time.time() + 2.0
+        procs = [
+            ctx.Process(target=_contend, args=(str(tmp_path / "rate_limits.db"), duration, start_at, results))
+            for _ in range(workers)
+        ]
+        for p in procs:
+            p.start()
+        counts = [results.get(timeout=30) for _ in procs]
+        for p in procs:
+            p.join(timeout=30)
+
+        # never more than the quota in one period (one token of slack for clock skew)
+        assert sum(counts) <= 10 * duration + 1
+        assert sum(counts) >= 10
+
+
+class TestCostLog:
+
+    def test_cost_log_is_buffered_and_flushed_for_summary(self, tmp_path):
+        lim = _make_limiter(tmp_path)
+        lim.call("svc", lambda: "ok")
+        lim.record_cache_lookup("svc", hit=True)
+        assert not lim.cost_log.exists()
+
+        summary = lim.get_cost_summary(days=1)
+        assert summary["total_calls"] == 1
+        assert summary["cache"]["hits"] == 1
+
+        lines = [json.loads(line) for line in lim.cost_log.read_text().splitlines()]
+        assert [line["service"] for line in lines] == ["svc", "svc"]
+
+    def test_cost_log_flushes_at_batch_size(self, tmp_path, monkeypatch):
+        import execution.rate_limiter as rl
+        monkeypatch.setattr(rl, "COST_LOG_BATCH_SIZE", 3)
+        lim = _make_limiter(tmp_path)
+        for _ in range(3):
+            lim._log_call("svc", success=True)
+        assert len(lim.cost_log.read_text().splitlines()) == 3
@@ -0,0 +1,197 @@
+"""Tests for the incremental report rollups (core/report_rollups.py) and their parity with core.reporting."""
+
+import json
+import random
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from core import report_rollups, reporting
+from core.event_log import migrate_legacy_events, segments_dir, write_events
+from core.report_rollups import get_report_rollups
+
+BASE = datetime(2026, 2, 1, tzinfo=timezone.utc)
+DAYS = 40
+
+
+def _event(rng, ts):
+    event_type = rng.choice([
+        "lead_segmented", "scrape_completed", "enrichment_completed", "enrichment_failed",
+        "campaign_created", "campaign_sent", "email_delivered", "email_opened",
+        "reply_classified", "meeting_booked", "campaign_approved", "campaign_rejected",
+        "compliance_failed", "retry_scheduled", "system_error", "scrape_failed", "sla_breach",
+    ])
+    payload = {"campaign_id": rng.choice(["c1", "c2", "c3"])}
+    if rng.random() < 0.1:
+        del payload["campaign_id"]
+    if event_type == "lead_segmented":
+        payload.update(source=rng.choice(["apollo", "linkedin"]), tier=rng.choice([1, 2, 3, "vip"]))
+    elif event_type in ("scrape_completed", "campaign_sent") and rng.random() < 0.7:
+        payload["count"] = rng.randint(1, 25)
+    elif event_type == "reply_classified":
+        payload["objection_type"] = rng.choice([
+            "positive_interest", "buying_signals", "not_interested", "timing", None,
+        ])
+    elif event_type == "campaign_rejected":
+        payload["reason"] = rng.choice(["tone", "wrong_persona"])
+    elif event_type == "compliance_failed":
+        payload["violation_type"] = rng.choice(["missing_unsubscribe", "spam_words"])
+    elif event_type == "system_error":
+        payload["category"] = rng.choice(["api", "timeout"])
+    return {"timestamp": ts.isoformat(), "event_type": event_type, "payload": payload}
+
+
+def _events(n, seed=7, start=BASE, days=DAYS):
+    rng = random.Random(seed)
+    return [_event(rng, start + timedelta(seconds=rng.randrange(days * 86400))) for _ in range(n)]
+
+
+def _strip(report):
+    report.pop("generated_at")
+    return report
+
+
+def _reference_daily(date):
+    start = datetime(date.year, date.month, date.day, tzinfo=timezone.utc)
+    events = reporting.load_events(start, start + timedelta(days=1))
+    return {
+        "date": date.strftime("%Y-%m-%d"),
+        "leads_scraped": reporting._count_leads_scraped(events, start),
+        "enrichment": reporting._calc_enrichment_stats(events, start),
+        "emails": reporting._calc_email_stats(events),
+        "replies": reporting._count_replies_by_sentiment(events),
+        "meetings_booked": reporting._count_meetings(events),
+    }
+
+
+def _reference_weekly(date):
+    start = datetime(date.year, date.month, date.day, tzinfo=timezone.utc) - timedelta(days=date.weekday())
+    end = start + timedelta(days=7)
+    events = reporting.load_events(start, end)
+    return {
+        "week_start": start.strftime("%Y-%m-%d"),
+        "week_end": (end - timedelta(days=1)).strftime("%Y-%m-%d"),
+        "icp_tier_distribution": reporting._calc_icp_distribution(events, start),
+        "conversion_funnel": reporting._calc_conversion_funnel(events),
+        "ae_approval_trends": reporting._calc_ae_approval_trends(events),
+        "performance_vs_targets": reporting._calc_performance_vs_targets(
+            events, reporting.load_performance_targets()
+        ),
+    }
+
+
+def _reference_monthly(date):
+    start = datetime(date.year, date.month, 1, tzinfo=timezone.utc)
+    end = datetime(date.year + date.month // 12, date.month % 12 + 1, 1, tzinfo=timezone.utc)
+    events = reporting.load_events(start, end)
+    return {
+        "month": start.strftime("%Y-%m"),
+        "roi_analysis": reporting._placeholder_roi_analysis(),
+        "campaign_performance": reporting._calc_campaign_performance(events),
+        "compliance_audit": reporting._calc_compliance_audit(events),
+        "system_health": reporting._calc_system_health(events),
+    }
+
+
+def _assert_parity():
+    for offset in range(-1, DAYS + 1, 3):
+        date = BASE + timedelta(days=offset)
+        assert _strip(reporting.daily_report(date)) == _reference_daily(date)
+        assert _strip(reporting.weekly_report(date)) == _reference_weekly(date)
+    for month in (1, 2, 3):
+        date = datetime(2026, month, 15)
+        assert _strip(reporting.monthly_report(date)) == _reference_monthly(date)
+
+
+@pytest.fixture
+def hive(tmp_path, monkeypatch):
+    monkeypatch.setattr(reporting, "HIVE_MIND", tmp_path)
+    monkeypatch.setattr(reporting, "EVENTS_FILE", tmp_path / "events.jsonl")
+    monkeypatch.setattr(report_rollups, "_instances", {})
+    return tmp_path
+
+
+class TestParity:
+
+    def test_reports_match_event_calculations(self, hive):
+        write_events(_events(3000), hive / "events.jsonl")
+        _assert_parity()
+
+    def test_legacy_file_and_undated_events(self, hive):
+        legacy = _events(500, seed=3) + [
+            {"event_type": "meeting_booked", "payload": {"campaign_id": "c9"}},
+            {"timestamp": "not a date", "event_type": "meeting_booked", "payload": {}},
+        ]
+        (hive / "events.jsonl").write_text("".join(json.dumps(e) + "\n" for e in legacy) + "{bad\n")
+        write_events(_events(500, seed=4), hive / "events.jsonl")
+        _assert_parity()
+
+    def test_filesystem_fallbacks_when_no_events(self, hive):
+        (hive / "scraped").mkdir()
+        (hive / "scraped" / "leads_apollo_2026-01-20.json").write_text(json.dumps([{}, {}]))
+        (hive / "review_queue.json").write_text(json.dumps({"approved": [{}], "rejected": []}))
+        write_events(_events(50, start=BASE + timedelta(days=30), days=1), hive / "events.jsonl")
+
+        date = datetime(2026, 1, 20)
+        assert reporting.daily_report(date)["leads_scraped"] == {"total": 2, "by_source": {"apollo": 2}}
+        assert reporting.weekly_report(date)["ae_approval_trends"]["approved"] == 1
+        assert _strip(reporting.daily_report(date)) == _reference_daily(date)
+
+
+class TestIncremental:
+
+    def test_only_appended_events_are_consumed(self, hive):
+        events_file = hive / "events.jsonl"
+        rollups = get_report_rollups(events_file)
+        write_events(_events(1000, seed=1), events_file)
+        assert rollups.refresh() == 1000
+        assert rollups.refresh() == 0
+
+        late = _events(300, seed=2)
+        write_events(late, events_file)
+        assert rollups.refresh() == 300
+        _assert_parity()
+
+    def test_partial_trailing_line_waits_for_newline(self, hive):
+        events_file = hive / "events.jsonl"
+        rollups = get_report_rollups(events_file)
+        write_events(_events(10, days=1), events_file)
+        rollups.refresh()
+
+        line = json.dumps({"timestamp": BASE.isoformat(), "event_type": "meeting_booked", "payload": {}})
+        segment = segments_dir(events_file) / "2026-02-01.jsonl"
+        with open(segment, "a") as f:
+            f.write(line[:20])
+        assert rollups.refresh() == 0
+        with open(segment, "a") as f:
+            f.write(line[20:] + "\n")
+        assert rollups.refresh() == 1
+
+        day = BASE.date()
+        assert rollups.totals(day, day + timedelta(days=1))["event_type"]["meeting_booked"] == sum(
+            1 for e in reporting.load_events(BASE, BASE + timedelta(days=1))
+            if e["event_type"] == "meeting_booked"
+        )
+
+    def test_legacy_migration_triggers_rebuild(self, hive):
+        events_file = hive / "events.jsonl"
+        events_file.write_text("".join(json.dumps(e) + "\n" for e in _events(400, seed=5)))
+        rollups = get_report_rollups(events_file)
+        assert rollups.refresh() == 400
+        before = rollups.totals()
+
+        migrate_legacy_events(events_file)
+        assert rollups.refresh() == 400
+        assert rollups.totals() == before
+        _assert_parity()
+
+    def test_rebuild_matches_incremental(self, hive):
+        events_file = hive / "events.jsonl"
+        rollups = get_report_rollups(events_file)
+        for seed in range(5):
+            write_events(_events(200, seed=seed), events_file)
+            rollups.refresh()
+        incremental = rollups.totals(BASE.date(), (BASE + timedelta(days=14)).date())
+
+        assert rollups.rebuild() == 1000
+        assert rollups.totals(BASE.date(), (BASE + timedelta(days=14)).date()) == incremental
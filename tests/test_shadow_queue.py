@@ -32,6 +32,12 @@ class FakeRedis:
     def get(self, key: str) -> Optional[str]:
         return self._store.get(key)
 
+    def mget(self, keys: List[str]) -> List[Optional[str]]:
+        return [self._store.get(k) for k in keys]
+
+    def pipeline(self, transaction: bool = True) -> "FakePipeline":
+        return FakePipeline(self)
+
     def set(self, key: str, value: str, ex=None):
         self._store[key] = value
 
@@ -61,6 +67,27 @@ class FakeRedis:
             self._store.pop(key, None)
 
 
+class FakePipeline:
+    """Buffers commands and replays them against FakeRedis on execute()."""
+
+    def __init__(self, redis: "FakeRedis"):
+        self._redis = redis
+        self._ops: List[Any] = []
+
+    def __getattr__(self, name: str):
+        method = getattr(self._redis, name)
+
+        def _queue(*args, **kwargs):
+            self._ops.append((method, args, kwargs))
+            return self
+
+        return _queue
+
+    def execute(self) -> List[Any]:
+        ops, self._ops = self._ops, []
+        return [method(*args, **kwargs) for method, args, kwargs in ops]
+
+
 class BrokenRedis:
     """Redis client that raises on every operation."""
 
@@ -96,9 +123,11 @@ def _reset_shadow_queue_globals():
     old_init = sq._init_done
     sq._client = None
     sq._init_done = False
+    sq.invalidate_page_cache()
     yield
     sq._client = old_client
     sq._init_done = old_init
+    sq.invalidate_page_cache()
 
 
 @pytest.fixture
@@ -463,3 +492,307 @@ def test_railway_dashboard_key_pattern(monkeypatch, fake_redis):
     # Verify the pending index key
     expected_index = "caio:production:context:shadow:pending_ids"
     assert "test_001" in fake_redis._zsets.get(expected_index, {})
+
+
+# ── Status indexes ───────────────────────────────────────────────
+
+
+def test_update_status_moves_between_status_indexes(monkeypatch, fake_redis):
+    """update_status() moves the id from the pending index to the new status index."""
+    import core.shadow_queue as sq
+    _inject_redis(monkeypatch, fake_redis)
+    monkeypatch.setenv("CONTEXT_REDIS_PREFIX", "caio:test")
+
+    sq.push(_sample_email(status="pending"))
+    sq.update_status("test_001", "approved")
+
+    assert "test_001" in fake_redis._zsets["caio:test:shadow:status:approved"]
+    assert "test_001" not in fake_redis._zsets["caio:test:shadow:pending_ids"]
+
+    sq.update_status("test_001", "sent")
+    assert "test_001" in fake_redis._zsets["caio:test:shadow:status:sent"]
+    assert "test_001" not in fake_redis._zsets["caio:test:shadow:status:approved"]
+
+
+def test_list_by_status_paginates_newest_first(monkeypatch, fake_redis):
+    """list_by_status() pages through an index with a SCAN-style cursor."""
+    import core.shadow_queue as sq
+    _inject_redis(monkeypatch, fake_redis)
+    monkeypatch.setenv("CONTEXT_REDIS_PREFIX", "caio:test")
+
+    for i in range(5):
+        sq.push(_sample_email(email_id=f"email_{i}", status="approved"))
+        time.sleep(0.01)
+
+    page1, cursor = sq.list_by_status("approved", limit=2)
+    assert [e["email_id"] for e in page1] == ["email_4", "email_3"]
+    assert cursor == 2
+    page2, cursor = sq.list_by_status("approved", cursor=cursor, limit=2)
+    assert [e["email_id"] for e in page2] == ["email_2", "email_1"]
+    page3, cursor = sq.list_by_status("approved", cursor=cursor, limit=2)
+    assert [e["email_id"] for e in page3] == ["email_0"]
+    assert cursor == 0
+
+
+def test_list_by_status_prunes_stale_entries(monkeypatch, fake_redis):
+    """Expired records and status mismatches are dropped from the index on read."""
+    import core.shadow_queue as sq
+    _inject_redis(monkeypatch, fake_redis)
+    monkeypatch.setenv("CONTEXT_REDIS_PREFIX", "caio:test")
+
+    sq.push(_sample_email(email_id="keep", status="rejected"))
+    sq.push(_sample_email(email_id="expired", status="rejected"))
+    sq.push(_sample_email(email_id="moved", status="rejected"))
+    fake_redis.delete("caio:test:shadow:email:expired")
+    fake_redis.set(
+        "caio:test:shadow:email:moved",
+        json.dumps(_sample_email(email_id="moved", status="approved")),
+    )
+
+    emails, _ = sq.list_by_status("rejected", limit=10)
+    assert [e["email_id"] for e in emails] == ["keep"]
+    assert set(fake_redis._zsets["caio:test:shadow:status:rejected"]) == {"keep"}
+
+
+def test_list_by_status_without_redis_is_empty(monkeypatch):
+    import core.shadow_queue as sq
+    _inject_redis(monkeypatch, None)
+
+    assert sq.list_by_status("approved") == ([], 0)
+    assert sq.list_by_status("not_a_status") == ([], 0)
+
+
+def test_get_email_history_merges_reviewed_statuses(monkeypatch, fake_redis):
+    import core.shadow_queue as sq
+    _inject_redis(monkeypatch, fake_redis)
+    monkeypatch.setenv("CONTEXT_REDIS_PREFIX", "caio:test")
+
+    sq.push(_sample_email(email_id="a1", status="approved", approved_at="2026-02-01T10:00:00+00:00"))
+    sq.push(_sample_email(email_id="r1", status="rejected", rejected_at="2026-02-02T10:00:00+00:00"))
+    sq.push(_sample_email(email_id="p1", status="pending"))
+
+    history = sq.get_email_history(limit=10)
+    assert [e["email_id"] for e in history] == ["r1", "a1"]
+
+
+def test_backfill_status_indexes_indexes_existing_keys(monkeypatch, fake_redis):
+    """backfill_status_indexes() indexes legacy keys using their review timestamps."""
+    import core.shadow_queue as sq
+    _inject_redis(monkeypatch, fake_redis)
+    monkeypatch.setenv("CONTEXT_REDIS_PREFIX", "caio:test")
+
+    legacy = [
+        _sample_email(email_id="old_a", status="approved", approved_at="2026-02-01T10:00:00"),
+        _sample_email(email_id="old_r", status="rejected", rejected_at="2026-02-02T10:00:00Z"),
+        _sample_email(email_id="old_x", status="draft"),
+    ]
+    for email in legacy:
+        fake_redis.set(f"caio:test:shadow:email:{email['email_id']}", json.dumps(email))
+
+    dry = sq.backfill_status_indexes(batch_size=2, dry_run=True)
+    assert dry["scanned"] == 3
+    assert "caio:test:shadow:status:approved" not in fake_redis._zsets
+
+    summary = sq.backfill_status_indexes(batch_size=2)
+    assert summary["indexed"]["approved"] == 1
+    assert summary["indexed"]["rejected"] == 1
+    assert summary["unindexed_status"] == 1
+    approved_index = fake_redis._zsets["caio:test:shadow:status:approved"]
+    expected = datetime(2026, 2, 1, 10, tzinfo=timezone.utc).timestamp()
+    assert approved_index["old_a"] == expected
+
+
+# ── Batched list_pending + page cache ────────────────────────────
+
+
+class CountingRedis(FakeRedis):
+    """FakeRedis that records every direct (non-pipelined) command name."""
+
+    def __init__(self):
+        super().__init__()
+        self.calls: List[str] = []
+
+    def get(self, key):
+        self.calls.append("get")
+        return super().get(key)
+
+    def mget(self, keys):
+        self.calls.append("mget")
+        return super().mget(keys)
+
+    def zrem(self, key, *members):
+        self.calls.append("zrem")
+        return super().zrem(key, *members)
+
+
+def test_list_pending_uses_single_mget(monkeypatch):
+    """list_pending() reads a page with one MGET and one batched ZREM for stale ids."""
+    import core.shadow_queue as sq
+    r = CountingRedis()
+    _inject_redis(monkeypatch, r)
+    monkeypatch.setenv("CONTEXT_REDIS_PREFIX", "caio:test")
+
+    for i in range(5):
+        sq.push(_sample_email(email_id=f"email_{i}", status="pending"))
+    r.delete("caio:test:shadow:email:email_1", "caio:test:shadow:email:email_3")
+    r.calls.clear()
+
+    result = sq.list_pending(limit=10)
+    assert len(result) == 3
+    assert r.calls == ["mget", "zrem"]
+    assert set(r._zsets["caio:test:shadow:pending_ids"]) == {"email_0", "email_2", "email_4"}
+
+
+def test_list_pending_page_cache_serves_repeat_reads(monkeypatch):
+    """With a TTL set, repeat reads skip Redis and return independent copies."""
+    import core.shadow_queue as sq
+    r = CountingRedis()
+    _inject_redis(monkeypatch, r)
+    monkeypatch.setenv("CONTEXT_REDIS_PREFIX", "caio:test")
+    monkeypatch.setenv("SHADOW_QUEUE_PAGE_CACHE_TTL_SECONDS", "30")
+
+    sq.push(_sample_email(status="pending"))
+    first = sq.list_pending(limit=10)
+    first[0]["subject"] = "mutated by caller"
+    r.calls.clear()
+
+    second = sq.list_pending(limit=10)
+    assert r.calls == []
+    assert second[0]["subject"] == "Test Subject"
+
+
+def test_page_cache_invalidated_by_local_writes(monkeypatch):
+    import core.shadow_queue as sq
+    r = CountingRedis()
+    _inject_redis(monkeypatch, r)
+    monkeypatch.setenv("CONTEXT_REDIS_PREFIX", "caio:test")
+    monkeypatch.setenv("SHADOW_QUEUE_PAGE_CACHE_TTL_SECONDS", "30")
+
+    sq.push(_sample_email(email_id="a", status="pending"))
+    assert len(sq.list_pending(limit=10)) == 1
+
+    sq.push(_sample_email(email_id="b", status="pending"))
+    assert {e["email_id"] for e in sq.list_pending(limit=10)} == {"a", "b"}
+
+    sq.update_status("a", "approved")
+    assert [e["email_id"] for e in sq.list_pending(limit=10)] == ["b"]
+
+
+def test_page_cache_not_refilled_by_read_overlapping_a_write(monkeypatch):
+    """A read that fetched pre-write data must not cache it once the write lands."""
+    import core.shadow_queue as sq
+    r = CountingRedis()
+    _inject_redis(monkeypatch, r)
+    monkeypatch.setenv("CONTEXT_REDIS_PREFIX", "caio:test")
+    monkeypatch.setenv("SHADOW_QUEUE_PAGE_CACHE_TTL_SECONDS", "30")
+    sq.push(_sample_email(email_id="a", status="pending"))
+
+    real_mget = r.mget
+
+    def mget_then_write(keys):
+        raws = real_mget(keys)
+        r.mget = real_mget
+        sq.update_status("a", "approved")  # completes while the read is in flight
+        return raws
+
+    r.mget = mget_then_write
+    assert [e["email_id"] for e in sq.list_pending(limit=10)] == ["a"]
+    assert sq.list_pending(limit=10) == []
+
+
+def test_page_cache_disabled_by_default(monkeypatch):
+    import core.shadow_queue as sq
+    r = CountingRedis()
+    _inject_redis(monkeypatch, r)
+    monkeypatch.setenv("CONTEXT_REDIS_PREFIX", "caio:test")
+    monkeypatch.delenv("SHADOW_QUEUE_PAGE_CACHE_TTL_SECONDS", raising=False)
+
+    sq.push(_sample_email(status="pending"))
+    sq.list_pending(limit=10)
+    r.calls.clear()
+    sq.list_pending(limit=10)
+    assert r.calls == ["mget"]
+
+
+# ── Filesystem index ─────────────────────────────────────────────
+
+
+def _write_legacy(shadow_dir: Path, filename: str, email: Dict[str, Any]) -> Path:
+    path = shadow_dir / filename
+    path.write_text(json.dumps(email), encoding="utf-8")
+    return path
+
+
+def test_push_into_empty_dir_writes_complete_manifest(monkeypatch, shadow_dir):
+    import core.shadow_queue as sq
+    _inject_redis(monkeypatch, None)
+
+    sq.push(_sample_email(email_id="fresh_001"), shadow_dir=shadow_dir)
+
+    lines = (shadow_dir / sq.FILE_INDEX_NAME).read_text().splitlines()
+    assert json.loads(lines[0])["complete"] is True
+    assert json.loads(lines[1]) == {"email_id": "fresh_001", "file": "fresh_001.json"}
+
+
+def test_get_email_miss_skips_scan_when_index_complete(monkeypatch, shadow_dir):
+    """A complete manifest answers misses without parsing every file."""
+    import core.shadow_queue as sq
+    _inject_redis(monkeypatch, None)
+
+    sq.push(_sample_email(email_id="a"), shadow_dir=shadow_dir)
+    sq.push(_sample_email(email_id="b"), shadow_dir=shadow_dir)
+
+    opened: List[str] = []
+    real_load = json.load
+    monkeypatch.setattr(sq.json, "load", lambda fp, *a, **k: opened.append(fp.name) or real_load(fp, *a, **k))
+
+    assert sq.get_email("missing", shadow_dir=shadow_dir) is None
+    assert opened == []
+    assert sq.get_email("b", shadow_dir=shadow_dir)["email_id"] == "b"
+    assert len(opened) == 1
+
+
+def test_legacy_filename_found_by_scan_then_indexed(monkeypatch, shadow_dir):
+    """Files from older writers are found once by scan, then via the manifest."""
+    import core.shadow_queue as sq
+    _inject_redis(monkeypatch, None)
+
+    _write_legacy(shadow_dir, "20260201_120000_lead.json", _sample_email(email_id="legacy_001"))
+
+    result = sq.update_status("legacy_001", "approved", shadow_dir=shadow_dir)
+    assert result["status"] == "approved"
+    index = sq._load_file_index(shadow_dir)
+    assert index["files"]["legacy_001"] == "20260201_120000_lead.json"
+    assert index["complete"] is False
+
+    stored = json.loads((shadow_dir / "20260201_120000_lead.json").read_text())
+    assert stored["status"] == "approved"
+
+
+def test_rebuild_file_index_repairs_legacy_dir(monkeypatch, shadow_dir):
+    import core.shadow_queue as sq
+    _inject_redis(monkeypatch, None)
+
+    _write_legacy(shadow_dir, "old_name_1.json", _sample_email(email_id="e1"))
+    _write_legacy(shadow_dir, "e2.json", _sample_email(email_id="e2"))
+    (shadow_dir / "broken.json").write_text("{not json", encoding="utf-8")
+
+    summary = sq.rebuild_file_index(shadow_dir)
+    assert summary["indexed"] == 2
+    assert summary["non_canonical"] == 1
+    assert summary["unreadable"] == 1
+    index = sq._load_file_index(shadow_dir)
+    assert index["complete"] is True
+    assert sq.get_email("e1", shadow_dir=shadow_dir)["email_id"] == "e1"
+
+
+def test_rebuild_file_index_renames_to_canonical(monkeypatch, shadow_dir):
+    import core.shadow_queue as sq
+    _inject_redis(monkeypatch, None)
+
+    _write_legacy(shadow_dir, "old_name_1.json", _sample_email(email_id="e1"))
+
+    summary = sq.rebuild_file_index(shadow_dir, rename_to_canonical=True)
+    assert summary["renamed"] == 1
+    assert (shadow_dir / "e1.json").exists()
+    assert not (shadow_dir / "old_name_1.json").exists()
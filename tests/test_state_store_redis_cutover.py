@@ -17,6 +17,7 @@ import pytest
 class _FakeRedisClient:
     def __init__(self):
         self._kv: dict[str, str] = {}
+        self._zsets: dict[str, dict[str, float]] = {}
 
     @classmethod
     def from_url(cls, *args, **kwargs):
@@ -34,6 +35,22 @@ class _FakeRedisClient:
         self._kv[key] = value
         return True
 
+    def mget(self, keys):
+        return [self._kv.get(k) for k in keys]
+
+    def zadd(self, key: str, mapping: dict):
+        self._zsets.setdefault(key, {}).update(mapping)
+
+    def zrem(self, key: str, *members: str):
+        for member in members:
+            self._zsets.get(key, {}).pop(member, None)
+
+    def zrangebyscore(self, key: str, min_score, max_score):
+        lo = float(min_score)
+        hi = float(max_score)
+        zset = self._zsets.get(key, {})
+        return [m for m, score in sorted(zset.items(), key=lambda kv: kv[1]) if lo <= score <= hi]
+
     def scan_iter(self, match: str):
         for key in list(self._kv.keys()):
             if fnmatch.fnmatch(key, match):
@@ -139,3 +156,66 @@ def test_operator_lock_disallows_concurrent_live_runs(monkeypatch, tmp_path: Pat
     store.release_operator_lock("outbound", token1)
     token3 = store.acquire_operator_lock("outbound", ttl_seconds=60)
     assert token3 is not None
+
+
+def _cadence(email: str, due: str, status: str = "active") -> dict:
+    return {
+        "email": email,
+        "cadence_id": "default_21day",
+        "tier": "tier_1",
+        "started_at": "2026-02-17T00:00:00+00:00",
+        "current_step": 1,
+        "status": status,
+        "next_step_due": due,
+    }
+
+
+def test_cadence_due_index_maintained_on_save(monkeypatch, tmp_path: Path):
+    state_store = _set_fake_redis(monkeypatch)
+    monkeypatch.setenv("STATE_BACKEND", "redis")
+    monkeypatch.setenv("REDIS_URL", "redis://fake:6379/0")
+
+    store = state_store.StateStore(hive_dir=tmp_path / ".hive-mind")
+    store.save_cadence_lead_state("a@example.com", _cadence("a@example.com", "2026-03-01"))
+    index = store._redis_client._zsets[store._due_index_key("default_21day")]
+    email_hash = state_store.cadence_email_hash("a@example.com")
+    assert index[email_hash] == state_store._due_date_score("2026-03-01")
+
+    store.save_cadence_lead_state("a@example.com", _cadence("a@example.com", "2026-03-01", status="exited"))
+    assert email_hash not in index
+
+
+def test_cadence_due_scan_uses_range_query_after_first_backfill(monkeypatch, tmp_path: Path):
+    state_store = _set_fake_redis(monkeypatch)
+    monkeypatch.setenv("STATE_BACKEND", "redis")
+    monkeypatch.setenv("REDIS_URL", "redis://fake:6379/0")
+
+    store = state_store.StateStore(hive_dir=tmp_path / ".hive-mind")
+    client = store._redis_client
+    # Records written before the due index existed.
+    for email, due in (("due@example.com", "2026-03-01"), ("later@example.com", "2026-03-09")):
+        client.set(store._key("cadence", "lead", state_store.cadence_email_hash(email)), json.dumps(_cadence(email, due)))
+
+    first = store.list_due_cadence_lead_states("default_21day", "2026-03-02")
+    assert [d["email"] for d in first] == ["due@example.com"]
+    assert client.get(store._due_index_ready_key())
+
+    monkeypatch.setattr(client, "scan_iter", lambda match: pytest.fail("full scan after backfill"))
+    second = store.list_due_cadence_lead_states("default_21day", "2026-03-10")
+    assert sorted(d["email"] for d in second) == ["due@example.com", "later@example.com"]
+
+
+def test_cadence_due_scan_prunes_stale_members(monkeypatch, tmp_path: Path):
+    state_store = _set_fake_redis(monkeypatch)
+    monkeypatch.setenv("STATE_BACKEND", "redis")
+    monkeypatch.setenv("REDIS_URL", "redis://fake:6379/0")
+
+    store = state_store.StateStore(hive_dir=tmp_path / ".hive-mind")
+    client = store._redis_client
+    client.set(store._due_index_ready_key(), "1")
+    store.save_cadence_lead_state("gone@example.com", _cadence("gone@example.com", "2026-03-01"))
+    gone_hash = state_store.cadence_email_hash("gone@example.com")
+    del client._kv[store._key("cadence", "lead", gone_hash)]
+
+    assert store.list_due_cadence_lead_states("default_21day", "2026-03-02") == []
+    assert gone_hash not in client._zsets[store._due_index_key("default_21day")]
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+StateStore SQLite backend tests (STATE_BACKEND=sqlite).
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+from datetime import date, timedelta
+from pathlib import Path
+
+import pytest
+
+
+def _write_json(path: Path, payload: dict):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(payload), encoding="utf-8")
+
+
+def _cadence_payload(email: str, *, due: str, status: str = "active", cadence_id: str = "default_21day") -> dict:
+    return {
+        "email": email,
+        "cadence_id": cadence_id,
+        "tier": "tier_1",
+        "started_at": "2026-02-17T00:00:00+00:00",
+        "current_step": 1,
+        "status": status,
+        "next_step_due": due,
+    }
+
+
+@pytest.fixture
+def sqlite_store(monkeypatch, tmp_path: Path):
+    from core import state_store
+
+    monkeypatch.setenv("STATE_BACKEND", "sqlite")
+    monkeypatch.delenv("STATE_SQLITE_PATH", raising=False)
+    monkeypatch.setenv("STATE_DUAL_READ_ENABLED", "true")
+    monkeypatch.setenv("STATE_FILE_FALLBACK_WRITE", "false")
+    return state_store.StateStore(hive_dir=tmp_path / ".hive-mind")
+
+
+def test_sqlite_backend_uses_wal(sqlite_store):
+    assert sqlite_store._sqlite_enabled()
+    assert sqlite_store.sqlite_path.exists()
+    mode = sqlite_store._get_sqlite_connection().execute("PRAGMA journal_mode").fetchone()[0]
+    assert mode.lower() == "wal"
+
+
+def test_sqlite_round_trips_all_record_types(sqlite_store):
+    today = date.today().isoformat()
+    sqlite_store.save_operator_daily_state(today, {"date": today, "runs_today": 2})
+    sqlite_store.save_batch("batch_a", {"batch_id": "batch_a", "status": "pending", "created_at": "2026-02-01"})
+    sqlite_store.save_cadence_lead_state("Lead@Example.com", _cadence_payload("Lead@Example.com", due=today))
+
+    assert sqlite_store.get_operator_daily_state(today)["runs_today"] == 2
+    assert sqlite_store.get_batch("batch_a")["status"] == "pending"
+    assert sqlite_store.get_cadence_lead_state("lead@example.com")["email"] == "Lead@Example.com"
+    # File fallback writes disabled: nothing on disk besides the database.
+    assert not any(sqlite_store.cadence_state_dir.glob("*.json"))
+
+
+def test_sqlite_upsert_replaces_indexed_columns(sqlite_store):
+    email = "lead@example.com"
+    sqlite_store.save_cadence_lead_state(email, _cadence_payload(email, due="2026-02-01"))
+    sqlite_store.save_cadence_lead_state(email, _cadence_payload(email, due="2026-02-05", status="exited"))
+
+    conn = sqlite3.connect(str(sqlite_store.sqlite_path))
+    rows = conn.execute("SELECT status, next_step_due FROM cadence_leads").fetchall()
+    conn.close()
+    assert rows == [("exited", "2026-02-05")]
+
+
+def test_list_due_cadence_states_is_range_query(sqlite_store):
+    today = date.today()
+    sqlite_store.save_cadence_lead_state("due@example.com", _cadence_payload("due@example.com", due=today.isoformat()))
+    sqlite_store.save_cadence_lead_state(
+        "overdue@example.com", _cadence_payload("overdue@example.com", due=(today - timedelta(days=3)).isoformat())
+    )
+    sqlite_store.save_cadence_lead_state(
+        "future@example.com", _cadence_payload("future@example.com", due=(today + timedelta(days=1)).isoformat())
+    )
+    sqlite_store.save_cadence_lead_state(
+        "exited@example.com", _cadence_payload("exited@example.com", due=today.isoformat(), status="exited")
+    )
+    sqlite_store.save_cadence_lead_state(
+        "other@example.com", _cadence_payload("other@example.com", due=today.isoformat(), cadence_id="other")
+    )
+
+    due = sqlite_store.list_due_cadence_lead_states("default_21day", today.isoformat())
+    assert [d["email"] for d in due] == ["overdue@example.com", "due@example.com"]
+
+    plan = sqlite_store._get_sqlite_connection().execute(
+        "EXPLAIN QUERY PLAN SELECT payload FROM cadence_leads "
+        "WHERE status = 'active' AND cadence_id = ? AND next_step_due != '' AND next_step_due <= ?",
+        ("default_21day", today.isoformat()),
+    ).fetchall()
+    assert any("idx_cadence_due" in str(row) for row in plan)
+
+
+def test_sqlite_dual_read_migrates_file_state(monkeypatch, tmp_path: Path):
+    from core import state_store
+
+    hive_dir = tmp_path / ".hive-mind"
+    today = date.today().isoformat()
+    email = "legacy@example.com"
+    filename = email.replace("@", "_at_").replace(".", "_") + ".json"
+    _write_json(hive_dir / "cadence_state" / filename, _cadence_payload(email, due=today))
+    _write_json(hive_dir / "operator_batches" / "batch_old.json", {"batch_id": "batch_old", "status": "approved"})
+
+    monkeypatch.setenv("STATE_BACKEND", "sqlite")
+    monkeypatch.setenv("STATE_DUAL_READ_ENABLED", "true")
+    store = state_store.StateStore(hive_dir=hive_dir)
+
+    # Empty table on first scan: file state is returned and copied into SQLite.
+    due = store.list_due_cadence_lead_states("default_21day", today)
+    assert [d["email"] for d in due] == [email]
+    assert store.list_batches(status="approved")[0]["batch_id"] == "batch_old"
+
+    (hive_dir / "cadence_state" / filename).unlink()
+    (hive_dir / "operator_batches" / "batch_old.json").unlink()
+    assert store.get_cadence_lead_state(email)["email"] == email
+    assert store.get_batch("batch_old")["status"] == "approved"
+
+
+def test_sqlite_list_batches_filters_by_status(sqlite_store):
+    sqlite_store.save_batch("batch_1", {"batch_id": "batch_1", "status": "pending", "created_at": "2026-02-01"})
+    sqlite_store.save_batch("batch_2", {"batch_id": "batch_2", "status": "approved", "created_at": "2026-02-02"})
+    sqlite_store.save_batch("batch_3", {"batch_id": "batch_3", "status": "pending", "created_at": "2026-02-03"})
+
+    pending = sqlite_store.list_batches(status="pending")
+    assert [b["batch_id"] for b in pending] == ["batch_3", "batch_1"]
+    assert len(sqlite_store.list_batches()) == 3
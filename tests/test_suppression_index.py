@@ -0,0 +1,146 @@
+"""Tests for core/suppression_index.py and the instantly_webhook suppression helpers."""
+
+import json
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import core.suppression_index as si
+from core.suppression_index import BloomFilter, SuppressionIndex
+
+
+def _append(path: Path, *emails: str) -> None:
+    with open(path, "a", encoding="utf-8") as f:
+        for email in emails:
+            f.write(json.dumps({"email": email, "at": "2026-01-01T00:00:00+00:00"}) + "\n")
+
+
+@pytest.fixture
+def unsub_file(tmp_path):
+    return tmp_path / "unsubscribes.jsonl"
+
+
+class TestExactIndex:
+
+    def test_membership_is_case_insensitive(self, unsub_file):
+        _append(unsub_file, "Jane@Acme.com", "bob@example.com")
+        index = SuppressionIndex(unsub_file, mode="exact")
+        assert index.contains("jane@acme.com")
+        assert " BOB@example.com " in index
+        assert not index.contains("other@acme.com")
+        assert not index.contains("")
+        assert len(index) == 2
+
+    def test_missing_file_is_empty(self, unsub_file):
+        index = SuppressionIndex(unsub_file, mode="exact")
+        assert not index.contains("jane@acme.com")
+        _append(unsub_file, "jane@acme.com")
+        assert index.contains("jane@acme.com")
+
+    def test_tails_appends_without_rereading(self, unsub_file):
+        _append(unsub_file, *(f"u{i}@acme.com" for i in range(100)))
+        index = SuppressionIndex(unsub_file, mode="exact")
+        assert index.get_stats()["lines_read"] == 100
+        _append(unsub_file, "new@acme.com")
+        assert index.contains("new@acme.com")
+        assert index.get_stats()["lines_read"] == 101
+
+    def test_partial_line_waits_for_newline(self, unsub_file):
+        _append(unsub_file, "a@acme.com")
+        index = SuppressionIndex(unsub_file, mode="exact")
+        with open(unsub_file, "a", encoding="utf-8") as f:
+            f.write('{"email": "b@acme.com"')
+        assert not index.contains("b@acme.com")
+        with open(unsub_file, "a", encoding="utf-8") as f:
+            f.write("}\n")
+        assert index.contains("b@acme.com")
+
+    def test_corrupt_lines_are_skipped(self, unsub_file):
+        unsub_file.write_text('not json\n{"email": "a@acme.com"}\n[1, 2]\n', encoding="utf-8")
+        index = SuppressionIndex(unsub_file, mode="exact")
+        assert len(index) == 1
+
+    def test_replaced_file_triggers_reload(self, unsub_file, tmp_path):
+        _append(unsub_file, "a@acme.com", "b@acme.com")
+        index = SuppressionIndex(unsub_file, mode="exact")
+        replacement = tmp_path / "new.jsonl"
+        _append(replacement, "c@acme.com")
+        os.replace(replacement, unsub_file)
+        assert index.contains("c@acme.com")
+        assert not index.contains("a@acme.com")
+        assert index.get_stats()["reloads"] == 1
+
+    def test_add_many_skips_existing_and_duplicates(self, unsub_file):
+        index = SuppressionIndex(unsub_file, mode="exact")
+        assert index.add("a@acme.com", source="test")
+        assert index.add_many(["A@acme.com", "b@acme.com", "B@ACME.com", ""]) == 1
+        assert not index.add("a@acme.com")
+        lines = unsub_file.read_text(encoding="utf-8").splitlines()
+        assert [json.loads(line)["email"] for line in lines] == ["a@acme.com", "b@acme.com"]
+        assert json.loads(lines[0])["source"] == "test"
+
+
+class TestBloomIndex:
+
+    def test_bloom_filter_has_no_false_negatives(self):
+        bloom = BloomFilter(capacity=5000, error_rate=0.01)
+        keys = [f"user{i}@acme.com" for i in range(5000)]
+        for key in keys:
+            bloom.add(key)
+        assert all(key in bloom for key in keys)
+        false_positives = sum(f"other{i}@acme.com" in bloom for i in range(10000))
+        assert false_positives < 300
+
+    def test_bloom_mode_resumes_from_snapshot(self, unsub_file):
+        _append(unsub_file, *(f"u{i}@acme.com" for i in range(50)))
+        SuppressionIndex(unsub_file, mode="exact").save_bloom()
+        _append(unsub_file, "late@acme.com")
+
+        reader = SuppressionIndex(unsub_file, mode="bloom")
+        assert reader.get_stats()["lines_read"] == 1  # only the line after the snapshot
+        assert reader.contains("u7@acme.com")
+        assert reader.contains("late@acme.com")
+        assert not reader.contains("nobody@acme.com")
+
+    def test_stale_snapshot_for_other_file_is_ignored(self, unsub_file):
+        _append(unsub_file, *(f"u{i}@acme.com" for i in range(10)))
+        SuppressionIndex(unsub_file, mode="exact").save_bloom()
+        unsub_file.write_text("", encoding="utf-8")
+        _append(unsub_file, "only@acme.com")
+
+        reader = SuppressionIndex(unsub_file, mode="bloom")
+        assert reader.contains("only@acme.com")
+        assert not reader.contains("u1@acme.com")
+
+    def test_bloom_false_positive_is_still_persisted(self, unsub_file):
+        _append(unsub_file, "known@acme.com")
+        index = SuppressionIndex(unsub_file, mode="bloom")
+        index._bloom.bits = bytearray(b"\xff" * len(index._bloom.bits))  # every key hits
+        assert index.contains("new@acme.com")
+
+        assert index.add("new@acme.com", source="test") is True
+        assert SuppressionIndex(unsub_file, mode="exact").contains("new@acme.com")
+
+    def test_bloom_grows_past_capacity(self, unsub_file, monkeypatch):
+        monkeypatch.setattr(si, "MIN_BLOOM_CAPACITY", 100)
+        index = SuppressionIndex(unsub_file, mode="bloom")
+        index.add_many([f"u{i}@acme.com" for i in range(500)])
+        assert all(index.contains(f"u{i}@acme.com") for i in range(500))
+        assert index.get_stats()["bloom_estimated_error_rate"] < 0.01
+
+
+class TestInstantlyWebhookHelpers:
+
+    def test_add_and_check_use_shared_index(self, unsub_file, monkeypatch):
+        import webhooks.instantly_webhook as iw
+        index = SuppressionIndex(unsub_file, mode="exact")
+        monkeypatch.setattr(iw, "get_suppression_index", lambda: index)
+        assert not iw._is_suppressed("jane@acme.com")
+        iw._add_to_suppression("Jane@Acme.com")
+        assert iw._is_suppressed("jane@acme.com")
+        entry = json.loads(unsub_file.read_text(encoding="utf-8"))
+        assert entry["email"] == "Jane@Acme.com" and "at" in entry
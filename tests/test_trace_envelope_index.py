@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Tests for trace envelope rotation, the reverse tail reader and the
+agent/correlation/case sidecar index.
+"""
+
+from __future__ import annotations
+
+import json
+import multiprocessing
+import random
+from pathlib import Path
+
+import pytest
+
+from core import trace_envelope
+from core.trace_envelope import (
+    _reverse_lines,
+    count_traces,
+    emit_tool_trace,
+    find_traces,
+    tail_traces,
+    trace_files,
+)
+
+AGENTS = ["HUNTER", "ENRICHER", "SEGMENTOR", "CRAFTER", "GATEKEEPER"]
+
+
+@pytest.fixture
+def trace_file(tmp_path: Path, monkeypatch):
+    path = tmp_path / "traces" / "tool_trace_envelopes.jsonl"
+    monkeypatch.setenv("TRACE_ENVELOPE_FILE", str(path))
+    monkeypatch.setattr(trace_envelope, "TRACE_MAX_BYTES", 0)
+    return path
+
+
+def _emit(n, seed=1):
+    rng = random.Random(seed)
+    emitted = []
+    for i in range(n):
+        emitted.append(emit_tool_trace(
+            agent=rng.choice(AGENTS),
+            tool_name=f"tool_{i % 7}",
+            tool_input={"i": i, "pad": "x" * rng.randrange(200)},
+            status=rng.choice(["success", "failure"]),
+            duration_ms=i,
+            correlation_id=f"corr-{i % 40}",
+            case_id=f"case-{i % 9}" if i % 3 else None,
+        ))
+    return emitted
+
+
+def _all_retained(path):
+    traces = []
+    for f in reversed(trace_files(path)):
+        traces.extend(json.loads(line) for line in f.read_text(encoding="utf-8").splitlines())
+    return traces
+
+
+def test_reverse_lines_across_block_boundaries(tmp_path):
+    path = tmp_path / "lines.jsonl"
+    lines = [f"line-{i}-" + "y" * (i % 13) for i in range(200)]
+    path.write_text("\n".join(lines) + "\n\n")
+    for block_size in (1, 7, 64, 10_000):
+        assert [raw.decode() for raw in _reverse_lines(path, block_size)] == lines[::-1]
+
+
+def test_tail_traces_matches_linear_scan(trace_file):
+    emitted = _emit(300)
+    assert tail_traces(50) == emitted[::-1][:50]
+    assert tail_traces(1000) == emitted[::-1]
+    assert tail_traces(0) == []
+    for agent in AGENTS:
+        expected = [t for t in emitted if t["agent"] == agent][::-1][:20]
+        assert tail_traces(20, agent=agent) == expected
+    assert tail_traces(20, agent="NOBODY") == []
+
+
+def test_find_traces_by_correlation_and_case(trace_file):
+    emitted = _emit(300)
+    assert find_traces(correlation_id="corr-7") == [t for t in emitted if t["correlation_id"] == "corr-7"]
+    assert find_traces(case_id="case-4") == [t for t in emitted if t["case_id"] == "case-4"]
+    assert find_traces(correlation_id="corr-7", agent="CRAFTER") == [
+        t for t in emitted if t["correlation_id"] == "corr-7" and t["agent"] == "CRAFTER"
+    ]
+    # "corr-1" must not match corr-10..corr-19 through the substring prefilter
+    assert {t["correlation_id"] for t in find_traces(correlation_id="corr-1")} == {"corr-1"}
+    assert count_traces() == 300
+
+
+def test_rotation_keeps_retention_and_readers_span_files(trace_file, monkeypatch):
+    monkeypatch.setattr(trace_envelope, "TRACE_MAX_BYTES", 20_000)
+    monkeypatch.setattr(trace_envelope, "TRACE_RETENTION", 2)
+    emitted = _emit(400)
+
+    files = trace_files(trace_file)
+    assert [f.name for f in files][1:] == [f"{trace_file.name}.1", f"{trace_file.name}.2"]
+    assert not trace_file.with_name(f"{trace_file.name}.3").exists()
+    assert all(f.stat().st_size < 25_000 for f in files)
+
+    retained = _all_retained(trace_file)
+    assert retained == emitted[-len(retained):]
+    assert count_traces() == len(retained)
+    assert tail_traces(len(retained) + 10) == retained[::-1]
+    assert find_traces(correlation_id="corr-3") == [t for t in retained if t["correlation_id"] == "corr-3"]
+    assert tail_traces(30, agent="HUNTER") == [t for t in retained if t["agent"] == "HUNTER"][::-1][:30]
+
+
+def test_unindexed_traces_are_found_and_indexed(trace_file):
+    trace_file.parent.mkdir(parents=True)
+    old = [{"agent": "HUNTER", "correlation_id": f"old-{i}", "case_id": None, "status": "success"}
+           for i in range(20)]
+    trace_file.write_text("".join(json.dumps(t) + "\n" for t in old))
+
+    assert find_traces(correlation_id="old-5") == [old[5]]
+    assert tail_traces(3, agent="HUNTER") == old[::-1][:3]
+
+    new = emit_tool_trace(agent="CRAFTER", tool_name="t", status="success", duration_ms=1,
+                          correlation_id="old-5")
+    index = trace_file.with_name(trace_file.name + ".idx").read_text().splitlines()
+    assert len(index) == 21
+    assert find_traces(correlation_id="old-5") == [old[5], new]
+    assert count_traces() == 21
+
+
+def _emit_in_child(seed):
+    _emit(150, seed=seed)
+
+
+def test_concurrent_writer_processes_keep_index_consistent(trace_file, monkeypatch):
+    try:
+        ctx = multiprocessing.get_context("fork")
+    except ValueError:
+        pytest.skip("needs fork to share the patched limits with the writers")
+    monkeypatch.setattr(trace_envelope, "TRACE_MAX_BYTES", 20_000)
+    monkeypatch.setattr(trace_envelope, "TRACE_RETENTION", 50)
+    writers = [ctx.Process(target=_emit_in_child, args=(seed,)) for seed in range(4)]
+    for p in writers:
+        p.start()
+    for p in writers:
+        p.join()
+    assert all(p.exitcode == 0 for p in writers)
+
+    files = trace_files(trace_file)
+    assert sum(len(f.read_text(encoding="utf-8").splitlines()) for f in files) == 600
+    # Every rotated file was full when it rotated: no back-to-back rotations
+    assert all(f.stat().st_size >= 20_000 for f in files[1:])
+    for f in files:
+        data = f.read_bytes()
+        index = f.with_name(f.name + ".idx").read_text(encoding="utf-8").splitlines()
+        assert len(index) == len(data.splitlines())
+        for line in index:
+            agent, correlation_id, _, offset, length = line.split("\t")
+            trace = json.loads(data[int(offset):int(offset) + int(length)])
+            assert (trace["agent"], trace["correlation_id"]) == (agent, correlation_id)
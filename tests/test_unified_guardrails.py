@@ -26,6 +26,7 @@ from core.unified_guardrails import (
     GroundingEvidence,
     UnifiedRateLimiter,
     RateLimitConfig,
+    SlidingWindowCounter,
     ExponentialBackoff,
     HookSystem,
     PermissionsConfigLoader,
@@ -294,6 +295,61 @@ class TestRateLimiting:
         allowed, reason = guardrails.check_rate_limits("ENRICHER", ActionType.READ_CONTACT)
         assert allowed
 
+    def test_acquire_checks_and_records(self, rate_limiter):
+        """acquire() records only while the limit allows it."""
+        limits = RateLimitConfig(per_minute=3, per_hour=100, per_day=1000)
+        results = [rate_limiter.acquire("test_agent", limits) for _ in range(5)]
+        assert [allowed for allowed, _ in results] == [True, True, True, False, False]
+        assert "3/minute" in results[-1][1]
+        assert rate_limiter.get_usage("test_agent")["minute"]["used"] == 3
+
+    def test_sliding_window_expires_sub_buckets(self):
+        """Counts drop as sub-buckets leave the window, never before."""
+        counter = SlidingWindowCounter(60)
+        counter.add(1000.0)
+        counter.add(1030.0, 2)
+        assert counter.count(1059.0) == 3
+        assert counter.count(1060.5) == 3  # oldest sub-bucket still in range
+        assert counter.count(1061.0) == 2
+        assert counter.count(1091.0) == 0
+        counter.add(5000.0)
+        assert counter.count(5000.0) == 1
+
+    def test_sliding_window_matches_exact_count(self):
+        """Bucketed counts never under-count and over-count by at most one sub-bucket."""
+        import random
+        rng = random.Random(3)
+        stamps = sorted(rng.uniform(0, 7200) for _ in range(3000))
+        counter = SlidingWindowCounter(3600)
+        for i, ts in enumerate(stamps):
+            counter.add(ts)
+            exact = sum(1 for t in stamps[:i + 1] if ts - t < 3600)
+            slack = sum(1 for t in stamps[:i + 1] if 3600 <= ts - t < 3660)
+            assert exact <= counter.count(ts) <= exact + slack
+
+    def test_state_is_written_behind(self, tmp_path):
+        """Recorded actions are persisted by the debounced flush, not per action."""
+        path = tmp_path / "rate_limits.json"
+        limiter = UnifiedRateLimiter(path, redis_url="", flush_interval=60)
+        for _ in range(10):
+            limiter.record_action("agent_x")
+        assert not path.exists()
+
+        limiter.flush()
+        restored = UnifiedRateLimiter(path, redis_url="", flush_interval=60)
+        assert restored.get_usage("agent_x")["minute"]["used"] == 10
+
+    def test_legacy_timestamp_state_is_loaded(self, tmp_path):
+        """Old timestamp-list state files are re-bucketed on load."""
+        now = time.time()
+        path = tmp_path / "rate_limits.json"
+        stamps = [now - 10, now - 120, now - 7200]
+        path.write_text(json.dumps({"counters": {"agent_x": {
+            "minute": stamps[:1], "hour": stamps[:2], "day": stamps,
+        }}}))
+        usage = UnifiedRateLimiter(path, redis_url="").get_usage("agent_x")
+        assert [usage[w]["used"] for w in ("minute", "hour", "day")] == [1, 2, 3]
+
 
 # =============================================================================
 # CIRCUIT BREAKER TESTS
@@ -0,0 +1,244 @@
+"""Tests for the segment-based EventQueue in webhooks/webhook_server.py."""
+
+import json
+import sys
+import threading
+from unittest.mock import AsyncMock, MagicMock
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import core.hot_lead_detector as hot_lead_detector
+import webhooks.webhook_server as ws
+from webhooks.webhook_server import EventQueue, WebhookEvent, create_app
+
+
+def _event(n, source="instantly"):
+    return WebhookEvent(
+        source=source,
+        event_type="email_opened",
+        payload={"n": n},
+        received_at=datetime.now(timezone.utc).isoformat(),
+        event_id=f"evt_{n}",
+    )
+
+
+@pytest.fixture
+def queue_file(tmp_path):
+    return tmp_path / "webhook_queue.json"
+
+
+class TestEventQueue:
+
+    def test_add_and_ack(self, queue_file):
+        q = EventQueue(queue_file)
+        for n in range(3):
+            q.add(_event(n))
+        q.mark_processed("evt_1", error="boom")
+        assert [e.event_id for e in q.get_unprocessed()] == ["evt_0", "evt_2"]
+        stats = q.get_stats()
+        assert stats["pending"] == 2
+        assert stats["queue_size"] == 3
+        assert stats["processed"] == 1 and stats["errors"] == 1
+        recent = q.get_recent(limit=2)
+        assert [r["event_id"] for r in recent] == ["evt_2", "evt_1"]
+        assert recent[1]["processed"] and recent[1]["error"] == "boom"
+
+    def test_ack_unknown_id_is_noop(self, queue_file):
+        q = EventQueue(queue_file)
+        q.add(_event(0))
+        q.mark_processed("evt_0")
+        q.mark_processed("evt_0")
+        q.mark_processed("missing")
+        assert q.get_stats()["processed"] == 1
+
+    def test_state_survives_restart(self, queue_file):
+        q = EventQueue(queue_file, segment_max_events=2)
+        for n in range(5):
+            q.add(_event(n))
+        q.mark_processed("evt_0")
+        q.mark_processed("evt_3")
+        q.close()
+
+        reloaded = EventQueue(queue_file, segment_max_events=2)
+        assert [e.event_id for e in reloaded.get_unprocessed()] == ["evt_1", "evt_2", "evt_4"]
+        assert reloaded.get_recent(limit=5)[1]["processed"] is True  # evt_3
+        reloaded.add(_event(5))
+        assert reloaded.get_stats()["pending"] == 4
+
+    def test_fully_acked_segments_are_deleted(self, queue_file):
+        q = EventQueue(queue_file, segment_max_events=10)
+        for n in range(35):
+            q.add(_event(n))
+        assert len(list(q.queue_dir.glob("segment-*.jsonl"))) == 4
+        for n in range(20):
+            q.mark_processed(f"evt_{n}")
+        assert len(list(q.queue_dir.glob("segment-*.jsonl"))) == 2
+        stats = q.get_stats()
+        assert stats["segments_compacted"] == 2
+        assert stats["queue_size"] == 15
+        assert stats["pending"] == 15
+
+    def test_ack_log_compaction(self, queue_file, monkeypatch):
+        monkeypatch.setattr(ws, "ACK_COMPACT_MIN_LINES", 5)
+        q = EventQueue(queue_file, segment_max_events=5)
+        for n in range(22):
+            q.add(_event(n))
+        for n in range(21):
+            q.mark_processed(f"evt_{n}")
+        lines = q.ack_file.read_text(encoding="utf-8").splitlines()
+        assert len(lines) < 21
+        assert {json.loads(line)["segment"] for line in lines} <= set(q._segments)
+        q.close()
+        reloaded = EventQueue(queue_file, segment_max_events=5)
+        assert [e.event_id for e in reloaded.get_unprocessed()] == ["evt_21"]
+
+    def test_colliding_event_ids_are_suffixed(self, queue_file):
+        q = EventQueue(queue_file)
+        q.add(_event(0))
+        dup = _event(0)
+        q.add(dup)
+        assert dup.event_id == "evt_0_1"
+        assert len(q.get_unprocessed()) == 2
+
+    def test_torn_trailing_line_is_skipped(self, queue_file):
+        q = EventQueue(queue_file)
+        q.add(_event(0))
+        q.close()
+        segment = next(q.queue_dir.glob("segment-*.jsonl"))
+        with open(segment, "a", encoding="utf-8") as f:
+            f.write('{"source": "instan')
+        assert [e.event_id for e in EventQueue(queue_file).get_unprocessed()] == ["evt_0"]
+
+    def test_legacy_queue_file_is_migrated(self, queue_file):
+        done = _event(0)
+        done.processed = True
+        queue_file.write_text(json.dumps({"events": [done.to_dict(), _event(1).to_dict()]}), encoding="utf-8")
+        q = EventQueue(queue_file)
+        assert [e.event_id for e in q.get_unprocessed()] == ["evt_1"]
+        assert not queue_file.exists()
+        assert queue_file.with_name("webhook_queue.json.migrated").exists()
+        q.close()
+        assert [e.event_id for e in EventQueue(queue_file).get_unprocessed()] == ["evt_1"]
+
+
+class TestCrossProcessAcks:
+    """Two EventQueue instances on one directory stand in for two processes."""
+
+    def test_ack_after_other_process_compacts_is_kept(self, queue_file, monkeypatch):
+        monkeypatch.setattr(ws, "ACK_COMPACT_MIN_LINES", 5)
+        server = EventQueue(queue_file, segment_max_events=5)
+        for n in range(22):
+            server.add(_event(n))
+        detector = EventQueue(queue_file, segment_max_events=5)
+
+        server.mark_processed("evt_16")  # opens the server's ack handle
+        ack_inode = server.ack_file.stat().st_ino
+        for n in range(15):
+            detector.mark_processed(f"evt_{n}")
+        assert server.ack_file.stat().st_ino != ack_inode  # compacted by the detector
+        server.mark_processed("evt_17")
+        server.close()
+        detector.close()
+
+        pending = [e.event_id for e in EventQueue(queue_file, segment_max_events=5).get_unprocessed()]
+        assert pending == ["evt_15", "evt_18", "evt_19", "evt_20", "evt_21"]
+
+    def test_refresh_applies_other_process_acks(self, queue_file, monkeypatch):
+        server = EventQueue(queue_file, segment_max_events=5)
+        for n in range(12):
+            server.add(_event(n))
+        detector = EventQueue(queue_file, segment_max_events=5)
+        for n in range(6):
+            detector.mark_processed(f"evt_{n}", error="boom" if n == 0 else None)
+
+        # Only the appended bytes are read, never a full reload
+        monkeypatch.setattr(EventQueue, "_load", lambda self: pytest.fail("reloaded"))
+        assert server.refresh() is True
+        assert server.refresh() is False
+        assert [e.event_id for e in server.get_unprocessed()] == [f"evt_{n}" for n in range(6, 12)]
+        stats = server.get_stats()
+        assert stats["processed"] == 6 and stats["errors"] == 1
+        assert stats["segments"] == 2  # segment 1 was deleted by the detector
+
+        server.add(_event(12))
+        assert detector.refresh() is True
+        assert detector.get_stats()["total_received"] == 1
+        assert detector.get_unprocessed()[-1].event_id == "evt_12"
+
+
+class TestHotLeadProcessor:
+
+    @pytest.fixture
+    def detector(self, monkeypatch):
+        detector = MagicMock()
+        detector.process_webhook_event = AsyncMock(return_value=None)
+        monkeypatch.setattr(hot_lead_detector, "HotLeadDetector", lambda: detector)
+        return detector
+
+    async def test_detector_sees_queued_ghl_events(self, queue_file, detector):
+        q = EventQueue(queue_file)
+        q.add(_event(0, source="gohighlevel"))
+        q.add(_event(1))
+        processor = hot_lead_detector.WebhookQueueProcessor(event_queue=q)
+
+        await processor._process_pending_events()
+
+        detector.process_webhook_event.assert_awaited_once_with({"n": 0})
+        assert q.get_unprocessed() == []
+        await processor._process_pending_events()
+        assert detector.process_webhook_event.await_count == 1
+
+    async def test_events_from_server_process_are_picked_up(self, queue_file, detector):
+        server_queue = EventQueue(queue_file)
+        processor = hot_lead_detector.WebhookQueueProcessor(event_queue=EventQueue(queue_file))
+        await processor._process_pending_events()
+
+        server_queue.add(_event(2, source="gohighlevel"))
+        await processor._process_pending_events()
+
+        detector.process_webhook_event.assert_awaited_once_with({"n": 2})
+        assert EventQueue(queue_file).get_unprocessed() == []
+
+
+class TestWebhookRoutesLoad:
+
+    def test_concurrent_burst_through_flask_routes(self, queue_file, monkeypatch):
+        monkeypatch.setattr(ws, "INSTANTLY_WEBHOOK_SECRET", "")
+        queue = EventQueue(queue_file, segment_max_events=250)
+        app = create_app(queue)
+        workers, per_worker = 8, 250
+        event_ids = []
+        ids_lock = threading.Lock()
+
+        def post_events(worker):
+            client = app.test_client()
+            for n in range(per_worker):
+                resp = client.post("/webhooks/instantly", json={
+                    "event_type": "email_opened" if n % 2 else "email_replied",
+                    "lead_email": f"w{worker}_{n}@example.com",
+                })
+                assert resp.status_code == 200
+                with ids_lock:
+                    event_ids.append(resp.get_json()["event_id"])
+
+        threads = [threading.Thread(target=post_events, args=(w,)) for w in range(workers)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        total = workers * per_worker
+        assert len(set(event_ids)) == total
+        stats = app.test_client().get("/stats").get_json()["statistics"]
+        assert stats["total_received"] == total
+        assert stats["pending"] == total
+
+        for event in queue.get_unprocessed():
+            queue.mark_processed(event.event_id)
+        assert app.test_client().get("/queue/pending").get_json()["count"] == 0
+        # Only the active segment remains once everything is acked
+        assert len(list(queue.queue_dir.glob("segment-*.jsonl"))) == 1
@@ -28,6 +28,7 @@ logger = logging.getLogger("instantly_webhook")
 
 PROJECT_ROOT = Path(__file__).parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
+from core.suppression_index import get_suppression_index
 from core.webhook_security import (
     get_webhook_signature_status,
     require_webhook_auth,
@@ -352,29 +353,13 @@ async def _update_ghl_tags(lead_email: str, tags: list):
 
 def _add_to_suppression(email: str):
     """Add email to local suppression list (append-only JSONL — no race condition)."""
-    suppression_file = PROJECT_ROOT / ".hive-mind" / "unsubscribes.jsonl"
-    suppression_file.parent.mkdir(parents=True, exist_ok=True)
-    with open(suppression_file, "a", encoding="utf-8") as f:
-        f.write(json.dumps({
-            "email": email,
-            "at": datetime.now(timezone.utc).isoformat(),
-        }) + "\n")
-    logger.info("Added %s to suppression list", email)
+    if get_suppression_index().add(email, source="instantly_webhook"):
+        logger.info("Added %s to suppression list", email)
 
 
 def _is_suppressed(email: str) -> bool:
-    """Check if email is in the suppression list."""
-    suppression_file = PROJECT_ROOT / ".hive-mind" / "unsubscribes.jsonl"
-    if not suppression_file.exists():
-        return False
-    with open(suppression_file, "r", encoding="utf-8") as f:
-        for line in f:
-            try:
-                if json.loads(line.strip()).get("email") == email:
-                    return True
-            except (json.JSONDecodeError, KeyError):
-                continue
-    return False
+    """Check if email is in the suppression list (case-insensitive, in-memory index)."""
+    return get_suppression_index().contains(email)
 
 
 # =============================================================================
@@ -42,6 +42,7 @@ Environment Variables:
 - WEBHOOK_SECRET: General webhook secret
 - INSTANTLY_WEBHOOK_SECRET: Instantly-specific secret
 - GHL_WEBHOOK_SECRET: GoHighLevel-specific secret
+- WEBHOOK_QUEUE_SEGMENT_EVENTS: Events per queue segment file (default: 1000)
 
 Usage:
     python webhook_server.py
@@ -56,10 +57,12 @@ import hashlib
 import logging
 import threading
 import time
+from contextlib import contextmanager
 from pathlib import Path
 from datetime import datetime, timezone
 from dataclasses import dataclass, asdict, field
-from typing import Dict, Any, Optional, List
+from typing import Deque, Dict, Any, Optional, List, Tuple
+from collections import deque
 from enum import Enum
 
 # Add parent to path for imports
@@ -68,6 +71,11 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from dotenv import load_dotenv
 load_dotenv()
 
+try:
+    import fcntl
+except ImportError:  # Windows: no cross-process locking
+    fcntl = None
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -88,6 +96,10 @@ GHL_WEBHOOK_SECRET = os.getenv("GHL_WEBHOOK_SECRET", "")
 PROJECT_ROOT = Path(__file__).parent.parent
 HIVE_MIND_DIR = PROJECT_ROOT / ".hive-mind"
 QUEUE_FILE = HIVE_MIND_DIR / "webhook_queue.json"
+# Events per queue segment before a new segment file is started
+QUEUE_SEGMENT_MAX_EVENTS = int(os.getenv("WEBHOOK_QUEUE_SEGMENT_EVENTS", "1000"))
+# Ack log is rewritten once it holds at least this many entries for deleted segments
+ACK_COMPACT_MIN_LINES = 1000
 
 
 # ============================================================================
@@ -131,19 +143,57 @@ class WebhookEvent:
 
 class EventQueue:
     """
-    Thread-safe event queue persisted to JSON file.
-    
-    Events are saved to .hive-mind/webhook_queue.json for processing
-    by the FeedbackCollector.
+    Thread-safe, log-structured event queue.
+
+    Events are appended to numbered segment files under
+    .hive-mind/webhook_queue/ (one JSON line per event) and acks are appended
+    to acks.jsonl, so neither add() nor mark_processed() rewrites existing
+    data. Pending events are indexed by event_id for O(1) acks. Once every
+    event in a sealed segment is acked the segment is deleted and the ack log
+    is compacted when most of its lines refer to deleted segments.
+
+    Events are added by the webhook server process only, but acks may come
+    from several processes (the server's processor thread and the hot lead
+    detector service). Ack appends and compaction hold an flock on
+    queue.lock, writers reopen the ack log after another process compacts
+    it, and refresh() tails the bytes other processes appended since the
+    last call.
+
+    A legacy .hive-mind/webhook_queue.json is imported on first start and
+    renamed to webhook_queue.json.migrated.
     """
-    
-    def __init__(self, queue_file: Optional[Path] = None):
+
+    def __init__(
+        self,
+        queue_file: Optional[Path] = None,
+        segment_max_events: Optional[int] = None,
+        recent_limit: int = 100,
+    ):
         self.queue_file = queue_file or QUEUE_FILE
         self.queue_file.parent.mkdir(parents=True, exist_ok=True)
+        self.queue_dir = self.queue_file.parent / self.queue_file.stem
+        self.queue_dir.mkdir(parents=True, exist_ok=True)
+        self.ack_file = self.queue_dir / "acks.jsonl"
+        self.lock_file = self.queue_dir / "queue.lock"
+        self.segment_max_events = max(1, int(segment_max_events or QUEUE_SEGMENT_MAX_EVENTS))
         self._lock = threading.Lock()
-        self._events: List[WebhookEvent] = []
-        self._load()
-        
+
+        # event_id -> (segment number, event) for unacked events, in arrival order
+        self._pending: Dict[str, Tuple[int, WebhookEvent]] = {}
+        # segment number -> [events written, events still pending]
+        self._segments: Dict[int, List[int]] = {}
+        # segment number -> bytes of complete lines already read
+        self._segment_offsets: Dict[int, int] = {}
+        self._recent: Deque[WebhookEvent] = deque(maxlen=max(1, recent_limit))
+        self._active_segment = 0
+        self._active_handle = None
+        self._ack_handle = None
+        self._lock_handle = None
+        self._ack_inode: Optional[int] = None
+        self._ack_offset = 0
+        self._ack_lines = 0
+        self._live_acks = 0
+
         # Statistics
         self.stats = {
             "total_received": 0,
@@ -151,81 +201,430 @@ class EventQueue:
             "ghl_events": 0,
             "processed": 0,
             "errors": 0,
+            "segments_compacted": 0,
             "started_at": datetime.now(timezone.utc).isoformat()
         }
-    
-    def _load(self):
-        """Load queue from disk."""
-        if self.queue_file.exists():
+
+        self._load()
+        self._migrate_legacy_file()
+        if self._pending:
+            logger.info(f"Loaded {len(self._pending)} pending events from {len(self._segments)} queue segments")
+
+    # ── Persistence ──────────────────────────────────────────────
+
+    def _segment_path(self, segment: int) -> Path:
+        return self.queue_dir / f"segment-{segment:08d}.jsonl"
+
+    def _segment_numbers(self) -> List[int]:
+        return sorted(
+            int(p.stem.split("-", 1)[1]) for p in self.queue_dir.glob("segment-*.jsonl")
+            if p.stem.split("-", 1)[1].isdigit()
+        )
+
+    @staticmethod
+    def _read_lines(handle, offset: int, name: str) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Parse the complete lines after offset in a binary handle.
+
+        Returns:
+            (records, offset just past the last complete line)
+        """
+        handle.seek(offset)
+        data = handle.read()
+        # A trailing line without a newline is still being written (or torn)
+        end = data.rfind(b"\n") + 1
+        records = []
+        for line in data[:end].splitlines():
+            line = line.strip()
+            if not line:
+                continue
             try:
-                with open(self.queue_file, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                    self._events = [WebhookEvent.from_dict(e) for e in data.get("events", [])]
-                    logger.info(f"Loaded {len(self._events)} events from queue")
-            except Exception as e:
-                logger.error(f"Failed to load queue: {e}")
-                self._events = []
-    
-    def _save(self):
-        """Save queue to disk."""
+                records.append(json.loads(line))
+            except json.JSONDecodeError:
+                # Torn write from a crash mid-append
+                logger.warning(f"Skipping corrupt line in {name}")
+        return records, offset + end
+
+    def _tail_segment(self, segment: int) -> List[Dict[str, Any]]:
+        """Records appended to a segment since it was last read."""
+        path = self._segment_path(segment)
+        offset = self._segment_offsets.get(segment, 0)
+        try:
+            with open(path, "rb") as f:
+                records, self._segment_offsets[segment] = self._read_lines(f, offset, path.name)
+        except FileNotFoundError:
+            return []
+        except OSError as e:
+            logger.error(f"Failed to read {path}: {e}")
+            return []
+        return records
+
+    def _tail_acks(self) -> List[Dict[str, Any]]:
+        """Ack records appended since the last read; the whole log after a compaction."""
+        try:
+            f = open(self.ack_file, "rb")
+        except FileNotFoundError:
+            return []
+        except OSError as e:
+            logger.error(f"Failed to read {self.ack_file}: {e}")
+            return []
+        with f:
+            inode = os.fstat(f.fileno()).st_ino
+            if inode != self._ack_inode:
+                # Replaced by a compaction (here or in another process)
+                self._ack_inode, self._ack_offset, self._ack_lines = inode, 0, 0
+            records, self._ack_offset = self._read_lines(f, self._ack_offset, self.ack_file.name)
+        self._ack_lines += len(records)
+        return records
+
+    @contextmanager
+    def _file_lock(self):
+        """Exclusive cross-process lock on the queue directory. Caller holds the lock."""
+        if fcntl is None:
+            yield
+            return
+        if self._lock_handle is None:
+            self._lock_handle = open(self.lock_file, "a")
+        fcntl.flock(self._lock_handle.fileno(), fcntl.LOCK_EX)
         try:
-            with open(self.queue_file, "w", encoding="utf-8") as f:
-                json.dump({
-                    "events": [e.to_dict() for e in self._events],
-                    "updated_at": datetime.now(timezone.utc).isoformat()
-                }, f, indent=2)
+            yield
+        finally:
+            fcntl.flock(self._lock_handle.fileno(), fcntl.LOCK_UN)
+
+    def _load(self):
+        """Build the pending index from segments and the ack log."""
+        acks: Dict[str, Dict[str, Any]] = {
+            record["event_id"]: record for record in self._tail_acks() if record.get("event_id")
+        }
+
+        segments = self._segment_numbers()
+        for segment in segments:
+            written = pending = 0
+            for data in self._tail_segment(segment):
+                try:
+                    event = WebhookEvent.from_dict(data)
+                except TypeError as e:
+                    logger.warning(f"Skipping malformed queued event: {e}")
+                    continue
+                written += 1
+                ack = acks.get(event.event_id)
+                if ack is not None:
+                    event.processed = True
+                    event.processed_at = ack.get("processed_at")
+                    event.error = ack.get("error")
+                    self._live_acks += 1
+                else:
+                    self._pending[event.event_id] = (segment, event)
+                    pending += 1
+                self._recent.append(event)
+            self._segments[segment] = [written, pending]
+
+        self._active_segment = segments[-1] if segments else 1
+        self._segments.setdefault(self._active_segment, [0, 0])
+        if self._segments[self._active_segment][0] >= self.segment_max_events:
+            self._roll_segment()
+
+        for segment in list(self._segments):
+            self._maybe_drop_segment(segment)
+        self._maybe_compact_acks()
+
+    def _migrate_legacy_file(self):
+        """Import events from the old single-file webhook_queue.json."""
+        if not self.queue_file.exists():
+            return
+        try:
+            with open(self.queue_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            events = [WebhookEvent.from_dict(e) for e in data.get("events", [])]
         except Exception as e:
-            logger.error(f"Failed to save queue: {e}")
-    
+            logger.error(f"Failed to load legacy queue: {e}")
+            return
+
+        with self._lock:
+            for event in events:
+                if event.event_id in self._pending:
+                    continue
+                self._append_event(event)
+                if event.processed:
+                    self._append_ack(event)
+        self.queue_file.rename(self.queue_file.with_name(self.queue_file.name + ".migrated"))
+        logger.info(f"Migrated {len(events)} events from {self.queue_file.name}")
+
+    def _write_line(self, handle, record: Dict[str, Any]) -> Tuple[int, int]:
+        """Append one JSON line; returns the file size before and after."""
+        before = os.fstat(handle.fileno()).st_size
+        handle.write(json.dumps(record, separators=(",", ":")) + "\n")
+        handle.flush()
+        return before, os.fstat(handle.fileno()).st_size
+
+    def _count_received(self, event: WebhookEvent):
+        self.stats["total_received"] += 1
+        if event.source == WebhookSource.INSTANTLY.value:
+            self.stats["instantly_events"] += 1
+        elif event.source == WebhookSource.GHL.value:
+            self.stats["ghl_events"] += 1
+        if event.error:
+            self.stats["errors"] += 1
+
+    def _append_event(self, event: WebhookEvent):
+        """Append to the active segment. Caller holds the lock."""
+        if self._segments[self._active_segment][0] >= self.segment_max_events:
+            self._roll_segment()
+        if self._active_handle is None:
+            self._active_handle = open(self._segment_path(self._active_segment), "a", encoding="utf-8")
+        before, after = self._write_line(self._active_handle, event.to_dict())
+        if self._segment_offsets.get(self._active_segment, 0) == before:
+            # Already indexed; refresh() need not read our own line back
+            self._segment_offsets[self._active_segment] = after
+        counts = self._segments[self._active_segment]
+        counts[0] += 1
+        counts[1] += 1
+        self._pending[event.event_id] = (self._active_segment, event)
+        self._recent.append(event)
+
+    def _ack_writer(self):
+        """The ack log handle, reopened if a compaction replaced the file. Caller holds the file lock."""
+        if self._ack_handle is not None:
+            try:
+                replaced = os.stat(self.ack_file).st_ino != os.fstat(self._ack_handle.fileno()).st_ino
+            except FileNotFoundError:
+                replaced = True
+            if replaced:
+                self._ack_handle.close()
+                self._ack_handle = None
+        if self._ack_handle is None:
+            self._ack_handle = open(self.ack_file, "a", encoding="utf-8")
+        return self._ack_handle
+
+    def _append_ack(self, event: WebhookEvent):
+        """Record an ack and release its segment slot. Caller holds the lock."""
+        entry = self._pending.get(event.event_id)
+        if entry is None:
+            return
+        with self._file_lock():
+            handle = self._ack_writer()
+            before, after = self._write_line(handle, {
+                "event_id": event.event_id,
+                "segment": entry[0],
+                "processed_at": event.processed_at,
+                "error": event.error,
+            })
+            inode = os.fstat(handle.fileno()).st_ino
+            if self._ack_inode is None and before == 0:
+                self._ack_inode = inode
+            if inode == self._ack_inode and self._ack_offset == before:
+                # Already applied; refresh() need not read our own line back
+                self._ack_offset = after
+        self._ack_lines += 1
+        del self._pending[event.event_id]
+        self._live_acks += 1
+        self._segments[entry[0]][1] -= 1
+        self._maybe_drop_segment(entry[0])
+
+    def _apply_ack(self, record: Dict[str, Any]) -> bool:
+        """Apply an ack written by another process. Caller holds the lock."""
+        entry = self._pending.pop(record.get("event_id"), None)
+        if entry is None:
+            return False
+        segment, event = entry
+        event.processed = True
+        event.processed_at = record.get("processed_at")
+        event.error = record.get("error")
+        self._live_acks += 1
+        self._segments[segment][1] -= 1
+        self.stats["processed"] += 1
+        if event.error:
+            self.stats["errors"] += 1
+        self._maybe_drop_segment(segment)
+        return True
+
+    def _roll_segment(self):
+        """Seal the active segment and start the next one."""
+        if self._active_handle is not None:
+            self._active_handle.close()
+            self._active_handle = None
+        sealed = self._active_segment
+        self._active_segment = sealed + 1
+        self._segments[self._active_segment] = [0, 0]
+        self._maybe_drop_segment(sealed)
+
+    def _maybe_drop_segment(self, segment: int):
+        """Delete a sealed segment once all of its events are acked."""
+        counts = self._segments.get(segment)
+        if counts is None or segment == self._active_segment or counts[1] > 0:
+            return
+        try:
+            self._segment_path(segment).unlink()
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning(f"Failed to remove queue segment {segment}: {e}")
+            return
+        self._forget_segment(segment)
+        self._maybe_compact_acks()
+
+    def _forget_segment(self, segment: int):
+        counts = self._segments.pop(segment)
+        self._segment_offsets.pop(segment, None)
+        self._live_acks -= counts[0] - counts[1]
+        self.stats["segments_compacted"] += 1
+
+    def _maybe_compact_acks(self):
+        """Rewrite the ack log without entries for deleted segments."""
+        dead = self._ack_lines - self._live_acks
+        if dead < ACK_COMPACT_MIN_LINES or dead < self._live_acks:
+            return
+        with self._file_lock():
+            # Re-read under the lock so acks from other processes are kept
+            try:
+                with open(self.ack_file, "rb") as f:
+                    records, _ = self._read_lines(f, 0, self.ack_file.name)
+            except FileNotFoundError:
+                records = []
+            live_segments = set(self._segments) | set(self._segment_numbers())
+            live = [record for record in records if record.get("segment") in live_segments]
+            if self._ack_handle is not None:
+                self._ack_handle.close()
+                self._ack_handle = None
+            tmp = self.ack_file.with_suffix(".tmp")
+            with open(tmp, "w", encoding="utf-8") as f:
+                for record in live:
+                    f.write(json.dumps(record, separators=(",", ":")) + "\n")
+            os.replace(tmp, self.ack_file)
+            st = os.stat(self.ack_file)
+        self._ack_inode, self._ack_offset = st.st_ino, st.st_size
+        self._ack_lines = self._live_acks = len(live)
+        # Apply acks other processes wrote since the last refresh()
+        for record in records:
+            self._apply_ack(record)
+
+    def _close_handles(self):
+        for handle in (self._active_handle, self._ack_handle, self._lock_handle):
+            if handle is not None:
+                handle.close()
+        self._active_handle = self._ack_handle = self._lock_handle = None
+
+    def close(self):
+        """Close open segment, ack log and lock file handles."""
+        with self._lock:
+            self._close_handles()
+
+    # ── Public API ───────────────────────────────────────────────
+
     def add(self, event: WebhookEvent):
         """Add event to queue."""
         with self._lock:
-            self._events.append(event)
-            self.stats["total_received"] += 1
-            
-            if event.source == WebhookSource.INSTANTLY.value:
-                self.stats["instantly_events"] += 1
-            elif event.source == WebhookSource.GHL.value:
-                self.stats["ghl_events"] += 1
-            
-            if event.error:
-                self.stats["errors"] += 1
+            # Generated IDs are timestamp based and can collide under bursts
+            if event.event_id in self._pending:
+                base, n = event.event_id, 1
+                while f"{base}_{n}" in self._pending:
+                    n += 1
+                event.event_id = f"{base}_{n}"
+
+            try:
+                self._append_event(event)
+            except OSError as e:
+                logger.error(f"Failed to save queued event: {e}")
+                raise
+            self._count_received(event)
             
-            self._save()
-            logger.info(f"Queued event: {event.event_id} ({event.source}/{event.event_type})")
+        logger.info(f"Queued event: {event.event_id} ({event.source}/{event.event_type})")
     
+    def refresh(self) -> bool:
+        """
+        Pick up events and acks written by other processes.
+
+        Only bytes appended since the previous call are read; the ack log is
+        read from the start again after a compaction replaces it.
+
+        Returns:
+            True if any new events or acks were applied
+        """
+        with self._lock:
+            changed = False
+            on_disk = self._segment_numbers()
+            for segment in on_disk:
+                records = self._tail_segment(segment)
+                if not records:
+                    continue
+                counts = self._segments.setdefault(segment, [0, 0])
+                for data in records:
+                    try:
+                        event = WebhookEvent.from_dict(data)
+                    except TypeError as e:
+                        logger.warning(f"Skipping malformed queued event: {e}")
+                        continue
+                    if event.event_id in self._pending:
+                        continue
+                    counts[0] += 1
+                    counts[1] += 1
+                    self._pending[event.event_id] = (segment, event)
+                    self._recent.append(event)
+                    self._count_received(event)
+                    changed = True
+                if segment > self._active_segment and self._active_handle is None:
+                    # The writer moved on; our old active segment is now sealed
+                    sealed, self._active_segment = self._active_segment, segment
+                    self._maybe_drop_segment(sealed)
+
+            for record in self._tail_acks():
+                changed = self._apply_ack(record) or changed
+
+            # Segments another process deleted after acking all of their events
+            existing = set(on_disk)
+            gone = {s for s in self._segments if s != self._active_segment and s not in existing}
+            if gone:
+                for event_id, (segment, event) in list(self._pending.items()):
+                    if segment in gone:
+                        del self._pending[event_id]
+                        event.processed = True
+                        self._segments[segment][1] -= 1
+                        self.stats["processed"] += 1
+                for segment in gone:
+                    self._forget_segment(segment)
+                changed = True
+            return changed
+
     def get_unprocessed(self) -> List[WebhookEvent]:
         """Get all unprocessed events."""
         with self._lock:
-            return [e for e in self._events if not e.processed]
+            return [event for _, event in self._pending.values()]
     
     def mark_processed(self, event_id: str, error: Optional[str] = None):
         """Mark an event as processed."""
         with self._lock:
-            for event in self._events:
-                if event.event_id == event_id:
-                    event.processed = True
-                    event.processed_at = datetime.now(timezone.utc).isoformat()
-                    event.error = error
-                    self.stats["processed"] += 1
-                    if error:
-                        self.stats["errors"] += 1
-                    break
-            self._save()
+            entry = self._pending.get(event_id)
+            if entry is None:
+                return
+            event = entry[1]
+            event.processed = True
+            event.processed_at = datetime.now(timezone.utc).isoformat()
+            event.error = error
+            try:
+                self._append_ack(event)
+            except OSError as e:
+                logger.error(f"Failed to save ack for {event_id}: {e}")
+                event.processed = False
+                event.processed_at = None
+                return
+            self.stats["processed"] += 1
+            if error:
+                self.stats["errors"] += 1
     
     def get_stats(self) -> Dict[str, Any]:
         """Get queue statistics."""
         with self._lock:
             return {
                 **self.stats,
-                "pending": len([e for e in self._events if not e.processed]),
-                "queue_size": len(self._events)
+                "pending": len(self._pending),
+                "queue_size": sum(counts[0] for counts in self._segments.values()),
+                "segments": len(self._segments),
             }
     
     def get_recent(self, limit: int = 20) -> List[Dict[str, Any]]:
         """Get recent events for display."""
         with self._lock:
-            recent = self._events[-limit:]
+            recent = list(self._recent)[-limit:] if limit > 0 else []
             return [
                 {
                     "event_id": e.event_id,
@@ -347,6 +746,8 @@ def process_queue(event_queue: EventQueue, interval: int = 30):
     
     while True:
         try:
+            # Pick up acks from the hot lead detector service
+            event_queue.refresh()
             unprocessed = event_queue.get_unprocessed()
             
             if unprocessed:
@@ -418,6 +819,7 @@ def create_app(event_queue: Optional[EventQueue] = None) -> "Flask":
     @app.route("/stats", methods=["GET"])
     def stats():
         """Webhook statistics endpoint."""
+        queue.refresh()
         queue_stats = queue.get_stats()
         recent = queue.get_recent(limit=10)
         
@@ -556,6 +958,7 @@ def create_app(event_queue: Optional[EventQueue] = None) -> "Flask":
     @app.route("/queue/pending", methods=["GET"])
     def pending_events():
         """Get pending (unprocessed) events."""
+        queue.refresh()
         unprocessed = queue.get_unprocessed()
         return jsonify({
             "count": len(unprocessed),
@@ -650,7 +1053,7 @@ def main():
 ║    GET  /queue/pending       - Pending events                ║
 ║    GET  /queue/recent        - Recent events                 ║
 ║                                                              ║
-║  Queue file: {str(QUEUE_FILE)[:45]}...
+║  Queue dir: {str(QUEUE_FILE.with_suffix(''))[:46]}...
 ║                                                              ║
 ║  Press Ctrl+C to stop                                        ║
 ╚══════════════════════════════════════════════════════════════╝